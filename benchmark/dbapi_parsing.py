@@ -0,0 +1,181 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for the statement analysis of the DB-API.
+
+Compares, on statements as issued by ORMs, the former sqlparse-based
+classification, WHERE clause detection, placeholder translation and script
+splitting with the lexer of ``spanner_dbapi``.  The statement cache is
+bypassed, as for statements seen for the first time.  Requires the
+``sqlparse`` package;  no Cloud Spanner instance is required.
+
+Usage:
+
+  $ python benchmark/dbapi_parsing.py --repeat 5
+
+"""
+
+import argparse
+import re
+import timeit
+
+import sqlparse
+
+from google.cloud.spanner_dbapi import _lexer
+from google.cloud.spanner_dbapi import parse_utils
+
+STATEMENTS = [
+    # Django
+    'SELECT "django_session"."session_key", "django_session"."session_data", '
+    '"django_session"."expire_date" FROM django_session WHERE '
+    "(django_session.expire_date > %s AND django_session.session_key = %s) "
+    "LIMIT 21",
+    "SELECT auth_user.id, auth_user.password, auth_user.last_login, "
+    "auth_user.is_superuser, auth_user.username, auth_user.first_name, "
+    "auth_user.last_name, auth_user.email, auth_user.is_staff, "
+    "auth_user.is_active, auth_user.date_joined FROM auth_user "
+    "WHERE auth_user.id = %s LIMIT 21",
+    "INSERT INTO django_admin_log (id, action_time, user_id, content_type_id, "
+    "object_id, object_repr, action_flag, change_message) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+    "UPDATE auth_user SET last_login = %s WHERE auth_user.id = %s",
+    "DELETE FROM django_session WHERE django_session.session_key IN (%s)",
+    "SELECT COUNT(*) AS __count FROM blog_entry INNER JOIN blog_blog ON "
+    "(blog_entry.blog_id = blog_blog.id) WHERE (blog_blog.name LIKE %s "
+    "ESCAPE '\\\\' AND blog_entry.pub_date >= %s)",
+    "SELECT (1) AS a FROM django_content_type WHERE "
+    "(django_content_type.app_label = %s AND django_content_type.model = %s) "
+    "LIMIT 1",
+    # SQLAlchemy
+    "SELECT users.id AS users_id, users.name AS users_name, users.fullname AS "
+    "users_fullname \nFROM users \nWHERE users.name = %(name_1)s",
+    "UPDATE users SET fullname=%(fullname)s WHERE users.id = %(users_id)s",
+    "INSERT INTO addresses (id, email_address, user_id) VALUES "
+    "(%(id)s, %(email_address)s, %(user_id)s)",
+    "WITH anon_1 AS \n(SELECT orders.region AS region, sum(orders.amount) AS "
+    "total_sales \nFROM orders GROUP BY orders.region)\n SELECT anon_1.region "
+    "\nFROM anon_1 \nWHERE anon_1.total_sales > (SELECT sum(anon_1.total_sales) "
+    "/ %(param_1)s AS anon_2 \nFROM anon_1)",
+    "DELETE FROM addresses",
+    # Hand-written, with comments and literals
+    "/* request_id: 12345 */ SELECT SingerId, FirstName FROM Singers "
+    "WHERE LastName = 'O''Brien' -- by last name\n",
+    "@{FORCE_INDEX=SingersByLastName} SELECT SingerId FROM Singers "
+    "WHERE LastName = %s",
+]
+
+SCRIPT = (
+    "CREATE TABLE Singers (\n"
+    "  SingerId INT64 NOT NULL,\n"
+    "  FirstName STRING(1024),\n"
+    "  FullName STRING(2048) AS (ARRAY_TO_STRING([FirstName, 'x;y'], ' ')) STORED,\n"
+    ") PRIMARY KEY (SingerId);\n"
+    "CREATE INDEX SingersByFirstName ON Singers(FirstName);\n"
+    "-- Albums\n"
+    "CREATE TABLE Albums (\n"
+    "  SingerId INT64 NOT NULL,\n"
+    "  AlbumId INT64 NOT NULL,\n"
+    ") PRIMARY KEY (SingerId, AlbumId),\n"
+    "  INTERLEAVE IN PARENT Singers ON DELETE CASCADE;\n"
+)
+
+_RE_DDL = re.compile(r"^\s*(CREATE|ALTER|DROP|GRANT|REVOKE)", re.IGNORECASE)
+_RE_IS_INSERT = re.compile(r"^\s*(INSERT)", re.IGNORECASE)
+_RE_NON_UPDATE = re.compile(r"^\W*(SELECT)", re.IGNORECASE)
+_RE_WITH = re.compile(r"^\s*(WITH)", re.IGNORECASE)
+_RE_PYFORMAT = re.compile(r"(%s|%\([^\(\)]+\)s)+", re.DOTALL)
+
+
+def _sqlparse_analyze(sql):
+    """The analysis of ``Cursor.execute`` before the lexer."""
+    query = sqlparse.format(sql, strip_comments=True).strip()
+    if _RE_DDL.match(query):
+        class_ = parse_utils.STMT_DDL
+    elif _RE_IS_INSERT.match(query):
+        class_ = parse_utils.STMT_INSERT
+    elif _RE_NON_UPDATE.match(query) or _RE_WITH.match(query):
+        class_ = parse_utils.STMT_NON_UPDATING
+    else:
+        class_ = parse_utils.STMT_UPDATING
+        statement = sqlparse.parse(sql)[0]
+        if not any(isinstance(token, sqlparse.sql.Where) for token in statement):
+            sql += " WHERE 1=1"
+    for i, pyfmt in enumerate(_RE_PYFORMAT.findall(sql)):
+        sql = sql.replace(pyfmt, "@a%d" % i, 1)
+    return class_, sql
+
+
+def _lexer_analyze(sql):
+    """The analysis of ``Cursor.execute``, bypassing the statement cache."""
+    class_ = parse_utils.classify_stmt.__wrapped__(sql)
+    if class_ == parse_utils.STMT_UPDATING:
+        sql = parse_utils.ensure_where_clause.__wrapped__(sql)
+    return class_, parse_utils._translate_pyformat.__wrapped__(sql).named_sql
+
+
+def _bench(name, old, new, count, repeat):
+    """Time both implementations, each running over the corpus."""
+    old_time = min(timeit.repeat(old, number=1, repeat=repeat))
+    new_time = min(timeit.repeat(new, number=1, repeat=repeat))
+    print(
+        "{:<12}{:>14,.0f}{:>14,.0f}{:>10.1f}x".format(
+            name, count / old_time, count / new_time, old_time / new_time
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=100,
+        help="Copies of the statement corpus analyzed per run.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for sql in STATEMENTS:
+        # The former classification took queries with hints for DML.
+        if not sql.startswith("@{"):
+            assert _sqlparse_analyze(sql)[0] == _lexer_analyze(sql)[0], sql
+    # sqlparse keeps the comments preceding a statement.
+    assert len(sqlparse.split(SCRIPT)) == len(_lexer.split_statements(SCRIPT))
+
+    statements = STATEMENTS * args.copies
+    scripts = [SCRIPT] * args.copies
+
+    print(
+        "{:<12}{:>14}{:>14}{:>11}".format(
+            "analysis", "sqlparse/s", "lexer/s", "speedup"
+        )
+    )
+    _bench(
+        "execute",
+        lambda: [_sqlparse_analyze(sql) for sql in statements],
+        lambda: [_lexer_analyze(sql) for sql in statements],
+        len(statements),
+        args.repeat,
+    )
+    _bench(
+        "split",
+        lambda: [sqlparse.split(script) for script in scripts],
+        lambda: [_lexer.split_statements(script) for script in scripts],
+        len(scripts),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
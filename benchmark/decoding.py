@@ -0,0 +1,127 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for decoding result set values.
+
+Compares, for each type code, the per-cell ``_parse_value_pb`` dispatch with
+the decoder plan compiled once per result set by ``_make_row_decoders``.
+No Cloud Spanner instance is required.
+
+Usage:
+
+  $ python benchmark/decoding.py --rows 100000 --repeat 5
+
+"""
+
+import argparse
+import datetime
+import decimal
+import timeit
+
+from google.cloud.spanner_v1 import StructType
+from google.cloud.spanner_v1 import Type
+from google.cloud.spanner_v1 import TypeCode
+from google.cloud.spanner_v1._helpers import _make_row_decoders
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1._helpers import _parse_value_pb
+
+
+def _sample_types():
+    """Return (name, type, sample value) triples to benchmark."""
+    int64 = Type(code=TypeCode.INT64)
+    return [
+        ("BOOL", Type(code=TypeCode.BOOL), True),
+        ("INT64", int64, 1234567890),
+        ("FLOAT64", Type(code=TypeCode.FLOAT64), 3.25),
+        ("STRING", Type(code=TypeCode.STRING), "phred phlyntstone"),
+        ("BYTES", Type(code=TypeCode.BYTES), b"cGhyZWQgcGhseW50c3RvbmU="),
+        ("DATE", Type(code=TypeCode.DATE), datetime.date(2023, 6, 1)),
+        (
+            "TIMESTAMP",
+            Type(code=TypeCode.TIMESTAMP),
+            datetime.datetime(2023, 6, 1, 12, 30, tzinfo=datetime.timezone.utc),
+        ),
+        ("NUMERIC", Type(code=TypeCode.NUMERIC), decimal.Decimal("12345.678")),
+        (
+            "ARRAY<INT64>",
+            Type(code=TypeCode.ARRAY, array_element_type=int64),
+            [1, 2, 3, 4],
+        ),
+        (
+            "STRUCT<INT64, STRING>",
+            Type(
+                code=TypeCode.STRUCT,
+                struct_type=StructType(
+                    fields=[
+                        StructType.Field(name="a", type_=int64),
+                        StructType.Field(name="b", type_=Type(code=TypeCode.STRING)),
+                    ]
+                ),
+            ),
+            [1, "one"],
+        ),
+    ]
+
+
+def _bench(name, field_type, sample, rows, null_ratio, repeat):
+    """Time both decoding paths over ``rows`` values of one type."""
+    null_every = int(1 / null_ratio) if null_ratio else 0
+    value_pbs = [
+        _make_value_pb(None if null_every and i % null_every == 0 else sample)
+        for i in range(rows)
+    ]
+    # Result set metadata is consumed as raw protobuf, as in StreamedResultSet.
+    row_type = StructType.pb(
+        StructType(fields=[StructType.Field(name="c", type_=field_type)])
+    )
+    field_type = row_type.fields[0].type_
+
+    def per_cell():
+        return [_parse_value_pb(value_pb, field_type) for value_pb in value_pbs]
+
+    def planned():
+        (decoder,) = _make_row_decoders(row_type)
+        return [decoder(value_pb) for value_pb in value_pbs]
+
+    assert per_cell() == planned()
+    old = min(timeit.repeat(per_cell, number=1, repeat=repeat))
+    new = min(timeit.repeat(planned, number=1, repeat=repeat))
+    print(
+        "{:<24}{:>14,.0f}{:>14,.0f}{:>10.2f}x".format(
+            name, rows / old, rows / new, old / new
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--null-ratio",
+        type=float,
+        default=0.0,
+        help="Fraction of NULL cells in each column.",
+    )
+    args = parser.parse_args()
+
+    print(
+        "{:<24}{:>14}{:>14}{:>11}".format("type", "per-cell/s", "planned/s", "speedup")
+    )
+    for name, field_type, sample in _sample_types():
+        _bench(name, field_type, sample, args.rows, args.null_ratio, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,11 @@ from google.cloud.spanner_v1 import KeySet
 from google.cloud.spanner_v1 import AbstractSessionPool
 from google.cloud.spanner_v1 import BurstyPool
 from google.cloud.spanner_v1 import FixedSizePool
+from google.cloud.spanner_v1 import MultiplexedSessionPool
 from google.cloud.spanner_v1 import PingingPool
+from google.cloud.spanner_v1 import SessionLeak
+from google.cloud.spanner_v1 import SessionPoolMaintainer
+from google.cloud.spanner_v1 import SessionPoolStats
 from google.cloud.spanner_v1 import TransactionPingingPool
 from google.cloud.spanner_v1 import COMMIT_TIMESTAMP
 
@@ -40,7 +44,11 @@ __all__ = (
     "AbstractSessionPool",
     "BurstyPool",
     "FixedSizePool",
+    "MultiplexedSessionPool",
     "PingingPool",
+    "SessionLeak",
+    "SessionPoolMaintainer",
+    "SessionPoolStats",
     "TransactionPingingPool",
     # local
     "COMMIT_TIMESTAMP",
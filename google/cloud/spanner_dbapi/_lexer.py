@@ -0,0 +1,273 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Minimal SQL lexer, for the analysis done by the DB-API.
+
+Tokenizes just enough of GoogleSQL and of the PostgreSQL dialect to split
+scripts into statements, find their leading keyword, their top-level
+``WHERE`` clause and their pyformat placeholders:  comments, quoted
+identifiers, string and bytes literals and statement hints are skipped as
+whole tokens.
+
+The dialects differ in:
+
+- comments:  GoogleSQL also starts them with ``#``, which is an operator
+  in PostgreSQL, and PostgreSQL ``/* */`` comments nest;
+
+- literals:  GoogleSQL has raw, bytes and triple-quoted literals, with
+  backslash escapes unless raw, and backquoted identifiers.  PostgreSQL
+  literals double their quote character, only ``E'...'`` strings have
+  backslash escapes, and dollar-quoted strings have no escapes at all.
+"""
+
+import collections
+import re
+
+from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+# Tokens of both dialects, following the comments and literals.
+_COMMON_TOKENS = (
+    r"(?P<escape>%%)",
+    r"(?P<placeholder>%(?:s|\([^()]*\)s))",
+    r"(?P<hint>@\{[^}]*\}?)",
+    r"(?P<param>@\w+)",
+    r"(?P<word>\w+)",
+    r"(?P<open>\()",
+    r"(?P<close>\))",
+    r"(?P<end>;)",
+    r"(?P<other>[^\w\s'\"`$%@#;()/-]+|.)",
+)
+
+_GOOGLE_SQL_TOKENS = re.compile(
+    "|".join(
+        (
+            r"(?P<space>\s+)",
+            r"(?P<comment>(?:--|#)[^\n]*|/\*.*?(?:\*/|\Z))",
+            # String and bytes literals, optionally raw, and quoted
+            # identifiers.  An unterminated literal extends to the end.
+            r"(?P<quoted>(?:[rR][bB]?|[bB][rR]?)?"
+            r"(?:'''(?:[^\\]|\\.)*?(?:'''|\Z)"
+            r'|"""(?:[^\\]|\\.)*?(?:"""|\Z)'
+            r"|'(?:[^'\\]|\\.)*(?:'|\Z)"
+            r'|"(?:[^"\\]|\\.)*(?:"|\Z))'
+            r"|`(?:[^`\\]|\\.)*(?:`|\Z))",
+        )
+        + _COMMON_TOKENS
+    ),
+    re.DOTALL,
+)
+
+_POSTGRESQL_TOKENS = re.compile(
+    "|".join(
+        (
+            r"(?P<space>\s+)",
+            r"(?P<comment>--[^\n]*)",
+            # Nested comments are matched by :func:`_nested_comment_end`.
+            r"(?P<nested_comment>/\*)",
+            # Escape strings, standard strings and quoted identifiers,
+            # doubling their quote, and dollar-quoted strings.  An
+            # unterminated literal extends to the end.
+            r"(?P<quoted>[eE]'(?:[^'\\]|\\.|'')*(?:'|\Z)"
+            r"|'(?:[^']|'')*(?:'|\Z)"
+            r'|"(?:[^"]|"")*(?:"|\Z)'
+            r"|\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z))",
+        )
+        + _COMMON_TOKENS
+    ),
+    re.DOTALL,
+)
+
+_COMMENT_DELIMITERS = re.compile(r"/\*|\*/")
+
+_SKIPPED = ("space", "comment")
+
+Statement = collections.namedtuple(
+    "Statement", ["start", "end", "keyword", "has_where", "placeholders"]
+)
+Statement.__doc__ = """A statement found by :func:`scan_statements`.
+
+:type start: int
+:param start: offset of the first token of the statement.
+
+:type end: int
+:param end: offset following the last token of the statement, excluding
+            trailing comments and the terminating semicolon.
+
+:type keyword: str
+:param keyword: the first keyword of the statement, in upper case, or None.
+
+:type has_where: bool
+:param has_where: whether a ``WHERE`` clause is found outside parentheses.
+
+:type placeholders: tuple
+:param placeholders: ``(start, end)`` offsets of the pyformat placeholders
+                     (``%s`` or ``%(name)s``), outside literals and
+                     comments.
+"""
+
+
+def _nested_comment_end(sql, start):
+    """Helper for :func:`_tokenize`:  find the end of a nested comment.
+
+    :type sql: str
+    :param sql: the SQL text.
+
+    :type start: int
+    :param start: offset of the ``/*`` opening the comment.
+
+    :rtype: int
+    :returns: offset following the matching ``*/``, or the length of
+              ``sql`` if the comment is not terminated.
+    """
+    depth = 0
+    for match in _COMMENT_DELIMITERS.finditer(sql, start):
+        if match.group() == "/*":
+            depth += 1
+        else:
+            depth -= 1
+            if not depth:
+                return match.end()
+    return len(sql)
+
+
+def _tokenize(sql, dialect):
+    """Split SQL text into tokens.
+
+    :type sql: str
+    :param sql: the SQL text.
+
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: the dialect of ``sql``;  GoogleSQL unless
+                    ``DatabaseDialect.POSTGRESQL``.
+
+    :rtype: iterator of tuple
+    :returns: the ``(kind, start, end)`` of each token, ``kind`` being the
+              name of its group in the token patterns.
+    """
+    if dialect == DatabaseDialect.POSTGRESQL:
+        pattern = _POSTGRESQL_TOKENS
+    else:
+        pattern = _GOOGLE_SQL_TOKENS
+    pos, length = 0, len(sql)
+    while pos < length:
+        match = pattern.match(sql, pos)
+        kind, end = match.lastgroup, match.end()
+        if kind == "nested_comment":
+            kind, end = "comment", _nested_comment_end(sql, pos)
+        yield kind, pos, end
+        pos = end
+
+
+def scan_statements(sql, dialect=None):
+    """Analyze the statements of a SQL script, in one pass.
+
+    :type sql: str
+    :param sql: one or more statements, separated by semicolons.
+
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of ``sql``.  Defaults to
+                    GoogleSQL.
+
+    :rtype: list of :class:`Statement`
+    :returns: the non-empty statements of ``sql``.
+    """
+    statements = []
+    start = end = keyword = None
+    has_where = False
+    depth = 0
+    placeholders = []
+
+    for kind, token_start, token_end in _tokenize(sql, dialect):
+        if kind in _SKIPPED:
+            continue
+        if kind == "end":
+            if start is not None:
+                statements.append(
+                    Statement(start, end, keyword, has_where, tuple(placeholders))
+                )
+            start = end = keyword = None
+            has_where = False
+            depth = 0
+            placeholders = []
+            continue
+
+        if start is None:
+            start = token_start
+        end = token_end
+        if kind == "word":
+            if keyword is None:
+                keyword = sql[token_start:token_end].upper()
+            elif not depth and not has_where and token_end - token_start == 5:
+                has_where = sql[token_start:token_end].upper() == "WHERE"
+        elif kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth = max(depth - 1, 0)
+        elif kind == "placeholder":
+            placeholders.append((token_start, token_end))
+
+    if start is not None:
+        statements.append(
+            Statement(start, end, keyword, has_where, tuple(placeholders))
+        )
+    return statements
+
+
+def leading_keyword(sql, dialect=None):
+    """Find the first keyword of a SQL statement.
+
+    Comments, opening parentheses and statement hints before it are skipped.
+    Unlike :func:`scan_statements`, stops at the keyword.
+
+    :type sql: str
+    :param sql: a SQL statement.
+
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of ``sql``.  Defaults to
+                    GoogleSQL.
+
+    :rtype: str
+    :returns: the keyword, in upper case, or None if the statement does not
+              start with one.
+    """
+    for kind, start, end in _tokenize(sql, dialect):
+        if kind == "word":
+            return sql[start:end].upper()
+        if kind not in _SKIPPED and kind not in ("open", "hint"):
+            return None
+    return None
+
+
+def split_statements(sql, dialect=None):
+    """Split a SQL script into statements.
+
+    :type sql: str
+    :param sql: statements separated by semicolons.
+
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of ``sql``.  Defaults to
+                    GoogleSQL.
+
+    :rtype: list of str
+    :returns: the text of each statement, without surrounding whitespace and
+              comments, or terminating semicolon.
+    """
+    return [
+        sql[statement.start : statement.end]
+        for statement in scan_statements(sql, dialect)
+    ]
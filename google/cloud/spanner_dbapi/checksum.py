@@ -14,11 +14,78 @@
 
 """API to calculate checksums of SQL statements results."""
 
+import copyreg
+import datetime
+import decimal
 import hashlib
+import io
+import itertools
 import pickle
 
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from google.cloud.spanner_v1 import JsonObject
+from google.cloud.spanner_v1.streamed import StreamedResultSet
 from google.cloud.spanner_dbapi.exceptions import RetryAborted
 
+try:
+    import xxhash
+
+    HAS_XXHASH = hasattr(xxhash, "xxh3_128")
+except ImportError:  # pragma: NO COVER
+    HAS_XXHASH = False
+
+CHECKSUM_SHA256 = "sha256"
+# Non-cryptographic 128-bit hash, requires the ``xxhash`` package.
+CHECKSUM_XXH3_128 = "xxh3-128"
+
+_HASH_FACTORIES = {CHECKSUM_SHA256: hashlib.sha256}
+if HAS_XXHASH:
+    _HASH_FACTORIES[CHECKSUM_XXH3_128] = xxhash.xxh3_128
+
+# Encoded results are hashed by chunks of about this size.
+_FLUSH_BYTES = 64 * 1024
+# Intermediate digests are kept every so many results, for the replay of a
+# statement to stop at the first mismatch.
+_CHECKPOINT_RESULTS = 1000
+
+_MISMATCH_MESSAGE = (
+    "The transaction was aborted and could not be retried due to a "
+    "concurrent modification."
+)
+
+
+def _reduce_datetime(value):
+    # Unlike pickling its state, keeps the nanoseconds of a
+    # DatetimeWithNanoseconds, and is several times faster.
+    return type(value), (
+        "%s/%d" % (value.isoformat(), getattr(value, "nanosecond", 0)),
+    )
+
+
+def _reduce_as_str(value):
+    return type(value), (str(value),)
+
+
+def _reduce_json(value):
+    # A null JSON value is an empty JsonObject.
+    return JsonObject, ("null" if value._is_null else repr(value),)
+
+
+# Values of rows are pickled:  the types of cells which are slow to pickle
+# are first converted to strings, tagged with their type, so that e.g. a
+# DATE is not encoded as a STRING of the same text.  The encoding is only
+# hashed, never unpickled.  Reducers are looked up by exact type.
+_DISPATCH_TABLE = copyreg.dispatch_table.copy()
+_DISPATCH_TABLE.update(
+    {
+        datetime.datetime: _reduce_datetime,
+        DatetimeWithNanoseconds: _reduce_datetime,
+        datetime.date: _reduce_as_str,
+        decimal.Decimal: _reduce_as_str,
+        JsonObject: _reduce_json,
+    }
+)
+
 
 class ResultsChecksum:
     """Cumulative checksum.
@@ -29,12 +96,75 @@ class ResultsChecksum:
     These checksums are used while retrying an aborted
     transaction to check if the results of a retried transaction
     are equal to the results of the original transaction.
+
+    Results are pickled into a buffer, hashed by chunks.  Rows are
+    encoded as tuples, as returned by the cursor, even if received as
+    lists from the result set.
+
+    :type algorithm: str
+    :param algorithm: (Optional) hash function: :data:`CHECKSUM_SHA256`
+                      (the default) or, if the ``xxhash`` package is
+                      installed, :data:`CHECKSUM_XXH3_128`.
+
+    :raises: :exc:`ValueError` if the algorithm is not available.
     """
 
-    def __init__(self):
-        self.checksum = hashlib.sha256()
+    def __init__(self, algorithm=None):
+        if algorithm is None:
+            algorithm = CHECKSUM_SHA256
+        try:
+            hash_factory = _HASH_FACTORIES[algorithm]
+        except KeyError:
+            raise ValueError("Unavailable checksum algorithm: %r" % (algorithm,))
+        self._hash = hash_factory()
+        # Encoder of the results not hashed yet, created on demand.
+        self._buffer = None
+        self._pickler = None
+        # (count, digest) pairs, about every _CHECKPOINT_RESULTS results.
+        self._checkpoints = []
         self.count = 0  # counter of consumed results
 
+    @property
+    def checksum(self):
+        """Hash of the results consumed so far.
+
+        :rtype: hash object, see :mod:`hashlib`
+        :returns: the hash, updated with all the consumed results.
+        """
+        self.compact()
+        return self._hash
+
+    def compact(self):
+        """Hash the buffered results, and release the memory used to encode
+        them.
+
+        Called once no more results are expected;  consuming more results
+        afterwards is still possible.
+        """
+        if self._buffer is not None:
+            self._hash.update(self._buffer.getvalue())
+            self._buffer = self._pickler = None
+
+    def _encoder(self):
+        """Helper for :meth:`consume_result` / :meth:`consume_results`."""
+        if self._pickler is None:
+            self._buffer = io.BytesIO()
+            self._pickler = pickle.Pickler(self._buffer, protocol=4)
+            self._pickler.dispatch_table = _DISPATCH_TABLE
+            # Without memo, the encoding of a row only depends on its values,
+            # not on which of them happen to be the same object.
+            self._pickler.fast = True
+        return self._pickler
+
+    def _consumed(self, count):
+        """Helper for :meth:`consume_result` / :meth:`consume_results`."""
+        last_checkpoint = self._checkpoints[-1][0] if self._checkpoints else 0
+        self.count += count
+        if self.count - last_checkpoint >= _CHECKPOINT_RESULTS:
+            self._checkpoints.append((self.count, self.checksum.digest()))
+        elif self._buffer.tell() >= _FLUSH_BYTES:
+            self.compact()
+
     def __len__(self):
         """Return the number of consumed results.
 
@@ -54,11 +184,31 @@ class ResultsChecksum:
     def consume_result(self, result):
         """Add the given result into the checksum.
 
-        :type result: Union[int, list]
+        :type result: Union[int, list, tuple]
         :param result: Streamed row or row count from an UPDATE operation.
         """
-        self.checksum.update(pickle.dumps(result))
-        self.count += 1
+        if type(result) is list:
+            result = tuple(result)
+        self._encoder().dump(result)
+        self._consumed(1)
+
+    def consume_results(self, results):
+        """Add the given results into the checksum.
+
+        The checksum is the same as if each result was added with
+        :meth:`consume_result`.
+
+        :type results: iterable
+        :param results: Streamed rows.
+        """
+        dump = self._encoder().dump
+        count = 0
+        for result in results:
+            if type(result) is list:
+                result = tuple(result)
+            dump(result)
+            count += 1
+        self._consumed(count)
 
 
 def _compare_checksums(original, retried):
@@ -75,6 +225,52 @@ def _compare_checksums(original, retried):
     :raises: :exc:`google.cloud.spanner_dbapi.exceptions.RetryAborted` in case if checksums are not equal.
     """
     if retried != original:
-        raise RetryAborted(
-            "The transaction was aborted and could not be retried due to a concurrent modification."
+        raise RetryAborted(_MISMATCH_MESSAGE)
+
+
+def _replay_results(original, retried, results, complete=True):
+    """Checksum the results of a replayed statement, as they are streamed.
+
+    The replayed results are compared to the original ones at each
+    checkpoint of ``original``:  a mismatch stops the replay without reading
+    the remaining results.  The caller compares the final checksums with
+    :func:`_compare_checksums`.
+
+    :type original: :class:`~google.cloud.spanner_dbapi.checksum.ResultsChecksum`
+    :param original: results checksum of the original transaction.
+
+    :type retried: :class:`~google.cloud.spanner_dbapi.checksum.ResultsChecksum`
+    :param retried: results checksum of the retried transaction, updated.
+
+    :type results: iterable
+    :param results: rows of the replayed statement.  A
+                    :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+                    is read by partial result set.
+
+    :type complete: bool
+    :param complete: (Optional) whether all the results of the original
+                     statement were read.  If False, as for the statement
+                     interrupted by the abort, the results past those
+                     consumed in ``original`` are left unread.
+
+    :raises: :exc:`google.cloud.spanner_dbapi.exceptions.RetryAborted` in case
+             a checkpoint does not match.
+    """
+    if isinstance(results, StreamedResultSet):
+        results = itertools.chain.from_iterable(results.iter_batches())
+    else:
+        results = iter(results)
+
+    for count, digest in original._checkpoints:
+        retried.consume_results(
+            itertools.islice(results, max(count - retried.count, 0))
         )
+        if retried.count < count or retried.checksum.digest() != digest:
+            raise RetryAborted(_MISMATCH_MESSAGE)
+
+    remaining = max(original.count - retried.count, 0)
+    if complete:
+        # A result beyond the original ones is enough for the checksums
+        # to differ.
+        remaining += 1
+    retried.consume_results(itertools.islice(results, remaining))
@@ -14,6 +14,7 @@
 
 """DB-API Connection for the Google Cloud Spanner."""
 
+from collections import namedtuple
 import time
 import warnings
 
@@ -21,12 +22,14 @@ from google.api_core.exceptions import Aborted
 from google.api_core.gapic_v1.client_info import ClientInfo
 from google.cloud import spanner_v1 as spanner
 from google.cloud.spanner_v1 import RequestOptions
-from google.cloud.spanner_v1.session import _get_retry_delay
+from google.cloud.spanner_v1.retry_policy import DEFAULT_ABORT_RETRY_POLICY
 from google.cloud.spanner_v1.snapshot import Snapshot
 
 from google.cloud.spanner_dbapi.checksum import _compare_checksums
+from google.cloud.spanner_dbapi.checksum import _replay_results
 from google.cloud.spanner_dbapi.checksum import ResultsChecksum
 from google.cloud.spanner_dbapi.cursor import Cursor
+from google.cloud.spanner_dbapi.cursor import Statement
 from google.cloud.spanner_dbapi.exceptions import InterfaceError, OperationalError
 from google.cloud.spanner_dbapi.version import DEFAULT_USER_AGENT
 from google.cloud.spanner_dbapi.version import PY_VERSION
@@ -37,6 +40,22 @@ from google.rpc.code_pb2 import ABORTED
 AUTOCOMMIT_MODE_WARNING = "This method is non-operational in autocommit mode"
 MAX_INTERNAL_RETRIES = 50
 
+ReplayStats = namedtuple("ReplayStats", ["replays", "statements", "rows", "seconds"])
+ReplayStats.__doc__ = """Cost of replaying aborted transactions on a connection.
+
+:type replays: int
+:param replays: number of attempts to replay a transaction.
+
+:type statements: int
+:param statements: number of statements executed again.
+
+:type rows: int
+:param rows: number of result rows read again.
+
+:type seconds: float
+:param seconds: time spent replaying.
+"""
+
 
 def check_not_closed(function):
     """`Connection` class methods decorator.
@@ -91,8 +110,10 @@ class Connection:
         self._transaction = None
         self._session = None
         self._snapshot = None
-        # SQL statements, which were executed
-        # within the current transaction
+        # SQL statements, which were executed within the current
+        # transaction.  Their parameters are kept, as the statements are
+        # executed again to retry an aborted transaction, but only a digest
+        # of their results.
         self._statements = []
 
         self.is_closed = False
@@ -104,6 +125,18 @@ class Connection:
         self._read_only = read_only
         self._staleness = None
         self.request_priority = None
+        # AbortRetryPolicy delaying retries of aborted transactions;  the
+        # default policy is used if None.
+        self.retry_policy = None
+        # Whether the results of statements run in read-write transactions
+        # are checksummed, to verify that a retried transaction returned the
+        # same results as the aborted one.  Disabling it saves hashing every
+        # row, at the risk of silently replaying a transaction which read
+        # concurrently modified data.
+        self.checksum_results = True
+        # Hash function of the checksums, see ResultsChecksum.
+        self.checksum_algorithm = None
+        self._replay_stats = ReplayStats(0, 0, 0, 0.0)
 
     @property
     def autocommit(self):
@@ -197,6 +230,14 @@ class Connection:
         self.request_priority = None
         return req_opts
 
+    @property
+    def replay_stats(self):
+        """Cumulative cost of the replays of aborted transactions.
+
+        :rtype: :class:`ReplayStats`
+        """
+        return self._replay_stats
+
     @property
     def staleness(self):
         """Current read staleness option value of this `Connection`.
@@ -266,10 +307,18 @@ class Connection:
         will be re-executed in new one. Results checksums of the
         original statements and the retried ones will be compared.
 
+        Retries stop once the deadline of :attr:`retry_policy` (by default
+        30 seconds after the first retry) has passed, or after
+        ``MAX_INTERNAL_RETRIES`` attempts.
+
         :raises: :class:`google.cloud.spanner_dbapi.exceptions.RetryAborted`
             If results checksum of the retried statement is
             not equal to the checksum of the original one.
+        :raises: :class:`google.api_core.exceptions.Aborted`
+            If the transaction is still aborted once retries stop.
         """
+        retry_policy = self.retry_policy or DEFAULT_ABORT_RETRY_POLICY
+        deadline = retry_policy.deadline()
         attempt = 0
         while True:
             self._transaction = None
@@ -278,10 +327,11 @@ class Connection:
                 raise
 
             try:
+                retry_policy.record_attempt()
                 self._rerun_previous_statements()
                 break
             except Aborted as exc:
-                delay = _get_retry_delay(exc.errors[0], attempt)
+                delay = retry_policy.retry_delay(exc, deadline, attempt)
                 if delay:
                     time.sleep(delay)
 
@@ -290,42 +340,57 @@ class Connection:
         Helper to run all the remembered statements
         from the last transaction.
         """
-        for statement in self._statements:
-            if isinstance(statement, list):
-                statements, checksum = statement
+        started = time.monotonic()
+        statements = rows = 0
+        last = len(self._statements) - 1
+        try:
+            for index, statement in enumerate(self._statements):
+                statements += 1
+                if not isinstance(statement, Statement):
+                    batch_statements, checksum = statement
 
-                transaction = self.transaction_checkout()
-                status, res = transaction.batch_update(statements)
+                    transaction = self.transaction_checkout()
+                    status, res = transaction.batch_update(batch_statements)
 
-                if status.code == ABORTED:
-                    self.connection._transaction = None
-                    raise Aborted(status.details)
+                    if status.code == ABORTED:
+                        self._transaction = None
+                        raise Aborted(status.details)
 
-                retried_checksum = ResultsChecksum()
-                retried_checksum.consume_result(res)
-                retried_checksum.consume_result(status.code)
+                    if not self.checksum_results:
+                        continue
+
+                    retried_checksum = ResultsChecksum(self.checksum_algorithm)
+                    retried_checksum.consume_result(res)
+                    retried_checksum.consume_result(status.code)
+
+                    _compare_checksums(checksum, retried_checksum)
+                    continue
 
-                _compare_checksums(checksum, retried_checksum)
-            else:
                 res_iter, retried_checksum = self.run_statement(statement, retried=True)
-                # executing all the completed statements
-                if statement != self._statements[-1]:
-                    for res in res_iter:
-                        retried_checksum.consume_result(res)
-
-                    _compare_checksums(statement.checksum, retried_checksum)
-                # executing the failed statement
-                else:
-                    # streaming up to the failed result or
-                    # to the end of the streaming iterator
-                    while len(retried_checksum) < len(statement.checksum):
-                        try:
-                            res = next(iter(res_iter))
-                            retried_checksum.consume_result(res)
-                        except StopIteration:
-                            break
-
-                    _compare_checksums(statement.checksum, retried_checksum)
+                # the failed statement is only replayed up to
+                # the results fetched before the abort
+                complete = index != last
+                if not self.checksum_results:
+                    if complete:
+                        for _ in res_iter:
+                            rows += 1
+                    continue
+
+                try:
+                    _replay_results(
+                        statement.checksum, retried_checksum, res_iter, complete
+                    )
+                finally:
+                    rows += len(retried_checksum)
+                _compare_checksums(statement.checksum, retried_checksum)
+        finally:
+            stats = self._replay_stats
+            self._replay_stats = ReplayStats(
+                stats.replays + 1,
+                stats.statements + statements,
+                stats.rows + rows,
+                stats.seconds + time.monotonic() - started,
+            )
 
     def transaction_checkout(self):
         """Get a Cloud Spanner transaction.
@@ -455,6 +520,10 @@ class Connection:
         """
         transaction = self.transaction_checkout()
         if not retried:
+            if self._statements and isinstance(self._statements[-1], Statement):
+                # Only the digest of the results of the previous statement
+                # is needed from now on, unless more are fetched.
+                self._statements[-1].checksum.compact()
             self._statements.append(statement)
 
         return (
@@ -464,7 +533,7 @@ class Connection:
                 param_types=statement.param_types,
                 request_options=self.request_options,
             ),
-            ResultsChecksum() if retried else statement.checksum,
+            ResultsChecksum(self.checksum_algorithm) if retried else statement.checksum,
         )
 
     @check_not_closed
@@ -16,8 +16,6 @@
 
 from collections import namedtuple
 
-import sqlparse
-
 from google.api_core.exceptions import Aborted
 from google.api_core.exceptions import AlreadyExists
 from google.api_core.exceptions import FailedPrecondition
@@ -37,6 +35,7 @@ from google.cloud.spanner_dbapi._helpers import ColumnInfo
 from google.cloud.spanner_dbapi._helpers import CODE_TO_DISPLAY_SIZE
 
 from google.cloud.spanner_dbapi import parse_utils
+from google.cloud.spanner_dbapi._lexer import split_statements
 from google.cloud.spanner_dbapi.parse_utils import get_param_types
 from google.cloud.spanner_dbapi.parse_utils import sql_pyformat_args_to_spanner
 from google.cloud.spanner_dbapi.utils import PeekIterator
@@ -153,6 +152,19 @@ class Cursor(object):
 
         return _UNSET_COUNT
 
+    @property
+    def _dialect(self):
+        """Dialect of the connection's database, for parsing statements.
+
+        :rtype:
+            :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+        :returns: the dialect, or None if the connection has no database.
+        """
+        database = self.connection.database
+        if database is None:
+            return None
+        return database.database_dialect
+
     @check_not_closed
     def callproc(self, procname, args=None):
         """A no-op, raising an error if the cursor or connection is closed."""
@@ -207,13 +219,12 @@ class Cursor(object):
                  present in the operation.
         """
         statements = []
-        for ddl in sqlparse.split(sql):
-            if ddl:
-                ddl = ddl.rstrip(";")
-                if parse_utils.classify_stmt(ddl) != parse_utils.STMT_DDL:
-                    raise ValueError("Only DDL statements may be batched.")
+        dialect = self._dialect
+        for ddl in split_statements(sql, dialect):
+            if parse_utils.classify_stmt(ddl, dialect) != parse_utils.STMT_DDL:
+                raise ValueError("Only DDL statements may be batched.")
 
-                statements.append(ddl)
+            statements.append(ddl)
 
         # Only queue DDL statements if they are all correctly classified.
         self.connection._ddl_statements.extend(statements)
@@ -239,7 +250,8 @@ class Cursor(object):
                 self._handle_DQL(sql, args or None)
                 return
 
-            class_ = parse_utils.classify_stmt(sql)
+            dialect = self._dialect
+            class_ = parse_utils.classify_stmt(sql, dialect)
             if class_ == parse_utils.STMT_DDL:
                 self._batch_DDLs(sql)
                 if self.connection.autocommit:
@@ -252,16 +264,16 @@ class Cursor(object):
             self.connection.run_prior_DDL_statements()
 
             if class_ == parse_utils.STMT_UPDATING:
-                sql = parse_utils.ensure_where_clause(sql)
+                sql = parse_utils.ensure_where_clause(sql, dialect)
 
-            sql, args = sql_pyformat_args_to_spanner(sql, args or None)
+            sql, args = sql_pyformat_args_to_spanner(sql, args or None, dialect)
 
             if not self.connection.autocommit:
                 statement = Statement(
                     sql,
                     args,
                     get_param_types(args or None),
-                    ResultsChecksum(),
+                    ResultsChecksum(self.connection.checksum_algorithm),
                 )
 
                 (
@@ -309,7 +321,8 @@ class Cursor(object):
         self._result_set = None
         self._row_count = _UNSET_COUNT
 
-        class_ = parse_utils.classify_stmt(operation)
+        dialect = self._dialect
+        class_ = parse_utils.classify_stmt(operation, dialect)
         if class_ == parse_utils.STMT_DDL:
             raise ProgrammingError(
                 "Executing DDL statements with executemany() method is not allowed."
@@ -322,7 +335,7 @@ class Cursor(object):
 
             for params in seq_of_params:
                 sql, params = parse_utils.sql_pyformat_args_to_spanner(
-                    operation, params
+                    operation, params, dialect
                 )
                 statements.append((sql, params, get_param_types(params)))
 
@@ -337,7 +350,9 @@ class Cursor(object):
                     try:
                         transaction = self.connection.transaction_checkout()
 
-                        res_checksum = ResultsChecksum()
+                        res_checksum = ResultsChecksum(
+                            self.connection.checksum_algorithm
+                        )
                         if not retried:
                             self.connection._statements.append(
                                 (statements, res_checksum)
@@ -347,6 +362,8 @@ class Cursor(object):
                         many_result_set.add_iter(res)
                         res_checksum.consume_result(res)
                         res_checksum.consume_result(status.code)
+                        # All the results of a batch are in.
+                        res_checksum.compact()
                         total_row_count += sum([max(val, 0) for val in res])
 
                         if status.code == ABORTED:
@@ -368,14 +385,23 @@ class Cursor(object):
         self._result_set = many_result_set
         self._itr = many_result_set
 
+    def _consume_results(self, rows):
+        """Add the fetched rows into the checksum of the statement, if the
+        transaction may have to be retried."""
+        if (
+            not self.connection.autocommit
+            and not self.connection.read_only
+            and self.connection.checksum_results
+        ):
+            self._checksum.consume_results(rows)
+
     @check_not_closed
     def fetchone(self):
         """Fetch the next row of a query result set, returning a single
         sequence, or None when no more data is available."""
         try:
             res = next(self)
-            if not self.connection.autocommit and not self.connection.read_only:
-                self._checksum.consume_result(res)
+            self._consume_results((res,))
             return res
         except StopIteration:
             return
@@ -392,13 +418,15 @@ class Cursor(object):
         res = []
         try:
             for row in self:
-                if not self.connection.autocommit and not self.connection.read_only:
-                    self._checksum.consume_result(row)
                 res.append(row)
         except Aborted:
+            # The rows fetched so far are replayed by the retry.
+            self._consume_results(res)
             if not self.connection.read_only:
                 self.connection.retry_transaction()
                 return self.fetchall()
+        else:
+            self._consume_results(res)
 
         return res
 
@@ -420,17 +448,16 @@ class Cursor(object):
         items = []
         for _ in range(size):
             try:
-                res = next(self)
-                if not self.connection.autocommit and not self.connection.read_only:
-                    self._checksum.consume_result(res)
-                items.append(res)
+                items.append(next(self))
             except StopIteration:
                 break
             except Aborted:
+                self._consume_results(items)
                 if not self.connection.read_only:
                     self.connection.retry_transaction()
                     return self.fetchmany(size)
 
+        self._consume_results(items)
         return items
 
     def _handle_DQL_with_snapshot(self, snapshot, sql, params):
@@ -450,7 +477,9 @@ class Cursor(object):
     def _handle_DQL(self, sql, params):
         if self.connection.database is None:
             raise ValueError("Database needs to be passed for this operation")
-        sql, params = parse_utils.sql_pyformat_args_to_spanner(sql, params)
+        sql, params = parse_utils.sql_pyformat_args_to_spanner(
+            sql, params, self._dialect
+        )
         if self.connection.read_only and not self.connection.autocommit:
             # initiate or use the existing multi-use snapshot
             self._handle_DQL_with_snapshot(
@@ -14,14 +14,16 @@
 
 "SQL parsing and classification utils."
 
+import collections
 import datetime
 import decimal
+import functools
 import re
 
-import sqlparse
 from google.cloud import spanner_v1 as spanner
 from google.cloud.spanner_v1 import JsonObject
 
+from . import _lexer
 from .exceptions import Error
 from .types import DateStr, TimestampStr
 from .utils import sanitize_literals_for_upload
@@ -144,16 +146,14 @@ STMT_NON_UPDATING = "NON_UPDATING"
 STMT_UPDATING = "UPDATING"
 STMT_INSERT = "INSERT"
 
-# Heuristic for identifying statements that don't need to be run as updates.
-RE_NON_UPDATE = re.compile(r"^\W*(SELECT)", re.IGNORECASE)
-
-RE_WITH = re.compile(r"^\s*(WITH)", re.IGNORECASE)
-
 # DDL statements follow
 # https://cloud.google.com/spanner/docs/data-definition-language
-RE_DDL = re.compile(r"^\s*(CREATE|ALTER|DROP|GRANT|REVOKE)", re.IGNORECASE | re.DOTALL)
+DDL_KEYWORDS = frozenset(["CREATE", "ALTER", "DROP", "GRANT", "REVOKE"])
 
-RE_IS_INSERT = re.compile(r"^\s*(INSERT)", re.IGNORECASE | re.DOTALL)
+# Heuristic for identifying statements that don't need to be run as updates.
+# As of 13-March-2020, Cloud Spanner only supports WITH for DQL
+# statements and doesn't yet support WITH for DML statements.
+NON_UPDATING_KEYWORDS = frozenset(["SELECT", "WITH"])
 
 RE_INSERT = re.compile(
     # Only match the `INSERT INTO <table_name> (columns...)
@@ -171,39 +171,48 @@ RE_VALUES_PYFORMAT = re.compile(
     re.DOTALL,
 )
 
-RE_PYFORMAT = re.compile(r"(%s|%\([^\(\)]+\)s)+", re.DOTALL)
+# Applications, ORMs in particular, run the same statements over and over:
+# the analysis of the most recent ones is cached, keyed by the SQL text.
+STATEMENT_CACHE_SIZE = 1024
+
+
+def clear_statement_cache():
+    """Discard the cached analysis of SQL statements."""
+    classify_stmt.cache_clear()
+    ensure_where_clause.cache_clear()
+    _translate_pyformat.cache_clear()
 
 
-def classify_stmt(query):
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def classify_stmt(query, dialect=None):
     """Determine SQL query type.
 
     :type query: str
     :param query: A SQL query.
 
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of the database.  Defaults to
+                    GoogleSQL.
+
     :rtype: str
     :returns: The query type name.
     """
-    # sqlparse will strip Cloud Spanner comments,
-    # still, special commenting styles, like
-    # PostgreSQL dollar quoted comments are not
-    # supported and will not be stripped.
-    query = sqlparse.format(query, strip_comments=True).strip()
+    keyword = _lexer.leading_keyword(query, dialect)
 
-    if RE_DDL.match(query):
+    if keyword in DDL_KEYWORDS:
         return STMT_DDL
 
-    if RE_IS_INSERT.match(query):
+    if keyword == "INSERT":
         return STMT_INSERT
 
-    if RE_NON_UPDATE.match(query) or RE_WITH.match(query):
-        # As of 13-March-2020, Cloud Spanner only supports WITH for DQL
-        # statements and doesn't yet support WITH for DML statements.
+    if keyword in NON_UPDATING_KEYWORDS:
         return STMT_NON_UPDATING
 
     return STMT_UPDATING
 
 
-def sql_pyformat_args_to_spanner(sql, params):
+def sql_pyformat_args_to_spanner(sql, params, dialect=None):
     """
     Transform pyformat set SQL to named arguments for Cloud Spanner.
     It will also unescape previously escaped format specifiers
@@ -228,19 +237,25 @@ def sql_pyformat_args_to_spanner(sql, params):
     :type params: list
     :param params: A list of parameters.
 
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of the database.  Defaults to
+                    GoogleSQL.
+
     :rtype: tuple(str, dict)
     :returns: A tuple of the sanitized SQL and a dictionary of the named
               arguments.
     """
+    translation = _translate_pyformat(sql, dialect)
     if not params:
-        return sanitize_literals_for_upload(sql), None
+        return translation.sanitized_sql, None
 
-    found_pyformat_placeholders = RE_PYFORMAT.findall(sql)
+    found_pyformat_placeholders = translation.placeholders
     params_is_dict = isinstance(params, dict)
 
     if params_is_dict:
         if not found_pyformat_placeholders:
-            return sanitize_literals_for_upload(sql), params
+            return translation.sanitized_sql, params
     else:
         n_params = len(params) if params else 0
         n_matches = len(found_pyformat_placeholders)
@@ -248,7 +263,7 @@ def sql_pyformat_args_to_spanner(sql, params):
             raise Error(
                 "pyformat_args mismatch\ngot %d args from %s\n"
                 "want %d args in %s"
-                % (n_matches, found_pyformat_placeholders, n_params, params)
+                % (n_matches, list(found_pyformat_placeholders), n_params, params)
             )
 
     named_args = {}
@@ -259,7 +274,6 @@ def sql_pyformat_args_to_spanner(sql, params):
     # Case b) Params is a dict and the matches are %(value)s'
     for i, pyfmt in enumerate(found_pyformat_placeholders):
         key = "a%d" % i
-        sql = sql.replace(pyfmt, "@" + key, 1)
         if params_is_dict:
             # The '%(key)s' case, so interpolate it.
             resolved_value = pyfmt % params
@@ -267,7 +281,46 @@ def sql_pyformat_args_to_spanner(sql, params):
         else:
             named_args[key] = params[i]
 
-    return sanitize_literals_for_upload(sql), named_args
+    return translation.named_sql, named_args
+
+
+_PyformatTranslation = collections.namedtuple(
+    "_PyformatTranslation", ["sanitized_sql", "named_sql", "placeholders"]
+)
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _translate_pyformat(sql, dialect=None):
+    """Helper for :func:`sql_pyformat_args_to_spanner`:  the part of the
+    translation which does not depend on the parameters.
+
+    :type sql: str
+    :param sql: A SQL request.
+
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of the database.  Defaults to
+                    GoogleSQL.
+
+    :rtype: :class:`_PyformatTranslation`
+    :returns: The sanitized SQL, the sanitized SQL with the i-th pyformat
+              placeholder replaced by ``@ai``, and the placeholders.
+    """
+    placeholders = []
+    segments = []
+    last_end = 0
+    for statement in _lexer.scan_statements(sql, dialect):
+        for start, end in statement.placeholders:
+            segments.append(sql[last_end:start])
+            segments.append("@a%d" % len(placeholders))
+            placeholders.append(sql[start:end])
+            last_end = end
+    segments.append(sql[last_end:])
+    return _PyformatTranslation(
+        sanitize_literals_for_upload(sql),
+        sanitize_literals_for_upload("".join(segments)),
+        tuple(placeholders),
+    )
 
 
 def get_param_types(params):
@@ -292,18 +345,30 @@ def get_param_types(params):
     return param_types
 
 
-def ensure_where_clause(sql):
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def ensure_where_clause(sql, dialect=None):
     """
     Cloud Spanner requires a WHERE clause on UPDATE and DELETE statements.
     Add a dummy WHERE clause if non detected.
 
     :type sql: str
     :param sql: SQL code to check.
+
+    :type dialect:
+        :class:`~google.cloud.spanner_admin_database_v1.types.DatabaseDialect`
+    :param dialect: (Optional) the dialect of the database.  Defaults to
+                    GoogleSQL.
     """
-    if any(isinstance(token, sqlparse.sql.Where) for token in sqlparse.parse(sql)[0]):
+    statements = _lexer.scan_statements(sql, dialect)
+    if not statements:
+        return sql + " WHERE 1=1"
+
+    statement = statements[0]
+    if statement.has_where:
         return sql
 
-    return sql + " WHERE 1=1"
+    # Insert the clause before any trailing comment or semicolon.
+    return sql[: statement.end] + " WHERE 1=1" + sql[statement.end :]
 
 
 def escape_name(name):
@@ -60,6 +60,7 @@ from .types.type import Type
 from .types.type import TypeAnnotationCode
 from .types.type import TypeCode
 from .data_types import JsonObject
+from .data_types import RawBytes
 
 from google.cloud.spanner_v1 import param_types
 from google.cloud.spanner_v1.client import Client
@@ -68,7 +69,11 @@ from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import AbstractSessionPool
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import FixedSizePool
+from google.cloud.spanner_v1.pool import MultiplexedSessionPool
 from google.cloud.spanner_v1.pool import PingingPool
+from google.cloud.spanner_v1.pool import SessionLeak
+from google.cloud.spanner_v1.pool import SessionPoolMaintainer
+from google.cloud.spanner_v1.pool import SessionPoolStats
 from google.cloud.spanner_v1.pool import TransactionPingingPool
 
 
@@ -92,7 +97,11 @@ __all__ = (
     "AbstractSessionPool",
     "BurstyPool",
     "FixedSizePool",
+    "MultiplexedSessionPool",
     "PingingPool",
+    "SessionLeak",
+    "SessionPoolMaintainer",
+    "SessionPoolStats",
     "TransactionPingingPool",
     # local
     "COMMIT_TIMESTAMP",
@@ -137,6 +146,7 @@ __all__ = (
     "TypeCode",
     # Custom spanner related data types
     "JsonObject",
+    "RawBytes",
     # google.cloud.spanner_v1.services
     "SpannerClient",
 )
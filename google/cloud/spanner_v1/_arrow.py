@@ -0,0 +1,314 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conversion of streamed result set data to Apache Arrow.
+
+This module requires the ``pyarrow`` package, and is only imported when
+one of the ``to_arrow`` / ``to_pandas`` methods is called.
+"""
+
+import base64
+import calendar
+import functools
+
+import pyarrow
+
+from google.api_core import datetime_helpers
+from google.cloud.spanner_v1 import TypeCode
+from google.cloud.spanner_v1._helpers import _make_value_decoder
+from google.cloud.spanner_v1.columnar import _decode_base64_column
+from google.cloud.spanner_v1.columnar import _decode_float64_column
+from google.cloud.spanner_v1.columnar import _decode_int64_column
+from google.cloud.spanner_v1.columnar import _decode_binary_column
+
+_ARROW_TYPE_BY_TYPE = {
+    TypeCode.BOOL: pyarrow.bool_(),
+    TypeCode.INT64: pyarrow.int64(),
+    TypeCode.FLOAT64: pyarrow.float64(),
+    TypeCode.STRING: pyarrow.string(),
+    TypeCode.BYTES: pyarrow.binary(),
+    TypeCode.DATE: pyarrow.date32(),
+    TypeCode.TIMESTAMP: pyarrow.timestamp("ns", tz="UTC"),
+    TypeCode.NUMERIC: pyarrow.decimal128(38, 9),
+    TypeCode.JSON: pyarrow.string(),
+}
+
+
+def _struct_field_names(struct_type):
+    """Names used for the children of an Arrow struct.
+
+    Anonymous fields, e.g. from ``SELECT AS STRUCT 1, 2``, are named after
+    their position.
+    """
+    return [
+        field.name or "_{}".format(index)
+        for index, field in enumerate(struct_type.fields)
+    ]
+
+
+def _arrow_type(field_type):
+    """Map a Spanner type to the Arrow type used to represent it.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.types.Type`
+    :param field_type: Spanner type
+
+    :rtype: :class:`pyarrow.DataType`
+    :returns: the corresponding Arrow type
+    :raises ValueError: if the type has no Arrow representation.
+    """
+    type_code = field_type.code
+    arrow_type = _ARROW_TYPE_BY_TYPE.get(type_code)
+    if arrow_type is not None:
+        return arrow_type
+    if type_code == TypeCode.ARRAY:
+        return pyarrow.list_(_arrow_type(field_type.array_element_type))
+    if type_code == TypeCode.STRUCT:
+        names = _struct_field_names(field_type.struct_type)
+        return pyarrow.struct(
+            [
+                pyarrow.field(name, _arrow_type(field.type_))
+                for name, field in zip(names, field_type.struct_type.fields)
+            ]
+        )
+    raise ValueError("Unknown type: %s" % (field_type,))
+
+
+def _arrow_schema(row_type):
+    """Build the Arrow schema for rows of a result set.
+
+    :type row_type: :class:`~google.cloud.spanner_v1.types.StructType`
+    :param row_type: row schema specification
+
+    :rtype: :class:`pyarrow.Schema`
+    """
+    return pyarrow.schema(
+        [
+            pyarrow.field(field.name, _arrow_type(field.type_))
+            for field in row_type.fields
+        ]
+    )
+
+
+def _timestamp_nanos(value):
+    """Convert an RFC 3339 timestamp to nanoseconds since the epoch."""
+    stamp = datetime_helpers.DatetimeWithNanoseconds.from_rfc3339(value)
+    return calendar.timegm(stamp.utctimetuple()) * 10**9 + stamp.nanosecond
+
+
+def _make_arrow_value_decoder(field_type):
+    """Compile a decoder producing values accepted by :func:`pyarrow.array`.
+
+    Unlike :func:`~google.cloud.spanner_v1._helpers._make_value_decoder`,
+    ``BYTES`` are base64-decoded, ``TIMESTAMP`` values keep nanosecond
+    precision, ``JSON`` values are kept as text and ``STRUCT`` values are
+    returned as mappings.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.types.Type`
+    :param field_type: type of the values to decode
+
+    :rtype: callable
+    """
+    type_code = field_type.code
+    if type_code == TypeCode.BYTES:
+        convert = base64.b64decode
+    elif type_code == TypeCode.TIMESTAMP:
+        convert = _timestamp_nanos
+    elif type_code == TypeCode.JSON:
+        convert = None
+    elif type_code == TypeCode.ARRAY:
+        element_decoder = _make_arrow_value_decoder(field_type.array_element_type)
+
+        def decode_array(value_pb):
+            if value_pb.HasField("null_value"):
+                return None
+            return [element_decoder(item_pb) for item_pb in value_pb.list_value.values]
+
+        return decode_array
+    elif type_code == TypeCode.STRUCT:
+        names = _struct_field_names(field_type.struct_type)
+        field_decoders = [
+            _make_arrow_value_decoder(field.type_)
+            for field in field_type.struct_type.fields
+        ]
+
+        def decode_struct(value_pb):
+            if value_pb.HasField("null_value"):
+                return None
+            return {
+                name: field_decoder(item_pb)
+                for name, field_decoder, item_pb in zip(
+                    names, field_decoders, value_pb.list_value.values
+                )
+            }
+
+        return decode_struct
+    else:
+        return _make_value_decoder(field_type)
+
+    def decode(value_pb):
+        if value_pb.HasField("null_value"):
+            return None
+        if convert is None:
+            return value_pb.string_value
+        return convert(value_pb.string_value)
+
+    return decode
+
+
+def _validity_buffer(nulls):
+    """Build an Arrow validity bitmap from per-cell null flags."""
+    if nulls is None:
+        return None
+    return pyarrow.array([not is_null for is_null in nulls]).buffers()[1]
+
+
+def _convert_fixed_width_column(decode_column, arrow_type, field, value_pbs):
+    """Convert ``INT64`` / ``FLOAT64`` values, sharing the decoded buffer."""
+    column = decode_column(field, value_pbs)
+    return pyarrow.Array.from_buffers(
+        arrow_type,
+        len(column),
+        [_validity_buffer(column.nulls), pyarrow.py_buffer(column.values)],
+    )
+
+
+def _convert_string_column(field, value_pbs):
+    """Convert ``STRING`` values, sharing the decoded offsets / buffer."""
+    column = _decode_binary_column(field, value_pbs)
+    array = pyarrow.Array.from_buffers(
+        pyarrow.large_string(),
+        len(column),
+        [
+            _validity_buffer(column.nulls),
+            pyarrow.py_buffer(column.offsets),
+            pyarrow.py_buffer(column.values),
+        ],
+    )
+    return array.cast(pyarrow.string())
+
+
+def _convert_bytes_column(field, value_pbs):
+    """Convert ``BYTES`` values, sharing the decoded offsets / buffer."""
+    column = _decode_base64_column(field, value_pbs)
+    array = pyarrow.Array.from_buffers(
+        pyarrow.large_binary(),
+        len(column),
+        [
+            _validity_buffer(column.nulls),
+            pyarrow.py_buffer(column.offsets),
+            pyarrow.py_buffer(column.values),
+        ],
+    )
+    return array.cast(pyarrow.binary())
+
+
+def _convert_column(decoder, arrow_type, field, value_pbs):
+    """Convert values of other types through Python objects."""
+    return pyarrow.array([decoder(value_pb) for value_pb in value_pbs], type=arrow_type)
+
+
+def _make_array_converters(row_type):
+    """Compile one Arrow converter per field of a result set.
+
+    :type row_type: :class:`~google.cloud.spanner_v1.types.StructType`
+    :param row_type: row schema specification
+
+    :rtype: tuple of callable
+    :returns: one callable per field, each taking a list of
+              :class:`~google.protobuf.struct_pb2.Value` for that column and
+              returning a :class:`pyarrow.Array`.
+    """
+    converters = []
+    for field in row_type.fields:
+        type_code = field.type_.code
+        if type_code == TypeCode.INT64:
+            converter = functools.partial(
+                _convert_fixed_width_column,
+                _decode_int64_column,
+                pyarrow.int64(),
+                field,
+            )
+        elif type_code == TypeCode.FLOAT64:
+            converter = functools.partial(
+                _convert_fixed_width_column,
+                _decode_float64_column,
+                pyarrow.float64(),
+                field,
+            )
+        elif type_code == TypeCode.STRING:
+            converter = functools.partial(_convert_string_column, field)
+        elif type_code == TypeCode.BYTES:
+            converter = functools.partial(_convert_bytes_column, field)
+        else:
+            converter = functools.partial(
+                _convert_column,
+                _make_arrow_value_decoder(field.type_),
+                _arrow_type(field.type_),
+                field,
+            )
+        converters.append(converter)
+    return tuple(converters)
+
+
+def _column_values(column):
+    """Convert an Arrow column into values accepted by mutations.
+
+    Binary columns hold raw data, passed as :class:`memoryview` so that it
+    is base64-encoded when written.
+
+    :type column: :class:`pyarrow.ChunkedArray` or :class:`pyarrow.Array`
+    :param column: the column to convert.
+
+    :rtype: list
+    """
+    values = column.to_pylist()
+    if pyarrow.types.is_binary(column.type) or pyarrow.types.is_large_binary(
+        column.type
+    ):
+        values = [None if value is None else memoryview(value) for value in values]
+    return values
+
+
+def _to_table(row_type, array_batches):
+    """Assemble batches of Arrow arrays into a table.
+
+    :type row_type: :class:`~google.cloud.spanner_v1.types.StructType`
+    :param row_type: row schema specification, or None if unknown.
+
+    :type array_batches: iterable of list of :class:`pyarrow.Array`
+    :param array_batches: one array per field, for each batch of rows.
+
+    :rtype: :class:`pyarrow.Table`
+    """
+    if row_type is None:
+        return pyarrow.table({})
+    schema = _arrow_schema(row_type)
+    record_batches = [
+        pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+        for arrays in array_batches
+    ]
+    return pyarrow.Table.from_batches(record_batches, schema=schema)
+
+
+def _concat_tables(tables):
+    """Concatenate the tables produced for several partitions.
+
+    :type tables: list of :class:`pyarrow.Table`
+
+    :rtype: :class:`pyarrow.Table`
+    """
+    tables = [table for table in tables if table.num_columns]
+    if not tables:
+        return pyarrow.table({})
+    return pyarrow.concat_tables(tables)
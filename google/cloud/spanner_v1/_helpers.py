@@ -14,6 +14,8 @@
 
 """Helper functions for Cloud Spanner."""
 
+import binascii
+import collections.abc
 import datetime
 import decimal
 import math
@@ -27,6 +29,7 @@ from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud.spanner_v1 import TypeCode
 from google.cloud.spanner_v1 import ExecuteSqlRequest
 from google.cloud.spanner_v1 import JsonObject
+from google.cloud.spanner_v1 import RawBytes
 
 # Validation error messages
 NUMERIC_MAX_SCALE_ERR_MSG = (
@@ -38,25 +41,6 @@ NUMERIC_MAX_PRECISION_ERR_MSG = (
 )
 
 
-def _try_to_coerce_bytes(bytestring):
-    """Try to coerce a byte string into the right thing based on Python
-    version and whether or not it is base64 encoded.
-
-    Return a text string or raise ValueError.
-    """
-    # Attempt to coerce using google.protobuf.Value, which will expect
-    # something that is utf-8 (and base64 consistently is).
-    try:
-        Value(string_value=bytestring)
-        return bytestring
-    except ValueError:
-        raise ValueError(
-            "Received a bytes that is not base64 encoded. "
-            "Ensure that you either send a Unicode string or a "
-            "base64-encoded bytes."
-        )
-
-
 def _merge_query_options(base, merge):
     """Merge higher precedence QueryOptions with current QueryOptions.
 
@@ -154,9 +138,20 @@ def _make_value_pb(value):
         return Value(string_value=_datetime_to_rfc3339(value, ignore_zone=False))
     if isinstance(value, datetime.date):
         return Value(string_value=value.isoformat())
-    if isinstance(value, bytes):
-        value = _try_to_coerce_bytes(value)
-        return Value(string_value=value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # Already base64-encoded:  the protobuf only checks it is UTF-8.
+        if not isinstance(value, bytes):
+            value = bytes(value)
+        try:
+            return Value(string_value=value)
+        except ValueError:
+            raise ValueError(
+                "Received a bytes that is not base64 encoded. "
+                "Ensure that you either send a Unicode string or a "
+                "base64-encoded bytes, or wrap raw data in RawBytes."
+            )
+    if isinstance(value, RawBytes):
+        return Value(string_value=_encode_base64(value.data))
     if isinstance(value, str):
         return Value(string_value=value)
     if isinstance(value, ListValue):
@@ -198,6 +193,229 @@ def _make_list_value_pbs(values):
     return [_make_list_value_pb(row) for row in values]
 
 
+def _encode_any(values_pb, value):
+    """Append a value of any supported type, see :func:`_make_value_pb`.
+
+    :type values_pb: repeated :class:`~google.protobuf.struct_pb2.Value`
+    :param values_pb: the values of the row / array being built.
+
+    :type value: scalar value
+    :param value: value to convert
+    """
+    values_pb.append(_make_value_pb(value))
+
+
+def _encode_string(values_pb, value):
+    """Encoder for ``STRING`` values."""
+    if type(value) is str:
+        values_pb.add(string_value=value)
+    else:
+        _encode_any(values_pb, value)
+
+
+def _encode_bytes(values_pb, value):
+    """Encoder for ``BYTES`` values."""
+    if type(value) is str:
+        values_pb.add(string_value=value)
+    else:
+        _encode_any(values_pb, value)
+
+
+def _encode_int64(values_pb, value):
+    """Encoder for ``INT64`` values."""
+    if type(value) is int:
+        values_pb.add(string_value=str(value))
+    else:
+        _encode_any(values_pb, value)
+
+
+def _encode_float64(values_pb, value):
+    """Encoder for ``FLOAT64`` values."""
+    if type(value) is float and math.isfinite(value):
+        values_pb.add(number_value=value)
+    else:
+        _encode_any(values_pb, value)
+
+
+def _encode_bool(values_pb, value):
+    """Encoder for ``BOOL`` values."""
+    if type(value) is bool:
+        values_pb.add(bool_value=value)
+    else:
+        _encode_any(values_pb, value)
+
+
+def _encode_date(values_pb, value):
+    """Encoder for ``DATE`` values."""
+    if type(value) is datetime.date:
+        values_pb.add(string_value=value.isoformat())
+    else:
+        _encode_any(values_pb, value)
+
+
+_ENCODER_BY_TYPE = {
+    TypeCode.STRING: _encode_string,
+    TypeCode.BYTES: _encode_bytes,
+    TypeCode.INT64: _encode_int64,
+    TypeCode.FLOAT64: _encode_float64,
+    TypeCode.BOOL: _encode_bool,
+    TypeCode.DATE: _encode_date,
+}
+
+
+def _make_value_encoder(field_type):
+    """Compile an encoder for values of the given type.
+
+    The encoder converts values of the type's usual Python type without
+    going through the type dispatch of :func:`_make_value_pb`, which
+    remains the fallback for any other value (including ``None``).
+
+    :type field_type: :class:`~google.cloud.spanner_v1.types.Type`
+    :param field_type: type of the values to encode, or None if unknown.
+
+    :rtype: callable
+    :returns: encoder taking the repeated
+              :class:`~google.protobuf.struct_pb2.Value` field to which the
+              encoded value is appended, and the value.
+    """
+    if field_type is None:
+        return _encode_any
+
+    type_code = field_type.code
+    encoder = _ENCODER_BY_TYPE.get(type_code)
+    if encoder is not None:
+        return encoder
+
+    if type_code == TypeCode.ARRAY:
+        element_encoder = _make_value_encoder(field_type.array_element_type)
+
+        def encode_array(values_pb, value):
+            if not isinstance(value, (list, tuple)):
+                _encode_any(values_pb, value)
+                return
+            list_value_pb = values_pb.add().list_value
+            list_value_pb.SetInParent()  # Empty arrays are not null
+            items_pb = list_value_pb.values
+            for item in value:
+                element_encoder(items_pb, item)
+
+        return encode_array
+
+    return _encode_any
+
+
+def _make_column_encoders(columns, column_types=None):
+    """Compile one encoder per written column.
+
+    :type columns: list of str
+    :param columns: names of the columns being written.
+
+    :type column_types:
+        dict (str -> :class:`~google.cloud.spanner_v1.types.Type`),
+        list of :class:`~google.cloud.spanner_v1.types.Type`, or
+        list of :class:`~google.cloud.spanner_v1.types.StructType.Field`
+    :param column_types:
+        (Optional) types of the columns:  a mapping from column name, a
+        list parallel to ``columns``, or the fields of a table schema, as
+        returned by :attr:`~google.cloud.spanner_v1.table.Table.schema`.
+        Columns of unknown type are encoded as by :func:`_make_value_pb`.
+
+    :rtype: tuple of callable
+    :returns: one encoder per column, see :func:`_make_value_encoder`.
+    :raises ValueError: if a list of types does not match ``columns``.
+    """
+    if column_types is None:
+        return (_encode_any,) * len(columns)
+    if not isinstance(column_types, collections.abc.Mapping):
+        column_types = list(column_types)
+        if all(hasattr(field, "type_") for field in column_types):
+            column_types = {field.name: field.type_ for field in column_types}
+        elif len(column_types) != len(columns):
+            raise ValueError(
+                "Expected %d column types, got %d" % (len(columns), len(column_types))
+            )
+        else:
+            column_types = dict(zip(columns, column_types))
+    return tuple(_make_value_encoder(column_types.get(name)) for name in columns)
+
+
+def _column_value_lists(columns, values):
+    """Extract the values of each column from columnar input.
+
+    :type columns: list of str
+    :param columns: names of the columns being written.
+
+    :type values: list of lists, mapping or :class:`pyarrow.Table`
+    :param values: row data, or column data:  a mapping from column name to
+                   a sequence (including NumPy arrays) of values, or an
+                   Arrow table / record batch.
+
+    :rtype: list of list, or None
+    :returns: the values of each column, or None if ``values`` holds rows.
+    :raises ValueError: if the columns are not all of the same length.
+    """
+    if hasattr(values, "column_names"):  # Arrow table / record batch
+        from google.cloud.spanner_v1 import _arrow
+
+        column_lists = [_arrow._column_values(values.column(name)) for name in columns]
+    elif isinstance(values, collections.abc.Mapping):
+        column_lists = []
+        for name in columns:
+            column = values[name]
+            if hasattr(column, "tolist"):  # NumPy array / pandas series
+                column = column.tolist()
+            column_lists.append(column)
+    else:
+        return None
+
+    if len(set(map(len, column_lists))) > 1:
+        raise ValueError("Columns must all have the same number of values")
+    return column_lists
+
+
+def _encode_rows(list_values_pb, values, encoders):
+    """Append rows, encoding each column with its own encoder.
+
+    :type list_values_pb: repeated :class:`~google.protobuf.struct_pb2.ListValue`
+    :param list_values_pb: the rows of the mutation being built.
+
+    :type values: list of lists
+    :param values: row data.
+
+    :type encoders: tuple of callable
+    :param encoders: one encoder per column, see :func:`_make_column_encoders`.
+    """
+    for row in values:
+        row_pb = list_values_pb.add().values
+        for encoder, value in zip(encoders, row):
+            encoder(row_pb, value)
+
+
+def _encode_columns(list_values_pb, column_lists, encoders):
+    """Append rows, encoding column data one column at a time.
+
+    Rows are never materialized as Python sequences:  the ``ListValue`` of
+    every row is allocated up front, then each column's values are appended
+    to them in turn.
+
+    :type list_values_pb: repeated :class:`~google.protobuf.struct_pb2.ListValue`
+    :param list_values_pb: the rows of the mutation being built.
+
+    :type column_lists: list of list
+    :param column_lists: the values of each column, see
+                         :func:`_column_value_lists`.
+
+    :type encoders: tuple of callable
+    :param encoders: one encoder per column, see :func:`_make_column_encoders`.
+    """
+    if not column_lists:
+        return
+    row_pbs = [list_values_pb.add().values for _ in range(len(column_lists[0]))]
+    for encoder, column in zip(encoders, column_lists):
+        # Consume the iterator without building a list of results.
+        collections.deque(map(encoder, row_pbs, column), maxlen=0)
+
+
 def _parse_value_pb(value_pb, field_type):
     """Convert a Value protobuf to cell data.
 
@@ -250,6 +468,170 @@ def _parse_value_pb(value_pb, field_type):
         raise ValueError("Unknown type: %s" % (field_type,))
 
 
+def _decode_string(value_pb):
+    """Decoder for ``STRING`` values."""
+    value = value_pb.string_value
+    if not value and value_pb.HasField("null_value"):
+        return None
+    return value
+
+
+def _decode_bool(value_pb):
+    """Decoder for ``BOOL`` values."""
+    if value_pb.bool_value:
+        return True
+    if value_pb.HasField("null_value"):
+        return None
+    return False
+
+
+def _decode_float64(value_pb):
+    """Decoder for ``FLOAT64`` values."""
+    kind = value_pb.WhichOneof("kind")
+    if kind == "null_value":
+        return None
+    if kind == "string_value":  # NaN / Infinity / -Infinity
+        return float(value_pb.string_value)
+    return value_pb.number_value
+
+
+def _make_string_decoder(convert):
+    """Build a decoder for types transmitted as a ``string_value``.
+
+    :type convert: callable
+    :param convert: converts the non-null string value to cell data.
+
+    :rtype: callable
+    :returns: decoder for a single value protobuf.
+    """
+
+    def decode(value_pb):
+        value = value_pb.string_value
+        if not value and value_pb.HasField("null_value"):
+            return None
+        return convert(value)
+
+    return decode
+
+
+def _encode_utf8(value):
+    """Helper for ``BYTES`` decoders."""
+    return value.encode("utf8")
+
+
+def _encode_base64(value):
+    """Encode raw binary data as the text of a ``BYTES`` value.
+
+    :type value: bytes-like object
+    :param value: the raw (not base64-encoded) data.
+
+    :rtype: str
+    :returns: the base64 encoding of ``value``.
+    """
+    return binascii.b2a_base64(value, newline=False).decode("ascii")
+
+
+def _decode_base64(value):
+    """Helper for ``BYTES`` decoders returning raw binary data."""
+    return binascii.a2b_base64(value)
+
+
+_DECODER_BY_TYPE = {
+    TypeCode.STRING: _decode_string,
+    TypeCode.BYTES: _make_string_decoder(_encode_utf8),
+    TypeCode.BOOL: _decode_bool,
+    TypeCode.INT64: _make_string_decoder(int),
+    TypeCode.FLOAT64: _decode_float64,
+    TypeCode.DATE: _make_string_decoder(_date_from_iso8601_date),
+    TypeCode.TIMESTAMP: _make_string_decoder(
+        datetime_helpers.DatetimeWithNanoseconds.from_rfc3339
+    ),
+    TypeCode.NUMERIC: _make_string_decoder(decimal.Decimal),
+    TypeCode.JSON: _make_string_decoder(JsonObject.from_str),
+}
+
+
+_decode_raw_bytes = _make_string_decoder(_decode_base64)
+
+
+def _make_value_decoder(field_type, decode_bytes=False):
+    """Compile a decoder for values of the given type.
+
+    Equivalent to binding ``field_type`` in :func:`_parse_value_pb`, but the
+    type dispatch (including that of ``ARRAY`` elements and ``STRUCT``
+    fields) happens once, rather than for every value.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.types.Type`
+    :param field_type: type of the values to decode
+
+    :type decode_bytes: bool
+    :param decode_bytes: (Optional) if true, ``BYTES`` values are returned
+                         as the raw binary data, rather than as their
+                         base64 encoding.
+
+    :rtype: callable
+    :returns: decoder taking a :class:`~google.protobuf.struct_pb2.Value`
+              and returning cell data.
+    """
+    type_code = field_type.code
+    if decode_bytes and type_code == TypeCode.BYTES:
+        return _decode_raw_bytes
+    decoder = _DECODER_BY_TYPE.get(type_code)
+    if decoder is not None:
+        return decoder
+
+    if type_code == TypeCode.ARRAY:
+        element_decoder = _make_value_decoder(
+            field_type.array_element_type, decode_bytes
+        )
+
+        def decode_array(value_pb):
+            if value_pb.HasField("null_value"):
+                return None
+            return [element_decoder(item_pb) for item_pb in value_pb.list_value.values]
+
+        return decode_array
+
+    if type_code == TypeCode.STRUCT:
+        field_decoders = _make_row_decoders(field_type.struct_type, decode_bytes)
+
+        def decode_struct(value_pb):
+            if value_pb.HasField("null_value"):
+                return None
+            return [
+                field_decoder(item_pb)
+                for field_decoder, item_pb in zip(
+                    field_decoders, value_pb.list_value.values
+                )
+            ]
+
+        return decode_struct
+
+    def decode_unknown(value_pb):
+        if value_pb.HasField("null_value"):
+            return None
+        raise ValueError("Unknown type: %s" % (field_type,))
+
+    return decode_unknown
+
+
+def _make_row_decoders(row_type, decode_bytes=False):
+    """Compile the decoder plan for rows of a result set.
+
+    :type row_type: :class:`~google.cloud.spanner_v1.types.StructType`
+    :param row_type: row schema specification
+
+    :type decode_bytes: bool
+    :param decode_bytes: (Optional) see :func:`_make_value_decoder`.
+
+    :rtype: tuple of callable
+    :returns: one decoder per field, see :func:`_make_value_decoder`.
+    """
+    return tuple(
+        _make_value_decoder(field.type_, decode_bytes) for field in row_type.fields
+    )
+
+
 def _parse_list_value_pbs(rows, row_type):
     """Convert a list of ListValue protobufs into a list of list of cell data.
 
@@ -262,13 +644,11 @@ def _parse_list_value_pbs(rows, row_type):
     :rtype: list of list of cell data
     :returns: data for the rows, coerced into appropriate types
     """
-    result = []
-    for row in rows:
-        row_data = []
-        for value_pb, field in zip(row.values, row_type.fields):
-            row_data.append(_parse_value_pb(value_pb, field.type_))
-        result.append(row_data)
-    return result
+    decoders = _make_row_decoders(row_type)
+    return [
+        [decoder(value_pb) for decoder, value_pb in zip(decoders, row.values)]
+        for row in rows
+    ]
 
 
 class _SessionWrapper(object):
@@ -281,6 +661,23 @@ class _SessionWrapper(object):
     def __init__(self, session):
         self._session = session
 
+    def _make_metadata(self, route_to_leader):
+        """Helper for request methods:  build the RPC metadata.
+
+        :type route_to_leader: bool
+        :param route_to_leader: whether the request is eligible for
+                                leader-aware routing.
+
+        :rtype: list of tuple
+        """
+        database = self._session._database
+        metadata = _metadata_with_prefix(database.name)
+        if route_to_leader and database._route_to_leader_enabled:
+            metadata.append(
+                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
+            )
+        return metadata
+
 
 def _metadata_with_prefix(prefix, **kw):
     """Create RPC metadata containing a prefix.
@@ -304,3 +701,16 @@ def _metadata_with_leader_aware_routing(value, **kw):
         List[Tuple[str, str]]: RPC metadata with leader aware routing header
     """
     return ("x-goog-spanner-route-to-leader", str(value).lower())
+
+
+def _is_session_not_found(exc):
+    """Tell whether an error is due to the request's session no longer existing.
+
+    :type exc: :class:`~google.cloud.exceptions.NotFound`
+    :param exc: error raised by a request.
+
+    :rtype: bool
+    :returns: True if the request's session no longer exists, rather than
+              e.g. a table or row.
+    """
+    return "Session not found" in exc.message
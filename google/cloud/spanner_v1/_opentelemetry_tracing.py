@@ -27,6 +27,13 @@ try:
 except ImportError:
     HAS_OPENTELEMETRY_INSTALLED = False
 
+try:
+    from opentelemetry import metrics
+
+    HAS_OPENTELEMETRY_METRICS = True
+except ImportError:
+    HAS_OPENTELEMETRY_METRICS = False
+
 
 @contextmanager
 def trace_call(name, session, extra_attributes=None):
@@ -36,7 +43,22 @@ def trace_call(name, session, extra_attributes=None):
         return
 
     tracer = trace.get_tracer(__name__)
+    attributes = _span_attributes(session, extra_attributes)
+
+    with tracer.start_as_current_span(
+        name, kind=trace.SpanKind.CLIENT, attributes=attributes
+    ) as span:
+        try:
+            span.set_status(Status(StatusCode.OK))
+            yield span
+        except GoogleAPICallError as error:
+            span.set_status(Status(StatusCode.ERROR))
+            span.record_exception(error)
+            raise
 
+
+def _span_attributes(session, extra_attributes):
+    """Helper for :func:`trace_call` et al."""
     # Set base attributes that we know for every trace created
     attributes = {
         "db.type": "spanner",
@@ -47,14 +69,111 @@ def trace_call(name, session, extra_attributes=None):
 
     if extra_attributes:
         attributes.update(extra_attributes)
+    return attributes
 
-    with tracer.start_as_current_span(
-        name, kind=trace.SpanKind.CLIENT, attributes=attributes
-    ) as span:
-        try:
-            span.set_status(Status(StatusCode.OK))
-            yield span
-        except GoogleAPICallError as error:
-            span.set_status(Status(StatusCode.ERROR))
-            span.record_exception(error)
-            raise
+
+def start_call_span(name, session, extra_attributes=None):
+    """Start the span of a call completing asynchronously.
+
+    Unlike :func:`trace_call`, the span does not become the current span,
+    and must be ended by :func:`end_call_span`, possibly on another thread.
+
+    :rtype: :class:`opentelemetry.trace.Span`
+    :returns: the span, or None if tracing is not enabled.
+    """
+    if not HAS_OPENTELEMETRY_INSTALLED or not session:
+        return None
+
+    tracer = trace.get_tracer(__name__)
+    span = tracer.start_span(
+        name,
+        kind=trace.SpanKind.CLIENT,
+        attributes=_span_attributes(session, extra_attributes),
+    )
+    span.set_status(Status(StatusCode.OK))
+    return span
+
+
+def end_call_span(span, error=None):
+    """End a span started by :func:`start_call_span`.
+
+    :type span: :class:`opentelemetry.trace.Span`
+    :param span: the span, or None if tracing is not enabled.
+
+    :type error: Exception
+    :param error: (Optional) the error which failed the call.
+    """
+    if span is None:
+        return
+    if isinstance(error, GoogleAPICallError):
+        span.set_status(Status(StatusCode.ERROR))
+        span.record_exception(error)
+    span.end()
+
+
+def register_pool_metrics(stats, meter=None, attributes=None):
+    """Report session pool statistics as OpenTelemetry metrics.
+
+    :type stats: :class:`~google.cloud.spanner_v1.pool.SessionPoolStats`
+    :param stats: statistics of the pool being observed.
+
+    :type meter: :class:`opentelemetry.metrics.Meter`
+    :param meter: (Optional) meter creating the instruments.  Defaults to
+                  the global meter provider's meter for this module.
+
+    :type attributes: dict
+    :param attributes: (Optional) attributes of every measurement, e.g.
+                       identifying the database.
+
+    :rtype: :class:`opentelemetry.metrics.Meter` or None
+    :returns: the meter used, or None if OpenTelemetry metrics are not
+              installed.
+    """
+    if not HAS_OPENTELEMETRY_METRICS:
+        return None
+
+    if meter is None:
+        meter = metrics.get_meter(__name__)
+
+    def _observe(name):
+        def _callback(options):
+            value = getattr(stats, name)
+            if value is None:
+                return []
+            return [metrics.Observation(value, attributes)]
+
+        return _callback
+
+    meter.create_observable_gauge(
+        "spanner.pool.sessions.in_use",
+        callbacks=[_observe("in_use")],
+        unit="{session}",
+        description="Sessions checked out of the pool.",
+    )
+    meter.create_observable_gauge(
+        "spanner.pool.sessions.idle",
+        callbacks=[_observe("idle")],
+        unit="{session}",
+        description="Sessions available in the pool.",
+    )
+    for name, description in (
+        ("checkouts", "Sessions checked out of the pool."),
+        ("checkout_timeouts", "Checkouts which timed out on an empty pool."),
+        ("sessions_created", "Sessions created by the pool."),
+        ("sessions_deleted", "Sessions deleted by the pool."),
+        ("sessions_expired", "Pooled sessions found to no longer exist."),
+    ):
+        meter.create_observable_counter(
+            "spanner.pool." + name,
+            callbacks=[_observe(name)],
+            unit="1",
+            description=description,
+        )
+
+    histogram = meter.create_histogram(
+        "spanner.pool.checkout_latency",
+        unit="s",
+        description="Time spent waiting for a session.",
+    )
+    stats.add_checkout_listener(lambda wait: histogram.record(wait, attributes))
+    return meter
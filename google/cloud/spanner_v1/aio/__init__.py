@@ -0,0 +1,34 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio-native data-plane API for Cloud Spanner."""
+
+from google.cloud.spanner_v1.aio.batch import AsyncBatch
+from google.cloud.spanner_v1.aio.database import AsyncDatabase
+from google.cloud.spanner_v1.aio.pool import AsyncSessionPool
+from google.cloud.spanner_v1.aio.session import AsyncSession
+from google.cloud.spanner_v1.aio.snapshot import AsyncSnapshot
+from google.cloud.spanner_v1.aio.streamed import AsyncStreamedResultSet
+from google.cloud.spanner_v1.aio.transaction import AsyncTransaction
+
+
+__all__ = (
+    "AsyncBatch",
+    "AsyncDatabase",
+    "AsyncSessionPool",
+    "AsyncSession",
+    "AsyncSnapshot",
+    "AsyncStreamedResultSet",
+    "AsyncTransaction",
+)
@@ -0,0 +1,57 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Context manager for Cloud Spanner batched writes, for asyncio."""
+
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.batch import Batch
+
+
+class AsyncBatch(Batch):
+    """Accumulate mutations for transmission during :meth:`commit`."""
+
+    async def commit(self, return_commit_stats=False, request_options=None):
+        """Commit mutations to the database.
+
+        See :meth:`google.cloud.spanner_v1.batch.Batch.commit`.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self._check_state()
+        request, metadata = self._make_commit_request(
+            return_commit_stats, request_options
+        )
+        api = self._session._database.spanner_api
+        trace_attributes = {"num_mutations": len(self._mutations)}
+        with trace_call("CloudSpanner.Commit", self._session, trace_attributes):
+            response = await api.commit(
+                request=request,
+                metadata=metadata,
+            )
+        return self._process_commit_response(response)
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncBatch")
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        self._check_state()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        if exc_type is None:
+            await self.commit()
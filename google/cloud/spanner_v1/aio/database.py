@@ -0,0 +1,338 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""User-friendly container for Cloud Spanner Database, for asyncio."""
+
+import contextvars
+
+import google.auth.credentials
+from google.cloud.exceptions import NotFound
+from grpc import aio as grpc_aio
+
+from google.cloud.spanner_v1 import RequestOptions
+from google.cloud.spanner_v1.aio.pool import AsyncSessionCheckout
+from google.cloud.spanner_v1.aio.pool import AsyncSessionPool
+from google.cloud.spanner_v1.aio.session import AsyncSession
+from google.cloud.spanner_v1.database import SPANNER_DATA_SCOPE
+from google.cloud.spanner_v1.services.spanner import SpannerAsyncClient
+from google.cloud.spanner_v1.services.spanner.transports.grpc_asyncio import (
+    SpannerGrpcAsyncIOTransport,
+)
+
+
+_transaction_running = contextvars.ContextVar(
+    "spanner_aio_transaction_running", default=False
+)
+
+
+class AsyncDatabase(object):
+    """Data-plane access to a Cloud Spanner database, for asyncio.
+
+    Wraps a :class:`~google.cloud.spanner_v1.database.Database`, which still
+    owns the database's identity and administrative operations;  sessions,
+    reads, queries and transactions go through a
+    :class:`~google.cloud.spanner_v1.services.spanner.SpannerAsyncClient`
+    instead of blocking the event loop.
+
+    .. code-block:: python
+
+       database = AsyncDatabase(instance.database("my-database"))
+       async with database.snapshot() as snapshot:
+           async for row in snapshot.execute_sql("SELECT * FROM users"):
+               print(row)
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: the database being wrapped.
+
+    :type pool: :class:`~google.cloud.spanner_v1.aio.pool.AsyncSessionPool`
+    :param pool: (Optional) session pool to be used by the database.  If
+                 not passed, the database will construct an instance of
+                 :class:`~google.cloud.spanner_v1.aio.pool.AsyncSessionPool`.
+    """
+
+    _spanner_api = None
+
+    def __init__(self, database, pool=None):
+        self._database = database
+        if pool is None:
+            pool = AsyncSessionPool(database_role=database.database_role)
+        self._pool = pool
+        pool.bind(self)
+
+    @property
+    def name(self):
+        """Database name used in requests.
+
+        :rtype: str
+        :returns: The database name.
+        """
+        return self._database.name
+
+    @property
+    def database_role(self):
+        """User-assigned database_role for sessions created by the pool.
+
+        :rtype: str
+        :returns: a str with the name of the database role.
+        """
+        return self._database.database_role
+
+    @property
+    def database(self):
+        """The wrapped synchronous database.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.Database`
+        :returns: the database passed to the constructor.
+        """
+        return self._database
+
+    @property
+    def _instance(self):
+        return self._database._instance
+
+    @property
+    def _route_to_leader_enabled(self):
+        return self._database._route_to_leader_enabled
+
+    @property
+    def log_commit_stats(self):
+        """Whether commit statistics are logged.
+
+        :rtype: bool
+        :returns: the flag of the wrapped database.
+        """
+        return self._database.log_commit_stats
+
+    @property
+    def logger(self):
+        """Logger used by the wrapped database.
+
+        :rtype: :class:`logging.Logger`
+        """
+        return self._database.logger
+
+    @property
+    def spanner_api(self):
+        """Helper for session-related API calls."""
+        if self._spanner_api is None:
+            client_info = self._instance._client._client_info
+            client_options = self._instance._client._client_options
+            if self._instance.emulator_host is not None:
+                transport = SpannerGrpcAsyncIOTransport(
+                    channel=grpc_aio.insecure_channel(self._instance.emulator_host)
+                )
+                self._spanner_api = SpannerAsyncClient(
+                    client_info=client_info, transport=transport
+                )
+                return self._spanner_api
+            credentials = self._instance._client.credentials
+            if isinstance(credentials, google.auth.credentials.Scoped):
+                credentials = credentials.with_scopes((SPANNER_DATA_SCOPE,))
+            self._spanner_api = SpannerAsyncClient(
+                credentials=credentials,
+                client_info=client_info,
+                client_options=client_options,
+            )
+        return self._spanner_api
+
+    def session(self, labels=None, database_role=None):
+        """Factory to create a session for this database.
+
+        :type labels: dict (str -> str) or None
+        :param labels: (Optional) user-assigned labels for the session.
+
+        :type database_role: str
+        :param database_role: (Optional) user-assigned database_role for the session.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+        :returns: a session bound to this database.
+        """
+        # If role is specified in param, then that role is used
+        # instead.
+        role = database_role or self.database_role
+        return AsyncSession(self, labels=labels, database_role=role)
+
+    def snapshot(self, **kw):
+        """Return an object which wraps a snapshot.
+
+        The wrapper *must* be used as an async context manager, with the
+        snapshot as the value returned by the wrapper.
+
+        :type kw: dict
+        :param kw:
+            Passed through to
+            :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot` constructor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.database.AsyncSnapshotCheckout`
+        :returns: new wrapper
+        """
+        return AsyncSnapshotCheckout(self, **kw)
+
+    def batch(self, request_options=None):
+        """Return an object which wraps a batch.
+
+        The wrapper *must* be used as an async context manager, with the
+        batch as the value returned by the wrapper.
+
+        :type request_options:
+                :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for the commit request.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.database.AsyncBatchCheckout`
+        :returns: new wrapper
+        """
+        return AsyncBatchCheckout(self, request_options)
+
+    async def run_in_transaction(self, func, *args, **kw):
+        """Perform a unit of work in a transaction, retrying on abort.
+
+        :type func: coroutine function
+        :param func: takes a required positional argument, the transaction,
+                     and additional positional / keyword arguments as supplied
+                     by the caller.
+
+        :type args: tuple
+        :param args: additional positional arguments to be passed to ``func``.
+
+        :type kw: dict
+        :param kw: (Optional) keyword arguments to be passed to ``func``.
+                   If passed, "timeout_secs" will be removed and used to
+                   override the default retry timeout which defines maximum timestamp
+                   to continue retrying the transaction.
+
+        :rtype: Any
+        :returns: The value returned by awaiting ``func``.
+
+        :raises Exception:
+            reraises any non-ABORT exceptions raised by ``func``.
+        """
+        # Nesting is tracked per task, rather than per thread.
+        if _transaction_running.get():
+            raise RuntimeError("Spanner does not support nested transactions.")
+        token = _transaction_running.set(True)
+
+        try:
+            async with AsyncSessionCheckout(self._pool) as session:
+                return await session.run_in_transaction(func, *args, **kw)
+        finally:
+            _transaction_running.reset(token)
+
+    async def close(self):
+        """Delete the pooled sessions and close the underlying channel."""
+        await self._pool.clear()
+        if self._spanner_api is not None:
+            await self._spanner_api.transport.close()
+            self._spanner_api = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncBatchCheckout(object):
+    """Async context manager for using a batch from a database.
+
+    Inside the context manager, checks out a session from the database,
+    creates a batch from it, making the batch available.  The batch is
+    committed when the block exits without an exception.
+
+    :type database: :class:`AsyncDatabase`
+    :param database: database to use
+
+    :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+    :param request_options:
+            (Optional) Common options for the commit request.
+            If a dict is provided, it must be of the same form as the protobuf
+            message :class:`~google.cloud.spanner_v1.types.RequestOptions`.
+    """
+
+    def __init__(self, database, request_options=None):
+        self._database = database
+        self._session = self._batch = None
+        if request_options is None:
+            self._request_options = RequestOptions()
+        elif isinstance(request_options, dict):
+            self._request_options = RequestOptions(request_options)
+        else:
+            self._request_options = request_options
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        session = self._session = await self._database._pool.get()
+        batch = self._batch = session.batch()
+        if self._request_options.transaction_tag:
+            batch.transaction_tag = self._request_options.transaction_tag
+        return batch
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        try:
+            if exc_type is None:
+                await self._batch.commit(
+                    return_commit_stats=self._database.log_commit_stats,
+                    request_options=self._request_options,
+                )
+        finally:
+            if self._database.log_commit_stats and self._batch.commit_stats:
+                self._database.logger.info(
+                    "CommitStats: {}".format(self._batch.commit_stats),
+                    extra={"commit_stats": self._batch.commit_stats},
+                )
+            self._database._pool.put(self._session)
+
+
+class AsyncSnapshotCheckout(object):
+    """Async context manager for using a snapshot from a database.
+
+    Inside the context manager, checks out a session from the database,
+    creates a snapshot from it, making the snapshot available.
+
+    Caller must *not* use the snapshot to perform API requests outside the
+    scope of the context manager.
+
+    :type database: :class:`AsyncDatabase`
+    :param database: database to use
+
+    :type kw: dict
+    :param kw:
+        Passed through to
+        :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot` constructor.
+    """
+
+    def __init__(self, database, **kw):
+        self._database = database
+        self._session = None
+        self._kw = kw
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        session = self._session = await self._database._pool.get()
+        return session.snapshot(**self._kw)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        if isinstance(exc_val, NotFound):
+            # If NotFound exception occurs inside the with block
+            # then we validate if the session still exists.
+            if not await self._session.exists():
+                self._session = self._database.session(
+                    labels=self._database._pool.labels,
+                    database_role=self._database._pool.database_role,
+                )
+                await self._session.create()
+        self._database._pool.put(self._session)
@@ -0,0 +1,182 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool of Cloud Spanner sessions, for asyncio."""
+
+import asyncio
+
+from google.cloud.exceptions import NotFound
+
+
+class AsyncSessionPool(object):
+    """Bounded pool of sessions, shared by the tasks of an event loop.
+
+    Sessions are created on demand, up to ``size``;  once all of them are
+    checked out, :meth:`get` waits for one to be returned to the pool.
+
+    :type size: int
+    :param size: maximum number of sessions in the pool.
+
+    :type default_timeout: float
+    :param default_timeout: (Optional) default seconds to wait for a session
+                            to be returned to the pool.  Waits indefinitely
+                            if not passed.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+
+    :type database_role: str
+    :param database_role: (Optional) user-assigned database_role for the session.
+    """
+
+    DEFAULT_SIZE = 10
+    _database = None
+
+    def __init__(
+        self,
+        size=DEFAULT_SIZE,
+        default_timeout=None,
+        labels=None,
+        database_role=None,
+    ):
+        if labels is None:
+            labels = {}
+        self.size = size
+        self.default_timeout = default_timeout
+        self._labels = labels
+        self._database_role = database_role
+        self._sessions = None  # Created in the running event loop
+        self._created = 0
+
+    @property
+    def labels(self):
+        """User-assigned labels for sessions created by the pool.
+
+        :rtype: dict (str -> str)
+        :returns: labels assigned by the user
+        """
+        return self._labels
+
+    @property
+    def database_role(self):
+        """User-assigned database_role for sessions created by the pool.
+
+        :rtype: str
+        :returns: database_role assigned by the user
+        """
+        return self._database_role
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        Sessions are created lazily, by :meth:`get`.
+
+        :type database: :class:`~google.cloud.spanner_v1.aio.database.AsyncDatabase`
+        :param database: database used by the pool to create sessions
+                         when needed.
+        """
+        self._database = database
+        self._database_role = self._database_role or database.database_role
+
+    def _get_queue(self):
+        """Helper:  idle sessions, ready to be checked out."""
+        if self._sessions is None:
+            self._sessions = asyncio.Queue()
+        return self._sessions
+
+    async def get(self, timeout=None):
+        """Check a session out from the pool.
+
+        :type timeout: float
+        :param timeout: seconds to wait for a session to be returned to the
+                        pool, if all sessions are checked out.  Defaults to
+                        :attr:`default_timeout`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+        :returns: an existing session from the pool, or a newly-created
+                  session.
+        :raises: :exc:`asyncio.TimeoutError` if no session becomes available
+                 within ``timeout``.
+        """
+        sessions = self._get_queue()
+        if sessions.empty() and self._created < self.size:
+            self._created += 1
+            session = self._database.session(
+                labels=self.labels, database_role=self.database_role
+            )
+            try:
+                await session.create()
+            except BaseException:
+                self._created -= 1
+                raise
+            return session
+
+        if timeout is None:
+            timeout = self.default_timeout
+        return await asyncio.wait_for(sessions.get(), timeout)
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+        :param session: the session being returned.
+        """
+        self._get_queue().put_nowait(session)
+
+    async def clear(self):
+        """Delete all sessions currently in the pool."""
+        sessions = self._get_queue()
+        while not sessions.empty():
+            session = sessions.get_nowait()
+            self._created -= 1
+            try:
+                await session.delete()
+            except NotFound:
+                pass
+
+    def session(self, **kwargs):
+        """Check out a session from the pool.
+
+        :param kwargs: (optional) keyword arguments, passed through to
+                       the returned checkout.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.pool.AsyncSessionCheckout`
+        :returns: a checkout instance, to be used as an async context manager
+                  for accessing the session and returning it to the pool.
+        """
+        return AsyncSessionCheckout(self, **kwargs)
+
+
+class AsyncSessionCheckout(object):
+    """Async context manager:  hold session checked out from a pool.
+
+    :type pool: :class:`AsyncSessionPool`
+    :param pool: Pool from which to check out a session.
+
+    :param kwargs: extra keyword arguments to be passed to :meth:`pool.get`.
+    """
+
+    _session = None
+
+    def __init__(self, pool, **kwargs):
+        self._pool = pool
+        self._kwargs = kwargs.copy()
+
+    async def __aenter__(self):
+        self._session = await self._pool.get(**self._kwargs)
+        return self._session
+
+    async def __aexit__(self, *ignored):
+        self._pool.put(self._session)
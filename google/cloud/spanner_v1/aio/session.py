@@ -0,0 +1,260 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wrapper for Cloud Spanner Session objects, for asyncio."""
+
+import asyncio
+
+from google.api_core.exceptions import Aborted
+from google.api_core.exceptions import GoogleAPICallError
+from google.api_core.exceptions import NotFound
+
+from google.cloud.spanner_v1 import ExecuteSqlRequest
+from google.cloud.spanner_v1._helpers import (
+    _metadata_with_prefix,
+    _metadata_with_leader_aware_routing,
+)
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.aio.batch import AsyncBatch
+from google.cloud.spanner_v1.aio.snapshot import AsyncSnapshot
+from google.cloud.spanner_v1.aio.transaction import AsyncTransaction
+from google.cloud.spanner_v1.retry_policy import DEFAULT_ABORT_RETRY_POLICY
+from google.cloud.spanner_v1.session import Session
+
+
+class AsyncSession(Session):
+    """Representation of a Cloud Spanner Session, for asyncio.
+
+    :type database: :class:`~google.cloud.spanner_v1.aio.database.AsyncDatabase`
+    :param database: The database to which the session is bound.
+
+    :type labels: dict (str -> str)
+    :param labels: (Optional) User-assigned labels for the session.
+
+    :type database_role: str
+    :param database_role: (Optional) user-assigned database_role for the session.
+    """
+
+    async def create(self):
+        """Create this session, bound to its database.
+
+        :raises ValueError: if :attr:`session_id` is already set.
+        """
+        request, metadata = self._make_create_request()
+        api = self._database.spanner_api
+        with trace_call("CloudSpanner.CreateSession", self, self._labels):
+            session_pb = await api.create_session(
+                request=request,
+                metadata=metadata,
+            )
+        self._session_id = session_pb.name.split("/")[-1]
+
+    async def exists(self):
+        """Test for the existence of this session.
+
+        :rtype: bool
+        :returns: True if the session exists on the back-end, else False.
+        """
+        if self._session_id is None:
+            return False
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+        if self._database._route_to_leader_enabled:
+            metadata.append(
+                _metadata_with_leader_aware_routing(
+                    self._database._route_to_leader_enabled
+                )
+            )
+
+        with trace_call("CloudSpanner.GetSession", self) as span:
+            try:
+                await api.get_session(name=self.name, metadata=metadata)
+                if span:
+                    span.set_attribute("session_found", True)
+            except NotFound:
+                if span:
+                    span.set_attribute("session_found", False)
+                return False
+
+        return True
+
+    async def delete(self):
+        """Delete this session.
+
+        :raises ValueError: if :attr:`session_id` is not already set.
+        :raises NotFound: if the session does not exist
+        """
+        if self._session_id is None:
+            raise ValueError("Session ID not set by back-end")
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+        with trace_call("CloudSpanner.DeleteSession", self):
+            await api.delete_session(name=self.name, metadata=metadata)
+
+    async def ping(self):
+        """Ping the session to keep it alive by executing "SELECT 1".
+
+        :raises ValueError: if :attr:`session_id` is not already set.
+        """
+        if self._session_id is None:
+            raise ValueError("Session ID not set by back-end")
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+        request = ExecuteSqlRequest(session=self.name, sql="SELECT 1")
+        await api.execute_sql(request=request, metadata=metadata)
+
+    def snapshot(self, **kw):
+        """Create a snapshot to perform a set of reads with shared staleness.
+
+        :type kw: dict
+        :param kw: Passed through to
+                   :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot` ctor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot`
+        :returns: a snapshot bound to this session
+        :raises ValueError: if the session has not yet been created.
+        """
+        if self._session_id is None:
+            raise ValueError("Session has not been created.")
+
+        return AsyncSnapshot(self, **kw)
+
+    def batch(self):
+        """Factory to create a batch for this session.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.batch.AsyncBatch`
+        :returns: a batch bound to this session
+        :raises ValueError: if the session has not yet been created.
+        """
+        if self._session_id is None:
+            raise ValueError("Session has not been created.")
+
+        return AsyncBatch(self)
+
+    def transaction(self):
+        """Create a read-write transaction.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.transaction.AsyncTransaction`
+        :returns: a transaction bound to this session
+        :raises ValueError: if the session has not yet been created.
+        """
+        if self._session_id is None:
+            raise ValueError("Session has not been created.")
+
+        if self._transaction is not None:
+            self._transaction.rolled_back = True
+            del self._transaction
+
+        txn = self._transaction = AsyncTransaction(self)
+        return txn
+
+    async def run_in_transaction(self, func, *args, **kw):
+        """Perform a unit of work in a transaction, retrying on abort.
+
+        :type func: coroutine function
+        :param func: takes a required positional argument, the transaction,
+                     and additional positional / keyword arguments as supplied
+                     by the caller.
+
+        :type args: tuple
+        :param args: additional positional arguments to be passed to ``func``.
+
+        :type kw: dict
+        :param kw: (Optional) keyword arguments to be passed to ``func``.
+                   "timeout_secs", "commit_request_options",
+                   "transaction_tag" and "retry_policy" are handled as by
+                   :meth:`google.cloud.spanner_v1.session.Session.run_in_transaction`.
+
+        :rtype: Any
+        :returns: The value returned by awaiting ``func``.
+
+        :raises Exception:
+            reraises any non-ABORT exceptions raised by ``func``.
+        """
+        retry_policy = kw.pop("retry_policy", None) or DEFAULT_ABORT_RETRY_POLICY
+        deadline = retry_policy.deadline(kw.pop("timeout_secs", None))
+        commit_request_options = kw.pop("commit_request_options", None)
+        transaction_tag = kw.pop("transaction_tag", None)
+        attempts = 0
+
+        while True:
+            if self._transaction is None:
+                txn = self.transaction()
+                txn.transaction_tag = transaction_tag
+            else:
+                txn = self._transaction
+
+            try:
+                attempts += 1
+                retry_policy.record_attempt(transaction_tag)
+                return_value = await func(txn, *args, **kw)
+            except Aborted as exc:
+                del self._transaction
+                await _delay_until_retry(
+                    exc, deadline, attempts, retry_policy, transaction_tag
+                )
+                continue
+            except GoogleAPICallError:
+                del self._transaction
+                raise
+            except Exception:
+                await txn.rollback()
+                raise
+
+            try:
+                await txn.commit(
+                    return_commit_stats=self._database.log_commit_stats,
+                    request_options=commit_request_options,
+                )
+            except Aborted as exc:
+                del self._transaction
+                await _delay_until_retry(
+                    exc, deadline, attempts, retry_policy, transaction_tag
+                )
+            except GoogleAPICallError:
+                del self._transaction
+                raise
+            else:
+                if self._database.log_commit_stats and txn.commit_stats:
+                    self._database.logger.info(
+                        "CommitStats: {}".format(txn.commit_stats),
+                        extra={"commit_stats": txn.commit_stats},
+                    )
+                return return_value
+
+
+async def _delay_until_retry(exc, deadline, attempts, retry_policy, transaction_tag):
+    """Helper for :meth:`AsyncSession.run_in_transaction`.
+
+    Detect retryable abort, and impose the delay chosen by the retry policy
+    without blocking the event loop.
+
+    :type exc: :class:`google.api_core.exceptions.Aborted`
+    :param exc: exception for aborted transaction
+
+    :type deadline: float
+    :param deadline: maximum timestamp to continue retrying the transaction.
+
+    :type attempts: int
+    :param attempts: number of call retries
+
+    :type retry_policy: :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: policy choosing the delay.
+
+    :type transaction_tag: str
+    :param transaction_tag: tag of the aborted transaction.
+    """
+    delay = retry_policy.retry_delay(exc, deadline, attempts, transaction_tag)
+    if delay:
+        await asyncio.sleep(delay)
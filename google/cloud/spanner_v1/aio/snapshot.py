@@ -0,0 +1,322 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Model a set of read-only queries to a database as a snapshot, for asyncio."""
+
+import asyncio
+import functools
+
+from google.api_core.exceptions import InternalServerError
+from google.api_core.exceptions import ServiceUnavailable
+from google.api_core import gapic_v1
+
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.aio.streamed import AsyncStreamedResultSet
+from google.cloud.spanner_v1.snapshot import Snapshot
+from google.cloud.spanner_v1.snapshot import _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
+from google.cloud.spanner_v1.snapshot import _begins_inline
+
+
+def _is_resumable(exc):
+    """Helper for :func:`_restart_on_unavailable`.
+
+    :rtype: bool
+    :returns: True if the stream may be resumed after ``exc``.
+    """
+    if isinstance(exc, ServiceUnavailable):
+        return True
+    return isinstance(exc, InternalServerError) and any(
+        resumable_message in exc.message
+        for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
+    )
+
+
+async def _open_stream(method, request, trace_name, session, attributes, transaction):
+    """Helper for :func:`_restart_on_unavailable`:  (re)start the stream."""
+    request.transaction = transaction._make_txn_selector()
+    with trace_call(trace_name, session, attributes):
+        stream = await method(request=request)
+    return stream.__aiter__()
+
+
+async def _restart_on_unavailable(
+    method,
+    request,
+    trace_name=None,
+    session=None,
+    attributes=None,
+    transaction=None,
+    buffer_policy=None,
+):
+    """Restart iteration after :exc:`.ServiceUnavailable`.
+
+    Asynchronous counterpart of
+    :func:`google.cloud.spanner_v1.snapshot._restart_on_unavailable`:  items
+    are only yielded once a resume token is received, and the stream is
+    restarted from the last resume token after a resumable error.
+
+    If the request begins the transaction inline, the transaction's begin
+    lock is held until the first response, which carries the ID of the
+    transaction, so that concurrent requests do not begin it again.
+
+    :type method: callable
+    :param method: coroutine function returning an asynchronous iterator
+
+    :type request: proto
+    :param request: request proto to call the method with
+
+    :type transaction: :class:`_AsyncSnapshotBase`
+    :param transaction: Snapshot or Transaction object supplying the
+                        transaction selector.
+
+    :type buffer_policy: :class:`~google.cloud.spanner_v1.snapshot.ResumeBufferPolicy`
+    :param buffer_policy: (Optional) limits on the results buffered while
+                          awaiting a resume token.  Unbounded if not passed.
+    """
+    resume_token = b""
+    item_buffer = []
+    buffered_bytes = 0
+    flushed = False  # results past ``resume_token`` were yielded
+    resumable = buffer_policy is None or buffer_policy.resumable
+
+    begin_lock = None
+    if transaction._transaction_id is None and _begins_inline(transaction):
+        begin_lock = transaction._get_begin_lock()
+        await begin_lock.acquire()
+        if transaction._transaction_id is not None:  # begun while waiting
+            begin_lock.release()
+            begin_lock = None
+
+    try:
+        iterator = await _open_stream(
+            method, request, trace_name, session, attributes, transaction
+        )
+        while True:
+            try:
+                async for item in iterator:
+                    item_buffer.append(item)
+                    if begin_lock is not None:
+                        # The transaction was begun inline by this request.
+                        transaction_id = item.metadata.transaction.id
+                        if transaction_id:
+                            transaction._transaction_id = transaction_id
+                        begin_lock.release()
+                        begin_lock = None
+                    if item.resume_token or not resumable:
+                        resume_token = item.resume_token
+                        flushed = False
+                        break
+                    if buffer_policy is not None:
+                        buffered_bytes += buffer_policy._item_size(item)
+                        if buffer_policy._check_overflow(
+                            len(item_buffer), buffered_bytes
+                        ):
+                            flushed = True
+                            break
+            except (ServiceUnavailable, InternalServerError) as exc:
+                if not resumable or flushed or not _is_resumable(exc):
+                    raise
+                del item_buffer[:]
+                request.resume_token = resume_token
+                iterator = await _open_stream(
+                    method, request, trace_name, session, attributes, transaction
+                )
+                continue
+
+            if len(item_buffer) == 0:
+                break
+
+            for item in item_buffer:
+                yield item
+
+            del item_buffer[:]
+            buffered_bytes = 0
+    finally:
+        if begin_lock is not None:
+            begin_lock.release()
+
+
+class _AsyncSnapshotBase(object):
+    """Mixin providing asynchronous ``read`` / ``execute_sql``.
+
+    Requests are built by the synchronous base class, then sent through the
+    database's :class:`~google.cloud.spanner_v1.services.spanner.SpannerAsyncClient`.
+    """
+
+    _begin_lock = None
+
+    def _get_begin_lock(self):
+        """Lock serializing requests which would begin the transaction.
+
+        :rtype: :class:`asyncio.Lock`
+        """
+        if self._begin_lock is None:
+            self._begin_lock = asyncio.Lock()
+        return self._begin_lock
+
+    def _make_result_set(self, iterator, decode_bytes=False):
+        """Helper for :meth:`read` / :meth:`execute_sql`."""
+        if self._multi_use:
+            return AsyncStreamedResultSet(
+                iterator, source=self, decode_bytes=decode_bytes
+            )
+        return AsyncStreamedResultSet(iterator, decode_bytes=decode_bytes)
+
+    def read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        limit=0,
+        partition=None,
+        request_options=None,
+        data_boost_enabled=False,
+        *,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+        buffer_policy=None,
+        decode_bytes=False,
+    ):
+        """Perform a ``StreamingRead`` API request for rows in a table.
+
+        The request is sent when the result set is first iterated, using
+        ``async for``.  See
+        :meth:`google.cloud.spanner_v1.snapshot.Snapshot.read` for the
+        parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.streamed.AsyncStreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, or if a transaction ID is
+            already pending for multiple-use snapshots.
+        """
+        request, metadata = self._make_read_request(
+            table,
+            columns,
+            keyset,
+            index=index,
+            limit=limit,
+            partition=partition,
+            request_options=request_options,
+            data_boost_enabled=data_boost_enabled,
+        )
+        api = self._session._database.spanner_api
+        restart = functools.partial(
+            api.streaming_read,
+            metadata=metadata,
+            retry=retry,
+            timeout=timeout,
+        )
+        trace_attributes = {"table_id": table, "columns": columns}
+        iterator = _restart_on_unavailable(
+            restart,
+            request,
+            "CloudSpanner.ReadOnlyTransaction",
+            self._session,
+            trace_attributes,
+            transaction=self,
+            buffer_policy=buffer_policy,
+        )
+        self._read_request_count += 1
+        return self._make_result_set(iterator, decode_bytes)
+
+    def execute_sql(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        query_mode=None,
+        query_options=None,
+        request_options=None,
+        partition=None,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+        data_boost_enabled=False,
+        buffer_policy=None,
+        decode_bytes=False,
+    ):
+        """Perform an ``ExecuteStreamingSql`` API request.
+
+        The request is sent when the result set is first iterated, using
+        ``async for``.  See
+        :meth:`google.cloud.spanner_v1.snapshot.Snapshot.execute_sql` for the
+        parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.streamed.AsyncStreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, or if a transaction ID is
+            already pending for multiple-use snapshots.
+        """
+        request, metadata = self._make_execute_sql_request(
+            sql,
+            params=params,
+            param_types=param_types,
+            query_mode=query_mode,
+            query_options=query_options,
+            request_options=request_options,
+            partition=partition,
+            data_boost_enabled=data_boost_enabled,
+        )
+        api = self._session._database.spanner_api
+        restart = functools.partial(
+            api.execute_streaming_sql,
+            metadata=metadata,
+            retry=retry,
+            timeout=timeout,
+        )
+        trace_attributes = {"db.statement": sql}
+        iterator = _restart_on_unavailable(
+            restart,
+            request,
+            "CloudSpanner.ReadWriteTransaction",
+            self._session,
+            trace_attributes,
+            transaction=self,
+            buffer_policy=buffer_policy,
+        )
+        self._read_request_count += 1
+        self._execute_sql_count += 1
+        return self._make_result_set(iterator, decode_bytes)
+
+
+class AsyncSnapshot(_AsyncSnapshotBase, Snapshot):
+    """Allow a set of reads / SQL statements with shared staleness, for asyncio.
+
+    See :class:`~google.cloud.spanner_v1.snapshot.Snapshot` for the
+    constructor parameters.
+    """
+
+    async def begin(self):
+        """Begin a read-only transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        options, metadata = self._make_begin_request()
+        api = self._session._database.spanner_api
+        with trace_call("CloudSpanner.BeginTransaction", self._session):
+            response = await api.begin_transaction(
+                session=self._session.name,
+                options=options,
+                metadata=metadata,
+            )
+        self._transaction_id = response.id
+        return self._transaction_id
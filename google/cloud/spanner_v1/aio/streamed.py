@@ -0,0 +1,105 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wrapper for streaming results, consumed with ``async for``."""
+
+from google.cloud import exceptions
+
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+
+class AsyncStreamedResultSet(StreamedResultSet):
+    """Process an asynchronous stream of partial result sets into rows.
+
+    Partial result sets are merged exactly as by
+    :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`;  rows are
+    consumed with ``async for``.
+
+    :type response_iterator:
+    :param response_iterator:
+        Asynchronous iterator yielding
+        :class:`~google.cloud.spanner_v1.types.PartialResultSet`
+        instances.
+
+    :type source: :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot`
+    :param source: Snapshot from which the result set was fetched.
+    """
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate over an AsyncStreamedResultSet")
+
+    def _read_next_values(self):
+        """Synchronous consumption, e.g. columnar decoding, is not supported."""
+        raise TypeError("Use 'async for' to iterate over an AsyncStreamedResultSet")
+
+    def __aiter__(self):
+        return self._aiter_rows()
+
+    async def _aiter_rows(self):
+        """Helper for :meth:`__aiter__`."""
+        while True:
+            iter_rows, self._rows = self._rows, []
+            for row in iter_rows:
+                yield row
+            try:
+                response = await self._response_iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            self._merge_values(self._process_response(response))
+
+    async def to_list(self):
+        """Consume the whole result set.
+
+        :rtype: list
+        :returns: all rows of the result set.
+        """
+        return [row async for row in self]
+
+    async def one(self):
+        """Return exactly one result, or raise an exception.
+
+        :raises: :exc:`NotFound`: If there are no results.
+        :raises: :exc:`ValueError`: If there are multiple results.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        answer = await self.one_or_none()
+        if answer is None:
+            raise exceptions.NotFound("No rows matched the given query.")
+        return answer
+
+    async def one_or_none(self):
+        """Return exactly one result, or None if there are no results.
+
+        :raises: :exc:`ValueError`: If there are multiple results.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if self._metadata is not None:
+            raise RuntimeError(
+                "Can not call `.one` or `.one_or_none` after "
+                "stream consumption has already started."
+            )
+
+        rows = self.__aiter__()
+        try:
+            answer = await rows.__anext__()
+        except StopAsyncIteration:
+            return None
+
+        try:
+            await rows.__anext__()
+        except StopAsyncIteration:
+            return answer
+        raise ValueError("Expected one result; got more.")
@@ -0,0 +1,230 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spanner read-write transaction support, for asyncio."""
+
+import functools
+
+from google.api_core import gapic_v1
+
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.aio.snapshot import _AsyncSnapshotBase
+from google.cloud.spanner_v1.transaction import Transaction
+
+
+class AsyncTransaction(_AsyncSnapshotBase, Transaction):
+    """Implement read-write transaction semantics for a session, for asyncio.
+
+    Statements run before the transaction is begun begin it inline;  the
+    first of them holds the transaction's begin lock until its response
+    carries the transaction ID.
+
+    :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+    :param session: the session used to perform the commit
+
+    :raises ValueError: if session has an existing transaction
+    """
+
+    async def _wait_for_inline_begin(self):
+        """Wait for any in-flight statement beginning the transaction."""
+        if self._transaction_id is None and self._begin_lock is not None:
+            async with self._begin_lock:
+                pass
+
+    async def _execute_request(self, method, request, trace_name, attributes):
+        """Helper for :meth:`execute_update` / :meth:`batch_update`.
+
+        :type method: callable
+        :param method: coroutine function sending the request
+
+        :type request: proto
+        :param request: request proto to call the method with
+        """
+        request.transaction = self._make_txn_selector()
+        with trace_call(trace_name, self._session, attributes):
+            return await method(request=request)
+
+    async def begin(self):
+        """Begin a transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        txn_options, metadata = self._make_begin_request()
+        api = self._session._database.spanner_api
+        with trace_call("CloudSpanner.BeginTransaction", self._session):
+            response = await api.begin_transaction(
+                session=self._session.name, options=txn_options, metadata=metadata
+            )
+        self._transaction_id = response.id
+        return self._transaction_id
+
+    async def rollback(self):
+        """Roll back a transaction on the database."""
+        self._check_state()
+        await self._wait_for_inline_begin()
+
+        if self._transaction_id is not None:
+            api = self._session._database.spanner_api
+            metadata = self._make_metadata(route_to_leader=True)
+            with trace_call("CloudSpanner.Rollback", self._session):
+                await api.rollback(
+                    session=self._session.name,
+                    transaction_id=self._transaction_id,
+                    metadata=metadata,
+                )
+        self.rolled_back = True
+        del self._session._transaction
+
+    async def commit(self, return_commit_stats=False, request_options=None):
+        """Commit mutations to the database.
+
+        See :meth:`google.cloud.spanner_v1.transaction.Transaction.commit`.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        :raises ValueError: if there are no mutations to commit.
+        """
+        self._check_state()
+        await self._wait_for_inline_begin()
+        if self._transaction_id is None and len(self._mutations) > 0:
+            await self.begin()
+        elif self._transaction_id is None and len(self._mutations) == 0:
+            raise ValueError("Transaction is not begun")
+
+        request, metadata = self._make_commit_request(
+            return_commit_stats, request_options
+        )
+        api = self._session._database.spanner_api
+        trace_attributes = {"num_mutations": len(self._mutations)}
+        with trace_call("CloudSpanner.Commit", self._session, trace_attributes):
+            response = await api.commit(
+                request=request,
+                metadata=metadata,
+            )
+        return self._process_commit_response(response, return_commit_stats)
+
+    async def execute_update(
+        self,
+        dml,
+        params=None,
+        param_types=None,
+        query_mode=None,
+        query_options=None,
+        request_options=None,
+        *,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+    ):
+        """Perform an ``ExecuteSql`` API request with DML.
+
+        See :meth:`google.cloud.spanner_v1.transaction.Transaction.execute_update`.
+
+        :rtype: int
+        :returns: Count of rows affected by the DML statement.
+        """
+        request, metadata = self._make_execute_update_request(
+            dml,
+            params=params,
+            param_types=param_types,
+            query_mode=query_mode,
+            query_options=query_options,
+            request_options=request_options,
+        )
+        api = self._session._database.spanner_api
+        method = functools.partial(
+            api.execute_sql,
+            metadata=metadata,
+            retry=retry,
+            timeout=timeout,
+        )
+        trace_attributes = {"db.statement": dml}
+
+        if self._transaction_id is None:
+            async with self._get_begin_lock():
+                request.seqno = self._next_seqno()
+                response = await self._execute_request(
+                    method,
+                    request,
+                    "CloudSpanner.ReadWriteTransaction",
+                    trace_attributes,
+                )
+                self._update_transaction_id(response)
+        else:
+            request.seqno = self._next_seqno()
+            response = await self._execute_request(
+                method,
+                request,
+                "CloudSpanner.ReadWriteTransaction",
+                trace_attributes,
+            )
+
+        return response.stats.row_count_exact
+
+    async def batch_update(self, statements, request_options=None):
+        """Perform a batch of DML statements via an ``ExecuteBatchDml`` request.
+
+        See :meth:`google.cloud.spanner_v1.transaction.Transaction.batch_update`.
+
+        :rtype:
+            Tuple(status, Sequence[int])
+        :returns:
+            Status code, plus counts of rows affected by each completed DML
+            statement.
+        """
+        request, metadata = self._make_batch_update_request(statements, request_options)
+        api = self._session._database.spanner_api
+        method = functools.partial(api.execute_batch_dml, metadata=metadata)
+        trace_attributes = {
+            # Get just the queries from the DML statement batch
+            "db.statement": ";".join(
+                [statement.sql for statement in request.statements]
+            )
+        }
+
+        if self._transaction_id is None:
+            async with self._get_begin_lock():
+                request.seqno = self._next_seqno()
+                response = await self._execute_request(
+                    method, request, "CloudSpanner.DMLTransaction", trace_attributes
+                )
+                for result_set in response.result_sets:
+                    self._update_transaction_id(result_set)
+        else:
+            request.seqno = self._next_seqno()
+            response = await self._execute_request(
+                method, request, "CloudSpanner.DMLTransaction", trace_attributes
+            )
+
+        row_counts = [
+            result_set.stats.row_count_exact for result_set in response.result_sets
+        ]
+
+        return response.status, row_counts
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncTransaction")
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
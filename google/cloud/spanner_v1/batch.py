@@ -14,19 +14,50 @@
 
 """Context manager for Cloud Spanner batched writes."""
 
+import collections
+import concurrent.futures
+
+import grpc
+from google.api_core import exceptions
+from google.api_core import gapic_v1
+
 from google.cloud.spanner_v1 import CommitRequest
 from google.cloud.spanner_v1 import Mutation
 from google.cloud.spanner_v1 import TransactionOptions
 
 from google.cloud.spanner_v1._helpers import _SessionWrapper
+from google.cloud.spanner_v1._helpers import _column_value_lists
+from google.cloud.spanner_v1._helpers import _encode_columns
+from google.cloud.spanner_v1._helpers import _encode_rows
+from google.cloud.spanner_v1._helpers import _make_column_encoders
 from google.cloud.spanner_v1._helpers import _make_list_value_pbs
-from google.cloud.spanner_v1._helpers import (
-    _metadata_with_prefix,
-    _metadata_with_leader_aware_routing,
-)
+from google.cloud.spanner_v1._opentelemetry_tracing import end_call_span
+from google.cloud.spanner_v1._opentelemetry_tracing import start_call_span
 from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
 from google.cloud.spanner_v1 import RequestOptions
 
+DEFAULT_BATCH_WRITE_WORKERS = 4
+"""Default number of mutation groups committed at once."""
+
+
+BatchWriteResult = collections.namedtuple(
+    "BatchWriteResult", ["indexes", "commit_timestamp", "error"]
+)
+BatchWriteResult.__doc__ = """Outcome of applying mutation groups.
+
+:type indexes: list of int
+:param indexes: positions of the groups in the
+                :class:`MutationGroups`.
+
+:type commit_timestamp: :class:`datetime.datetime`
+:param commit_timestamp: timestamp at which the groups were committed, or
+                         None if they failed.
+
+:type error: Exception
+:param error: the error which prevented the groups from being applied, or
+              None if they were committed.
+"""
+
 
 class _BatchBase(_SessionWrapper):
     """Accumulate mutations for transmission during :meth:`commit`.
@@ -52,7 +83,7 @@ class _BatchBase(_SessionWrapper):
         """
         raise NotImplementedError
 
-    def insert(self, table, columns, values):
+    def insert(self, table, columns, values, column_types=None):
         """Insert one or more new table rows.
 
         :type table: str
@@ -61,12 +92,20 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, mapping or :class:`pyarrow.Table`
+        :param values: Values to be modified:  a list of rows, or columnar
+                       data, see :func:`_make_write_mutation`.
+
+        :type column_types: dict, or list
+        :param column_types:
+            (Optional) types of the columns, used to compile a specialized
+            encoder per column, see :func:`_make_write_mutation`.
         """
-        self._mutations.append(Mutation(insert=_make_write_pb(table, columns, values)))
+        self._mutations.append(
+            _make_write_mutation("insert", table, columns, values, column_types)
+        )
 
-    def update(self, table, columns, values):
+    def update(self, table, columns, values, column_types=None):
         """Update one or more existing table rows.
 
         :type table: str
@@ -75,12 +114,20 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, mapping or :class:`pyarrow.Table`
+        :param values: Values to be modified:  a list of rows, or columnar
+                       data, see :func:`_make_write_mutation`.
+
+        :type column_types: dict, or list
+        :param column_types:
+            (Optional) types of the columns, used to compile a specialized
+            encoder per column, see :func:`_make_write_mutation`.
         """
-        self._mutations.append(Mutation(update=_make_write_pb(table, columns, values)))
+        self._mutations.append(
+            _make_write_mutation("update", table, columns, values, column_types)
+        )
 
-    def insert_or_update(self, table, columns, values):
+    def insert_or_update(self, table, columns, values, column_types=None):
         """Insert/update one or more table rows.
 
         :type table: str
@@ -89,14 +136,22 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, mapping or :class:`pyarrow.Table`
+        :param values: Values to be modified:  a list of rows, or columnar
+                       data, see :func:`_make_write_mutation`.
+
+        :type column_types: dict, or list
+        :param column_types:
+            (Optional) types of the columns, used to compile a specialized
+            encoder per column, see :func:`_make_write_mutation`.
         """
         self._mutations.append(
-            Mutation(insert_or_update=_make_write_pb(table, columns, values))
+            _make_write_mutation(
+                "insert_or_update", table, columns, values, column_types
+            )
         )
 
-    def replace(self, table, columns, values):
+    def replace(self, table, columns, values, column_types=None):
         """Replace one or more table rows.
 
         :type table: str
@@ -105,10 +160,18 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, mapping or :class:`pyarrow.Table`
+        :param values: Values to be modified:  a list of rows, or columnar
+                       data, see :func:`_make_write_mutation`.
+
+        :type column_types: dict, or list
+        :param column_types:
+            (Optional) types of the columns, used to compile a specialized
+            encoder per column, see :func:`_make_write_mutation`.
         """
-        self._mutations.append(Mutation(replace=_make_write_pb(table, columns, values)))
+        self._mutations.append(
+            _make_write_mutation("replace", table, columns, values, column_types)
+        )
 
     def delete(self, table, keyset):
         """Delete one or more table rows.
@@ -141,33 +204,14 @@ class Batch(_BatchBase):
         if self.committed is not None:
             raise ValueError("Batch already committed")
 
-    def commit(self, return_commit_stats=False, request_options=None):
-        """Commit mutations to the database.
-
-        :type return_commit_stats: bool
-        :param return_commit_stats:
-          If true, the response will return commit stats which can be accessed though commit_stats.
-
-        :type request_options:
-            :class:`google.cloud.spanner_v1.types.RequestOptions`
-        :param request_options:
-                (Optional) Common options for this request.
-                If a dict is provided, it must be of the same form as the protobuf
-                message :class:`~google.cloud.spanner_v1.types.RequestOptions`.
+    def _make_commit_request(self, return_commit_stats, request_options):
+        """Helper for :meth:`commit`:  build the request.
 
-        :rtype: datetime
-        :returns: timestamp of the committed changes.
+        :rtype: tuple
+        :returns: the :class:`~google.cloud.spanner_v1.types.CommitRequest`
+                  and the RPC metadata.
         """
-        self._check_state()
-        database = self._session._database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
         txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        trace_attributes = {"num_mutations": len(self._mutations)}
 
         if request_options is None:
             request_options = RequestOptions()
@@ -185,14 +229,135 @@ class Batch(_BatchBase):
             return_commit_stats=return_commit_stats,
             request_options=request_options,
         )
+        return request, self._make_metadata(route_to_leader=True)
+
+    def _process_commit_response(self, response):
+        """Helper for :meth:`commit`:  record the outcome of the commit.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self.committed = response.commit_timestamp
+        self.commit_stats = response.commit_stats
+        return self.committed
+
+    def commit(self, return_commit_stats=False, request_options=None):
+        """Commit mutations to the database.
+
+        :type return_commit_stats: bool
+        :param return_commit_stats:
+          If true, the response will return commit stats which can be accessed though commit_stats.
+
+        :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for this request.
+                If a dict is provided, it must be of the same form as the protobuf
+                message :class:`~google.cloud.spanner_v1.types.RequestOptions`.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self._check_state()
+        request, metadata = self._make_commit_request(
+            return_commit_stats, request_options
+        )
+        api = self._session._database.spanner_api
+        trace_attributes = {"num_mutations": len(self._mutations)}
         with trace_call("CloudSpanner.Commit", self._session, trace_attributes):
             response = api.commit(
                 request=request,
                 metadata=metadata,
             )
-        self.committed = response.commit_timestamp
-        self.commit_stats = response.commit_stats
-        return self.committed
+        return self._process_commit_response(response)
+
+    def commit_async(
+        self,
+        return_commit_stats=False,
+        request_options=None,
+        timeout=gapic_v1.method.DEFAULT,
+    ):
+        """Start committing mutations to the database, without waiting.
+
+        The commit is sent using the gRPC future API, so that one thread can
+        keep several commits in flight (on distinct sessions).  Unlike
+        :meth:`commit`, failed commits are not retried.  Transports without
+        a future API commit synchronously, returning a completed future.
+
+        :type return_commit_stats: bool
+        :param return_commit_stats:
+          If true, the response will return commit stats which can be accessed though commit_stats.
+
+        :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for this request.
+                If a dict is provided, it must be of the same form as the protobuf
+                message :class:`~google.cloud.spanner_v1.types.RequestOptions`.
+
+        :type timeout: float
+        :param timeout: (Optional) The timeout for the commit request.
+                        Defaults to the timeout configured for ``Commit``
+                        requests by the client;  ``None`` for no timeout.
+
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: future resolving to the timestamp of the committed changes,
+                  once :attr:`committed` and :attr:`commit_stats` are set.
+        """
+        self._check_state()
+        request, metadata = self._make_commit_request(
+            return_commit_stats, request_options
+        )
+        api = self._session._database.spanner_api
+        span = start_call_span(
+            "CloudSpanner.Commit",
+            self._session,
+            {"num_mutations": len(self._mutations)},
+        )
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+
+        stub = getattr(getattr(api, "transport", None), "commit", None)
+        call_future = getattr(stub, "future", None)
+        if call_future is None:
+            try:
+                response = api.commit(
+                    request=request, metadata=metadata, timeout=timeout
+                )
+            except Exception as exc:
+                end_call_span(span, exc)
+                future.set_exception(exc)
+            else:
+                end_call_span(span)
+                future.set_result(self._process_commit_response(response))
+            return future
+
+        default_timeout, client_metadata = _commit_call_defaults(api.transport)
+        if timeout is gapic_v1.method.DEFAULT:
+            timeout = default_timeout
+        metadata.append(
+            gapic_v1.routing_header.to_grpc_metadata((("session", request.session),))
+        )
+        metadata.extend(client_metadata)
+
+        def _done(call):
+            try:
+                response = call.result()
+            except grpc.RpcError as exc:
+                error = exceptions.from_grpc_error(exc)
+            except Exception as exc:
+                error = exc
+            else:
+                end_call_span(span)
+                future.set_result(self._process_commit_response(response))
+                return
+            end_call_span(span, error)
+            future.set_exception(error)
+
+        call_future(request, metadata=metadata, timeout=timeout).add_done_callback(
+            _done
+        )
+        return future
 
     def __enter__(self):
         """Begin ``with`` block."""
@@ -206,21 +371,225 @@ class Batch(_BatchBase):
             self.commit()
 
 
-def _make_write_pb(table, columns, values):
+def _commit_call_defaults(transport):
+    """Helper for :meth:`Batch.commit_async`.
+
+    The future API bypasses the GAPIC wrapper of the ``Commit`` method:
+    apply its default timeout and metadata, e.g. the client info.
+
+    :type transport: :class:`~google.cloud.spanner_v1.services.spanner.transports.SpannerTransport`
+    :param transport: transport of the Spanner API client.
+
+    :rtype: tuple
+    :returns: the default timeout, in seconds, or None, and the list of
+              metadata added to each call.
+    """
+    wrapped_methods = getattr(transport, "_wrapped_methods", None) or {}
+    wrapped = wrapped_methods.get(transport.commit)
+    timeout = getattr(wrapped, "_timeout", None)
+    if timeout is not None and not isinstance(timeout, (int, float)):
+        # A ``google.api_core.timeout`` object, as in older releases.
+        timeout = getattr(timeout, "_timeout", None)
+    return timeout, list(getattr(wrapped, "_metadata", None) or ())
+
+
+def _make_write_mutation(operation, table, columns, values, column_types=None):
     """Helper for :meth:`Batch.insert` et al.
 
+    The mutation is built directly as a protobuf, rather than copying
+    row protobufs into proto-plus wrappers.
+
+    :type operation: str
+    :param operation: Name of the mutation's write field, e.g. ``"insert"``.
+
     :type table: str
     :param table: Name of the table to be modified.
 
     :type columns: list of str
     :param columns: Name of the table columns to be modified.
 
-    :type values: list of lists
-    :param values: Values to be modified.
+    :type values: list of lists, mapping or :class:`pyarrow.Table`
+    :param values: Values to be modified:  either a list of rows, or
+                   columnar data, i.e. a mapping from each column name to
+                   a sequence or NumPy array of values, or an Arrow table.
+                   Columnar data is encoded column by column, without
+                   building a Python sequence per row.
+
+    :type column_types:
+        dict (str -> :class:`~google.cloud.spanner_v1.types.Type`),
+        list of :class:`~google.cloud.spanner_v1.types.Type`, or
+        list of :class:`~google.cloud.spanner_v1.types.StructType.Field`
+    :param column_types:
+        (Optional) types of the columns, as a mapping from column name, a
+        list parallel to ``columns``, or a table's
+        :attr:`~google.cloud.spanner_v1.table.Table.schema`.  Values of
+        each typed column are encoded by a specialized encoder.
+
+    :rtype: :class:`google.cloud.spanner_v1.types.Mutation`
+    :returns: the write mutation.
+    """
+    mutation_pb = Mutation.pb()()
+    write_pb = getattr(mutation_pb, operation)
+    write_pb.table = table
+    write_pb.columns.extend(columns)
+
+    column_lists = _column_value_lists(columns, values)
+    if column_lists is not None:
+        encoders = _make_column_encoders(columns, column_types)
+        _encode_columns(write_pb.values, column_lists, encoders)
+    elif column_types is not None:
+        encoders = _make_column_encoders(columns, column_types)
+        _encode_rows(write_pb.values, values, encoders)
+    else:
+        write_pb.values.extend(_make_list_value_pbs(values))
+    return Mutation.wrap(mutation_pb)
+
+
+class MutationGroup(_BatchBase):
+    """A group of mutations, applied atomically by :class:`MutationGroups`.
 
-    :rtype: :class:`google.cloud.spanner_v1.types.Mutation.Write`
-    :returns: Write protobuf
+    :type session: :class:`~google.cloud.spanner_v1.session.Session`
+    :param session: unused, as groups are applied on pooled sessions.
     """
-    return Mutation.Write(
-        table=table, columns=columns, values=_make_list_value_pbs(values)
-    )
+
+    def _check_state(self):
+        """Helper for :meth:`MutationGroups.batch_write`.
+
+        :raises: :exc:`ValueError` if the group holds no mutation.
+        """
+        if not self._mutations:
+            raise ValueError("Mutation group is empty")
+
+
+class MutationGroups(object):
+    """Independent groups of mutations, applied concurrently.
+
+    Each group is committed atomically, but independently of the other
+    groups:  a failed group does not prevent the others from being
+    applied, nor undo them.  The outcome of each group is returned as soon
+    as it is known, so that only the failed groups need to be retried.
+
+    .. code-block:: python
+
+       groups = database.mutation_groups()
+       for user in users:
+           group = groups.group()
+           group.insert_or_update("users", columns, [user.row])
+           group.insert_or_update("profiles", columns, [user.profile_row])
+
+       failed = [
+           index
+           for result in groups.batch_write()
+           if result.error is not None
+           for index in result.indexes
+       ]
+       retried = list(groups.batch_write(indexes=failed))
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to which the groups are applied.
+    """
+
+    def __init__(self, database):
+        self._database = database
+        self._groups = []
+
+    def __len__(self):
+        return len(self._groups)
+
+    def __getitem__(self, index):
+        return self._groups[index]
+
+    def group(self):
+        """Add a new, empty group.
+
+        :rtype: :class:`MutationGroup`
+        :returns: the group, to which mutations are then added.
+        """
+        group = MutationGroup(None)
+        self._groups.append(group)
+        return group
+
+    def batch_write(
+        self,
+        request_options=None,
+        indexes=None,
+        max_workers=DEFAULT_BATCH_WRITE_WORKERS,
+        retry=None,
+    ):
+        """Apply the groups, each in its own commit.
+
+        Up to ``max_workers`` groups are committed at once, each on a
+        session checked out from the database's pool.  Closing the returned
+        iterator early cancels the groups not yet started.
+
+        :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for the commit requests.
+                If a dict is provided, it must be of the same form as the protobuf
+                message :class:`~google.cloud.spanner_v1.types.RequestOptions`.
+
+        :type indexes: list of int
+        :param indexes: (Optional) positions of the groups to apply, e.g. the
+                        failed groups of a previous call.  Defaults to all
+                        groups.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of groups committed
+                            at once.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) retry settings for each group's commit.
+
+        :rtype: iterable of :class:`BatchWriteResult`
+        :returns: one result per group, in order of completion.
+        :raises ValueError: if a group is empty.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if indexes is None:
+            indexes = range(len(self._groups))
+        indexes = list(indexes)
+        for index in indexes:
+            self._groups[index]._check_state()
+        if isinstance(request_options, RequestOptions):
+            request_options = RequestOptions.to_dict(request_options)
+        return self._batch_write(indexes, request_options, max_workers, retry)
+
+    def _batch_write(self, indexes, request_options, max_workers, retry):
+        """Helper for :meth:`batch_write`."""
+        if not indexes:
+            return
+        commit = self._commit_group
+        if retry is not None:
+            commit = retry(commit)
+        executor = concurrent.futures.ThreadPoolExecutor(
+            min(max_workers, len(indexes)), thread_name_prefix="spanner-batch-write"
+        )
+        futures = {}
+        try:
+            for index in indexes:
+                future = executor.submit(commit, self._groups[index], request_options)
+                futures[future] = index
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                try:
+                    commit_timestamp = future.result()
+                except Exception as exc:
+                    yield BatchWriteResult([index], None, exc)
+                else:
+                    yield BatchWriteResult([index], commit_timestamp, None)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _commit_group(self, group, request_options):
+        """Worker:  commit one group on a pooled session.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: the commit timestamp.
+        """
+        with self._database.batch(request_options=request_options) as batch:
+            batch._mutations.extend(group._mutations)
+        return batch.committed
@@ -0,0 +1,418 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk writes, split automatically into concurrent commits."""
+
+import collections
+import concurrent.futures
+import threading
+
+from google.api_core.exceptions import Aborted
+from google.api_core.exceptions import ServiceUnavailable
+from google.api_core.retry import Retry
+from google.api_core.retry import if_exception_type
+
+from google.cloud.spanner_v1 import Mutation
+from google.cloud.spanner_v1 import RequestOptions
+from google.cloud.spanner_v1.batch import _make_write_mutation
+
+DEFAULT_MAX_MUTATIONS = 20000
+"""Default maximum number of mutations (as counted by Spanner) per commit."""
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+"""Default maximum encoded size of the mutations of a commit."""
+
+DEFAULT_MAX_WORKERS = 4
+"""Default number of commits in flight, each on its own pooled session."""
+
+DEFAULT_COMMIT_RETRY = Retry(
+    initial=0.1,
+    maximum=30,
+    multiplier=1.5,
+    timeout=300,
+    predicate=if_exception_type(Aborted, ServiceUnavailable),
+)
+"""Default retry of commits failing with ``ABORTED`` or ``UNAVAILABLE``."""
+
+# Encoded size of the framing of a repeated message field's item:  one tag
+# byte, plus a length varint of up to 4 bytes.
+_ITEM_OVERHEAD = 5
+
+
+ChunkFailure = collections.namedtuple("ChunkFailure", ["mutations", "error"])
+ChunkFailure.__doc__ = """A chunk of mutations whose commit failed.
+
+:type mutations: list of :class:`~google.cloud.spanner_v1.types.Mutation`
+:param mutations: the mutations of the chunk, none of which were applied.
+
+:type error: Exception
+:param error: the error raised by the last commit attempt.
+"""
+
+
+class BulkWriteError(RuntimeError):
+    """Raised when chunks of a bulk write could not be committed.
+
+    :type failures: list of :class:`ChunkFailure`
+    :param failures: the chunks which failed;  their mutations may be
+                     passed to :meth:`BulkMutationWriter.write_mutations`
+                     to try again.
+    """
+
+    def __init__(self, failures):
+        super(BulkWriteError, self).__init__(
+            "%d chunk(s) failed to commit, first error: %r"
+            % (len(failures), failures[0].error)
+        )
+        self.failures = failures
+
+
+class BulkMutationWriter(object):
+    """Apply an unbounded stream of mutations, committing it in chunks.
+
+    Mutations are accumulated in chunks respecting the limits of a single
+    commit, on the number of mutations (cells written, including those of
+    secondary index entries) and on the request size.  Full chunks are
+    committed in the background by up to ``max_workers`` threads, each
+    using its own session from the database's pool, with retry of failed
+    commits.
+
+    Each chunk is committed atomically, but the bulk write as a whole is
+    not:  mutations are applied in no particular order, and a failure
+    leaves the chunks committed before it in place.  Chunks which fail
+    even after retrying are reported by :meth:`flush` / :meth:`close`, by
+    raising :exc:`BulkWriteError`.  Since a commit whose outcome is unknown
+    is retried, prefer ``insert_or_update`` / ``replace`` over ``insert``,
+    which may then fail with ``ALREADY_EXISTS``.
+
+    .. code-block:: python
+
+       with database.bulk_writer(index_counts={"users": 2}) as writer:
+           for rows in source:
+               writer.insert_or_update("users", columns, rows)
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to which the mutations are applied.
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) maximum number of mutations per commit.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) maximum encoded size of the mutations of a
+                      commit.
+
+    :type max_workers: int
+    :param max_workers: (Optional) maximum number of commits in flight.
+
+    :type max_pending_chunks: int
+    :param max_pending_chunks: (Optional) maximum number of full chunks
+                               waiting for a worker;  writes block once it
+                               is reached.  Defaults to ``max_workers``.
+
+    :type index_counts: dict (str -> int)
+    :param index_counts: (Optional) number of secondary indexes of each
+                         table, used to estimate the index entries written
+                         by each mutation.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) retry settings for each commit;  pass ``None``
+                  to disable retries.
+
+    :type request_options:
+        :class:`google.cloud.spanner_v1.types.RequestOptions`
+    :param request_options: (Optional) Common options for the commit
+                            requests.
+    """
+
+    def __init__(
+        self,
+        database,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_workers=DEFAULT_MAX_WORKERS,
+        max_pending_chunks=None,
+        index_counts=None,
+        retry=DEFAULT_COMMIT_RETRY,
+        request_options=None,
+    ):
+        if max_mutations < 1:
+            raise ValueError("max_mutations must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending_chunks is None:
+            max_pending_chunks = max_workers
+        if max_pending_chunks < 1:
+            raise ValueError("max_pending_chunks must be at least 1")
+        if isinstance(request_options, RequestOptions):
+            request_options = RequestOptions.to_dict(request_options)
+
+        self._database = database
+        self._max_mutations = max_mutations
+        self._max_bytes = max_bytes
+        self._index_counts = dict(index_counts or {})
+        self._retry = retry
+        self._request_options = request_options
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="spanner-bulk-writer"
+        )
+        # Limits the chunks submitted, but not yet committed.
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending_chunks)
+        self._lock = threading.Lock()
+        self._futures = set()
+        self._failures = []
+        self._chunk = []
+        self._chunk_mutations = 0
+        self._chunk_bytes = 0
+        self._mutation_count = 0
+        self._commit_count = 0
+        self._closed = False
+
+    @property
+    def mutation_count(self):
+        """Estimated number of mutations committed so far.
+
+        :rtype: int
+        """
+        with self._lock:
+            return self._mutation_count
+
+    @property
+    def commit_count(self):
+        """Number of chunks committed so far.
+
+        :rtype: int
+        """
+        with self._lock:
+            return self._commit_count
+
+    def insert(self, table, columns, values, column_types=None):
+        """Insert one or more new table rows.
+
+        See :meth:`google.cloud.spanner_v1.batch.Batch.insert`.
+        """
+        self._write("insert", table, columns, values, column_types)
+
+    def update(self, table, columns, values, column_types=None):
+        """Update one or more existing table rows.
+
+        See :meth:`google.cloud.spanner_v1.batch.Batch.update`.
+        """
+        self._write("update", table, columns, values, column_types)
+
+    def insert_or_update(self, table, columns, values, column_types=None):
+        """Insert/update one or more table rows.
+
+        See :meth:`google.cloud.spanner_v1.batch.Batch.insert_or_update`.
+        """
+        self._write("insert_or_update", table, columns, values, column_types)
+
+    def replace(self, table, columns, values, column_types=None):
+        """Replace one or more table rows.
+
+        See :meth:`google.cloud.spanner_v1.batch.Batch.replace`.
+        """
+        self._write("replace", table, columns, values, column_types)
+
+    def delete(self, table, keyset):
+        """Delete one or more table rows.
+
+        See :meth:`google.cloud.spanner_v1.batch.Batch.delete`.
+        """
+        delete = Mutation.Delete(table=table, key_set=keyset._to_pb())
+        self.write_mutations([Mutation(delete=delete)])
+
+    def write_mutations(self, mutations):
+        """Apply mutations built elsewhere, e.g. those of a failed chunk.
+
+        :type mutations: list of :class:`~google.cloud.spanner_v1.types.Mutation`
+        :param mutations: the mutations to apply.
+        """
+        self._check_open()
+        for mutation in mutations:
+            mutation_pb = Mutation.pb(mutation)
+            operation = mutation_pb.WhichOneof("operation")
+            if operation == "delete":
+                cost = self._delete_cost(mutation_pb.delete)
+                self._add(mutation, cost, mutation_pb.ByteSize())
+            else:
+                self._add_write(operation, mutation_pb)
+
+    def _write(self, operation, table, columns, values, column_types):
+        """Helper for :meth:`insert` et al."""
+        self._check_open()
+        mutation = _make_write_mutation(operation, table, columns, values, column_types)
+        self._add_write(operation, Mutation.pb(mutation))
+
+    def _check_open(self):
+        """Helper:  writes are rejected once the writer is closed."""
+        if self._closed:
+            raise ValueError("Bulk writer is closed")
+
+    def _cells_per_row(self, write_pb):
+        """Estimated mutations per row written, including index entries."""
+        return len(write_pb.columns) + self._index_counts.get(write_pb.table, 0)
+
+    def _delete_cost(self, delete_pb):
+        """Estimated mutations of a delete, including index entries."""
+        key_set = delete_pb.key_set
+        keys = max(1, len(key_set.keys) + len(key_set.ranges))
+        return keys * (1 + self._index_counts.get(delete_pb.table, 0))
+
+    def _add_write(self, operation, mutation_pb):
+        """Add a write mutation, splitting it if it exceeds a chunk."""
+        write_pb = getattr(mutation_pb, operation)
+        cells_per_row = self._cells_per_row(write_pb)
+        cost = len(write_pb.values) * cells_per_row, mutation_pb.ByteSize()
+        if self._fits(*cost):
+            self._add(Mutation.wrap(mutation_pb), *cost)
+            return
+
+        # Larger than a whole chunk:  split its rows.
+        rows = []
+        rows_bytes = _ITEM_OVERHEAD + len(write_pb.table)
+        rows_bytes += sum(len(column) + _ITEM_OVERHEAD for column in write_pb.columns)
+        header_bytes = rows_bytes
+        for row_pb in write_pb.values:
+            row_bytes = row_pb.ByteSize() + _ITEM_OVERHEAD
+            if rows and not self._fits(
+                (len(rows) + 1) * cells_per_row, rows_bytes + row_bytes
+            ):
+                self._add_rows(operation, write_pb, rows, cells_per_row, rows_bytes)
+                rows, rows_bytes = [], header_bytes
+            rows.append(row_pb)
+            rows_bytes += row_bytes
+        if rows:
+            self._add_rows(operation, write_pb, rows, cells_per_row, rows_bytes)
+
+    def _fits(self, mutations, size):
+        """Whether a mutation fits in an empty chunk."""
+        return mutations <= self._max_mutations and size <= self._max_bytes
+
+    def _add_rows(self, operation, write_pb, rows, cells_per_row, size):
+        """Helper for :meth:`_add_write`:  add part of a split mutation."""
+        mutation_pb = Mutation.pb()()
+        part_pb = getattr(mutation_pb, operation)
+        part_pb.table = write_pb.table
+        part_pb.columns.extend(write_pb.columns)
+        part_pb.values.extend(rows)
+        self._add(Mutation.wrap(mutation_pb), len(rows) * cells_per_row, size)
+
+    def _add(self, mutation, mutations, size):
+        """Add a mutation to the current chunk, flushing it first if full.
+
+        :type mutation: :class:`~google.cloud.spanner_v1.types.Mutation`
+        :param mutation: the mutation to add.
+
+        :type mutations: int
+        :param mutations: estimated mutation count of ``mutation``.
+
+        :type size: int
+        :param size: encoded size of ``mutation``.
+        """
+        size += _ITEM_OVERHEAD
+        if self._chunk and (
+            self._chunk_mutations + mutations > self._max_mutations
+            or self._chunk_bytes + size > self._max_bytes
+        ):
+            self._submit_chunk()
+        self._chunk.append(mutation)
+        self._chunk_mutations += mutations
+        self._chunk_bytes += size
+
+    def _submit_chunk(self):
+        """Hand the current chunk to a worker, blocking while too many are
+        pending."""
+        chunk, mutations = self._chunk, self._chunk_mutations
+        self._chunk, self._chunk_mutations, self._chunk_bytes = [], 0, 0
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._commit_chunk, chunk, mutations)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._chunk_done)
+
+    def _chunk_done(self, future):
+        """Callback:  release the slot of a finished chunk."""
+        with self._lock:
+            self._futures.discard(future)
+        self._slots.release()
+
+    def _commit_chunk(self, chunk, mutations):
+        """Worker:  commit one chunk on a pooled session, with retry."""
+        commit = self._commit_once
+        if self._retry is not None:
+            commit = self._retry(commit)
+        try:
+            commit(chunk)
+        except Exception as exc:
+            with self._lock:
+                self._failures.append(ChunkFailure(chunk, exc))
+            return
+        with self._lock:
+            self._mutation_count += mutations
+            self._commit_count += 1
+
+    def _commit_once(self, chunk):
+        """Helper for :meth:`_commit_chunk`:  a single commit attempt."""
+        with self._database.batch(request_options=self._request_options) as batch:
+            batch._mutations.extend(chunk)
+
+    def flush(self):
+        """Commit the pending mutations, and wait for all chunks.
+
+        :raises: :exc:`BulkWriteError` if chunks failed to commit since the
+                 last call;  the writer can still be used afterwards.
+        """
+        if self._chunk:
+            self._submit_chunk()
+        with self._lock:
+            futures = list(self._futures)
+        concurrent.futures.wait(futures)
+        with self._lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise BulkWriteError(failures)
+
+    def close(self):
+        """Flush the pending mutations, then stop the workers.
+
+        :raises: :exc:`BulkWriteError` if chunks failed to commit.
+        """
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+            return
+        # Drop the pending mutations, as 'Batch' does, and do not mask the
+        # original error with failures of the chunks already submitted.
+        self._chunk, self._chunk_mutations, self._chunk_bytes = [], 0, 0
+        try:
+            self.close()
+        except BulkWriteError:
+            pass
@@ -0,0 +1,328 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar representation of streamed result set data."""
+
+import array
+import binascii
+import functools
+import itertools
+
+from google.cloud.spanner_v1 import TypeCode
+from google.cloud.spanner_v1._helpers import _make_value_decoder
+
+_FIXED_WIDTH_TYPECODES = {
+    TypeCode.BOOL: "b",
+    TypeCode.INT64: "q",
+    TypeCode.FLOAT64: "d",
+}
+
+
+class Column(object):
+    """Values of a single result set column, decoded in bulk.
+
+    ``INT64``, ``FLOAT64`` and ``BOOL`` columns store their cells in a typed
+    :class:`array.array`.  ``STRING`` and ``BYTES`` columns store their cells
+    back-to-back in a single UTF-8 buffer, delimited by an array of offsets.
+    Columns of any other type store a list of Python objects, as returned
+    when iterating over rows.
+
+    :type field: :class:`~google.cloud.spanner_v1.types.StructType.Field`
+    :param field: descriptor of the column.
+
+    :type values: :class:`array.array`, :class:`bytes` or list
+    :param values: decoded cell data.
+
+    :type nulls: :class:`array.array` or None
+    :param nulls: (Optional) per-cell null flags, or ``None`` if no cell in
+                  the column is null.
+
+    :type offsets: :class:`array.array` or None
+    :param offsets: (Optional) ``len(column) + 1`` boundaries into ``values``,
+                    for ``STRING`` and ``BYTES`` columns only.
+    """
+
+    def __init__(self, field, values, nulls=None, offsets=None):
+        self._field = field
+        self._values = values
+        self._nulls = nulls
+        self._offsets = offsets
+
+    @property
+    def field(self):
+        """Descriptor of the column.
+
+        :rtype: :class:`~google.cloud.spanner_v1.types.StructType.Field`
+        :returns: the field describing the column name / type.
+        """
+        return self._field
+
+    @property
+    def name(self):
+        """Name of the column.
+
+        :rtype: str
+        :returns: the column name.
+        """
+        return self._field.name
+
+    @property
+    def values(self):
+        """Raw cell storage.
+
+        :rtype: :class:`array.array`, :class:`bytes` or list
+        :returns: the typed array, the UTF-8 buffer, or the list of objects
+                  backing the column.
+        """
+        return self._values
+
+    @property
+    def nulls(self):
+        """Per-cell null flags.
+
+        :rtype: :class:`array.array` or None
+        :returns: an array holding ``1`` for each null cell, or ``None`` if
+                  the column contains no null.
+        """
+        return self._nulls
+
+    @property
+    def offsets(self):
+        """Cell boundaries into :attr:`values` for string-like columns.
+
+        :rtype: :class:`array.array` or None
+        :returns: ``len(column) + 1`` offsets, or ``None`` for columns which
+                  are not ``STRING`` / ``BYTES``.
+        """
+        return self._offsets
+
+    @property
+    def null_count(self):
+        """Number of null cells in the column.
+
+        :rtype: int
+        """
+        if self._nulls is None:
+            return 0
+        return sum(self._nulls)
+
+    def __len__(self):
+        if self._offsets is not None:
+            return len(self._offsets) - 1
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if self._nulls is not None and self._nulls[index]:
+            return None
+        if self._offsets is not None:
+            value = bytes(self._values[self._offsets[index] : self._offsets[index + 1]])
+            if self._field.type_.code == TypeCode.STRING:
+                return value.decode("utf8")
+            return value
+        value = self._values[index]
+        if self._field.type_.code == TypeCode.BOOL:
+            return bool(value)
+        return value
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_list(self):
+        """Decode the column into a list of Python values.
+
+        :rtype: list
+        :returns: cell values, with ``None`` for null cells, as they would
+                  be returned when iterating over rows.
+        """
+        if self._offsets is None and self._nulls is None:
+            if self._field.type_.code == TypeCode.BOOL:
+                return [bool(value) for value in self._values]
+            return list(self._values)
+        return list(self)
+
+    def to_numpy(self):
+        """Convert the column into a NumPy array.
+
+        Requires the ``numpy`` package.  Fixed-width columns share memory
+        with :attr:`values`; columns containing nulls are returned as masked
+        arrays.
+
+        :rtype: :class:`numpy.ndarray`
+        :returns: the column data.
+        """
+        import numpy
+
+        type_code = self._field.type_.code
+        if type_code not in _FIXED_WIDTH_TYPECODES:
+            return numpy.array(self.to_list(), dtype=object)
+
+        result = numpy.frombuffer(self._values, dtype=self._values.typecode)
+        if type_code == TypeCode.BOOL:
+            result = result.astype(bool)
+        if self._nulls is not None:
+            mask = numpy.frombuffer(self._nulls, dtype=numpy.int8).astype(bool)
+            result = numpy.ma.masked_array(result, mask=mask)
+        return result
+
+    def extend(self, other):
+        """Append the cells of another column of the same type.
+
+        :type other: :class:`Column`
+        :param other: column whose cells are appended to this one.
+        """
+        if self._nulls is not None or other._nulls is not None:
+            nulls = self._nulls
+            if nulls is None:
+                nulls = self._nulls = array.array("b", bytes(len(self)))
+            if other._nulls is None:
+                nulls.frombytes(bytes(len(other)))
+            else:
+                nulls.extend(other._nulls)
+
+        if self._offsets is not None:
+            if not isinstance(self._values, bytearray):
+                self._values = bytearray(self._values)
+            base = self._offsets[-1]
+            self._offsets.extend(offset + base for offset in other._offsets[1:])
+        self._values += other._values
+
+
+def _null_flags(value_pbs):
+    """Helper for column decoders: compute per-cell null flags.
+
+    :rtype: :class:`array.array` or None
+    :returns: null flags, or ``None`` if no value is null.
+    """
+    nulls = array.array(
+        "b", [value_pb.HasField("null_value") for value_pb in value_pbs]
+    )
+    if any(nulls):
+        return nulls
+    return None
+
+
+def _decode_int64_column(field, value_pbs):
+    """Decode ``INT64`` values into a typed array."""
+    try:
+        values = array.array(
+            "q", [int(value_pb.string_value) for value_pb in value_pbs]
+        )
+    except ValueError:  # at least one NULL, whose 'string_value' is empty
+        nulls = _null_flags(value_pbs)
+        values = array.array(
+            "q",
+            [
+                0 if is_null else int(value_pb.string_value)
+                for is_null, value_pb in zip(nulls, value_pbs)
+            ],
+        )
+        return Column(field, values, nulls=nulls)
+    return Column(field, values)
+
+
+def _float64_or_none(value_pb):
+    """Helper for :func:`_decode_float64_column`."""
+    kind = value_pb.WhichOneof("kind")
+    if kind == "number_value":
+        return value_pb.number_value
+    if kind == "string_value":  # NaN / Infinity / -Infinity
+        return float(value_pb.string_value)
+    return None
+
+
+def _decode_float64_column(field, value_pbs):
+    """Decode ``FLOAT64`` values into a typed array."""
+    decoded = [_float64_or_none(value_pb) for value_pb in value_pbs]
+    nulls = None
+    if None in decoded:
+        nulls = array.array("b", [value is None for value in decoded])
+        decoded = [0.0 if value is None else value for value in decoded]
+    return Column(field, array.array("d", decoded), nulls=nulls)
+
+
+def _decode_bool_column(field, value_pbs):
+    """Decode ``BOOL`` values into a typed array."""
+    values = array.array("b", [value_pb.bool_value for value_pb in value_pbs])
+    return Column(field, values, nulls=_null_flags(value_pbs))
+
+
+def _decode_binary_column(field, value_pbs):
+    """Decode ``STRING`` / ``BYTES`` values into an offsets + buffer pair."""
+    encoded = [value_pb.string_value.encode("utf8") for value_pb in value_pbs]
+    offsets = array.array("q", [0])
+    offsets.extend(itertools.accumulate(map(len, encoded)))
+    return Column(
+        field, b"".join(encoded), nulls=_null_flags(value_pbs), offsets=offsets
+    )
+
+
+def _decode_base64_column(field, value_pbs):
+    """Decode ``BYTES`` values into a buffer of their raw binary data."""
+    decoded = [binascii.a2b_base64(value_pb.string_value) for value_pb in value_pbs]
+    offsets = array.array("q", [0])
+    offsets.extend(itertools.accumulate(map(len, decoded)))
+    return Column(
+        field, b"".join(decoded), nulls=_null_flags(value_pbs), offsets=offsets
+    )
+
+
+def _decode_object_column(field, decoder, value_pbs):
+    """Decode values of other types into a list of Python objects."""
+    return Column(field, [decoder(value_pb) for value_pb in value_pbs])
+
+
+_DECODE_COLUMN_BY_TYPE = {
+    TypeCode.BOOL: _decode_bool_column,
+    TypeCode.INT64: _decode_int64_column,
+    TypeCode.FLOAT64: _decode_float64_column,
+    TypeCode.STRING: _decode_binary_column,
+    TypeCode.BYTES: _decode_binary_column,
+}
+
+
+def _make_column_decoders(row_type, decode_bytes=False):
+    """Compile one column decoder per field of a result set.
+
+    :type row_type: :class:`~google.cloud.spanner_v1.types.StructType`
+    :param row_type: row schema specification
+
+    :type decode_bytes: bool
+    :param decode_bytes: (Optional) if true, ``BYTES`` columns hold the raw
+                         binary data rather than its base64 encoding.
+
+    :rtype: tuple of callable
+    :returns: one callable per field, each taking a list of
+              :class:`~google.protobuf.struct_pb2.Value` for that column and
+              returning a :class:`Column`.
+    """
+    decoders = []
+    for field in row_type.fields:
+        type_code = field.type_.code
+        if decode_bytes and type_code == TypeCode.BYTES:
+            column_decoder = _decode_base64_column
+        else:
+            column_decoder = _DECODE_COLUMN_BY_TYPE.get(type_code)
+        if column_decoder is None:
+            column_decoder = functools.partial(
+                _decode_object_column,
+                field,
+                _make_value_decoder(field.type_, decode_bytes),
+            )
+        else:
+            column_decoder = functools.partial(column_decoder, field)
+        decoders.append(column_decoder)
+    return tuple(decoders)
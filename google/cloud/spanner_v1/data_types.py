@@ -71,3 +71,29 @@ class JsonObject(dict):
             return json.dumps(self._array_value, sort_keys=True, separators=(",", ":"))
 
         return json.dumps(self, sort_keys=True, separators=(",", ":"))
+
+
+class RawBytes(object):
+    """
+    Raw binary data for a ``BYTES`` value, base64-encoded when sent.
+
+    ``bytes``, ``bytearray`` and ``memoryview`` values passed for ``BYTES``
+    columns and parameters must already be base64-encoded:  wrap raw data
+    in this class to have it encoded instead.
+
+    Args:
+        data (bytes-like object): the raw binary data.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __eq__(self, other):
+        if not isinstance(other, RawBytes):
+            return NotImplemented
+        return bytes(self.data) == bytes(other.data)
+
+    def __repr__(self):
+        return "RawBytes(%r)" % (bytes(self.data),)
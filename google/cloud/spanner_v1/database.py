@@ -14,19 +14,20 @@
 
 """User friendly container for Cloud Spanner Database."""
 
+import concurrent.futures
 import copy
 import functools
 import grpc
 import logging
 import re
 import threading
+import time
 
 import google.auth.credentials
-from google.api_core.retry import Retry
-from google.api_core.retry import if_exception_type
 from google.cloud.exceptions import NotFound
 from google.api_core.exceptions import Aborted
 from google.api_core import gapic_v1
+from google.api_core.retry import Retry
 from google.iam.v1 import iam_policy_pb2
 from google.iam.v1 import options_pb2
 
@@ -43,19 +44,28 @@ from google.cloud.spanner_v1 import TransactionSelector
 from google.cloud.spanner_v1 import TransactionOptions
 from google.cloud.spanner_v1 import RequestOptions
 from google.cloud.spanner_v1 import SpannerClient
+from google.cloud.spanner_v1._helpers import _is_session_not_found
 from google.cloud.spanner_v1._helpers import _merge_query_options
 from google.cloud.spanner_v1._helpers import (
     _metadata_with_prefix,
     _metadata_with_leader_aware_routing,
 )
 from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.batch import MutationGroups
+from google.cloud.spanner_v1.bulk_writer import BulkMutationWriter
 from google.cloud.spanner_v1.keyset import KeySet
+from google.cloud.spanner_v1.partitioned import DEFAULT_BATCH_SIZE
+from google.cloud.spanner_v1.partitioned import DEFAULT_MAX_PENDING_BATCHES
+from google.cloud.spanner_v1.partitioned import PartitionedQueryResults
 from google.cloud.spanner_v1.pool import BurstyPool
+from google.cloud.spanner_v1.pool import MultiplexedSessionPool
 from google.cloud.spanner_v1.pool import SessionCheckout
+from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
 from google.cloud.spanner_v1.session import Session
 from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
 from google.cloud.spanner_v1.snapshot import Snapshot
 from google.cloud.spanner_v1.streamed import StreamedResultSet
+from google.cloud.spanner_v1.streamed import _import_arrow
 from google.cloud.spanner_v1.services.spanner.transports.grpc import (
     SpannerGrpcTransport,
 )
@@ -78,7 +88,17 @@ FROM INFORMATION_SCHEMA.TABLES
 {}
 """
 
-DEFAULT_RETRY_BACKOFF = Retry(initial=0.02, maximum=32, multiplier=1.3)
+DEFAULT_PDML_RETRY_POLICY = AbortRetryPolicy(timeout=120)
+"""Default retry policy of :meth:`Database.execute_partitioned_dml`."""
+
+DEFAULT_RETRY_BACKOFF = Retry(
+    initial=DEFAULT_PDML_RETRY_POLICY.initial,
+    maximum=DEFAULT_PDML_RETRY_POLICY.maximum,
+    multiplier=DEFAULT_PDML_RETRY_POLICY.multiplier,
+)
+"""Deprecated:  no longer used, see :data:`DEFAULT_PDML_RETRY_POLICY`."""
+
+DEFAULT_MAX_OUTSTANDING_COMMITS = 8
 
 
 class Database(object):
@@ -509,6 +529,7 @@ class Database(object):
         param_types=None,
         query_options=None,
         request_options=None,
+        retry_policy=None,
     ):
         """Execute a partitionable DML statement.
 
@@ -541,6 +562,12 @@ class Database(object):
             Please note, the `transactionTag` setting will be ignored as it is
             not supported for partitioned DML.
 
+        :type retry_policy:
+            :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+        :param retry_policy:
+            (Optional) Policy delaying retries of aborted attempts.  Defaults
+            to :data:`DEFAULT_PDML_RETRY_POLICY`.
+
         :rtype: int
         :returns: Count of rows affected by the DML statement.
         """
@@ -574,40 +601,45 @@ class Database(object):
                 _metadata_with_leader_aware_routing(self._route_to_leader_enabled)
             )
 
-        def execute_pdml():
-            with SessionCheckout(self._pool) as session:
+        def execute_pdml_on(session):
+            txn = api.begin_transaction(
+                session=session.name, options=txn_options, metadata=metadata
+            )
 
-                txn = api.begin_transaction(
-                    session=session.name, options=txn_options, metadata=metadata
-                )
+            txn_selector = TransactionSelector(id=txn.id)
 
-                txn_selector = TransactionSelector(id=txn.id)
+            request = ExecuteSqlRequest(
+                session=session.name,
+                sql=dml,
+                params=params_pb,
+                param_types=param_types,
+                query_options=query_options,
+                request_options=request_options,
+            )
+            method = functools.partial(
+                api.execute_streaming_sql,
+                metadata=metadata,
+            )
 
-                request = ExecuteSqlRequest(
-                    session=session.name,
-                    sql=dml,
-                    params=params_pb,
-                    param_types=param_types,
-                    query_options=query_options,
-                    request_options=request_options,
-                )
-                method = functools.partial(
-                    api.execute_streaming_sql,
-                    metadata=metadata,
-                )
+            iterator = _restart_on_unavailable(
+                method=method,
+                request=request,
+                transaction_selector=txn_selector,
+            )
 
-                iterator = _restart_on_unavailable(
-                    method=method,
-                    request=request,
-                    transaction_selector=txn_selector,
-                )
+            result_set = StreamedResultSet(iterator)
+            list(result_set)  # consume all partials
 
-                result_set = StreamedResultSet(iterator)
-                list(result_set)  # consume all partials
+            return result_set.stats.row_count_lower_bound
 
-                return result_set.stats.row_count_lower_bound
+        def execute_pdml():
+            checkout = SessionCheckout(self._pool)
+            with checkout:
+                return _retry_session_not_found(checkout, execute_pdml_on)
 
-        return _retry_on_aborted(execute_pdml, DEFAULT_RETRY_BACKOFF)()
+        if retry_policy is None:
+            retry_policy = DEFAULT_PDML_RETRY_POLICY
+        return _retry_on_aborted(execute_pdml, retry_policy)
 
     def session(self, labels=None, database_role=None):
         """Factory to create a session for this database.
@@ -663,6 +695,55 @@ class Database(object):
         """
         return BatchCheckout(self, request_options)
 
+    def commit_pipeline(
+        self, max_outstanding=DEFAULT_MAX_OUTSTANDING_COMMITS, request_options=None
+    ):
+        """Return a pipeline keeping several batch commits in flight.
+
+        :type max_outstanding: int
+        :param max_outstanding: maximum number of commits in flight, each
+                                holding a session checked out of the pool.
+
+        :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for the commit requests.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.CommitPipeline`
+        :returns: new pipeline, to be closed (or used as a context manager)
+                  once all batches have been committed.
+        """
+        return CommitPipeline(self, max_outstanding, request_options)
+
+    def bulk_writer(self, **kw):
+        """Return a writer applying mutations in automatically-sized commits.
+
+        Unlike :meth:`batch`, the mutations are not applied atomically, but
+        are not limited to what fits in a single commit.
+
+        :type kw: dict
+        :param kw:
+            Passed through to
+            :class:`~google.cloud.spanner_v1.bulk_writer.BulkMutationWriter`
+            constructor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.bulk_writer.BulkMutationWriter`
+        :returns: new writer, to be closed (or used as a context manager) once
+                  all mutations have been written.
+        """
+        return BulkMutationWriter(self, **kw)
+
+    def mutation_groups(self):
+        """Return a container for independent groups of mutations.
+
+        Each group is applied atomically, but independently of the others,
+        see :meth:`~google.cloud.spanner_v1.batch.MutationGroups.batch_write`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.batch.MutationGroups`
+        :returns: new, empty container
+        """
+        return MutationGroups(self)
+
     def batch_snapshot(self, read_timestamp=None, exact_staleness=None):
         """Return an object which wraps a batch read / query.
 
@@ -676,8 +757,14 @@ class Database(object):
         :rtype: :class:`~google.cloud.spanner_v1.database.BatchSnapshot`
         :returns: new wrapper
         """
+        session_pool = None
+        if isinstance(self._pool, MultiplexedSessionPool):
+            session_pool = self._pool
         return BatchSnapshot(
-            self, read_timestamp=read_timestamp, exact_staleness=exact_staleness
+            self,
+            read_timestamp=read_timestamp,
+            exact_staleness=exact_staleness,
+            session_pool=session_pool,
         )
 
     def run_in_transaction(self, func, *args, **kw):
@@ -713,8 +800,12 @@ class Database(object):
         # Check out a session and run the function in a transaction; once
         # done, flip the sanity check bit back.
         try:
-            with SessionCheckout(self._pool) as session:
-                return session.run_in_transaction(func, *args, **kw)
+            checkout = SessionCheckout(self._pool)
+            with checkout:
+                return _retry_session_not_found(
+                    checkout,
+                    lambda session: session.run_in_transaction(func, *args, **kw),
+                )
         finally:
             self._local.transaction_running = False
 
@@ -952,14 +1043,24 @@ class BatchCheckout(object):
             batch.transaction_tag = self._request_options.transaction_tag
         return batch
 
+    @property
+    def _pool(self):
+        """Pool lending the session, for :func:`_retry_session_not_found`."""
+        return self._database._pool
+
+    def _commit(self, session):
+        """Commit the batch's mutations, using ``session``."""
+        self._batch._session = session
+        return self._batch.commit(
+            return_commit_stats=self._database.log_commit_stats,
+            request_options=self._request_options,
+        )
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End ``with`` block."""
         try:
             if exc_type is None:
-                self._batch.commit(
-                    return_commit_stats=self._database.log_commit_stats,
-                    request_options=self._request_options,
-                )
+                _retry_session_not_found(self, self._commit)
         finally:
             if self._database.log_commit_stats and self._batch.commit_stats:
                 self._database.logger.info(
@@ -969,6 +1070,206 @@ class BatchCheckout(object):
             self._database._pool.put(self._session)
 
 
+class CommitPipeline(object):
+    """Commit batches without waiting for each commit to complete.
+
+    Each batch checks out its own session from the database's pool, which
+    is returned once its commit completes, so that one thread can keep up
+    to ``max_outstanding`` commits in flight:
+
+    .. code-block:: python
+
+       with database.commit_pipeline(max_outstanding=16) as pipeline:
+           for rows in chunks:
+               with pipeline.batch() as batch:
+                   batch.insert("citizens", columns, rows)
+
+    Opening a batch blocks while ``max_outstanding`` commits are in flight.
+    Commits are not retried:  the first failure is raised by the next call
+    to :meth:`batch`, :meth:`flush` or :meth:`close`.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to use
+
+    :type max_outstanding: int
+    :param max_outstanding: maximum number of commits in flight.
+
+    :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+    :param request_options:
+            (Optional) Common options for the commit requests.
+            If a dict is provided, it must be of the same form as the protobuf
+            message :class:`~google.cloud.spanner_v1.types.RequestOptions`.
+    """
+
+    def __init__(
+        self,
+        database,
+        max_outstanding=DEFAULT_MAX_OUTSTANDING_COMMITS,
+        request_options=None,
+    ):
+        if max_outstanding < 1:
+            raise ValueError("max_outstanding must be positive")
+        self._database = database
+        if request_options is None:
+            self._request_options = RequestOptions()
+        elif isinstance(request_options, dict):
+            self._request_options = RequestOptions(request_options)
+        else:
+            self._request_options = request_options
+        self._slots = threading.BoundedSemaphore(max_outstanding)
+        self._lock = threading.Lock()
+        # Notified once no commit is outstanding.
+        self._idle = threading.Condition(self._lock)
+        self._outstanding = 0  # commits whose completion is not handled yet
+        self._errors = []
+        self._closed = False
+
+    def batch(self):
+        """Return an object which wraps a batch to be committed asynchronously.
+
+        The wrapper *must* be used as a context manager, with the batch as
+        the value returned by the wrapper.  Once the block exits, the
+        commit's future is available as the wrapper's ``future`` attribute.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.PipelinedBatchCheckout`
+        :returns: new wrapper
+        """
+        if self._closed:
+            raise ValueError("Pipeline is closed")
+        return PipelinedBatchCheckout(self)
+
+    def _raise_error(self):
+        """Helper:  raise the first failure not reported yet."""
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def _acquire(self):
+        """Helper:  wait for a commit slot to be available."""
+        self._raise_error()
+        self._slots.acquire()
+
+    def _submit(self, session, batch):
+        """Helper:  start committing ``batch``, holding ``session``."""
+        database = self._database
+        with self._lock:
+            self._outstanding += 1
+        try:
+            future = batch.commit_async(
+                return_commit_stats=database.log_commit_stats,
+                request_options=self._request_options,
+            )
+        except Exception:
+            try:
+                self._release(session)
+            finally:
+                self._completed()
+            raise
+
+        def _done(future):
+            try:
+                with self._lock:
+                    if future.exception() is not None:
+                        self._errors.append(future.exception())
+                if database.log_commit_stats and batch.commit_stats:
+                    database.logger.info(
+                        "CommitStats: {}".format(batch.commit_stats),
+                        extra={"commit_stats": batch.commit_stats},
+                    )
+                self._release(session)
+            finally:
+                self._completed()
+
+        future.add_done_callback(_done)
+        return future
+
+    def _completed(self):
+        """Helper:  count a commit as handled, waking :meth:`flush`."""
+        with self._idle:
+            self._outstanding -= 1
+            if not self._outstanding:
+                self._idle.notify_all()
+
+    def _release(self, session):
+        """Helper:  return ``session`` to the pool, freeing its slot."""
+        try:
+            self._database._pool.put(session)
+        finally:
+            self._slots.release()
+
+    def flush(self):
+        """Wait for the commits in flight to complete.
+
+        :raises: the first commit failure not reported yet.
+        """
+        with self._idle:
+            self._idle.wait_for(lambda: not self._outstanding)
+        self._raise_error()
+
+    def close(self):
+        """Wait for the commits in flight, and reject further batches.
+
+        :raises: the first commit failure not reported yet.
+        """
+        self._closed = True
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+            return
+        # Don't mask the original error with a commit failure.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class PipelinedBatchCheckout(object):
+    """Context manager for a batch committed by a :class:`CommitPipeline`.
+
+    Inside the context manager, checks out a session from the database,
+    creates a batch from it, making the batch available.  On a clean exit,
+    the batch's commit is started, and its session stays checked out until
+    the commit completes.
+
+    :type pipeline: :class:`CommitPipeline`
+    :param pipeline: pipeline committing the batch
+    """
+
+    future = None
+
+    def __init__(self, pipeline):
+        self._pipeline = pipeline
+        self._session = self._batch = None
+
+    def __enter__(self):
+        """Begin ``with`` block."""
+        pipeline = self._pipeline
+        pipeline._acquire()
+        try:
+            session = self._session = pipeline._database._pool.get()
+        except BaseException:
+            pipeline._slots.release()
+            raise
+        batch = self._batch = Batch(session)
+        if pipeline._request_options.transaction_tag:
+            batch.transaction_tag = pipeline._request_options.transaction_tag
+        return batch
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block."""
+        if exc_type is None:
+            self.future = self._pipeline._submit(self._session, self._batch)
+        else:
+            self._pipeline._release(self._session)
+
+
 class SnapshotCheckout(object):
     """Context manager for using a snapshot from a database.
 
@@ -994,18 +1295,31 @@ class SnapshotCheckout(object):
 
     def __enter__(self):
         """Begin ``with`` block."""
-        session = self._session = self._database._pool.get()
-        return Snapshot(session, **self._kw)
+        session = self._session = self._database._pool.get_read_only(
+            multi_use=self._kw.get("multi_use", False)
+        )
+        snapshot = Snapshot(session, **self._kw)
+        snapshot._session_replacer = self._replace_session
+        return snapshot
+
+    def _replace_session(self):
+        """Replace a session which was not found, e.g. having expired.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the replacement session, returned to the pool on exit.
+        """
+        self._session = self._database._pool._replace_session(self._session)
+        return self._session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End ``with`` block."""
+        pool = self._database._pool
         if isinstance(exc_val, NotFound):
             # If NotFound exception occurs inside the with block
             # then we validate if the session still exists.
             if not self._session.exists():
-                self._session = self._database._pool._new_session()
-                self._session.create()
-        self._database._pool.put(self._session)
+                self._session = pool._replace_session(self._session)
+        pool.put_read_only(self._session)
 
 
 class BatchSnapshot(object):
@@ -1020,10 +1334,19 @@ class BatchSnapshot(object):
     :type exact_staleness: :class:`datetime.timedelta`
     :param exact_staleness: Execute all reads at a timestamp that is
                             ``exact_staleness`` old.
+
+    :type session_pool: :class:`~google.cloud.spanner_v1.pool.MultiplexedSessionPool`
+    :param session_pool: (Optional) pool lending a session, via its
+                         fallback pool, instead of creating a dedicated
+                         session.  The session is returned to the pool,
+                         rather than deleted, by :meth:`close`.
     """
 
-    def __init__(self, database, read_timestamp=None, exact_staleness=None):
+    def __init__(
+        self, database, read_timestamp=None, exact_staleness=None, session_pool=None
+    ):
         self._database = database
+        self._session_pool = session_pool
         self._session = None
         self._snapshot = None
         self._read_timestamp = read_timestamp
@@ -1072,8 +1395,11 @@ class BatchSnapshot(object):
            all partitions have been processed.
         """
         if self._session is None:
-            session = self._session = self._database.session()
-            session.create()
+            if self._session_pool is not None:
+                self._session = self._session_pool.get_read_only(multi_use=True)
+            else:
+                session = self._session = self._database.session()
+                session.create()
         return self._session
 
     def _get_snapshot(self):
@@ -1338,6 +1664,111 @@ class BatchSnapshot(object):
             partition=batch["partition"], **batch["query"], retry=retry, timeout=timeout
         )
 
+    def run_partitioned_query(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        partition_size_bytes=None,
+        max_partitions=None,
+        query_options=None,
+        data_boost_enabled=False,
+        *,
+        max_workers=None,
+        ordered=False,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_pending_batches=DEFAULT_MAX_PENDING_BATCHES,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+    ):
+        """Partition a query, then process the partitions concurrently.
+
+        The query is partitioned immediately; see
+        :meth:`generate_query_batches` for the partitioning parameters.  The
+        partitions are then processed by a pool of threads as the returned
+        results are iterated.
+
+        :type sql: str
+        :param sql: SQL query statement
+
+        :type params: dict, {str -> column value}
+        :param params: values for parameter replacement.  Keys must match
+                       the names used in ``sql``.
+
+        :type param_types: dict[str -> Union[dict, .types.Type]]
+        :param param_types:
+            (Optional) maps explicit types for one or more param values;
+            required if parameters are passed.
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated.
+
+        :type query_options:
+            :class:`~google.cloud.spanner_v1.types.ExecuteSqlRequest.QueryOptions`
+            or :class:`dict`
+        :param query_options:
+                (Optional) Query optimizer configuration to use for the given query.
+
+        :type data_boost_enabled:
+        :param data_boost_enabled:
+                (Optional) If set ``true``, the partitions are executed via
+                offline access.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of partitions processed
+                            at once.
+
+        :type ordered: bool
+        :param ordered: (Optional) if true, yield rows partition by
+                        partition, in partition order, rather than as they
+                        arrive.
+
+        :type batch_size: int
+        :param batch_size: (Optional) maximum number of rows per batch handed
+                           over by the workers.
+
+        :type max_pending_batches: int
+        :param max_pending_batches:
+            (Optional) number of batches buffered per in-flight partition
+            before its worker waits for the consumer.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) The retry settings for each request.
+
+        :type timeout: float
+        :param timeout: (Optional) The timeout for each request.
+
+        :rtype: :class:`~google.cloud.spanner_v1.partitioned.PartitionedQueryResults`
+        :returns: results which can be used to consume rows, or batches of
+                  rows, and to inspect per-partition statistics.
+        """
+        batches = self.generate_query_batches(
+            sql,
+            params=params,
+            param_types=param_types,
+            partition_size_bytes=partition_size_bytes,
+            max_partitions=max_partitions,
+            query_options=query_options,
+            data_boost_enabled=data_boost_enabled,
+            retry=retry,
+            timeout=timeout,
+        )
+        return PartitionedQueryResults(
+            self,
+            list(batches),
+            max_workers=max_workers,
+            ordered=ordered,
+            batch_size=batch_size,
+            max_pending_batches=max_pending_batches,
+            retry=retry,
+            timeout=timeout,
+        )
+
     def process(self, batch):
         """Process a single, partitioned query or read.
 
@@ -1356,6 +1787,40 @@ class BatchSnapshot(object):
             return self.process_read_batch(batch)
         raise ValueError("Invalid batch")
 
+    def to_arrow(self, batches, max_workers=None):
+        """Process partitions concurrently into a single Arrow table.
+
+        Each partition is streamed in a worker thread and decoded straight
+        into Arrow arrays; see
+        :meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet.to_arrow`
+        for the type mapping.  Requires the ``pyarrow`` package.
+
+        :type batches: iterable of mapping
+        :param batches:
+            mappings returned from an earlier call to
+            :meth:`generate_query_batches` or :meth:`generate_read_batches`.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of partitions processed
+                            at once.  Defaults to the
+                            :class:`concurrent.futures.ThreadPoolExecutor`
+                            default.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: the rows of all partitions, in the order of ``batches``.
+        """
+        _arrow = _import_arrow()
+        batches = list(batches)
+        # Begin the shared snapshot before fanning out to the workers.
+        self._get_snapshot()
+
+        def process_to_arrow(batch):
+            return self.process(batch).to_arrow()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            tables = list(executor.map(process_to_arrow, batches))
+        return _arrow._concat_tables(tables)
+
     def close(self):
         """Clean up underlying session.
 
@@ -1367,7 +1832,37 @@ class BatchSnapshot(object):
            from all the partitions.
         """
         if self._session is not None:
-            self._session.delete()
+            if self._session_pool is not None:
+                self._session_pool.put_read_only(self._session)
+                self._session = self._snapshot = None
+            else:
+                self._session.delete()
+
+
+def _retry_session_not_found(checkout, func):
+    """Run ``func`` on a checked-out session, retried once if it expired.
+
+    A session which expired while idle in the pool, e.g. when the pool
+    skips validating recently used sessions, is replaced via the pool, and
+    ``func`` runs again on the replacement:  nothing was applied by the
+    failed attempt.
+
+    :type checkout: :class:`~google.cloud.spanner_v1.pool.SessionCheckout`
+    :param checkout: the checkout, or :class:`BatchCheckout`, updated with
+                     the replacement session.
+
+    :type func: callable
+    :param func: takes the session.
+
+    :returns: the value returned by ``func``.
+    """
+    try:
+        return func(checkout._session)
+    except NotFound as exc:
+        if not _is_session_not_found(exc):
+            raise
+        checkout._session = checkout._pool._replace_session(checkout._session)
+        return func(checkout._session)
 
 
 def _check_ddl_statements(value):
@@ -1394,17 +1889,28 @@ def _check_ddl_statements(value):
     return tuple(value)
 
 
-def _retry_on_aborted(func, retry_config):
+def _retry_on_aborted(func, retry_policy):
     """Helper for :meth:`Database.execute_partitioned_dml`.
 
-    Wrap function in a Retry that will retry on Aborted exceptions
-    with the retry config specified.
+    Call the function, retrying on Aborted exceptions as directed by the
+    retry policy.
 
     :type func: callable
     :param func: the function to be retried on Aborted exceptions
 
-    :type retry_config: Retry
-    :param retry_config: retry object with the settings to be used
+    :type retry_policy: :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: policy delaying the retries
+
+    :returns: the value returned by ``func``.
     """
-    retry = retry_config.with_predicate(if_exception_type(Aborted))
-    return retry(func)
+    deadline = retry_policy.deadline()
+    attempts = 0
+    while True:
+        attempts += 1
+        retry_policy.record_attempt()
+        try:
+            return func()
+        except Aborted as exc:
+            delay = retry_policy.retry_delay(exc, deadline, attempts)
+            if delay:
+                time.sleep(delay)
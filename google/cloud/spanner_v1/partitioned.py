@@ -0,0 +1,321 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent processing of partitioned queries / reads."""
+
+import collections
+import concurrent.futures
+import os
+import queue
+import threading
+import time
+
+from google.api_core import gapic_v1
+
+DEFAULT_BATCH_SIZE = 1000
+"""Default maximum number of rows per batch yielded by a worker."""
+
+DEFAULT_MAX_PENDING_BATCHES = 2
+"""Default number of batches buffered per in-flight partition."""
+
+_PUT_INTERVAL = 0.1  # seconds between checks for cancellation
+
+_PARTITION_DONE = object()
+_CLOSED = object()
+
+
+PartitionStats = collections.namedtuple(
+    "PartitionStats", ["index", "row_count", "elapsed"]
+)
+PartitionStats.__doc__ = """Statistics for one fully-processed partition.
+
+:type index: int
+:param index: position of the partition in the list of batches.
+
+:type row_count: int
+:param row_count: number of rows returned by the partition.
+
+:type elapsed: float
+:param elapsed: seconds spent streaming the partition.
+"""
+
+
+def _default_max_workers(partition_count):
+    """Mirror the :class:`~concurrent.futures.ThreadPoolExecutor` default."""
+    return max(1, min(partition_count, 32, (os.cpu_count() or 1) + 4))
+
+
+class PartitionedQueryResults(object):
+    """Rows of a partitioned query / read, processed by a pool of threads.
+
+    Partitions are streamed concurrently by up to ``max_workers`` threads
+    sharing the batch snapshot.  Each worker groups rows in batches of up to
+    ``batch_size`` rows and hands them to the consumer through a bounded
+    queue:  a worker whose queue is full blocks until the consumer catches
+    up, so that memory use stays bounded however slow the consumer is.
+
+    Processing starts when the results are first iterated, and can only be
+    done once.  Exiting the iteration early, or calling :meth:`close`,
+    possibly from another thread, cancels the remaining partitions.
+
+    :type batch_snapshot: :class:`~google.cloud.spanner_v1.database.BatchSnapshot`
+    :param batch_snapshot: snapshot used to process the partitions.
+
+    :type batches: list of mapping
+    :param batches: partition descriptors, as returned by
+                    :meth:`~google.cloud.spanner_v1.database.BatchSnapshot.generate_query_batches`
+                    or :meth:`~google.cloud.spanner_v1.database.BatchSnapshot.generate_read_batches`.
+
+    :type max_workers: int
+    :param max_workers: (Optional) maximum number of partitions processed
+                        at once.
+
+    :type ordered: bool
+    :param ordered: (Optional) if true, rows are yielded partition by
+                    partition, in the order of ``batches``.  Otherwise (the
+                    default), batches are yielded as soon as any worker
+                    produces them.
+
+    :type batch_size: int
+    :param batch_size: (Optional) maximum number of rows per batch.
+
+    :type max_pending_batches: int
+    :param max_pending_batches: (Optional) number of batches buffered per
+                                in-flight partition before its worker
+                                blocks.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) The retry settings for each partition request.
+
+    :type timeout: float
+    :param timeout: (Optional) The timeout for each partition request.
+    """
+
+    def __init__(
+        self,
+        batch_snapshot,
+        batches,
+        max_workers=None,
+        ordered=False,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_pending_batches=DEFAULT_MAX_PENDING_BATCHES,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_pending_batches < 1:
+            raise ValueError("max_pending_batches must be at least 1")
+
+        self._batch_snapshot = batch_snapshot
+        self._batches = list(batches)
+        if max_workers is None:
+            max_workers = _default_max_workers(len(self._batches))
+        self._max_workers = max_workers
+        self._ordered = ordered
+        self._batch_size = batch_size
+        self._max_pending_batches = max_pending_batches
+        self._retry = retry
+        self._timeout = timeout
+        self._stats = []
+        self._stats_lock = threading.Lock()
+        self._cancelled = threading.Event()
+        # Result sets being streamed by the workers, by partition index.
+        self._active = {}
+        self._active_lock = threading.Lock()
+        self._sinks = ()
+        self._executor = None
+        self._started = False
+
+    @property
+    def partition_count(self):
+        """Number of partitions to process.
+
+        :rtype: int
+        """
+        return len(self._batches)
+
+    @property
+    def partition_stats(self):
+        """Statistics for the partitions processed so far.
+
+        :rtype: list of :class:`PartitionStats`
+        :returns: one entry per fully-processed partition, in order of
+                  completion.
+        """
+        with self._stats_lock:
+            return list(self._stats)
+
+    def __iter__(self):
+        return self._iter_rows(self.iter_batches())
+
+    @staticmethod
+    def _iter_rows(batches):
+        """Helper for :meth:`__iter__`."""
+        for rows in batches:
+            for row in rows:
+                yield row
+
+    def iter_batches(self):
+        """Iterate over batches of rows, as produced by the workers.
+
+        :rtype: iterable of list
+        :returns: lists of rows, each from a single partition.
+        :raises: :exc:`RuntimeError`: If the results have already been
+            iterated.
+        """
+        if self._started:
+            raise RuntimeError("Partitioned results can only be iterated once.")
+        self._started = True
+        return self._iter_batches()
+
+    def _iter_batches(self):
+        """Helper for :meth:`iter_batches`."""
+        if not self._batches:
+            return
+
+        if self._ordered:
+            sinks = [queue.Queue(self._max_pending_batches) for _ in self._batches]
+        else:
+            shared = queue.Queue(self._max_pending_batches * self._max_workers)
+            sinks = [shared] * len(self._batches)
+        self._sinks = sinks
+
+        # Begin the shared snapshot before fanning out to the workers.
+        self._batch_snapshot._get_snapshot()
+        self._executor = concurrent.futures.ThreadPoolExecutor(self._max_workers)
+        try:
+            for index, (batch, sink) in enumerate(zip(self._batches, sinks)):
+                self._executor.submit(self._process_partition, index, batch, sink)
+
+            if self._ordered:
+                for sink in sinks:
+                    for rows in self._drain(sink, 1):
+                        yield rows
+            else:
+                for rows in self._drain(shared, len(self._batches)):
+                    yield rows
+        finally:
+            self.close()
+
+    def _drain(self, sink, partition_count):
+        """Yield batches from ``sink`` until ``partition_count`` are done.
+
+        Stops early once :meth:`close` is called.
+        """
+        while partition_count and not self._cancelled.is_set():
+            item = sink.get()
+            if item is _CLOSED:
+                return
+            if item is _PARTITION_DONE:
+                partition_count -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+
+    def _put(self, sink, item):
+        """Block until ``item`` is queued, unless processing is cancelled.
+
+        :rtype: bool
+        :returns: False if processing was cancelled.
+        """
+        while not self._cancelled.is_set():
+            try:
+                sink.put(item, timeout=_PUT_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _process_partition(self, index, batch, sink):
+        """Worker:  stream one partition into ``sink``."""
+        if self._cancelled.is_set():
+            return
+        started = time.monotonic()
+        row_count = 0
+        try:
+            if "query" in batch:
+                results = self._batch_snapshot.process_query_batch(
+                    batch, retry=self._retry, timeout=self._timeout
+                )
+            elif "read" in batch:
+                results = self._batch_snapshot.process_read_batch(
+                    batch, retry=self._retry, timeout=self._timeout
+                )
+            else:
+                raise ValueError("Invalid batch")
+            with self._active_lock:
+                if self._cancelled.is_set():
+                    return
+                self._active[index] = results
+            rows = []
+            for row in results:
+                if self._cancelled.is_set():
+                    return
+                rows.append(row)
+                if len(rows) == self._batch_size:
+                    if not self._put(sink, rows):
+                        return
+                    row_count += len(rows)
+                    rows = []
+            if rows:
+                if not self._put(sink, rows):
+                    return
+                row_count += len(rows)
+        except Exception as exc:
+            # Once cancelled, errors (e.g. of the cancelled call) are moot.
+            if not self._cancelled.is_set():
+                self._put(sink, exc)
+            return
+        finally:
+            with self._active_lock:
+                self._active.pop(index, None)
+
+        with self._stats_lock:
+            self._stats.append(
+                PartitionStats(index, row_count, time.monotonic() - started)
+            )
+        self._put(sink, _PARTITION_DONE)
+
+    def close(self):
+        """Cancel any remaining partitions.
+
+        The streaming calls in flight are cancelled, and a consumer blocked
+        waiting for rows, e.g. on another thread, stops iterating.  Does not
+        wait for the workers to exit.
+        """
+        self._cancelled.set()
+        with self._active_lock:
+            active = list(self._active.values())
+        for results in active:
+            results.cancel()
+        # Wake up the consumer.  If a queue is full, the consumer is not
+        # waiting on it, and checks for cancellation before waiting again.
+        for sink in {id(sink): sink for sink in self._sinks}.values():
+            try:
+                sink.put_nowait(_CLOSED)
+            except queue.Full:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -14,8 +14,15 @@
 
 """Pools managing shared Session objects."""
 
+import bisect
+import collections
+import concurrent.futures
 import datetime
+import logging
 import queue
+import threading
+import time
+import traceback
 
 from google.cloud.exceptions import NotFound
 from google.cloud.spanner_v1 import BatchCreateSessionsRequest
@@ -24,9 +31,14 @@ from google.cloud.spanner_v1._helpers import (
     _metadata_with_prefix,
     _metadata_with_leader_aware_routing,
 )
+from google.cloud.spanner_v1._opentelemetry_tracing import register_pool_metrics
 from warnings import warn
 
 _NOW = datetime.datetime.utcnow  # unit tests may replace
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bound on the sessions returned by a single ``BatchCreateSessions``.
+_MAX_SESSIONS_PER_BATCH_CREATE = 100
 
 
 class AbstractSessionPool(object):
@@ -41,12 +53,29 @@ class AbstractSessionPool(object):
     """
 
     _database = None
+    _validation_delta = None
+    _bind_workers = 1
+    _bind_min_sessions = None
+    _warmup_thread = None
 
     def __init__(self, labels=None, database_role=None):
         if labels is None:
             labels = {}
         self._labels = labels
         self._database_role = database_role
+        self._stats = SessionPoolStats(idle_count=self._idle_count)
+
+    def _set_validation_interval(self, validation_interval):
+        """Helper for concrete pools skipping recent sessions' ``exists()``.
+
+        :type validation_interval: int
+        :param validation_interval: (Optional) seconds since a session was
+                                    last used, within which it is returned
+                                    without a ``GetSession`` round trip.  If
+                                    not passed, every checkout validates.
+        """
+        if validation_interval is not None:
+            self._validation_delta = datetime.timedelta(seconds=validation_interval)
 
     @property
     def labels(self):
@@ -66,6 +95,22 @@ class AbstractSessionPool(object):
         """
         return self._database_role
 
+    @property
+    def stats(self):
+        """Statistics of the pool's checkouts and sessions.
+
+        :rtype: :class:`SessionPoolStats`
+        :returns: the live statistics, updated as the pool is used.
+        """
+        return self._stats
+
+    def _idle_count(self):
+        """Helper for :attr:`stats`:  number of sessions available.
+
+        Concrete implementations override this;  returns None if unknown.
+        """
+        return None
+
     def bind(self, database):
         """Associate the pool with a database.
 
@@ -116,6 +161,192 @@ class AbstractSessionPool(object):
         """
         raise NotImplementedError()
 
+    def _set_bind_options(self, bind_workers, bind_min_sessions):
+        """Helper for concrete pools pre-creating sessions in :meth:`bind`.
+
+        :type bind_workers: int
+        :param bind_workers: maximum number of ``BatchCreateSessions``
+                             requests issued concurrently.
+
+        :type bind_min_sessions: int
+        :param bind_min_sessions: (Optional) number of sessions after which
+                                  :meth:`bind` returns, creating the rest
+                                  in the background.  If not passed,
+                                  :meth:`bind` creates all sessions.
+        """
+        if bind_workers < 1:
+            raise ValueError("bind_workers must be at least 1")
+        self._bind_workers = bind_workers
+        self._bind_min_sessions = bind_min_sessions
+
+    def _batch_create_sessions(self, count, add_session):
+        """Helper for concrete pools:  create sessions in bulk.
+
+        Requests are split into batches of at most
+        ``_MAX_SESSIONS_PER_BATCH_CREATE`` sessions, sent concurrently by
+        up to ``bind_workers`` threads.
+
+        :type count: int
+        :param count: number of sessions to create.
+
+        :type add_session: callable
+        :param add_session: called with each new session, possibly from
+                            several threads at once.
+
+        :rtype: int
+        :returns: number of sessions created.
+        """
+        database = self._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        if database._route_to_leader_enabled:
+            metadata.append(
+                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
+            )
+
+        def _create_batch(batch_count):
+            created = 0
+            while created < batch_count:
+                request = BatchCreateSessionsRequest(
+                    database=database.name,
+                    session_count=batch_count - created,
+                    session_template=Session(creator_role=self.database_role),
+                )
+                resp = api.batch_create_sessions(
+                    request=request,
+                    metadata=metadata,
+                )
+                for session_pb in resp.session:
+                    session = self._new_session()
+                    session._session_id = session_pb.name.split("/")[-1]
+                    add_session(session)
+                created += len(resp.session)
+            return created
+
+        batch_counts = [
+            min(_MAX_SESSIONS_PER_BATCH_CREATE, count - start)
+            for start in range(0, count, _MAX_SESSIONS_PER_BATCH_CREATE)
+        ]
+        workers = min(self._bind_workers, len(batch_counts))
+        if workers <= 1:
+            created = sum(_create_batch(batch_count) for batch_count in batch_counts)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                created = sum(executor.map(_create_batch, batch_counts))
+        self._stats.record_created(created)
+        return created
+
+    def _bind_sessions(self, count, create_sessions):
+        """Helper for :meth:`bind`:  pre-create ``count`` sessions.
+
+        Returns once ``bind_min_sessions`` exist, if set, creating the
+        remaining ones on a background thread;  :meth:`get` blocks until a
+        session is available meanwhile.
+
+        :type count: int
+        :param count: number of sessions to create.
+
+        :type create_sessions: callable
+        :param create_sessions: creates the number of sessions passed, and
+                                adds them to the pool.
+        """
+        warm = count
+        if self._bind_min_sessions is not None:
+            warm = min(count, self._bind_min_sessions)
+        create_sessions(warm)
+
+        if count > warm:
+
+            def _warm_up():
+                try:
+                    create_sessions(count - warm)
+                except Exception:
+                    _LOGGER.exception("Creating pooled sessions failed")
+
+            self._warmup_thread = threading.Thread(
+                target=_warm_up, name="spanner-pool-warmup", daemon=True
+            )
+            self._warmup_thread.start()
+
+    def wait_for_warmup(self, timeout=None):
+        """Wait for sessions being created in the background by :meth:`bind`.
+
+        :type timeout: float
+        :param timeout: (Optional) seconds to wait.
+
+        :rtype: bool
+        :returns: True if no sessions are still being created.
+        """
+        thread = self._warmup_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def maintain(self):
+        """Perform one pass of background upkeep on the pool.
+
+        Called periodically by :class:`SessionPoolMaintainer`.  Pools with
+        nothing to maintain inherit this no-op.
+        """
+
+    def _mark_used(self, session):
+        """Helper:  record that ``session`` was known to exist just now."""
+        session._last_use_time = _NOW()
+
+    def _needs_validation(self, session):
+        """Helper for :meth:`get`:  should ``session.exists()`` be checked?
+
+        :rtype: bool
+        :returns: False if the session was used within the pool's
+                  validation interval, else True.
+        """
+        if self._validation_delta is None:
+            return True
+        last_use_time = session._last_use_time
+        return last_use_time is None or _NOW() - last_use_time > self._validation_delta
+
+    def get_read_only(self, multi_use=False):
+        """Check a session out from the pool, for read-only use.
+
+        Used by :meth:`~google.cloud.spanner_v1.database.Database.snapshot`.
+        Pools which share sessions between concurrent snapshots override
+        this;  by default, sessions are checked out as by :meth:`get`.
+
+        :type multi_use: bool
+        :param multi_use: (Optional) whether the session is used by a
+                          multi-use snapshot, which begins a transaction
+                          on it.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: a session, to be returned via :meth:`put_read_only`.
+        """
+        return self.get()
+
+    def put_read_only(self, session):
+        """Return a session checked out via :meth:`get_read_only`.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+        """
+        self.put(session)
+
+    def _replace_session(self, session):
+        """Helper for checkouts finding that a session no longer exists.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session which no longer exists.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the session to be returned to the pool in its place.
+        """
+        self._stats.record_expired()
+        replacement = self._new_session()
+        replacement.create()
+        self._stats.record_created()
+        self._stats.record_replaced(session, replacement)
+        return replacement
+
     def _new_session(self):
         """Helper for concrete methods creating session instances.
 
@@ -154,8 +385,15 @@ class FixedSizePool(AbstractSessionPool):
       never expected in normal practice, as users should be calling
       :meth:`get` followed by :meth:`put` whenever in need of a session.
 
+    - Optionally, :meth:`maintain` (e.g. driven by a
+      :class:`SessionPoolMaintainer`) keeps idle sessions alive, replaces
+      dead ones, grows the pool up to ``max_size`` while callers wait for
+      sessions, and shrinks it back to ``size`` once the extra sessions
+      sit idle.
+
     :type size: int
-    :param size: fixed pool size
+    :param size: fixed pool size;  the minimum size, if ``max_size`` is
+                 passed.
 
     :type default_timeout: int
     :param default_timeout: default timeout, in seconds, to wait for
@@ -167,10 +405,41 @@ class FixedSizePool(AbstractSessionPool):
 
     :type database_role: str
     :param database_role: (Optional) user-assigned database_role for the session.
+
+    :type validation_interval: int
+    :param validation_interval: (Optional) sessions used within this many
+                                seconds are returned without checking
+                                :meth:`session.exists`;  sessions which
+                                expired nevertheless are replaced when a
+                                request fails with "Session not found".
+
+    :type max_size: int
+    :param max_size: (Optional) size up to which :meth:`maintain` may grow
+                     the pool.  Defaults to ``size``.
+
+    :type ping_interval: int
+    :param ping_interval: seconds of idleness after which :meth:`maintain`
+                          pings a session, keeping it from expiring.
+
+    :type shrink_after: int
+    :param shrink_after: seconds of idleness after which :meth:`maintain`
+                         deletes sessions in excess of ``size``.
+
+    :type bind_workers: int
+    :param bind_workers: maximum number of ``BatchCreateSessions``
+                         requests issued concurrently when creating sessions.
+
+    :type bind_min_sessions: int
+    :param bind_min_sessions: (Optional) number of sessions after which
+                              :meth:`bind` returns, creating the rest in
+                              the background.
     """
 
     DEFAULT_SIZE = 10
     DEFAULT_TIMEOUT = 10
+    DEFAULT_PING_INTERVAL = 3000
+    DEFAULT_SHRINK_AFTER = 600
+    DEFAULT_BIND_WORKERS = 4
 
     def __init__(
         self,
@@ -178,11 +447,32 @@ class FixedSizePool(AbstractSessionPool):
         default_timeout=DEFAULT_TIMEOUT,
         labels=None,
         database_role=None,
+        validation_interval=None,
+        max_size=None,
+        ping_interval=DEFAULT_PING_INTERVAL,
+        shrink_after=DEFAULT_SHRINK_AFTER,
+        bind_workers=DEFAULT_BIND_WORKERS,
+        bind_min_sessions=None,
     ):
         super(FixedSizePool, self).__init__(labels=labels, database_role=database_role)
+        if max_size is None:
+            max_size = size
+        if max_size < size:
+            raise ValueError("max_size must not be less than size")
         self.size = size
+        self.max_size = max_size
         self.default_timeout = default_timeout
-        self._sessions = queue.LifoQueue(size)
+        self._set_validation_interval(validation_interval)
+        self._set_bind_options(bind_workers, bind_min_sessions)
+        self._ping_delta = datetime.timedelta(seconds=ping_interval)
+        self._shrink_delta = datetime.timedelta(seconds=shrink_after)
+        self._sessions = queue.LifoQueue(max_size)
+        # Guards the counters below, updated by callers, by background
+        # session creation and by the maintainer thread.
+        self._count_lock = threading.Lock()
+        self._session_count = 0  # idle and checked out
+        self._pending = 0  # being created
+        self._waits = 0  # checkouts finding the pool empty, since last maintain
 
     def bind(self, database):
         """Associate the pool with a database.
@@ -192,28 +482,36 @@ class FixedSizePool(AbstractSessionPool):
                          when needed.
         """
         self._database = database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
         self._database_role = self._database_role or self._database.database_role
-        request = BatchCreateSessionsRequest(
-            database=database.name,
-            session_count=self.size - self._sessions.qsize(),
-            session_template=Session(creator_role=self.database_role),
-        )
+        self._bind_sessions(self.size - self._sessions.qsize(), self._create_sessions)
 
-        while not self._sessions.full():
-            resp = api.batch_create_sessions(
-                request=request,
-                metadata=metadata,
-            )
-            for session_pb in resp.session:
-                session = self._new_session()
-                session._session_id = session_pb.name.split("/")[-1]
-                self._sessions.put(session)
+    def _create_sessions(self, count):
+        """Helper for :meth:`bind` / :meth:`maintain`:  add sessions.
+
+        Sessions are created in bulk, via ``BatchCreateSessions``.
+
+        :type count: int
+        :param count: number of sessions to add to the pool.
+        """
+
+        added = 0
+
+        def _add_session(session):
+            nonlocal added
+            self._mark_used(session)
+            with self._count_lock:
+                added += 1
+                self._pending -= 1
+                self._session_count += 1
+            self._sessions.put(session)
+
+        with self._count_lock:
+            self._pending += count
+        try:
+            self._batch_create_sessions(count, _add_session)
+        finally:
+            with self._count_lock:
+                self._pending -= count - added
 
     def get(self, timeout=None):
         """Check a session out from the pool.
@@ -229,12 +527,26 @@ class FixedSizePool(AbstractSessionPool):
         if timeout is None:
             timeout = self.default_timeout
 
-        session = self._sessions.get(block=True, timeout=timeout)
+        if self._sessions.empty():
+            with self._count_lock:
+                self._waits += 1
 
-        if not session.exists():
-            session = self._database.session()
-            session.create()
+        started = time.monotonic()
+        try:
+            session = self._sessions.get(block=True, timeout=timeout)
+        except queue.Empty:
+            self._stats.record_timeout()
+            raise
+
+        if self._needs_validation(session):
+            exists = session.exists()
+            self._stats.record_validation(exists)
+            if not exists:
+                session = self._database.session()
+                session.create()
+                self._stats.record_created()
 
+        self._stats.record_checkout(session, time.monotonic() - started)
         return session
 
     def put(self, session):
@@ -247,6 +559,17 @@ class FixedSizePool(AbstractSessionPool):
 
         :raises: :exc:`queue.Full` if the queue is full.
         """
+        self._stats.record_return(session)
+        self._enqueue(session)
+
+    def _enqueue(self, session):
+        """Helper for :meth:`put` / :meth:`maintain`:  queue an idle session.
+
+        Unlike :meth:`put`, does not record a checkout being returned.
+
+        :raises: :exc:`queue.Full` if the queue is full.
+        """
+        self._mark_used(session)
         self._sessions.put_nowait(session)
 
     def clear(self):
@@ -258,7 +581,91 @@ class FixedSizePool(AbstractSessionPool):
             except queue.Empty:
                 break
             else:
+                with self._count_lock:
+                    self._session_count -= 1
                 session.delete()
+                self._stats.record_deleted()
+
+    def _idle_count(self):
+        """Helper for :attr:`stats`:  number of sessions in the queue."""
+        return self._sessions.qsize()
+
+    def _take_idle(self, predicate, limit=None):
+        """Helper for :meth:`maintain`:  remove matching idle sessions.
+
+        Sessions are examined least recently used first.
+
+        :type predicate: callable
+        :param predicate: returns True for sessions to be removed.
+
+        :type limit: int
+        :param limit: (Optional) maximum number of sessions to remove.
+
+        :rtype: list
+        :returns: the removed sessions.
+        """
+        taken = []
+        with self._sessions.mutex:
+            for session in list(self._sessions.queue):
+                if limit is not None and len(taken) >= limit:
+                    break
+                if predicate(session):
+                    self._sessions.queue.remove(session)
+                    taken.append(session)
+            if taken:
+                self._sessions.not_full.notify(len(taken))
+        return taken
+
+    def maintain(self):
+        """Keep idle sessions alive, replace dead ones, and resize the pool.
+
+        - Pings sessions idle for longer than ``ping_interval``;  those
+          found expired are replaced in bulk.
+
+        - Grows the pool toward ``max_size`` by the number of checkouts
+          which found it empty since the last call.
+
+        - Deletes sessions in excess of ``size`` which have been idle for
+          longer than ``shrink_after``.
+
+        This method is designed to be called from a background thread, see
+        :class:`SessionPoolMaintainer`.
+        """
+        now = _NOW()
+
+        def _idle_for(delta):
+            return lambda session: now - session._last_use_time > delta
+
+        with self._count_lock:
+            excess = self._session_count - self.size
+        if excess > 0:
+            for session in self._take_idle(_idle_for(self._shrink_delta), excess):
+                with self._count_lock:
+                    self._session_count -= 1
+                try:
+                    session.delete()
+                except NotFound:
+                    pass
+                self._stats.record_deleted()
+
+        dead = 0
+        for session in self._take_idle(_idle_for(self._ping_delta)):
+            try:
+                session.ping()
+            except NotFound:
+                with self._count_lock:
+                    self._session_count -= 1
+                dead += 1
+            else:
+                self._enqueue(session)
+        self._stats.record_expired(dead)
+
+        with self._count_lock:
+            waits, self._waits = self._waits, 0
+            # Sessions still being created, e.g. by :meth:`bind` in the
+            # background, count toward ``max_size``.
+            room = self.max_size - self._session_count - self._pending - dead
+        self._create_sessions(dead + max(min(waits, room), 0))
 
 
 class BurstyPool(AbstractSessionPool):
@@ -282,12 +689,20 @@ class BurstyPool(AbstractSessionPool):
 
     :type database_role: str
     :param database_role: (Optional) user-assigned database_role for the session.
+
+    :type validation_interval: int
+    :param validation_interval: (Optional) sessions used within this many
+                                seconds are returned without checking
+                                :meth:`session.exists`.
     """
 
-    def __init__(self, target_size=10, labels=None, database_role=None):
+    def __init__(
+        self, target_size=10, labels=None, database_role=None, validation_interval=None
+    ):
         super(BurstyPool, self).__init__(labels=labels, database_role=database_role)
         self.target_size = target_size
         self._database = None
+        self._set_validation_interval(validation_interval)
         self._sessions = queue.LifoQueue(target_size)
 
     def bind(self, database):
@@ -307,15 +722,22 @@ class BurstyPool(AbstractSessionPool):
         :returns: an existing session from the pool, or a newly-created
                   session.
         """
+        started = time.monotonic()
         try:
             session = self._sessions.get_nowait()
         except queue.Empty:
             session = self._new_session()
             session.create()
+            self._stats.record_created()
         else:
-            if not session.exists():
-                session = self._new_session()
-                session.create()
+            if self._needs_validation(session):
+                exists = session.exists()
+                self._stats.record_validation(exists)
+                if not exists:
+                    session = self._new_session()
+                    session.create()
+                    self._stats.record_created()
+        self._stats.record_checkout(session, time.monotonic() - started)
         return session
 
     def put(self, session):
@@ -327,6 +749,9 @@ class BurstyPool(AbstractSessionPool):
         :type session: :class:`~google.cloud.spanner_v1.session.Session`
         :param session: the session being returned.
         """
+        self._stats.record_return(session)
+        if self._validation_delta is not None:
+            self._mark_used(session)
         try:
             self._sessions.put_nowait(session)
         except queue.Full:
@@ -334,6 +759,7 @@ class BurstyPool(AbstractSessionPool):
                 session.delete()
             except NotFound:
                 pass
+            self._stats.record_deleted()
 
     def clear(self):
         """Delete all sessions in the pool."""
@@ -345,6 +771,11 @@ class BurstyPool(AbstractSessionPool):
                 break
             else:
                 session.delete()
+                self._stats.record_deleted()
+
+    def _idle_count(self):
+        """Helper for :attr:`stats`:  number of sessions in the queue."""
+        return self._sessions.qsize()
 
 
 class PingingPool(AbstractSessionPool):
@@ -383,6 +814,15 @@ class PingingPool(AbstractSessionPool):
 
     :type database_role: str
     :param database_role: (Optional) user-assigned database_role for the session.
+
+    :type bind_workers: int
+    :param bind_workers: maximum number of ``BatchCreateSessions``
+                         requests issued concurrently by :meth:`bind`.
+
+    :type bind_min_sessions: int
+    :param bind_min_sessions: (Optional) number of sessions after which
+                              :meth:`bind` returns, creating the rest in
+                              the background.
     """
 
     def __init__(
@@ -392,11 +832,14 @@ class PingingPool(AbstractSessionPool):
         ping_interval=3000,
         labels=None,
         database_role=None,
+        bind_workers=4,
+        bind_min_sessions=None,
     ):
         super(PingingPool, self).__init__(labels=labels, database_role=database_role)
         self.size = size
         self.default_timeout = default_timeout
         self._delta = datetime.timedelta(seconds=ping_interval)
+        self._set_bind_options(bind_workers, bind_min_sessions)
         self._sessions = queue.PriorityQueue(size)
 
     def bind(self, database):
@@ -407,32 +850,11 @@ class PingingPool(AbstractSessionPool):
                          when needed.
         """
         self._database = database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
-        created_session_count = 0
         self._database_role = self._database_role or self._database.database_role
-
-        request = BatchCreateSessionsRequest(
-            database=database.name,
-            session_count=self.size - created_session_count,
-            session_template=Session(creator_role=self.database_role),
+        self._bind_sessions(
+            self.size, lambda count: self._batch_create_sessions(count, self._enqueue)
         )
 
-        while created_session_count < self.size:
-            resp = api.batch_create_sessions(
-                request=request,
-                metadata=metadata,
-            )
-            for session_pb in resp.session:
-                session = self._new_session()
-                session._session_id = session_pb.name.split("/")[-1]
-                self.put(session)
-            created_session_count += len(resp.session)
-
     def get(self, timeout=None):
         """Check a session out from the pool.
 
@@ -447,16 +869,25 @@ class PingingPool(AbstractSessionPool):
         if timeout is None:
             timeout = self.default_timeout
 
-        ping_after, session = self._sessions.get(block=True, timeout=timeout)
+        started = time.monotonic()
+        try:
+            ping_after, session = self._sessions.get(block=True, timeout=timeout)
+        except queue.Empty:
+            self._stats.record_timeout()
+            raise
 
         if _NOW() > ping_after:
             # Using session.exists() guarantees the returned session exists.
             # session.ping() uses a cached result in the backend which could
             # result in a recently deleted session being returned.
-            if not session.exists():
+            exists = session.exists()
+            self._stats.record_validation(exists)
+            if not exists:
                 session = self._new_session()
                 session.create()
+                self._stats.record_created()
 
+        self._stats.record_checkout(session, time.monotonic() - started)
         return session
 
     def put(self, session):
@@ -467,6 +898,16 @@ class PingingPool(AbstractSessionPool):
         :type session: :class:`~google.cloud.spanner_v1.session.Session`
         :param session: the session being returned.
 
+        :raises: :exc:`queue.Full` if the queue is full.
+        """
+        self._stats.record_return(session)
+        self._enqueue(session)
+
+    def _enqueue(self, session):
+        """Helper for :meth:`put` / :meth:`ping`:  queue an idle session.
+
+        Unlike :meth:`put`, does not record a checkout being returned.
+
         :raises: :exc:`queue.Full` if the queue is full.
         """
         self._sessions.put_nowait((_NOW() + self._delta, session))
@@ -480,6 +921,15 @@ class PingingPool(AbstractSessionPool):
                 break
             else:
                 session.delete()
+                self._stats.record_deleted()
+
+    def _idle_count(self):
+        """Helper for :attr:`stats`:  number of sessions in the queue."""
+        return self._sessions.qsize()
+
+    def maintain(self):
+        """Refresh maybe-expired sessions in the pool, see :meth:`ping`."""
+        self.ping()
 
     def ping(self):
         """Refresh maybe-expired sessions in the pool.
@@ -499,10 +949,12 @@ class PingingPool(AbstractSessionPool):
             try:
                 session.ping()
             except NotFound:
+                self._stats.record_expired()
                 session = self._new_session()
                 session.create()
+                self._stats.record_created()
             # Re-add to queue with new expiration
-            self.put(session)
+            self._enqueue(session)
 
 
 class TransactionPingingPool(PingingPool):
@@ -589,18 +1041,703 @@ class TransactionPingingPool(PingingPool):
         if self._sessions.full():
             raise queue.Full
 
+        self._stats.record_return(session)
+        self._enqueue(session)
+
+    def _enqueue(self, session):
+        """Helper for :meth:`put` / :meth:`ping`:  queue an idle session.
+
+        Sessions without a transaction in progress are queued as pending.
+        """
         txn = session._transaction
         if txn is None or txn.committed or txn.rolled_back:
             session.transaction()
             self._pending_sessions.put(session)
         else:
-            super(TransactionPingingPool, self).put(session)
+            super(TransactionPingingPool, self)._enqueue(session)
+
+    def maintain(self):
+        """Refresh maybe-expired sessions, then begin pending transactions."""
+        self.ping()
+        self.begin_pending_transactions()
 
     def begin_pending_transactions(self):
         """Begin all transactions for sessions added to the pool."""
         while not self._pending_sessions.empty():
             session = self._pending_sessions.get()
-            super(TransactionPingingPool, self).put(session)
+            super(TransactionPingingPool, self)._enqueue(session)
+
+
+class MultiplexedSessionPool(AbstractSessionPool):
+    """Concrete session pool implementation:
+
+    - Creates a small, fixed number of long-lived sessions, shared by
+      single-use read-only snapshots:  :meth:`get_read_only` hands out the
+      shared session with the fewest snapshots in flight.  Spanner limits
+      the concurrent reads on a session:  once every shared session has
+      ``max_streams_per_session`` snapshots in flight, it blocks, with a
+      timeout, until one is returned.
+
+    - Delegates other traffic to a fallback pool, which owns sessions
+      exclusively checked out as usual:  read-write traffic
+      (:meth:`get` / :meth:`put`, used by transactions, batches and
+      partitioned DML), and multi-use snapshots, each of which begins a
+      transaction on its session.
+
+    - "Pings" the shared sessions via :meth:`ping`, re-creating any which
+      have expired in place, so that snapshots holding a shared session
+      pick up its replacement.
+
+    The application is responsible for calling :meth:`ping` at appropriate
+    times, e.g. from a background thread.
+
+    :type session_count: int
+    :param session_count: number of sessions shared by read-only snapshots.
+
+    :type max_streams_per_session: int
+    :param max_streams_per_session: maximum number of snapshots sharing a
+                                    session concurrently.
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for a
+                            shared session below its limit of snapshots.
+
+    :type fallback_pool: concrete subclass of :class:`AbstractSessionPool`
+    :param fallback_pool: (Optional) pool used for read-write sessions.
+                          Defaults to a :class:`FixedSizePool`.
+
+    :type ping_interval: int
+    :param ping_interval: interval at which to ping the shared sessions.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+
+    :type database_role: str
+    :param database_role: (Optional) user-assigned database_role for the session.
+    """
+
+    DEFAULT_SESSION_COUNT = 1
+    DEFAULT_MAX_STREAMS_PER_SESSION = 100
+
+    def __init__(
+        self,
+        session_count=DEFAULT_SESSION_COUNT,
+        fallback_pool=None,
+        ping_interval=3000,
+        labels=None,
+        database_role=None,
+        max_streams_per_session=DEFAULT_MAX_STREAMS_PER_SESSION,
+        default_timeout=10,
+    ):
+        if session_count < 1:
+            raise ValueError("session_count must be at least 1")
+        if max_streams_per_session < 1:
+            raise ValueError("max_streams_per_session must be at least 1")
+        super(MultiplexedSessionPool, self).__init__(
+            labels=labels, database_role=database_role
+        )
+        if fallback_pool is None:
+            fallback_pool = FixedSizePool(labels=labels, database_role=database_role)
+        self.session_count = session_count
+        self.max_streams_per_session = max_streams_per_session
+        self.default_timeout = default_timeout
+        self._fallback_pool = fallback_pool
+        self._delta = datetime.timedelta(seconds=ping_interval)
+        self._ping_after = None
+        # Guards the shared sessions and their checkouts.
+        self._lock = threading.Lock()
+        # Notified when a read-only checkout is returned.
+        self._returned = threading.Condition(self._lock)
+        # Serializes RPCs creating the shared sessions, outside of _lock.
+        self._create_lock = threading.Lock()
+        self._sessions = []
+        self._checkouts = []  # read-only checkouts in flight, per session
+
+    @property
+    def fallback_pool(self):
+        """Pool used for read-write sessions.
+
+        :rtype: concrete subclass of :class:`AbstractSessionPool`
+        """
+        return self._fallback_pool
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        Creates the shared sessions, then binds the fallback pool.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database used by the pool to create sessions
+                         when needed.
+        """
+        self._database = database
+        self._database_role = self._database_role or self._database.database_role
+
+        self._create_sessions()
+        self._ping_after = _NOW() + self._delta
+
+        self._fallback_pool.bind(database)
+
+    def _create_sessions(self):
+        """Helper for :meth:`bind` / :meth:`get_read_only`.
+
+        Creates the missing shared sessions.
+
+        :rtype: int
+        :returns: the number of sessions created.
+        """
+        with self._create_lock:
+            with self._lock:
+                missing = self.session_count - len(self._sessions)
+            for _ in range(missing):
+                session = self._new_session()
+                session.create()
+                self._stats.record_created()
+                with self._lock:
+                    self._sessions.append(session)
+                    self._checkouts.append(0)
+        return max(missing, 0)
+
+    def get(self, **kwargs):
+        """Check a session out from the fallback pool.
+
+        :param kwargs: (optional) keyword arguments, passed through to the
+                       fallback pool's ``get``.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: a session for exclusive use.
+        """
+        return self._fallback_pool.get(**kwargs)
+
+    def put(self, session):
+        """Return a session to the fallback pool.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+        """
+        self._fallback_pool.put(session)
+
+    def get_read_only(self, multi_use=False, timeout=None):
+        """Check out a session, for read-only use.
+
+        Single-use snapshots share a session:  it may be in use by other
+        snapshots concurrently, up to ``max_streams_per_session``.  A
+        multi-use snapshot begins a transaction on its session:  it gets a
+        session of its own, from the fallback pool.
+
+        :type multi_use: bool
+        :param multi_use: (Optional) whether the session is used by a
+                          multi-use snapshot.
+
+        :type timeout: int
+        :param timeout: seconds to block waiting for a shared session below
+                        its limit of snapshots.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the shared session with the fewest checkouts in flight,
+                  or a session from the fallback pool if ``multi_use``.
+        :raises ValueError: if the pool is not bound to a database.
+        :raises: :exc:`queue.Empty` if every shared session stays at its
+                 limit of snapshots until the timeout.
+        """
+        if multi_use:
+            return self._fallback_pool.get()
+
+        if timeout is None:
+            timeout = self.default_timeout
+
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                if self._sessions:
+                    checkouts = min(self._checkouts)
+                    if checkouts < self.max_streams_per_session:
+                        index = self._checkouts.index(checkouts)
+                        self._checkouts[index] += 1
+                        session = self._sessions[index]
+                        break
+                    remaining = started + timeout - time.monotonic()
+                    if remaining <= 0 or not self._returned.wait(remaining):
+                        self._stats.record_timeout()
+                        raise queue.Empty()
+                    continue
+            # Cleared, e.g. by dropping the database.
+            if self._database is None:
+                raise ValueError("The pool is not bound to a database.")
+            if not self._create_sessions() and not self._sessions:
+                raise ValueError("No shared sessions could be created.")
+        self._stats.record_checkout(session, time.monotonic() - started)
+        return session
+
+    def put_read_only(self, session):
+        """Return a session checked out via :meth:`get_read_only`.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+        """
+        with self._lock:
+            for index, shared in enumerate(self._sessions):
+                if shared is session:
+                    self._checkouts[index] -= 1
+                    self._returned.notify()
+                    break
+            else:
+                shared = None
+        if shared is None:
+            # Checked out from the fallback pool, or no longer shared after
+            # the pool was cleared.
+            self._fallback_pool.put(session)
+            return
+        self._stats.record_return(session)
+
+    def read_only_checkouts(self):
+        """Count read-only checkouts in flight.
+
+        :rtype: list of int
+        :returns: number of snapshots using each shared session.
+        """
+        with self._lock:
+            return list(self._checkouts)
+
+    def _replace_session(self, session):
+        """Re-create an expired shared session in place.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session which no longer exists.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the re-created session.
+        """
+        with self._lock:
+            shared = any(shared is session for shared in self._sessions)
+        if not shared:
+            return self._fallback_pool._replace_session(session)
+
+        # Snapshots keep checking the shared sessions in and out meanwhile.
+        with self._create_lock:
+            # Another checkout may have re-created it while we waited.
+            if not session.exists():
+                self._stats.record_expired()
+                session._session_id = None
+                session.create()
+                self._stats.record_created()
+        return session
+
+    def clear(self):
+        """Delete the shared sessions, and all sessions in the fallback pool."""
+        with self._lock:
+            sessions, self._sessions, self._checkouts = self._sessions, [], []
+            self._returned.notify_all()
+
+        for session in sessions:
+            try:
+                session.delete()
+            except NotFound:
+                pass
+            self._stats.record_deleted()
+
+        self._fallback_pool.clear()
+
+    def _idle_count(self):
+        """Helper for :attr:`stats`:  shared sessions used by no snapshot."""
+        with self._lock:
+            return self._checkouts.count(0)
+
+    def maintain(self):
+        """Refresh the shared sessions, then maintain the fallback pool."""
+        self.ping()
+        self._fallback_pool.maintain()
+
+    def ping(self):
+        """Refresh the shared sessions, if the ping interval has elapsed.
+
+        This method is designed to be called from a background thread,
+        or during the "idle" phase of an event loop.
+        """
+        if self._ping_after is None or _NOW() < self._ping_after:
+            return
+
+        for session in list(self._sessions):
+            try:
+                session.ping()
+            except NotFound:
+                self._replace_session(session)
+        self._ping_after = _NOW() + self._delta
+
+
+SessionLeak = collections.namedtuple("SessionLeak", ["session", "held_for", "stack"])
+SessionLeak.__doc__ = """A session checked out for longer than the leak threshold.
+
+:type session: :class:`~google.cloud.spanner_v1.session.Session`
+:param session: the session checked out.
+
+:type held_for: float
+:param held_for: seconds since the session was checked out.
+
+:type stack: str or None
+:param stack: stack trace of the checkout, if captured.
+"""
+
+
+class SessionPoolStats(object):
+    """Counters and timings describing a session pool's activity.
+
+    Every pool records into its own instance, available as
+    :attr:`AbstractSessionPool.stats`.  Counters only grow;  callers
+    interested in rates should sample them periodically, or report them
+    via :meth:`register_opentelemetry_metrics`.
+
+    :type idle_count: callable
+    :param idle_count: (Optional) returns the number of sessions available
+                       in the pool, or None if unknown.
+
+    :type latency_buckets: sequence of float
+    :param latency_buckets: (Optional) upper bounds, in seconds, of the
+                            checkout latency histogram buckets.
+    """
+
+    DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+    def __init__(self, idle_count=None, latency_buckets=DEFAULT_LATENCY_BUCKETS):
+        self._idle_count = idle_count
+        self._lock = threading.Lock()
+        self._latency_bounds = tuple(sorted(latency_buckets))
+        self._latency_counts = [0] * (len(self._latency_bounds) + 1)
+        self._latency_sum = 0.0
+        self._listeners = []
+        self._leak_threshold = None
+        self._capture_stacks = False
+        # id(session) -> [session, checkout time, stack, reported], one per
+        # checkout in flight:  read-only sessions may be shared.
+        self._checked_out = {}
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.in_use = 0
+        self.validations = 0
+        self.sessions_created = 0
+        self.sessions_deleted = 0
+        self.sessions_expired = 0
+
+    @property
+    def idle(self):
+        """Number of sessions available in the pool.
+
+        :rtype: int or None
+        :returns: the count, or None if the pool cannot tell.
+        """
+        if self._idle_count is None:
+            return None
+        return self._idle_count()
+
+    @property
+    def utilization(self):
+        """Fraction of the pool's sessions currently checked out.
+
+        :rtype: float or None
+        :returns: ``in_use / (in_use + idle)``, or None if unknown.
+        """
+        idle = self.idle
+        if idle is None or self.in_use + idle == 0:
+            return None
+        return self.in_use / (self.in_use + idle)
+
+    @property
+    def checkout_latency(self):
+        """Histogram of the time spent waiting for sessions.
+
+        :rtype: list of (float, int)
+        :returns: ``(upper_bound, count)`` pairs, the last bound being
+                  ``float("inf")``.
+        """
+        with self._lock:
+            counts = list(self._latency_counts)
+        return list(zip(self._latency_bounds + (float("inf"),), counts))
+
+    @property
+    def mean_checkout_latency(self):
+        """Mean time spent waiting for sessions, in seconds.
+
+        :rtype: float or None
+        """
+        if not self.checkouts:
+            return None
+        return self._latency_sum / self.checkouts
+
+    def as_dict(self):
+        """Snapshot of the statistics.
+
+        :rtype: dict
+        :returns: counters, gauges and the checkout latency histogram.
+        """
+        return {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "in_use": self.in_use,
+            "idle": self.idle,
+            "utilization": self.utilization,
+            "validations": self.validations,
+            "sessions_created": self.sessions_created,
+            "sessions_deleted": self.sessions_deleted,
+            "sessions_expired": self.sessions_expired,
+            "mean_checkout_latency": self.mean_checkout_latency,
+            "checkout_latency": self.checkout_latency,
+        }
+
+    def add_checkout_listener(self, listener):
+        """Register a callable receiving each checkout's wait, in seconds.
+
+        :type listener: callable
+        :param listener: called with a float, on the checking-out thread.
+        """
+        self._listeners.append(listener)
+
+    def register_opentelemetry_metrics(self, meter=None, attributes=None):
+        """Report these statistics as OpenTelemetry metrics.
+
+        Creates gauges for the in-use and idle session counts, counters for
+        checkouts, timeouts and session lifecycle events, and a histogram
+        of checkout latencies.
+
+        :type meter: :class:`opentelemetry.metrics.Meter`
+        :param meter: (Optional) meter creating the instruments.
+
+        :type attributes: dict
+        :param attributes: (Optional) attributes of every measurement.
+
+        :rtype: :class:`opentelemetry.metrics.Meter` or None
+        :returns: the meter used, or None if OpenTelemetry metrics are not
+                  installed.
+        """
+        return register_pool_metrics(self, meter=meter, attributes=attributes)
+
+    def enable_leak_detection(self, threshold, capture_stacks=True):
+        """Track sessions checked out for longer than ``threshold``.
+
+        :type threshold: float
+        :param threshold: seconds after which a checked-out session is
+                          reported by :meth:`find_leaks`.
+
+        :type capture_stacks: bool
+        :param capture_stacks: record the stack trace of each checkout.
+                               Costs a stack walk per checkout.
+        """
+        self._leak_threshold = threshold
+        self._capture_stacks = capture_stacks
+
+    def find_leaks(self, unreported_only=False):
+        """Sessions checked out for longer than the leak threshold.
+
+        :type unreported_only: bool
+        :param unreported_only: skip leaks returned by previous calls
+                                passing this flag.
+
+        :rtype: list of :class:`SessionLeak`
+        :returns: the leaks found, longest held first;  empty if leak
+                  detection is not enabled.
+        """
+        if self._leak_threshold is None:
+            return []
+        now = time.monotonic()
+        leaks = []
+        with self._lock:
+            for entries in self._checked_out.values():
+                for entry in entries:
+                    session, started, stack, reported = entry
+                    held_for = now - started
+                    if held_for <= self._leak_threshold:
+                        continue
+                    if unreported_only:
+                        if reported:
+                            continue
+                        entry[3] = True
+                    leaks.append(SessionLeak(session, held_for, stack))
+        leaks.sort(key=lambda leak: leak.held_for, reverse=True)
+        return leaks
+
+    def record_checkout(self, session, wait):
+        """Record a session being checked out.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session checked out.
+
+        :type wait: float
+        :param wait: seconds spent obtaining the session.
+        """
+        stack = None
+        if self._capture_stacks:
+            stack = "".join(traceback.format_stack(limit=16)[:-1])
+        index = bisect.bisect_left(self._latency_bounds, wait)
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self._latency_counts[index] += 1
+            self._latency_sum += wait
+            self._checked_out.setdefault(id(session), []).append(
+                [session, time.monotonic(), stack, False]
+            )
+        for listener in self._listeners:
+            listener(wait)
+
+    def record_return(self, session):
+        """Record a session being returned to the pool.
+
+        Sessions not checked out via this pool, e.g. shared sessions
+        handed to the fallback pool after a :class:`MultiplexedSessionPool`
+        was cleared, are ignored.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session returned.
+        """
+        with self._lock:
+            entries = self._checked_out.get(id(session))
+            if not entries:
+                return
+            entries.pop(0)
+            if not entries:
+                del self._checked_out[id(session)]
+            self.in_use -= 1
+
+    def record_replaced(self, session, replacement):
+        """Record a checked-out session being replaced by a new one.
+
+        The checkout is then completed by returning ``replacement``.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session checked out, which no longer exists.
+
+        :type replacement: :class:`~google.cloud.spanner_v1.session.Session`
+        :param replacement: the session used in its place.
+        """
+        with self._lock:
+            entries = self._checked_out.get(id(session))
+            if not entries:
+                return
+            entry = entries.pop(0)
+            if not entries:
+                del self._checked_out[id(session)]
+            entry[0] = replacement
+            self._checked_out.setdefault(id(replacement), []).append(entry)
+
+    def record_timeout(self):
+        """Record a checkout timing out on an empty pool."""
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_validation(self, exists):
+        """Record a checkout checking whether a session exists.
+
+        :type exists: bool
+        :param exists: the result of ``session.exists()``.
+        """
+        with self._lock:
+            self.validations += 1
+            if not exists:
+                self.sessions_expired += 1
+
+    def record_expired(self, count=1):
+        """Record sessions found to no longer exist, e.g. when pinged."""
+        with self._lock:
+            self.sessions_expired += count
+
+    def record_created(self, count=1):
+        """Record sessions created by the pool."""
+        with self._lock:
+            self.sessions_created += count
+
+    def record_deleted(self, count=1):
+        """Record sessions deleted by the pool."""
+        with self._lock:
+            self.sessions_deleted += count
+
+
+class SessionPoolMaintainer(object):
+    """Call a pool's :meth:`~AbstractSessionPool.maintain` periodically.
+
+    Runs on a daemon thread, so that applications need not drive e.g.
+    :meth:`PingingPool.ping` themselves.  Errors raised by a maintenance
+    pass are logged, and retried on the next one;  so are sessions held
+    past the threshold of :meth:`SessionPoolStats.enable_leak_detection`.
+
+    .. code-block:: python
+
+       pool = FixedSizePool(size=10, max_size=50)
+       database = instance.database(DATABASE_NAME, pool=pool)
+       maintainer = SessionPoolMaintainer(pool, interval=60)
+       maintainer.start()
+
+    :type pool: concrete subclass of :class:`AbstractSessionPool`
+    :param pool: the pool to maintain.
+
+    :type interval: float
+    :param interval: seconds between maintenance passes.
+    """
+
+    DEFAULT_INTERVAL = 60
+
+    def __init__(self, pool, interval=DEFAULT_INTERVAL):
+        self._pool = pool
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        """Whether the maintenance thread is running.
+
+        :rtype: bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the maintenance thread.
+
+        :raises RuntimeError: if the thread is already running.
+        """
+        if self.running:
+            raise RuntimeError("Maintainer is already running")
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="spanner-pool-maintainer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop the maintenance thread, waiting for any pass in progress.
+
+        :type timeout: float
+        :param timeout: (Optional) seconds to wait for the thread to exit.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        """Helper for :meth:`start`:  body of the maintenance thread."""
+        while not self._stopped.wait(self.interval):
+            try:
+                self._pool.maintain()
+                self._report_leaks()
+            except Exception:
+                _LOGGER.exception("Session pool maintenance failed")
+
+    def _report_leaks(self):
+        """Helper for :meth:`_run`:  log newly detected session leaks."""
+        for leak in self._pool.stats.find_leaks(unreported_only=True):
+            _LOGGER.warning(
+                "Session %s checked out for %.1f seconds%s",
+                leak.session.session_id,
+                leak.held_for,
+                ", at:\n" + leak.stack if leak.stack else "",
+            )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
 
 
 class SessionCheckout(object):
@@ -0,0 +1,243 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retry policy for transactions aborted by Cloud Spanner."""
+
+import collections
+import random
+import threading
+import time
+
+from google.rpc.error_details_pb2 import RetryInfo
+
+DEFAULT_RETRY_TIMEOUT_SECS = 30
+"""Default timeout used by :meth:`Session.run_in_transaction`."""
+
+
+TransactionAbortStats = collections.namedtuple(
+    "TransactionAbortStats", ["attempts", "aborts", "exhausted"]
+)
+TransactionAbortStats.__doc__ = """Abort statistics of a transaction tag.
+
+:type attempts: int
+:param attempts: number of attempts to run a transaction.
+
+:type aborts: int
+:param aborts: number of attempts aborted by the server.
+
+:type exhausted: int
+:param exhausted: number of transactions abandoned after an abort, because
+                  their deadline or maximum number of attempts was reached.
+"""
+
+
+def _server_retry_delay(exc):
+    """Helper for :meth:`AbortRetryPolicy.retry_delay`.
+
+    :type exc: :class:`google.api_core.exceptions.Aborted`
+    :param exc: exception for aborted transaction
+
+    :rtype: float
+    :returns: seconds to wait before retrying the transaction, as requested
+              by the server, or None if the server did not say.
+    """
+    if not exc.errors:
+        return None
+    return _call_retry_delay(exc.errors[0])
+
+
+def _call_retry_delay(call):
+    """Helper for :func:`_server_retry_delay`.
+
+    :type call: :class:`grpc.Call`
+    :param call: the failed call
+
+    :rtype: float
+    :returns: seconds to wait before retrying the transaction, per the
+              call's ``RetryInfo`` trailing metadata, or None if absent.
+    """
+    trailing_metadata = getattr(call, "trailing_metadata", None)
+    if trailing_metadata is None:
+        return None
+    retry_info_pb = dict(trailing_metadata() or ()).get("google.rpc.retryinfo-bin")
+    if retry_info_pb is None:
+        return None
+    retry_info = RetryInfo()
+    retry_info.ParseFromString(retry_info_pb)
+    return retry_info.retry_delay.seconds + retry_info.retry_delay.nanos / 1.0e9
+
+
+class AbortRetryPolicy(object):
+    """Deadline-aware retry of aborted transactions.
+
+    Used by :meth:`~google.cloud.spanner_v1.session.Session.run_in_transaction`,
+    :meth:`~google.cloud.spanner_v1.database.Database.execute_partitioned_dml`
+    and the DB-API connection.  Aborted transactions are not retried once
+    ``timeout`` has elapsed since the first attempt.
+
+    The delay before a retry is the one requested by the server, if any.
+    Otherwise it grows exponentially from ``initial`` by ``multiplier``, up
+    to ``maximum``, and a random fraction ``jitter`` of it is subtracted so
+    that conflicting transactions do not retry in lockstep.
+
+    :type initial: float
+    :param initial: delay before the first retry, in seconds.
+
+    :type maximum: float
+    :param maximum: maximum delay between retries, in seconds.
+
+    :type multiplier: float
+    :param multiplier: growth of the delay after each attempt.
+
+    :type jitter: float
+    :param jitter: fraction of the delay which is randomized, between 0
+                   (no randomization) and 1 (delays drawn uniformly between
+                   zero and the exponential delay).
+
+    :type timeout: float
+    :param timeout: seconds after the first attempt past which aborted
+                    transactions are no longer retried.
+
+    :type max_attempts: int
+    :param max_attempts: (Optional) maximum number of attempts.  Unlimited,
+                         within ``timeout``, if not passed.
+    """
+
+    def __init__(
+        self,
+        initial=0.02,
+        maximum=32.0,
+        multiplier=1.3,
+        jitter=1.0,
+        timeout=DEFAULT_RETRY_TIMEOUT_SECS,
+        max_attempts=None,
+    ):
+        if initial < 0 or maximum < initial:
+            raise ValueError("Need 0 <= initial <= maximum")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if max_attempts is not None and max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+
+    def deadline(self, timeout=None):
+        """Deadline of a transaction starting now.
+
+        :type timeout: float
+        :param timeout: (Optional) overrides :attr:`timeout`.
+
+        :rtype: float
+        :returns: timestamp past which aborted attempts are not retried.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return time.time() + timeout
+
+    def backoff(self, attempts):
+        """Delay before retrying, if the server did not request one.
+
+        :type attempts: int
+        :param attempts: number of attempts made so far.
+
+        :rtype: float
+        :returns: seconds to wait.
+        """
+        try:
+            delay = self.initial * self.multiplier ** max(attempts - 1, 0)
+        except OverflowError:
+            delay = self.maximum
+        return min(self.maximum, delay) * (1 - self.jitter * random.random())
+
+    def retry_delay(self, exc, deadline, attempts, transaction_tag=None):
+        """Decide whether an aborted attempt is retried.
+
+        :type exc: :class:`google.api_core.exceptions.Aborted`
+        :param exc: exception for aborted transaction
+
+        :type deadline: float
+        :param deadline: timestamp returned by :meth:`deadline`.
+
+        :type attempts: int
+        :param attempts: number of attempts made so far.
+
+        :type transaction_tag: str
+        :param transaction_tag: (Optional) tag of the transaction, for
+                                :meth:`abort_stats`.
+
+        :rtype: float
+        :returns: seconds to wait before retrying.
+        :raises: ``exc``, if the transaction is not to be retried.
+        """
+        now = time.time()
+        delay = _server_retry_delay(exc)
+        if delay is None:
+            delay = self.backoff(attempts)
+
+        exhausted = (
+            now >= deadline
+            or now + delay > deadline
+            or (self.max_attempts is not None and attempts >= self.max_attempts)
+        )
+        self._record(transaction_tag, aborts=1, exhausted=int(exhausted))
+        if exhausted:
+            raise exc
+        return delay
+
+    def record_attempt(self, transaction_tag=None):
+        """Count an attempt to run a transaction, for :meth:`abort_stats`.
+
+        :type transaction_tag: str
+        :param transaction_tag: (Optional) tag of the transaction.
+        """
+        self._record(transaction_tag, attempts=1)
+
+    def _record(self, transaction_tag, attempts=0, aborts=0, exhausted=0):
+        """Helper for :meth:`record_attempt` / :meth:`retry_delay`."""
+        with self._stats_lock:
+            stats = self._stats.get(transaction_tag, (0, 0, 0))
+            self._stats[transaction_tag] = (
+                stats[0] + attempts,
+                stats[1] + aborts,
+                stats[2] + exhausted,
+            )
+
+    def abort_stats(self):
+        """Abort statistics, by transaction tag.
+
+        Untagged transactions are counted under ``None``.
+
+        :rtype: dict (str -> :class:`TransactionAbortStats`)
+        """
+        with self._stats_lock:
+            return {
+                tag: TransactionAbortStats(*stats) for tag, stats in self._stats.items()
+            }
+
+    def reset_abort_stats(self):
+        """Discard the statistics returned by :meth:`abort_stats`."""
+        with self._stats_lock:
+            self._stats.clear()
+
+
+DEFAULT_ABORT_RETRY_POLICY = AbortRetryPolicy()
+"""Policy used when none is passed explicitly."""
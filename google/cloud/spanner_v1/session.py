@@ -15,14 +15,12 @@
 """Wrapper for Cloud Spanner Session objects."""
 
 from functools import total_ordering
-import random
 import time
 
 from google.api_core.exceptions import Aborted
 from google.api_core.exceptions import GoogleAPICallError
 from google.api_core.exceptions import NotFound
 from google.api_core.gapic_v1 import method
-from google.rpc.error_details_pb2 import RetryInfo
 
 from google.cloud.spanner_v1 import ExecuteSqlRequest
 from google.cloud.spanner_v1 import CreateSessionRequest
@@ -32,14 +30,13 @@ from google.cloud.spanner_v1._helpers import (
 )
 from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
 from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.retry_policy import DEFAULT_ABORT_RETRY_POLICY
+from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_TIMEOUT_SECS  # noqa
+from google.cloud.spanner_v1.retry_policy import _call_retry_delay
 from google.cloud.spanner_v1.snapshot import Snapshot
 from google.cloud.spanner_v1.transaction import Transaction
 
 
-DEFAULT_RETRY_TIMEOUT_SECS = 30
-"""Default timeout used by :meth:`Session.run_in_transaction`."""
-
-
 @total_ordering
 class Session(object):
     """Representation of a Cloud Spanner Session.
@@ -62,6 +59,7 @@ class Session(object):
 
     _session_id = None
     _transaction = None
+    _last_use_time = None  # Maintained by session pools
 
     def __init__(self, database, labels=None, database_role=None):
         self._database = database
@@ -116,17 +114,16 @@ class Session(object):
             raise ValueError("No session ID set by back-end")
         return self._database.name + "/sessions/" + self._session_id
 
-    def create(self):
-        """Create this session, bound to its database.
-
-        See
-        https://cloud.google.com/spanner/reference/rpc/google.spanner.v1#google.spanner.v1.Spanner.CreateSession
+    def _make_create_request(self):
+        """Helper for :meth:`create`:  validate state and build the request.
 
+        :rtype: tuple
+        :returns: the :class:`~google.cloud.spanner_v1.types.CreateSessionRequest`
+                  and the RPC metadata.
         :raises ValueError: if :attr:`session_id` is already set.
         """
         if self._session_id is not None:
             raise ValueError("Session ID already set by back-end")
-        api = self._database.spanner_api
         metadata = _metadata_with_prefix(self._database.name)
         if self._database._route_to_leader_enabled:
             metadata.append(
@@ -141,7 +138,18 @@ class Session(object):
 
         if self._labels:
             request.session.labels = self._labels
+        return request, metadata
 
+    def create(self):
+        """Create this session, bound to its database.
+
+        See
+        https://cloud.google.com/spanner/reference/rpc/google.spanner.v1#google.spanner.v1.Spanner.CreateSession
+
+        :raises ValueError: if :attr:`session_id` is already set.
+        """
+        request, metadata = self._make_create_request()
+        api = self._database.spanner_api
         with trace_call("CloudSpanner.CreateSession", self, self._labels):
             session_pb = api.create_session(
                 request=request,
@@ -363,6 +371,11 @@ class Session(object):
                    to continue retrying the transaction.
                    "commit_request_options" will be removed and used to set the
                    request options for the commit request.
+                   "transaction_tag" will be removed and used to tag the
+                   transaction.
+                   "retry_policy" will be removed and used instead of
+                   :data:`~google.cloud.spanner_v1.retry_policy.DEFAULT_ABORT_RETRY_POLICY`
+                   to delay retries of aborted attempts.
 
         :rtype: Any
         :returns: The return value of ``func``.
@@ -370,7 +383,8 @@ class Session(object):
         :raises Exception:
             reraises any non-ABORT exceptions raised by ``func``.
         """
-        deadline = time.time() + kw.pop("timeout_secs", DEFAULT_RETRY_TIMEOUT_SECS)
+        retry_policy = kw.pop("retry_policy", None) or DEFAULT_ABORT_RETRY_POLICY
+        deadline = retry_policy.deadline(kw.pop("timeout_secs", None))
         commit_request_options = kw.pop("commit_request_options", None)
         transaction_tag = kw.pop("transaction_tag", None)
         attempts = 0
@@ -384,10 +398,13 @@ class Session(object):
 
             try:
                 attempts += 1
+                retry_policy.record_attempt(transaction_tag)
                 return_value = func(txn, *args, **kw)
             except Aborted as exc:
                 del self._transaction
-                _delay_until_retry(exc, deadline, attempts)
+                _delay_until_retry(
+                    exc, deadline, attempts, retry_policy, transaction_tag
+                )
                 continue
             except GoogleAPICallError:
                 del self._transaction
@@ -403,7 +420,9 @@ class Session(object):
                 )
             except Aborted as exc:
                 del self._transaction
-                _delay_until_retry(exc, deadline, attempts)
+                _delay_until_retry(
+                    exc, deadline, attempts, retry_policy, transaction_tag
+                )
             except GoogleAPICallError:
                 del self._transaction
                 raise
@@ -418,10 +437,12 @@ class Session(object):
 
 # Rational:  this function factors out complex shared deadline / retry
 #            handling from two `except:` clauses.
-def _delay_until_retry(exc, deadline, attempts):
+def _delay_until_retry(
+    exc, deadline, attempts, retry_policy=None, transaction_tag=None
+):
     """Helper for :meth:`Session.run_in_transaction`.
 
-    Detect retryable abort, and impose server-supplied delay.
+    Detect retryable abort, and impose the delay chosen by the retry policy.
 
     :type exc: :class:`google.api_core.exceptions.Aborted`
     :param exc: exception for aborted transaction
@@ -431,41 +452,36 @@ def _delay_until_retry(exc, deadline, attempts):
 
     :type attempts: int
     :param attempts: number of call retries
-    """
-    cause = exc.errors[0]
-
-    now = time.time()
-
-    if now >= deadline:
-        raise
-
-    delay = _get_retry_delay(cause, attempts)
-    if delay is not None:
 
-        if now + delay > deadline:
-            raise
+    :type retry_policy: :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: (Optional) policy choosing the delay.
 
+    :type transaction_tag: str
+    :param transaction_tag: (Optional) tag of the aborted transaction.
+    """
+    if retry_policy is None:
+        retry_policy = DEFAULT_ABORT_RETRY_POLICY
+    delay = retry_policy.retry_delay(exc, deadline, attempts, transaction_tag)
+    if delay:
         time.sleep(delay)
 
 
 def _get_retry_delay(cause, attempts):
     """Helper for :func:`_delay_until_retry`.
 
-    :type exc: :class:`grpc.Call`
-    :param exc: exception for aborted transaction
+    Deprecated:  retries are delayed by
+    :meth:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy.retry_delay`.
 
-    :rtype: float
-    :returns: seconds to wait before retrying the transaction.
+    :type cause: :class:`grpc.Call`
+    :param cause: the call of the aborted transaction
 
     :type attempts: int
     :param attempts: number of call retries
+
+    :rtype: float
+    :returns: seconds to wait before retrying the transaction.
     """
-    metadata = dict(cause.trailing_metadata())
-    retry_info_pb = metadata.get("google.rpc.retryinfo-bin")
-    if retry_info_pb is not None:
-        retry_info = RetryInfo()
-        retry_info.ParseFromString(retry_info_pb)
-        nanos = retry_info.retry_delay.nanos
-        return retry_info.retry_delay.seconds + nanos / 1.0e9
-
-    return 2**attempts + random.random()
+    delay = _call_retry_delay(cause)
+    if delay is None:
+        delay = DEFAULT_ABORT_RETRY_POLICY.backoff(attempts)
+    return delay
@@ -14,10 +14,12 @@
 
 """Model a set of read-only queries to a database as a snapshot."""
 
+import contextlib
 import functools
 import threading
 from google.protobuf.struct_pb2 import Struct
 from google.cloud.spanner_v1 import ExecuteSqlRequest
+from google.cloud.spanner_v1 import PartialResultSet
 from google.cloud.spanner_v1 import ReadRequest
 from google.cloud.spanner_v1 import TransactionOptions
 from google.cloud.spanner_v1 import TransactionSelector
@@ -28,7 +30,9 @@ from google.cloud.spanner_v1 import PartitionReadRequest
 from google.api_core.exceptions import InternalServerError
 from google.api_core.exceptions import ServiceUnavailable
 from google.api_core.exceptions import InvalidArgument
+from google.api_core.exceptions import NotFound
 from google.api_core import gapic_v1
+from google.cloud.spanner_v1._helpers import _is_session_not_found
 from google.cloud.spanner_v1._helpers import _make_value_pb
 from google.cloud.spanner_v1._helpers import _merge_query_options
 from google.cloud.spanner_v1._helpers import (
@@ -46,6 +50,85 @@ _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES = (
 )
 
 
+class ResumeBufferOverflow(RuntimeError):
+    """Results buffered while awaiting a resume token exceeded the limits.
+
+    Raised when a :class:`ResumeBufferPolicy` is configured with
+    ``on_overflow=ResumeBufferPolicy.FAIL``.
+    """
+
+
+class ResumeBufferPolicy(object):
+    """Bounds results buffered by a stream awaiting a resume token.
+
+    Streaming reads and queries hold back results until the server sends a
+    resume token, so that the stream can be restarted transparently from
+    that token after a transient error.  Servers may send tokens rarely, in
+    which case the buffer can grow large, and no row is returned until it
+    is released.
+
+    :type max_items: int
+    :param max_items: (Optional) maximum number of ``PartialResultSet``
+                      messages buffered.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) maximum serialized size of the buffered
+                      ``PartialResultSet`` messages.
+
+    :type on_overflow: str
+    :param on_overflow: what to do once a limit is exceeded:
+                        :attr:`FLUSH` (the default) returns the buffered
+                        results, after which an error cannot be recovered
+                        from until the next resume token is received;
+                        :attr:`FAIL` raises :exc:`ResumeBufferOverflow`.
+
+    :type resumable: bool
+    :param resumable: if False, results are returned as soon as they are
+                      received, and the stream is never restarted:  errors
+                      are raised to the caller.
+
+    :raises ValueError: if ``on_overflow`` is not a supported value.
+    """
+
+    FLUSH = "flush"
+    FAIL = "fail"
+
+    def __init__(
+        self, max_items=None, max_bytes=None, on_overflow=FLUSH, resumable=True
+    ):
+        if on_overflow not in (self.FLUSH, self.FAIL):
+            raise ValueError("Unsupported on_overflow: {!r}".format(on_overflow))
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.on_overflow = on_overflow
+        self.resumable = resumable
+
+    def _item_size(self, item):
+        """Helper for streams:  bytes counted against :attr:`max_bytes`."""
+        if self.max_bytes is None:
+            return 0
+        return PartialResultSet.pb(item).ByteSize()
+
+    def _check_overflow(self, item_count, byte_count):
+        """Helper for streams:  has the buffer outgrown the limits?
+
+        :rtype: bool
+        :returns: True if buffered results should be flushed.
+        :raises: :exc:`ResumeBufferOverflow` if a limit is exceeded and
+                 the policy fails fast.
+        """
+        overflowed = (self.max_items is not None and item_count > self.max_items) or (
+            self.max_bytes is not None and byte_count > self.max_bytes
+        )
+        if overflowed and self.on_overflow == self.FAIL:
+            raise ResumeBufferOverflow(
+                "Buffered {} results ({} bytes) without a resume token".format(
+                    item_count, byte_count
+                )
+            )
+        return overflowed
+
+
 def _restart_on_unavailable(
     method,
     request,
@@ -54,6 +137,7 @@ def _restart_on_unavailable(
     attributes=None,
     transaction=None,
     transaction_selector=None,
+    buffer_policy=None,
 ):
     """Restart iteration after :exc:`.ServiceUnavailable`.
 
@@ -69,69 +153,237 @@ def _restart_on_unavailable(
     :type transaction_selector: :class:`transaction_pb2.TransactionSelector`
     :param transaction_selector: Transaction selector object to be used in request if transaction is not passed,
     if both transaction_selector and transaction are passed, then transaction is given priority.
+
+    :type buffer_policy: :class:`ResumeBufferPolicy`
+    :param buffer_policy: (Optional) limits on the results buffered while
+                          awaiting a resume token.  Unbounded if not passed.
     """
 
     resume_token = b""
     item_buffer = []
+    buffered_bytes = 0
+    # Set once results past ``resume_token`` have been yielded:  restarting
+    # from it would then return them twice.
+    flushed = False
 
-    if transaction is not None:
-        transaction_selector = transaction._make_txn_selector()
-    elif transaction_selector is None:
+    if transaction is None and transaction_selector is None:
         raise InvalidArgument(
             "Either transaction or transaction_selector should be set"
         )
 
-    request.transaction = transaction_selector
-    with trace_call(trace_name, session, attributes):
-        iterator = method(request=request)
-    while True:
-        try:
+    # If this request begins the transaction, concurrent requests wait for
+    # its first response, rather than beginning another transaction.
+    begins_inline = transaction is not None and transaction._acquire_inline_begin()
+
+    try:
+        if transaction is not None:
+            transaction_selector = transaction._make_txn_selector()
+
+        request.transaction = transaction_selector
+        with trace_call(trace_name, session, attributes):
+            iterator = method(request=request)
+
+        if buffer_policy is not None and not buffer_policy.resumable:
             for item in iterator:
-                item_buffer.append(item)
-                # Setting the transaction id because the transaction begin was inlined for first rpc.
-                if (
-                    transaction is not None
-                    and transaction._transaction_id is None
-                    and item.metadata is not None
-                    and item.metadata.transaction is not None
-                    and item.metadata.transaction.id is not None
-                ):
-                    transaction._transaction_id = item.metadata.transaction.id
-                if item.resume_token:
-                    resume_token = item.resume_token
-                    break
-        except ServiceUnavailable:
+                _set_inline_transaction_id(transaction, item)
+                if begins_inline:
+                    transaction._release_inline_begin()
+                    begins_inline = False
+                yield item
+            return
+
+        while True:
+            try:
+                for item in iterator:
+                    item_buffer.append(item)
+                    _set_inline_transaction_id(transaction, item)
+                    if begins_inline:
+                        transaction._release_inline_begin()
+                        begins_inline = False
+                    if item.resume_token:
+                        resume_token = item.resume_token
+                        flushed = False
+                        break
+                    if buffer_policy is not None:
+                        buffered_bytes += buffer_policy._item_size(item)
+                        if buffer_policy._check_overflow(
+                            len(item_buffer), buffered_bytes
+                        ):
+                            flushed = True
+                            break
+            except ServiceUnavailable:
+                if flushed:
+                    raise
+                del item_buffer[:]
+                with trace_call(trace_name, session, attributes):
+                    request.resume_token = resume_token
+                    if transaction is not None:
+                        transaction_selector = transaction._make_txn_selector()
+                    request.transaction = transaction_selector
+                    iterator = method(request=request)
+                continue
+            except InternalServerError as exc:
+                resumable_error = any(
+                    resumable_message in exc.message
+                    for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
+                )
+                if not resumable_error or flushed:
+                    raise
+                del item_buffer[:]
+                with trace_call(trace_name, session, attributes):
+                    request.resume_token = resume_token
+                    if transaction is not None:
+                        transaction_selector = transaction._make_txn_selector()
+                    request.transaction = transaction_selector
+                    iterator = method(request=request)
+                continue
+
+            if len(item_buffer) == 0:
+                break
+
+            for item in item_buffer:
+                yield item
+
             del item_buffer[:]
-            with trace_call(trace_name, session, attributes):
-                request.resume_token = resume_token
-                if transaction is not None:
-                    transaction_selector = transaction._make_txn_selector()
-                request.transaction = transaction_selector
-                iterator = method(request=request)
-            continue
-        except InternalServerError as exc:
-            resumable_error = any(
-                resumable_message in exc.message
-                for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
-            )
-            if not resumable_error:
+            buffered_bytes = 0
+    finally:
+        if begins_inline:
+            transaction._release_inline_begin()
+
+
+class _CancellableStream(object):
+    """Responses of :func:`_restart_on_unavailable`, which can be cancelled.
+
+    Unlike closing the generator, :meth:`cancel` may be called from any
+    thread, including while another thread waits for the next response.
+
+    :type method: callable
+    :param method: function returning iterator, e.g. a gRPC streaming call.
+
+    :type request: proto
+    :param request: request proto to call the method with
+
+    :type replace_session: callable
+    :param replace_session:
+        (Optional) called without arguments if the session is not found
+        before any response was returned, e.g. after it expired in the
+        pool.  Returns a replacement session, on which the request is
+        retried once, or None if the request cannot be retried.
+
+    Other arguments are passed to :func:`_restart_on_unavailable`.
+    """
+
+    def __init__(self, method, request, *args, replace_session=None, **kwargs):
+        self._method = method
+        self._request = request
+        self._args = args
+        self._kwargs = kwargs
+        self._replace_session = replace_session
+        self._lock = threading.Lock()
+        self._call = None
+        self._cancelled = False
+        self._returned = False
+        self._iterator = _restart_on_unavailable(
+            self._start_call, request, *args, **kwargs
+        )
+
+    def _start_call(self, **kwargs):
+        """Helper for :func:`_restart_on_unavailable`:  track the call."""
+        call = self._method(**kwargs)
+        with self._lock:
+            self._call = call
+            cancelled = self._cancelled
+        if cancelled:
+            _cancel_call(call)
+        return call
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            item = next(self._iterator)
+        except NotFound as exc:
+            if not self._retry_session_not_found(exc):
                 raise
-            del item_buffer[:]
-            with trace_call(trace_name, session, attributes):
-                request.resume_token = resume_token
-                if transaction is not None:
-                    transaction_selector = transaction._make_txn_selector()
-                request.transaction = transaction_selector
-                iterator = method(request=request)
-            continue
+            item = next(self._iterator)
+        self._returned = True
+        return item
+
+    def _retry_session_not_found(self, exc):
+        """Helper for :meth:`__next__`:  restart on a replacement session.
+
+        :rtype: bool
+        :returns: True if the request was restarted.
+        """
+        replace_session, self._replace_session = self._replace_session, None
+        if (
+            replace_session is None
+            or self._returned
+            or self._cancelled
+            or not _is_session_not_found(exc)
+        ):
+            return False
+        session = replace_session()
+        if session is None:
+            return False
+        self._request.session = session.name
+        self._request.resume_token = b""
+        if "session" in self._kwargs:
+            self._kwargs["session"] = session
+        self._iterator = _restart_on_unavailable(
+            self._start_call, self._request, *self._args, **self._kwargs
+        )
+        return True
 
-        if len(item_buffer) == 0:
-            break
+    def close(self):
+        """Close the iterator, from the thread consuming it."""
+        self._iterator.close()
 
-        for item in item_buffer:
-            yield item
+    def cancel(self):
+        """Cancel the current call, and any call restarted later.
+
+        The consumer then gets :exc:`google.api_core.exceptions.Cancelled`
+        in place of the remaining responses.
+        """
+        with self._lock:
+            self._cancelled = True
+            call = self._call
+        if call is not None:
+            _cancel_call(call)
+
+
+def _cancel_call(call):
+    """Helper for :class:`_CancellableStream`."""
+    cancel = getattr(call, "cancel", None)
+    if cancel is not None:
+        cancel()
+
+
+def _set_inline_transaction_id(transaction, item):
+    """Helper for :func:`_restart_on_unavailable`.
+
+    Sets the transaction id, if the transaction was begun inline by the
+    request.
+    """
+    if (
+        transaction is not None
+        and transaction._transaction_id is None
+        and item.metadata is not None
+        and item.metadata.transaction is not None
+        and item.metadata.transaction.id is not None
+    ):
+        transaction._transaction_id = item.metadata.transaction.id
 
-        del item_buffer[:]
+
+def _begins_inline(transaction):
+    """Helper for :meth:`_SnapshotBase._acquire_inline_begin`.
+
+    :rtype: bool
+    :returns: True if the next request begins the transaction.
+    """
+    selector = transaction._make_txn_selector()
+    return TransactionSelector.pb(selector).HasField("begin")
 
 
 class _SnapshotBase(_SessionWrapper):
@@ -148,7 +400,66 @@ class _SnapshotBase(_SessionWrapper):
     _transaction_id = None
     _read_request_count = 0
     _execute_sql_count = 0
-    _lock = threading.Lock()
+    # Set by :class:`~google.cloud.spanner_v1.database.SnapshotCheckout`:
+    # returns a replacement for a session which was not found.
+    _session_replacer = None
+
+    def __init__(self, session):
+        super(_SnapshotBase, self).__init__(session)
+        # Held by the request beginning the transaction inline, until its
+        # response carries the transaction ID.
+        self._inline_begin_lock = threading.Lock()
+
+    def _acquire_inline_begin(self):
+        """Helper for requests which may begin the transaction inline.
+
+        Blocks while another request is beginning the transaction.
+
+        :rtype: bool
+        :returns: True if the request must begin the transaction:  the
+                  caller then holds the begin lock, until
+                  :meth:`_release_inline_begin`.  False if the transaction
+                  ID is known, or not needed.
+        """
+        if self._transaction_id is not None or not _begins_inline(self):
+            return False
+        self._inline_begin_lock.acquire()
+        if self._transaction_id is not None:  # begun while waiting
+            self._inline_begin_lock.release()
+            return False
+        return True
+
+    def _release_inline_begin(self):
+        """Let requests waiting in :meth:`_acquire_inline_begin` proceed."""
+        self._inline_begin_lock.release()
+
+    @contextlib.contextmanager
+    def _inline_begin(self):
+        """Hold the begin lock around a request, if it begins the transaction.
+
+        The body must record the transaction ID from the response.
+        """
+        begins_inline = self._acquire_inline_begin()
+        try:
+            yield begins_inline
+        finally:
+            if begins_inline:
+                self._release_inline_begin()
+
+    def _replace_expired_session(self):
+        """Helper for :meth:`read` / :meth:`execute_sql`.
+
+        Replaces a session which was not found, if the snapshot was checked
+        out from a pool and no transaction was begun on the session.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the replacement session, or None if the request cannot
+                  be retried.
+        """
+        if self._session_replacer is None or self._transaction_id is not None:
+            return None
+        self._session = self._session_replacer()
+        return self._session
 
     def _make_txn_selector(self):
         """Helper for :meth:`read` / :meth:`execute_sql`.
@@ -161,6 +472,115 @@ class _SnapshotBase(_SessionWrapper):
         """
         raise NotImplementedError
 
+    def _check_reuse(self):
+        """Helper for :meth:`read` / :meth:`execute_sql`.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, or if a transaction ID is
+            already pending for multiple-use snapshots.
+        """
+        if self._read_request_count > 0:
+            if not self._multi_use:
+                raise ValueError("Cannot re-use single-use snapshot.")
+            if self._transaction_id is None and self._read_only:
+                raise ValueError("Transaction ID pending.")
+
+    def _make_request_options(self, request_options):
+        """Helper for :meth:`read` / :meth:`execute_sql`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.types.RequestOptions`
+        """
+        if request_options is None:
+            request_options = RequestOptions()
+        elif type(request_options) == dict:
+            request_options = RequestOptions(request_options)
+
+        if self._read_only:
+            # Transaction tags are not supported for read only transactions.
+            request_options.transaction_tag = None
+        elif self.transaction_tag is not None:
+            request_options.transaction_tag = self.transaction_tag
+        return request_options
+
+    def _make_read_request(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        limit=0,
+        partition=None,
+        request_options=None,
+        data_boost_enabled=False,
+    ):
+        """Helper for :meth:`read`:  validate state and build the request.
+
+        :rtype: tuple
+        :returns: the :class:`~google.cloud.spanner_v1.types.ReadRequest`
+                  and the RPC metadata.
+        """
+        self._check_reuse()
+        request = ReadRequest(
+            session=self._session.name,
+            table=table,
+            columns=columns,
+            key_set=keyset._to_pb(),
+            index=index,
+            limit=limit,
+            partition_token=partition,
+            request_options=self._make_request_options(request_options),
+            data_boost_enabled=data_boost_enabled,
+        )
+        return request, self._make_metadata(not self._read_only)
+
+    def _make_execute_sql_request(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        query_mode=None,
+        query_options=None,
+        request_options=None,
+        partition=None,
+        data_boost_enabled=False,
+    ):
+        """Helper for :meth:`execute_sql`:  validate state and build the request.
+
+        :rtype: tuple
+        :returns: the :class:`~google.cloud.spanner_v1.types.ExecuteSqlRequest`
+                  and the RPC metadata.
+        """
+        self._check_reuse()
+
+        if params is not None:
+            if param_types is None:
+                raise ValueError("Specify 'param_types' when passing 'params'.")
+            params_pb = Struct(
+                fields={key: _make_value_pb(value) for key, value in params.items()}
+            )
+        else:
+            params_pb = {}
+
+        database = self._session._database
+        # Query-level options have higher precedence than client-level and
+        # environment-level options
+        default_query_options = database._instance._client._query_options
+        query_options = _merge_query_options(default_query_options, query_options)
+
+        request = ExecuteSqlRequest(
+            session=self._session.name,
+            sql=sql,
+            params=params_pb,
+            param_types=param_types,
+            query_mode=query_mode,
+            partition_token=partition,
+            seqno=self._execute_sql_count,
+            query_options=query_options,
+            request_options=self._make_request_options(request_options),
+            data_boost_enabled=data_boost_enabled,
+        )
+        return request, self._make_metadata(not self._read_only)
+
     def read(
         self,
         table,
@@ -174,6 +594,9 @@ class _SnapshotBase(_SessionWrapper):
         *,
         retry=gapic_v1.method.DEFAULT,
         timeout=gapic_v1.method.DEFAULT,
+        buffer_policy=None,
+        prefetch=0,
+        decode_bytes=False,
     ):
         """Perform a ``StreamingRead`` API request for rows in a table.
 
@@ -222,6 +645,23 @@ class _SnapshotBase(_SessionWrapper):
                 ``partition_token``, the API will return an
                 ``INVALID_ARGUMENT`` error.
 
+        :type buffer_policy: :class:`ResumeBufferPolicy`
+        :param buffer_policy:
+                (Optional) limits on the results held back while awaiting
+                a resume token.  Unbounded if not passed.
+
+        :type prefetch: int
+        :param prefetch:
+                (Optional) if positive, a background thread receives and
+                decodes up to this many partial result sets ahead of the
+                consumer, overlapping network waits with row processing.
+
+        :type decode_bytes: bool
+        :param decode_bytes:
+                (Optional) if true, ``BYTES`` values are returned as their
+                raw binary data, decoded from base64 as each partial result
+                set is processed.
+
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
 
@@ -229,42 +669,17 @@ class _SnapshotBase(_SessionWrapper):
             for reuse of single-use snapshots, or if a transaction ID is
             already pending for multiple-use snapshots.
         """
-        if self._read_request_count > 0:
-            if not self._multi_use:
-                raise ValueError("Cannot re-use single-use snapshot.")
-            if self._transaction_id is None and self._read_only:
-                raise ValueError("Transaction ID pending.")
-
-        database = self._session._database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if not self._read_only and database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
-
-        if request_options is None:
-            request_options = RequestOptions()
-        elif type(request_options) == dict:
-            request_options = RequestOptions(request_options)
-
-        if self._read_only:
-            # Transaction tags are not supported for read only transactions.
-            request_options.transaction_tag = None
-        elif self.transaction_tag is not None:
-            request_options.transaction_tag = self.transaction_tag
-
-        request = ReadRequest(
-            session=self._session.name,
-            table=table,
-            columns=columns,
-            key_set=keyset._to_pb(),
+        request, metadata = self._make_read_request(
+            table,
+            columns,
+            keyset,
             index=index,
             limit=limit,
-            partition_token=partition,
+            partition=partition,
             request_options=request_options,
             data_boost_enabled=data_boost_enabled,
         )
+        api = self._session._database.spanner_api
         restart = functools.partial(
             api.streaming_read,
             request=request,
@@ -275,38 +690,30 @@ class _SnapshotBase(_SessionWrapper):
 
         trace_attributes = {"table_id": table, "columns": columns}
 
-        if self._transaction_id is None:
-            # lock is added to handle the inline begin for first rpc
-            with self._lock:
-                iterator = _restart_on_unavailable(
-                    restart,
-                    request,
-                    "CloudSpanner.ReadOnlyTransaction",
-                    self._session,
-                    trace_attributes,
-                    transaction=self,
-                )
-                self._read_request_count += 1
-                if self._multi_use:
-                    return StreamedResultSet(iterator, source=self)
-                else:
-                    return StreamedResultSet(iterator)
-        else:
-            iterator = _restart_on_unavailable(
-                restart,
-                request,
-                "CloudSpanner.ReadOnlyTransaction",
-                self._session,
-                trace_attributes,
-                transaction=self,
-            )
+        iterator = _CancellableStream(
+            restart,
+            request,
+            trace_name="CloudSpanner.ReadOnlyTransaction",
+            session=self._session,
+            attributes=trace_attributes,
+            transaction=self,
+            buffer_policy=buffer_policy,
+            replace_session=self._replace_expired_session,
+        )
 
         self._read_request_count += 1
 
         if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
+            return StreamedResultSet(
+                iterator,
+                source=self,
+                prefetch=prefetch,
+                decode_bytes=decode_bytes,
+            )
         else:
-            return StreamedResultSet(iterator)
+            return StreamedResultSet(
+                iterator, prefetch=prefetch, decode_bytes=decode_bytes
+            )
 
     def execute_sql(
         self,
@@ -320,6 +727,9 @@ class _SnapshotBase(_SessionWrapper):
         retry=gapic_v1.method.DEFAULT,
         timeout=gapic_v1.method.DEFAULT,
         data_boost_enabled=False,
+        buffer_policy=None,
+        prefetch=0,
+        decode_bytes=False,
     ):
         """Perform an ``ExecuteStreamingSql`` API request.
 
@@ -377,61 +787,38 @@ class _SnapshotBase(_SessionWrapper):
                 ``partition_token``, the API will return an
                 ``INVALID_ARGUMENT`` error.
 
+        :type buffer_policy: :class:`ResumeBufferPolicy`
+        :param buffer_policy:
+                (Optional) limits on the results held back while awaiting
+                a resume token.  Unbounded if not passed.
+
+        :type prefetch: int
+        :param prefetch:
+                (Optional) if positive, a background thread receives and
+                decodes up to this many partial result sets ahead of the
+                consumer, overlapping network waits with row processing.
+
+        :type decode_bytes: bool
+        :param decode_bytes:
+                (Optional) if true, ``BYTES`` values are returned as their
+                raw binary data, decoded from base64 as each partial result
+                set is processed.
+
         :raises ValueError:
             for reuse of single-use snapshots, or if a transaction ID is
             already pending for multiple-use snapshots.
         """
-        if self._read_request_count > 0:
-            if not self._multi_use:
-                raise ValueError("Cannot re-use single-use snapshot.")
-            if self._transaction_id is None and self._read_only:
-                raise ValueError("Transaction ID pending.")
-
-        if params is not None:
-            if param_types is None:
-                raise ValueError("Specify 'param_types' when passing 'params'.")
-            params_pb = Struct(
-                fields={key: _make_value_pb(value) for key, value in params.items()}
-            )
-        else:
-            params_pb = {}
-
-        database = self._session._database
-        metadata = _metadata_with_prefix(database.name)
-        if not self._read_only and database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
-
-        api = database.spanner_api
-
-        # Query-level options have higher precedence than client-level and
-        # environment-level options
-        default_query_options = database._instance._client._query_options
-        query_options = _merge_query_options(default_query_options, query_options)
-
-        if request_options is None:
-            request_options = RequestOptions()
-        elif type(request_options) == dict:
-            request_options = RequestOptions(request_options)
-        if self._read_only:
-            # Transaction tags are not supported for read only transactions.
-            request_options.transaction_tag = None
-        elif self.transaction_tag is not None:
-            request_options.transaction_tag = self.transaction_tag
-
-        request = ExecuteSqlRequest(
-            session=self._session.name,
-            sql=sql,
-            params=params_pb,
+        request, metadata = self._make_execute_sql_request(
+            sql,
+            params=params,
             param_types=param_types,
             query_mode=query_mode,
-            partition_token=partition,
-            seqno=self._execute_sql_count,
             query_options=query_options,
             request_options=request_options,
+            partition=partition,
             data_boost_enabled=data_boost_enabled,
         )
+        api = self._session._database.spanner_api
         restart = functools.partial(
             api.execute_streaming_sql,
             request=request,
@@ -442,41 +829,31 @@ class _SnapshotBase(_SessionWrapper):
 
         trace_attributes = {"db.statement": sql}
 
-        if self._transaction_id is None:
-            # lock is added to handle the inline begin for first rpc
-            with self._lock:
-                iterator = _restart_on_unavailable(
-                    restart,
-                    request,
-                    "CloudSpanner.ReadWriteTransaction",
-                    self._session,
-                    trace_attributes,
-                    transaction=self,
-                )
-                self._read_request_count += 1
-                self._execute_sql_count += 1
-
-                if self._multi_use:
-                    return StreamedResultSet(iterator, source=self)
-                else:
-                    return StreamedResultSet(iterator)
-        else:
-            iterator = _restart_on_unavailable(
-                restart,
-                request,
-                "CloudSpanner.ReadWriteTransaction",
-                self._session,
-                trace_attributes,
-                transaction=self,
-            )
+        iterator = _CancellableStream(
+            restart,
+            request,
+            trace_name="CloudSpanner.ReadWriteTransaction",
+            session=self._session,
+            attributes=trace_attributes,
+            transaction=self,
+            buffer_policy=buffer_policy,
+            replace_session=self._replace_expired_session,
+        )
 
         self._read_request_count += 1
         self._execute_sql_count += 1
 
         if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
+            return StreamedResultSet(
+                iterator,
+                source=self,
+                prefetch=prefetch,
+                decode_bytes=decode_bytes,
+            )
         else:
-            return StreamedResultSet(iterator)
+            return StreamedResultSet(
+                iterator, prefetch=prefetch, decode_bytes=decode_bytes
+            )
 
     def partition_read(
         self,
@@ -764,12 +1141,11 @@ class Snapshot(_SnapshotBase):
         else:
             return TransactionSelector(single_use=options)
 
-    def begin(self):
-        """Begin a read-only transaction on the database.
-
-        :rtype: bytes
-        :returns: the ID for the newly-begun transaction.
+    def _make_begin_request(self):
+        """Helper for :meth:`begin`:  validate state and build the request.
 
+        :rtype: tuple
+        :returns: the transaction options and the RPC metadata.
         :raises ValueError:
             if the transaction is already begun, committed, or rolled back.
         """
@@ -782,18 +1158,24 @@ class Snapshot(_SnapshotBase):
         if self._read_request_count > 0:
             raise ValueError("Read-only transaction already pending")
 
-        database = self._session._database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if not self._read_only and database._route_to_leader_enabled:
-            metadata.append(
-                (_metadata_with_leader_aware_routing(database._route_to_leader_enabled))
-            )
         txn_selector = self._make_txn_selector()
+        return txn_selector.begin, self._make_metadata(not self._read_only)
+
+    def begin(self):
+        """Begin a read-only transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        options, metadata = self._make_begin_request()
+        api = self._session._database.spanner_api
         with trace_call("CloudSpanner.BeginTransaction", self._session):
             response = api.begin_transaction(
                 session=self._session.name,
-                options=txn_selector.begin,
+                options=options,
                 metadata=metadata,
             )
         self._transaction_id = response.id
@@ -14,6 +14,9 @@
 
 """Wrapper for streaming results."""
 
+import queue
+import threading
+
 from google.cloud import exceptions
 from google.protobuf.struct_pb2 import ListValue
 from google.protobuf.struct_pb2 import Value
@@ -21,7 +24,8 @@ from google.protobuf.struct_pb2 import Value
 from google.cloud.spanner_v1 import PartialResultSet
 from google.cloud.spanner_v1 import ResultSetMetadata
 from google.cloud.spanner_v1 import TypeCode
-from google.cloud.spanner_v1._helpers import _parse_value_pb
+from google.cloud.spanner_v1._helpers import _make_row_decoders
+from google.cloud.spanner_v1.columnar import _make_column_decoders
 
 
 class StreamedResultSet(object):
@@ -35,15 +39,29 @@ class StreamedResultSet(object):
 
     :type source: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
     :param source: Snapshot from which the result set was fetched.
+
+    :type prefetch: int
+    :param prefetch: (Optional) if positive, partial result sets are read
+                     and decoded on a background thread, up to this many
+                     ahead of the consumer.
+
+    :type decode_bytes: bool
+    :param decode_bytes: (Optional) if true, ``BYTES`` values are returned as
+                         their raw binary data, rather than as base64-encoded
+                         bytes.
     """
 
-    def __init__(self, response_iterator, source=None):
+    def __init__(self, response_iterator, source=None, prefetch=0, decode_bytes=False):
         self._response_iterator = response_iterator
+        self._prefetch = prefetch
+        self._decode_bytes = decode_bytes
         self._rows = []  # Fully-processed rows
         self._metadata = None  # Until set from first PRS
         self._stats = None  # Until set from last PRS
         self._current_row = []  # Accumulated values for incomplete row
         self._pending_chunk = None  # Incomplete value
+        self._pending_chunk_tail = []  # Later chunks of the incomplete value
+        self._decoders = None  # Until compiled from metadata
         self._source = source  # Source snapshot
 
     @property
@@ -88,8 +106,12 @@ class StreamedResultSet(object):
         """
         current_column = len(self._current_row)
         field = self.fields[current_column]
-        merged = _merge_by_type(self._pending_chunk, value, field.type_)
+        chunks = [self._pending_chunk]
+        chunks.extend(self._pending_chunk_tail)
+        chunks.append(value)
+        merged = _merge_chunks(chunks, field.type_)
         self._pending_chunk = None
+        self._pending_chunk_tail = []
         return merged
 
     def _merge_values(self, values):
@@ -98,23 +120,39 @@ class StreamedResultSet(object):
         :type values: list of :class:`~google.protobuf.struct_pb2.Value`
         :param values: non-chunked values from partial result set.
         """
-        field_types = [field.type_ for field in self.fields]
-        width = len(field_types)
+        decoders = self._decoders
+        if decoders is None:
+            decoders = self._decoders = _make_row_decoders(
+                self._metadata.row_type, self._decode_bytes
+            )
+        width = len(decoders)
         index = len(self._current_row)
         for value in values:
-            self._current_row.append(_parse_value_pb(value, field_types[index]))
+            self._current_row.append(decoders[index](value))
             index += 1
             if index == width:
                 self._rows.append(self._current_row)
                 self._current_row = []
                 index = 0
 
-    def _consume_next(self):
-        """Consume the next partial result set from the stream.
+    def _read_next_values(self):
+        """Read the next partial result set from the stream.
 
-        Parse the result set into new/existing rows in :attr:`_rows`
+        :rtype: list of :class:`~google.protobuf.struct_pb2.Value`
+        :returns: the complete (non-chunked) values of the partial result set.
+        """
+        return self._process_response(next(self._response_iterator))
+
+    def _process_response(self, response):
+        """Record metadata / stats of a partial result set, and merge any
+        pending chunk.
+
+        :type response: :class:`~google.cloud.spanner_v1.types.PartialResultSet`
+        :param response: the next partial result set from the stream.
+
+        :rtype: list of :class:`~google.protobuf.struct_pb2.Value`
+        :returns: the complete (non-chunked) values of the partial result set.
         """
-        response = next(self._response_iterator)
         response_pb = PartialResultSet.pb(response)
 
         if self._metadata is None:  # first response
@@ -129,23 +167,258 @@ class StreamedResultSet(object):
 
         values = list(response_pb.values)
         if self._pending_chunk is not None:
+            if response_pb.chunked_value and len(values) == 1:
+                # The value continues in the next response:  merge all of
+                # its chunks at once, when complete.
+                self._pending_chunk_tail.append(values.pop())
+                return values
             values[0] = self._merge_chunk(values[0])
 
         if response_pb.chunked_value:
             self._pending_chunk = values.pop()
 
-        self._merge_values(values)
+        return values
+
+    def _consume_next(self):
+        """Consume the next partial result set from the stream.
+
+        Parse the result set into new/existing rows in :attr:`_rows`
+        """
+        self._merge_values(self._read_next_values())
 
     def __iter__(self):
+        if self._prefetch > 0:
+            return self._iter_prefetched(self._iter_row_batches())
+        return self._iter_rows()
+
+    def _iter_rows(self):
+        """Helper for :meth:`__iter__`:  decode rows as they are consumed."""
+        for rows in self._iter_row_batches():
+            yield from rows
+
+    def _iter_row_batches(self):
+        """Helper for :meth:`__iter__` et al.:  rows decoded from each response.
+
+        Each list of rows is handed over to the consumer, which may keep it.
+        """
         while True:
-            iter_rows, self._rows[:] = self._rows[:], ()
-            while iter_rows:
-                yield iter_rows.pop(0)
+            rows, self._rows = self._rows, []
+            if rows:
+                yield rows
             try:
                 self._consume_next()
             except StopIteration:
                 return
 
+    def iter_batches(self, max_rows=None):
+        """Iterate over the result set in lists of rows.
+
+        Avoids the per-row overhead of iterating over the result set itself,
+        e.g. for bulk exports.  Consumption may resume a partially consumed
+        result set.
+
+        :type max_rows: int
+        :param max_rows: (Optional) if passed, each list holds exactly this
+                         many rows, except the last one, which holds the
+                         remaining rows.  Otherwise, each list holds the
+                         rows completed by one partial result set.
+
+        :rtype: iterable of list
+        :returns: non-empty lists of rows, each owned by the caller.
+        :raises: :exc:`ValueError`: If ``max_rows`` is not positive.
+        """
+        if max_rows is not None and max_rows < 1:
+            raise ValueError("max_rows must be positive")
+        batches = self._maybe_prefetch(self._iter_row_batches())
+        if max_rows is None:
+            return batches
+        return _rebatch(batches, max_rows)
+
+    def cancel(self):
+        """Cancel the streaming call.
+
+        May be called from any thread, e.g. to stop one blocked waiting for
+        rows:  consuming the result set then raises
+        :exc:`google.api_core.exceptions.Cancelled`.  Has no effect if the
+        responses cannot be cancelled.
+        """
+        cancel = getattr(self._response_iterator, "cancel", None)
+        if cancel is not None:
+            cancel()
+
+    def _iter_prefetched(self, batches):
+        """Helper for :meth:`__iter__` et al.:  flatten prefetched batches.
+
+        :type batches: iterator
+        :param batches: lists of items, produced on a background thread.
+        """
+        prefetcher = _Prefetcher(
+            self._closing(batches), self._prefetch, cancel=self.cancel
+        )
+        try:
+            for batch in prefetcher:
+                yield from batch
+        finally:
+            prefetcher.close()
+
+    def _closing(self, batches):
+        """Helper for :meth:`_iter_prefetched`.
+
+        Closes the response stream once the background thread stops, e.g.
+        when the consumer stops iterating early.
+        """
+        try:
+            yield from batches
+        finally:
+            close = getattr(self._response_iterator, "close", None)
+            if close is not None:
+                close()
+
+    def _check_not_consumed(self, method_name):
+        """Helper for methods which require a fresh stream.
+
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if self._metadata is not None:
+            raise RuntimeError(
+                "Can not call `.%s` after stream consumption has already "
+                "started." % (method_name,)
+            )
+
+    def iter_column_batches(self):
+        """Iterate over the result set in columnar batches.
+
+        Rather than building one Python object per cell, the values of each
+        partial result set are decoded column by column, using decoders
+        compiled once from the result set metadata.  See
+        :class:`~google.cloud.spanner_v1.columnar.Column` for the storage
+        used for each type.
+
+        :rtype: iterable of list of
+            :class:`~google.cloud.spanner_v1.columnar.Column`
+        :returns: for each partial result set containing complete rows, one
+            column per field of the result set.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        self._check_not_consumed("iter_column_batches")
+        return self._maybe_prefetch(
+            self._iter_column_batches(self._make_column_decoders)
+        )
+
+    def _make_column_decoders(self, row_type):
+        """Helper for :meth:`iter_column_batches` et al."""
+        return _make_column_decoders(row_type, self._decode_bytes)
+
+    def _maybe_prefetch(self, batches):
+        """Helper:  produce ``batches`` on a background thread, if enabled.
+
+        :type batches: iterator
+        :param batches: batches decoded from the stream.
+
+        :rtype: iterator
+        :returns: the same batches.
+        """
+        if self._prefetch > 0:
+            return self._iter_prefetched([batch] for batch in batches)
+        return batches
+
+    def _iter_column_batches(self, make_decoders):
+        """Helper for :meth:`iter_column_batches` et al.
+
+        :type make_decoders: callable
+        :param make_decoders: compiles, from the row type, one decoder per
+                              field taking the list of values for a column.
+        """
+        decoders = None
+        # Raw values of the incomplete row, kept in '_current_row' so that
+        # '_merge_chunk' finds the field type of a pending chunk.
+        pending = self._current_row
+        while True:
+            try:
+                values = self._read_next_values()
+            except StopIteration:
+                return
+            if decoders is None:
+                decoders = make_decoders(self._metadata.row_type)
+            width = len(decoders)
+            if not width or not values:
+                continue
+            pending.extend(values)
+            complete = len(pending) - len(pending) % width
+            if complete:
+                yield [
+                    decoder(pending[index:complete:width])
+                    for index, decoder in enumerate(decoders)
+                ]
+                del pending[:complete]
+
+    def to_columns(self):
+        """Consume the whole result set into columns.
+
+        See :meth:`iter_column_batches`.
+
+        :rtype: list of :class:`~google.cloud.spanner_v1.columnar.Column`
+        :returns: one column per field of the result set; an empty list if
+            the stream returned no metadata.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        columns = None
+        for batch in self.iter_column_batches():
+            if columns is None:
+                columns = batch
+            else:
+                for column, more in zip(columns, batch):
+                    column.extend(more)
+
+        if columns is None:
+            if self._metadata is None:
+                return []
+            decoders = self._make_column_decoders(self._metadata.row_type)
+            columns = [decoder([]) for decoder in decoders]
+        return columns
+
+    def to_arrow(self):
+        """Consume the whole result set into an Apache Arrow table.
+
+        Values are decoded directly into Arrow arrays, one record batch per
+        partial result set, using the following type mapping: ``NUMERIC``
+        to ``decimal128(38, 9)``, ``TIMESTAMP`` to ``timestamp[ns, UTC]``,
+        ``JSON`` to ``string``, ``BYTES`` to (base64-decoded) ``binary``,
+        ``ARRAY`` to ``list`` and ``STRUCT`` to ``struct``.
+
+        Requires the ``pyarrow`` package.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: the rows of the result set.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        _arrow = _import_arrow()
+        self._check_not_consumed("to_arrow")
+        array_batches = list(
+            self._maybe_prefetch(
+                self._iter_column_batches(_arrow._make_array_converters)
+            )
+        )
+        row_type = None if self._metadata is None else self._metadata.row_type
+        return _arrow._to_table(row_type, array_batches)
+
+    def to_pandas(self):
+        """Consume the whole result set into a pandas DataFrame.
+
+        See :meth:`to_arrow` for the type mapping.  Requires the ``pyarrow``
+        and ``pandas`` packages.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: the rows of the result set.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        return self.to_arrow().to_pandas()
+
     def one(self):
         """Return exactly one result, or raise an exception.
 
@@ -191,6 +464,146 @@ class StreamedResultSet(object):
             return answer
 
 
+def _rebatch(batches, size):
+    """Helper for :meth:`StreamedResultSet.iter_batches`.
+
+    :type batches: iterator
+    :param batches: non-empty lists of rows, of any length.
+
+    :type size: int
+    :param size: length of the lists produced, except the last one.
+
+    :rtype: iterator
+    :returns: lists of ``size`` rows, then the remaining rows, if any.
+    """
+    pending = []
+    for rows in batches:
+        if pending:
+            pending.extend(rows)
+        else:
+            pending = rows
+        complete = len(pending) - len(pending) % size
+        if not complete:
+            continue
+        if complete == size == len(pending):
+            yield pending
+            pending = []
+            continue
+        for start in range(0, complete, size):
+            yield pending[start : start + size]
+        pending = pending[complete:]
+    if pending:
+        yield pending
+
+
+class _Prefetcher(object):
+    """Run an iterator on a background thread, up to ``depth`` items ahead.
+
+    Exceptions raised by the iterator are re-raised to the consumer, after
+    the items produced before them.
+
+    :type iterator: iterator
+    :param iterator: the iterator to be run on the background thread.
+
+    :type depth: int
+    :param depth: maximum number of items produced but not yet consumed.
+
+    :type cancel: callable
+    :param cancel: (Optional) called by :meth:`close` if the iterator is
+                   not exhausted, e.g. to cancel the call the background
+                   thread is waiting on.
+    """
+
+    _DONE = object()
+    _PUT_TIMEOUT = 0.1  # seconds between checks for :meth:`close`
+
+    def __init__(self, iterator, depth, cancel=None):
+        self._queue = queue.Queue(depth)
+        self._cancel = cancel
+        self._closed = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._produce,
+            args=(iterator,),
+            name="spanner-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _put(self, entry):
+        """Helper for :meth:`_produce`:  wait for room, unless closed.
+
+        :rtype: bool
+        :returns: False if the consumer closed the prefetcher.
+        """
+        while not self._closed.is_set():
+            try:
+                self._queue.put(entry, timeout=self._PUT_TIMEOUT)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _produce(self, iterator):
+        """Body of the background thread."""
+        try:
+            for item in iterator:
+                if not self._put((item, None)):
+                    break
+            else:
+                self._put((self._DONE, None))
+        except Exception as exc:
+            self._put((self._DONE, exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+        item, exc = self._queue.get()
+        if item is self._DONE:
+            self._finished = True
+            if exc is not None:
+                raise exc
+            raise StopIteration
+        return item
+
+    def close(self):
+        """Stop the background thread, discarding items not yet consumed.
+
+        Cancels the iterator, if not exhausted, so that the thread exits
+        without waiting for the item it is producing.
+        """
+        finished, self._finished = self._finished, True
+        self._closed.set()
+        if not finished and self._cancel is not None:
+            self._cancel()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+def _import_arrow():
+    """Import the Arrow conversion helpers, which require ``pyarrow``."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "The 'pyarrow' package is required to convert results to Arrow or "
+            "pandas: install 'google-cloud-spanner[arrow]'."
+        ) from exc
+    from google.cloud.spanner_v1 import _arrow
+
+    return _arrow
+
+
 class Unmergeable(ValueError):
     """Unable to merge two values.
 
@@ -236,7 +649,12 @@ def _merge_float64(lhs, rhs, type_):
 
 def _merge_string(lhs, rhs, type_):
     """Helper for '_merge_by_type'."""
-    return Value(string_value=lhs.string_value + rhs.string_value)
+    return _merge_string_chunks((lhs, rhs), type_)
+
+
+def _merge_string_chunks(chunks, type_):
+    """Helper for '_merge_chunks':  join the pieces once."""
+    return Value(string_value="".join([chunk.string_value for chunk in chunks]))
 
 
 _UNMERGEABLE_TYPES = (TypeCode.BOOL,)
@@ -244,65 +662,76 @@ _UNMERGEABLE_TYPES = (TypeCode.BOOL,)
 
 def _merge_array(lhs, rhs, type_):
     """Helper for '_merge_by_type'."""
+    return _merge_array_chunks((lhs, rhs), type_)
+
+
+def _merge_array_chunks(chunks, type_):
+    """Helper for '_merge_chunks'."""
     element_type = type_.array_element_type
-    if element_type.code in _UNMERGEABLE_TYPES:
-        # Individual values cannot be merged, just concatenate
-        lhs.list_value.values.extend(rhs.list_value.values)
-        return lhs
-    lhs, rhs = list(lhs.list_value.values), list(rhs.list_value.values)
-
-    # Sanity check: If either list is empty, short-circuit.
-    # This is effectively a no-op.
-    if not len(lhs) or not len(rhs):
-        return Value(list_value=ListValue(values=(lhs + rhs)))
-
-    first = rhs.pop(0)
-    if first.HasField("null_value"):  # can't merge
-        lhs.append(first)
-    else:
-        last = lhs.pop()
-        if last.HasField("null_value"):
-            lhs.append(last)
-            lhs.append(first)
-        else:
-            try:
-                merged = _merge_by_type(last, first, element_type)
-            except Unmergeable:
-                lhs.append(last)
-                lhs.append(first)
-            else:
-                lhs.append(merged)
-    return Value(list_value=ListValue(values=(lhs + rhs)))
+    return _merge_list_chunks(chunks, lambda index: element_type)
 
 
 def _merge_struct(lhs, rhs, type_):
     """Helper for '_merge_by_type'."""
+    return _merge_struct_chunks((lhs, rhs), type_)
+
+
+def _merge_struct_chunks(chunks, type_):
+    """Helper for '_merge_chunks'."""
     fields = type_.struct_type.fields
-    lhs, rhs = list(lhs.list_value.values), list(rhs.list_value.values)
-
-    # Sanity check: If either list is empty, short-circuit.
-    # This is effectively a no-op.
-    if not len(lhs) or not len(rhs):
-        return Value(list_value=ListValue(values=(lhs + rhs)))
-
-    candidate_type = fields[len(lhs) - 1].type_
-    first = rhs.pop(0)
-    if first.HasField("null_value") or candidate_type.code in _UNMERGEABLE_TYPES:
-        lhs.append(first)
-    else:
-        last = lhs.pop()
-        if last.HasField("null_value"):
-            lhs.append(last)
-            lhs.append(first)
-        else:
-            try:
-                merged = _merge_by_type(last, first, candidate_type)
-            except Unmergeable:
-                lhs.append(last)
-                lhs.append(first)
-            else:
-                lhs.append(merged)
-    return Value(list_value=ListValue(values=lhs + rhs))
+    return _merge_list_chunks(chunks, lambda index: fields[index].type_)
+
+
+def _merge_list_chunks(chunks, element_type_at):
+    """Helper for '_merge_array_chunks' / '_merge_struct_chunks'.
+
+    Elements are gathered as lists of their own chunks, the first element of
+    each list value continuing the last element of the previous one when
+    mergeable;  each element is then merged once.
+
+    :type chunks: sequence of :class:`~google.protobuf.struct_pb2.Value`
+    :param chunks: list values, in stream order.
+
+    :type element_type_at: callable
+    :param element_type_at: returns the type of the element at an index.
+
+    :rtype: :class:`~google.protobuf.struct_pb2.Value`
+    :returns: the merged list value.
+    """
+    elements = []
+    for chunk in chunks:
+        values = chunk.list_value.values
+        if not values:
+            continue
+        start = 0
+        if elements:
+            last = elements[-1]
+            element_type = element_type_at(len(elements) - 1)
+            first = values[0]
+            mergeable = not (
+                first.HasField("null_value")
+                or last[0].HasField("null_value")
+                or element_type.code in _UNMERGEABLE_TYPES
+            )
+            if mergeable and element_type.code == TypeCode.FLOAT64:
+                # May be unmergeable:  check eagerly, floats are short.
+                try:
+                    merged = _merge_float64(last[0], first, element_type)
+                except Unmergeable:
+                    pass
+                else:
+                    last[0] = merged
+                    start = 1
+            elif mergeable:
+                last.append(first)
+                start = 1
+        elements.extend([value] for value in values[start:])
+
+    merged = [
+        _merge_chunks(element_chunks, element_type_at(index))
+        for index, element_chunks in enumerate(elements)
+    ]
+    return Value(list_value=ListValue(values=merged))
 
 
 _MERGE_BY_TYPE = {
@@ -324,3 +753,41 @@ def _merge_by_type(lhs, rhs, type_):
     """Helper for '_merge_chunk'."""
     merger = _MERGE_BY_TYPE[type_.code]
     return merger(lhs, rhs, type_)
+
+
+_MERGE_CHUNKS_BY_TYPE = {
+    TypeCode.ARRAY: _merge_array_chunks,
+    TypeCode.BYTES: _merge_string_chunks,
+    TypeCode.DATE: _merge_string_chunks,
+    TypeCode.INT64: _merge_string_chunks,
+    TypeCode.STRING: _merge_string_chunks,
+    TypeCode.STRUCT: _merge_struct_chunks,
+    TypeCode.TIMESTAMP: _merge_string_chunks,
+    TypeCode.NUMERIC: _merge_string_chunks,
+    TypeCode.JSON: _merge_string_chunks,
+}
+
+
+def _merge_chunks(chunks, type_):
+    """Helper for '_merge_chunk':  merge all the chunks of a value.
+
+    Unlike merging chunks pairwise, copies each chunk's contents once.
+
+    :type chunks: sequence of :class:`~google.protobuf.struct_pb2.Value`
+    :param chunks: chunks of the value, in stream order.
+
+    :type type_: :class:`~google.cloud.spanner_v1.types.Type`
+    :param type_: type of the value.
+
+    :rtype: :class:`~google.protobuf.struct_pb2.Value`
+    :returns: the merged value.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    merger = _MERGE_CHUNKS_BY_TYPE.get(type_.code)
+    if merger is None:
+        merged = chunks[0]
+        for chunk in chunks[1:]:
+            merged = _merge_by_type(merged, chunk, type_)
+        return merged
+    return merger(chunks, type_)
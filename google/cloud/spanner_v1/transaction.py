@@ -20,8 +20,6 @@ from google.protobuf.struct_pb2 import Struct
 from google.cloud.spanner_v1._helpers import (
     _make_value_pb,
     _merge_query_options,
-    _metadata_with_prefix,
-    _metadata_with_leader_aware_routing,
 )
 from google.cloud.spanner_v1 import CommitRequest
 from google.cloud.spanner_v1 import ExecuteBatchDmlRequest
@@ -50,7 +48,6 @@ class Transaction(_SnapshotBase, _BatchBase):
     commit_stats = None
     _multi_use = True
     _execute_sql_count = 0
-    _lock = threading.Lock()
     _read_only = False
 
     def __init__(self, session):
@@ -58,6 +55,28 @@ class Transaction(_SnapshotBase, _BatchBase):
             raise ValueError("Session has existing transaction.")
 
         super(Transaction, self).__init__(session)
+        self._seqno_lock = threading.Lock()
+
+    def _next_seqno(self):
+        """Helper for DML requests:  consume a sequence number.
+
+        Statements may be issued concurrently from several threads:  the
+        server rejects sequence numbers arriving out of order, so callers
+        consume one just before sending the request, once any inline begin
+        they wait for is complete.
+
+        :rtype: int
+        """
+        with self._seqno_lock:
+            seqno = self._execute_sql_count
+            self._execute_sql_count = seqno + 1
+        return seqno
+
+    def _wait_for_inline_begin(self):
+        """Wait for any in-flight statement beginning the transaction."""
+        if self._transaction_id is None:
+            with self._inline_begin_lock:
+                pass
 
     def _check_state(self):
         """Helper for :meth:`commit` et al.
@@ -106,11 +125,11 @@ class Transaction(_SnapshotBase, _BatchBase):
 
         return response
 
-    def begin(self):
-        """Begin a transaction on the database.
+    def _make_begin_request(self):
+        """Helper for :meth:`begin`:  validate state and build the request.
 
-        :rtype: bytes
-        :returns: the ID for the newly-begun transaction.
+        :rtype: tuple
+        :returns: the transaction options and the RPC metadata.
         :raises ValueError:
             if the transaction is already begun, committed, or rolled back.
         """
@@ -123,14 +142,149 @@ class Transaction(_SnapshotBase, _BatchBase):
         if self.rolled_back:
             raise ValueError("Transaction is already rolled back")
 
-        database = self._session._database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
         txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+        return txn_options, self._make_metadata(route_to_leader=True)
+
+    def _make_commit_request(self, return_commit_stats, request_options):
+        """Helper for :meth:`commit`:  build the request.
+
+        :rtype: tuple
+        :returns: the :class:`~google.cloud.spanner_v1.types.CommitRequest`
+                  and the RPC metadata.
+        """
+        if request_options is None:
+            request_options = RequestOptions()
+        elif type(request_options) == dict:
+            request_options = RequestOptions(request_options)
+        if self.transaction_tag is not None:
+            request_options.transaction_tag = self.transaction_tag
+
+        # Request tags are not supported for commit requests.
+        request_options.request_tag = None
+
+        request = CommitRequest(
+            session=self._session.name,
+            mutations=self._mutations,
+            transaction_id=self._transaction_id,
+            return_commit_stats=return_commit_stats,
+            request_options=request_options,
+        )
+        return request, self._make_metadata(route_to_leader=True)
+
+    def _process_commit_response(self, response, return_commit_stats):
+        """Helper for :meth:`commit`:  record the outcome of the commit.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self.committed = response.commit_timestamp
+        if return_commit_stats:
+            self.commit_stats = response.commit_stats
+        del self._session._transaction
+        return self.committed
+
+    def _update_transaction_id(self, result_set):
+        """Record the ID of a transaction begun inline with a statement.
+
+        :type result_set: :class:`~google.cloud.spanner_v1.types.ResultSet`
+        :param result_set: response to the first statement of the transaction.
+        """
+        if (
+            self._transaction_id is None
+            and result_set is not None
+            and result_set.metadata is not None
+            and result_set.metadata.transaction is not None
+        ):
+            self._transaction_id = result_set.metadata.transaction.id
+
+    def _make_execute_update_request(
+        self,
+        dml,
+        params=None,
+        param_types=None,
+        query_mode=None,
+        query_options=None,
+        request_options=None,
+    ):
+        """Helper for :meth:`execute_update`:  build the request.
+
+        The caller sets ``seqno``, see :meth:`_next_seqno`.
+
+        :rtype: tuple
+        :returns: the :class:`~google.cloud.spanner_v1.types.ExecuteSqlRequest`
+                  and the RPC metadata.
+        """
+        params_pb = self._make_params_pb(params, param_types)
+        database = self._session._database
+
+        # Query-level options have higher precedence than client-level and
+        # environment-level options
+        default_query_options = database._instance._client._query_options
+        query_options = _merge_query_options(default_query_options, query_options)
+
+        if request_options is None:
+            request_options = RequestOptions()
+        elif type(request_options) == dict:
+            request_options = RequestOptions(request_options)
+        request_options.transaction_tag = self.transaction_tag
+
+        request = ExecuteSqlRequest(
+            session=self._session.name,
+            sql=dml,
+            params=params_pb,
+            param_types=param_types,
+            query_mode=query_mode,
+            query_options=query_options,
+            request_options=request_options,
+        )
+        return request, self._make_metadata(route_to_leader=True)
+
+    def _make_batch_update_request(self, statements, request_options=None):
+        """Helper for :meth:`batch_update`:  build the request.
+
+        The caller sets ``seqno``, see :meth:`_next_seqno`.
+
+        :rtype: tuple
+        :returns: the
+                  :class:`~google.cloud.spanner_v1.types.ExecuteBatchDmlRequest`
+                  and the RPC metadata.
+        """
+        parsed = []
+        for statement in statements:
+            if isinstance(statement, str):
+                parsed.append(ExecuteBatchDmlRequest.Statement(sql=statement))
+            else:
+                dml, params, param_types = statement
+                params_pb = self._make_params_pb(params, param_types)
+                parsed.append(
+                    ExecuteBatchDmlRequest.Statement(
+                        sql=dml, params=params_pb, param_types=param_types
+                    )
+                )
+
+        if request_options is None:
+            request_options = RequestOptions()
+        elif type(request_options) == dict:
+            request_options = RequestOptions(request_options)
+        request_options.transaction_tag = self.transaction_tag
+
+        request = ExecuteBatchDmlRequest(
+            session=self._session.name,
+            statements=parsed,
+            request_options=request_options,
+        )
+        return request, self._make_metadata(route_to_leader=True)
+
+    def begin(self):
+        """Begin a transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        txn_options, metadata = self._make_begin_request()
+        api = self._session._database.spanner_api
         with trace_call("CloudSpanner.BeginTransaction", self._session):
             response = api.begin_transaction(
                 session=self._session.name, options=txn_options, metadata=metadata
@@ -141,17 +295,11 @@ class Transaction(_SnapshotBase, _BatchBase):
     def rollback(self):
         """Roll back a transaction on the database."""
         self._check_state()
+        self._wait_for_inline_begin()
 
         if self._transaction_id is not None:
-            database = self._session._database
-            api = database.spanner_api
-            metadata = _metadata_with_prefix(database.name)
-            if database._route_to_leader_enabled:
-                metadata.append(
-                    _metadata_with_leader_aware_routing(
-                        database._route_to_leader_enabled
-                    )
-                )
+            api = self._session._database.spanner_api
+            metadata = self._make_metadata(route_to_leader=True)
             with trace_call("CloudSpanner.Rollback", self._session):
                 api.rollback(
                     session=self._session.name,
@@ -180,47 +328,23 @@ class Transaction(_SnapshotBase, _BatchBase):
         :raises ValueError: if there are no mutations to commit.
         """
         self._check_state()
+        self._wait_for_inline_begin()
         if self._transaction_id is None and len(self._mutations) > 0:
             self.begin()
         elif self._transaction_id is None and len(self._mutations) == 0:
             raise ValueError("Transaction is not begun")
 
-        database = self._session._database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
-        trace_attributes = {"num_mutations": len(self._mutations)}
-
-        if request_options is None:
-            request_options = RequestOptions()
-        elif type(request_options) == dict:
-            request_options = RequestOptions(request_options)
-        if self.transaction_tag is not None:
-            request_options.transaction_tag = self.transaction_tag
-
-        # Request tags are not supported for commit requests.
-        request_options.request_tag = None
-
-        request = CommitRequest(
-            session=self._session.name,
-            mutations=self._mutations,
-            transaction_id=self._transaction_id,
-            return_commit_stats=return_commit_stats,
-            request_options=request_options,
+        request, metadata = self._make_commit_request(
+            return_commit_stats, request_options
         )
+        api = self._session._database.spanner_api
+        trace_attributes = {"num_mutations": len(self._mutations)}
         with trace_call("CloudSpanner.Commit", self._session, trace_attributes):
             response = api.commit(
                 request=request,
                 metadata=metadata,
             )
-        self.committed = response.commit_timestamp
-        if return_commit_stats:
-            self.commit_stats = response.commit_stats
-        del self._session._transaction
-        return self.committed
+        return self._process_commit_response(response, return_commit_stats)
 
     @staticmethod
     def _make_params_pb(params, param_types):
@@ -307,43 +431,16 @@ class Transaction(_SnapshotBase, _BatchBase):
         :rtype: int
         :returns: Count of rows affected by the DML statement.
         """
-        params_pb = self._make_params_pb(params, param_types)
-        database = self._session._database
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
-        api = database.spanner_api
-
-        seqno, self._execute_sql_count = (
-            self._execute_sql_count,
-            self._execute_sql_count + 1,
-        )
-
-        # Query-level options have higher precedence than client-level and
-        # environment-level options
-        default_query_options = database._instance._client._query_options
-        query_options = _merge_query_options(default_query_options, query_options)
-
-        if request_options is None:
-            request_options = RequestOptions()
-        elif type(request_options) == dict:
-            request_options = RequestOptions(request_options)
-        request_options.transaction_tag = self.transaction_tag
-
-        trace_attributes = {"db.statement": dml}
-
-        request = ExecuteSqlRequest(
-            session=self._session.name,
-            sql=dml,
-            params=params_pb,
+        request, metadata = self._make_execute_update_request(
+            dml,
+            params=params,
             param_types=param_types,
             query_mode=query_mode,
             query_options=query_options,
-            seqno=seqno,
             request_options=request_options,
         )
+        api = self._session._database.spanner_api
+        trace_attributes = {"db.statement": dml}
 
         method = functools.partial(
             api.execute_sql,
@@ -353,25 +450,9 @@ class Transaction(_SnapshotBase, _BatchBase):
             timeout=timeout,
         )
 
-        if self._transaction_id is None:
-            # lock is added to handle the inline begin for first rpc
-            with self._lock:
-                response = self._execute_request(
-                    method,
-                    request,
-                    "CloudSpanner.ReadWriteTransaction",
-                    self._session,
-                    trace_attributes,
-                )
-                # Setting the transaction id because the transaction begin was inlined for first rpc.
-                if (
-                    self._transaction_id is None
-                    and response is not None
-                    and response.metadata is not None
-                    and response.metadata.transaction is not None
-                ):
-                    self._transaction_id = response.metadata.transaction.id
-        else:
+        # Concurrent statements wait only while one begins the transaction.
+        with self._inline_begin():
+            request.seqno = self._next_seqno()
             response = self._execute_request(
                 method,
                 request,
@@ -379,6 +460,7 @@ class Transaction(_SnapshotBase, _BatchBase):
                 self._session,
                 trace_attributes,
             )
+            self._update_transaction_id(response)
 
         return response.stats.row_count_exact
 
@@ -411,48 +493,14 @@ class Transaction(_SnapshotBase, _BatchBase):
             statement triggering the error will not have an entry in the
             list, nor will any statements following that one.
         """
-        parsed = []
-        for statement in statements:
-            if isinstance(statement, str):
-                parsed.append(ExecuteBatchDmlRequest.Statement(sql=statement))
-            else:
-                dml, params, param_types = statement
-                params_pb = self._make_params_pb(params, param_types)
-                parsed.append(
-                    ExecuteBatchDmlRequest.Statement(
-                        sql=dml, params=params_pb, param_types=param_types
-                    )
-                )
-
-        database = self._session._database
-        metadata = _metadata_with_prefix(database.name)
-        if database._route_to_leader_enabled:
-            metadata.append(
-                _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
-            )
-        api = database.spanner_api
-
-        seqno, self._execute_sql_count = (
-            self._execute_sql_count,
-            self._execute_sql_count + 1,
-        )
-
-        if request_options is None:
-            request_options = RequestOptions()
-        elif type(request_options) == dict:
-            request_options = RequestOptions(request_options)
-        request_options.transaction_tag = self.transaction_tag
-
+        request, metadata = self._make_batch_update_request(statements, request_options)
+        api = self._session._database.spanner_api
         trace_attributes = {
             # Get just the queries from the DML statement batch
-            "db.statement": ";".join([statement.sql for statement in parsed])
+            "db.statement": ";".join(
+                [statement.sql for statement in request.statements]
+            )
         }
-        request = ExecuteBatchDmlRequest(
-            session=self._session.name,
-            statements=parsed,
-            seqno=seqno,
-            request_options=request_options,
-        )
 
         method = functools.partial(
             api.execute_batch_dml,
@@ -460,26 +508,8 @@ class Transaction(_SnapshotBase, _BatchBase):
             metadata=metadata,
         )
 
-        if self._transaction_id is None:
-            # lock is added to handle the inline begin for first rpc
-            with self._lock:
-                response = self._execute_request(
-                    method,
-                    request,
-                    "CloudSpanner.DMLTransaction",
-                    self._session,
-                    trace_attributes,
-                )
-                # Setting the transaction id because the transaction begin was inlined for first rpc.
-                for result_set in response.result_sets:
-                    if (
-                        self._transaction_id is None
-                        and result_set.metadata is not None
-                        and result_set.metadata.transaction is not None
-                    ):
-                        self._transaction_id = result_set.metadata.transaction.id
-                        break
-        else:
+        with self._inline_begin():
+            request.seqno = self._next_seqno()
             response = self._execute_request(
                 method,
                 request,
@@ -487,6 +517,8 @@ class Transaction(_SnapshotBase, _BatchBase):
                 self._session,
                 trace_attributes,
             )
+            for result_set in response.result_sets:
+                self._update_transaction_id(result_set)
 
         row_counts = [
             result_set.stats.row_count_exact for result_set in response.result_sets
@@ -40,7 +40,6 @@ dependencies = [
     "google-cloud-core >= 1.4.1, < 3.0dev",
     "grpc-google-iam-v1 >= 0.12.4, <1.0.0dev",
     "proto-plus >= 1.22.0, <2.0.0dev",
-    "sqlparse >= 0.3.0",
     "protobuf>=3.19.5,<5.0.0dev,!=3.20.0,!=3.20.1,!=4.21.0,!=4.21.1,!=4.21.2,!=4.21.3,!=4.21.4,!=4.21.5",
 ]
 extras = {
@@ -50,6 +49,9 @@ extras = {
         "opentelemetry-instrumentation >= 0.20b0, < 0.23dev",
     ],
     "libcst": "libcst >= 0.2.5",
+    "arrow": ["pyarrow >= 3.0.0"],
+    "pandas": ["pandas >= 1.1.0", "pyarrow >= 3.0.0"],
+    "xxhash": ["xxhash >= 2.0.0"],
 }
 
 url = "https://github.com/googleapis/python-spanner"
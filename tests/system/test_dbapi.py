@@ -13,13 +13,12 @@
 # limitations under the License.
 
 import datetime
-import hashlib
-import pickle
 import pytest
 import time
 
 from google.cloud import spanner_v1
 from google.cloud._helpers import UTC
+from google.cloud.spanner_dbapi.checksum import ResultsChecksum
 from google.cloud.spanner_dbapi.connection import connect
 from google.cloud.spanner_dbapi.connection import Connection
 from google.cloud.spanner_dbapi.exceptions import ProgrammingError
@@ -262,11 +261,12 @@ VALUES
     assert len(conn._statements) == 1
     conn.commit()
 
-    checksum = hashlib.sha256()
-    checksum.update(pickle.dumps(got_rows[0]))
-    checksum.update(pickle.dumps(got_rows[1]))
+    checksum = ResultsChecksum()
+    checksum.consume_result(got_rows[0])
+    checksum.consume_result(got_rows[1])
 
-    assert cursor._checksum.checksum.digest() == checksum.digest()
+    assert len(cursor._checksum) == 2
+    assert cursor._checksum == checksum
 
 
 def test_execute_many(shared_instance, dbapi_database):
@@ -0,0 +1,214 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class Test_scan_statements(unittest.TestCase):
+    def _call_fut(self, sql, dialect=None):
+        from google.cloud.spanner_dbapi._lexer import scan_statements
+
+        return scan_statements(sql, dialect)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut(""), [])
+        self.assertEqual(self._call_fut(" -- comment\n ; /* block */ ;"), [])
+
+    def test_single_statement(self):
+        sql = "  UPDATE t SET a = %s WHERE b = %(b)s; -- done"
+
+        (statement,) = self._call_fut(sql)
+
+        self.assertEqual(sql[statement.start : statement.end], sql[2:37])
+        self.assertEqual(statement.keyword, "UPDATE")
+        self.assertTrue(statement.has_where)
+        self.assertEqual(
+            [sql[start:end] for start, end in statement.placeholders],
+            ["%s", "%(b)s"],
+        )
+
+    def test_where_in_parentheses(self):
+        (statement,) = self._call_fut(
+            "UPDATE t SET a = (SELECT b FROM u WHERE u.id = t.id)"
+        )
+
+        self.assertEqual(statement.keyword, "UPDATE")
+        self.assertFalse(statement.has_where)
+
+    def test_skips_literals_and_comments(self):
+        sqls = [
+            "DELETE FROM t -- WHERE %s\n",
+            "DELETE FROM t # WHERE %s",
+            "DELETE FROM t /* WHERE\n %s */",
+            "UPDATE t SET a = 'WHERE %s'",
+            'UPDATE t SET a = "it\\"s WHERE %s"',
+            "UPDATE t SET a = '''\nWHERE ' %s\n'''",
+            'UPDATE t SET a = r"""WHERE\\""" %s"""',
+            "UPDATE t SET a = b'WHERE %s'",
+            "UPDATE t SET `WHERE %s` = 1",
+            "UPDATE t SET a = 'unterminated WHERE %s",
+        ]
+        for sql in sqls:
+            with self.subTest(sql=sql):
+                (statement,) = self._call_fut(sql)
+                self.assertFalse(statement.has_where)
+                self.assertEqual(statement.placeholders, ())
+
+    def test_dollar_is_not_a_quote(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        sql = "SELECT $a$; DELETE FROM t$a$"
+
+        statements = self._call_fut(sql)
+
+        self.assertEqual(
+            [statement.keyword for statement in statements], ["SELECT", "DELETE"]
+        )
+        self.assertFalse(statements[1].has_where)
+        # In PostgreSQL, this is a single dollar-quoted literal.
+        (statement,) = self._call_fut(sql, DatabaseDialect.POSTGRESQL)
+        self.assertEqual(statement.keyword, "SELECT")
+
+    def test_escapes_and_parameters(self):
+        sql = "SELECT a FROM t WHERE b LIKE '10%%' AND c = @where AND d % 2 = %%s"
+
+        (statement,) = self._call_fut(sql)
+
+        self.assertEqual(statement.keyword, "SELECT")
+        self.assertTrue(statement.has_where)
+        self.assertEqual(statement.placeholders, ())
+
+    def test_multiple_statements(self):
+        sql = (
+            "CREATE TABLE t (a STRING(10) DEFAULT (';')) PRIMARY KEY (a);\nDROP TABLE u"
+        )
+
+        statements = self._call_fut(sql)
+
+        self.assertEqual(
+            [statement.keyword for statement in statements], ["CREATE", "DROP"]
+        )
+        self.assertEqual(sql[statements[1].start : statements[1].end], "DROP TABLE u")
+
+    def test_postgresql_skips_literals_and_comments(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        sqls = [
+            "DELETE FROM t -- WHERE %s\n",
+            "DELETE FROM t /* WHERE /* nested */ %s */",
+            "DELETE FROM t /* WHERE /* unterminated */ %s",
+            "UPDATE t SET a = 'it''s WHERE %s'",
+            "UPDATE t SET a = E'it\\'s WHERE %s'",
+            'UPDATE t SET "WHERE ""%s""" = 1',
+            "UPDATE t SET a = $$WHERE %s$$",
+            "UPDATE t SET a = $x$ $$ WHERE %s $x$",
+        ]
+        for sql in sqls:
+            with self.subTest(sql=sql):
+                (statement,) = self._call_fut(sql, DatabaseDialect.POSTGRESQL)
+                self.assertFalse(statement.has_where)
+                self.assertEqual(statement.placeholders, ())
+
+    def test_postgresql_hash_is_an_operator(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        sql = "UPDATE t SET a = b # %s WHERE c = %s"
+
+        (statement,) = self._call_fut(sql, DatabaseDialect.POSTGRESQL)
+
+        self.assertTrue(statement.has_where)
+        self.assertEqual(len(statement.placeholders), 2)
+        self.assertFalse(self._call_fut(sql)[0].has_where)
+
+    def test_postgresql_backslash_ends_standard_string(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        sql = "UPDATE t SET a = 'C:\\' WHERE b = %s; DELETE FROM u"
+
+        statements = self._call_fut(sql, DatabaseDialect.POSTGRESQL)
+
+        self.assertEqual(
+            [statement.keyword for statement in statements], ["UPDATE", "DELETE"]
+        )
+        self.assertTrue(statements[0].has_where)
+        self.assertEqual(len(statements[0].placeholders), 1)
+        # In GoogleSQL, the backslash escapes the quote.
+        (statement,) = self._call_fut(sql)
+        self.assertEqual(statement.placeholders, ())
+
+    def test_postgresql_nested_comment_end(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        sql = "/* a /* b */ WHERE */ DELETE FROM t WHERE a = %s"
+
+        (statement,) = self._call_fut(sql, DatabaseDialect.POSTGRESQL)
+
+        self.assertEqual(sql[statement.start : statement.end], sql[22:])
+        self.assertEqual(statement.keyword, "DELETE")
+        self.assertEqual(len(statement.placeholders), 1)
+
+
+class Test_leading_keyword(unittest.TestCase):
+    def _call_fut(self, sql, dialect=None):
+        from google.cloud.spanner_dbapi._lexer import leading_keyword
+
+        return leading_keyword(sql, dialect)
+
+    def test_it(self):
+        cases = (
+            ("select 1", "SELECT"),
+            ("  ((SELECT 1))", "SELECT"),
+            ("/* x */ -- y\n# z\nWith a AS (SELECT 1) SELECT * FROM a", "WITH"),
+            ("@{USE_ADDITIONAL_PARALLELISM=TRUE} SELECT 1", "SELECT"),
+            ("'SELECT'", None),
+            ("-- only a comment", None),
+            ("", None),
+        )
+        for sql, want in cases:
+            with self.subTest(sql=sql):
+                self.assertEqual(self._call_fut(sql), want)
+
+    def test_postgresql(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        cases = (
+            ("/* x /* y */ z */ DELETE FROM t", "DELETE"),
+            ("# SELECT", None),
+        )
+        for sql, want in cases:
+            with self.subTest(sql=sql):
+                self.assertEqual(self._call_fut(sql, DatabaseDialect.POSTGRESQL), want)
+
+
+class Test_split_statements(unittest.TestCase):
+    def _call_fut(self, sql):
+        from google.cloud.spanner_dbapi._lexer import split_statements
+
+        return split_statements(sql)
+
+    def test_it(self):
+        sql = (
+            "-- Schema\n"
+            "CREATE TABLE t (\n  a STRING(MAX) AS ('a;b') STORED\n) PRIMARY KEY (a);\n"
+            ";\n"
+            "DROP INDEX i -- unused\n"
+        )
+
+        self.assertEqual(
+            self._call_fut(sql),
+            [
+                "CREATE TABLE t (\n  a STRING(MAX) AS ('a;b') STORED\n) PRIMARY KEY (a)",
+                "DROP INDEX i",
+            ],
+        )
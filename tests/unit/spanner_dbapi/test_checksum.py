@@ -14,6 +14,13 @@
 
 import unittest
 
+import mock
+
+try:
+    import xxhash
+except ImportError:  # pragma: NO COVER
+    xxhash = None
+
 
 class Test_compare_checksums(unittest.TestCase):
     def test_equal(self):
@@ -69,3 +76,283 @@ class Test_compare_checksums(unittest.TestCase):
 
         with self.assertRaises(RetryAborted):
             _compare_checksums(original, retried)
+
+
+class TestResultsChecksum(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        return ResultsChecksum
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_rows(self):
+        import datetime
+        import decimal
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+        from google.cloud.spanner_v1 import JsonObject
+
+        return [
+            [
+                "name-%d" % index,
+                index,
+                index / 2,
+                None,
+                b"bytes",
+                [1, index],
+                datetime.date(2023, 1, 1 + index),
+                DatetimeWithNanoseconds(
+                    2023, 1, 1, nanosecond=index, tzinfo=datetime.timezone.utc
+                ),
+                decimal.Decimal("1.25") * index,
+                JsonObject({"index": index}),
+            ]
+            for index in range(3)
+        ]
+
+    def test_ctor_w_invalid_algorithm(self):
+        with self.assertRaises(ValueError):
+            self._make_one("md5")
+
+    def test_consume_results_same_as_consume_result(self):
+        rows = self._make_rows()
+        checksum = self._make_one()
+        for row in rows:
+            checksum.consume_result(row)
+
+        batched = self._make_one()
+        batched.consume_results(rows[:1])
+        batched.consume_results(iter(rows[1:]))
+
+        self.assertEqual(len(batched), 3)
+        self.assertEqual(batched, checksum)
+
+    def test_rows_as_lists_or_tuples(self):
+        rows = self._make_rows()
+        checksum = self._make_one()
+        checksum.consume_results(rows)
+
+        tuples = self._make_one()
+        tuples.consume_results([tuple(row) for row in rows])
+
+        self.assertEqual(tuples, checksum)
+
+    def test_identity_of_values_ignored(self):
+        name = "a" * 10
+        checksum = self._make_one()
+        checksum.consume_result((name, name))
+
+        other = self._make_one()
+        other.consume_result((name, "".join(["a"] * 10)))
+
+        self.assertEqual(other, checksum)
+
+    def test_nanoseconds(self):
+        import datetime
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+        checksum = self._make_one()
+        checksum.consume_result(
+            (
+                DatetimeWithNanoseconds(
+                    2023, 1, 1, nanosecond=1, tzinfo=datetime.timezone.utc
+                ),
+            )
+        )
+
+        other = self._make_one()
+        other.consume_result(
+            (
+                DatetimeWithNanoseconds(
+                    2023, 1, 1, nanosecond=2, tzinfo=datetime.timezone.utc
+                ),
+            )
+        )
+
+        self.assertNotEqual(other, checksum)
+
+    def test_json_null(self):
+        from google.cloud.spanner_v1 import JsonObject
+
+        checksum = self._make_one()
+        checksum.consume_result((JsonObject(None),))
+
+        other = self._make_one()
+        other.consume_result((JsonObject({}),))
+
+        self.assertNotEqual(other, checksum)
+
+    def test_reduced_values_tagged_with_type(self):
+        import datetime
+        import decimal
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+        from google.cloud.spanner_v1 import JsonObject
+
+        timestamp = DatetimeWithNanoseconds(
+            2023, 1, 1, nanosecond=1, tzinfo=datetime.timezone.utc
+        )
+        values = [
+            datetime.date(2023, 1, 2),
+            timestamp,
+            decimal.Decimal("1.25"),
+            JsonObject({"a": 1}),
+            JsonObject(None),
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                checksum = self._make_one()
+                checksum.consume_result((value,))
+                texts = {
+                    str(value),
+                    repr(value),
+                    "null",
+                    "%s/%d" % (timestamp.isoformat(), 1),
+                }
+                for text in texts:
+                    other = self._make_one()
+                    other.consume_result((text,))
+                    self.assertNotEqual(other, checksum)
+
+    def test_consume_result_flushes_buffer(self):
+        import hashlib
+        import pickle
+        from google.cloud.spanner_dbapi import checksum as MUT
+
+        checksum = self._make_one()
+        with mock.patch.object(MUT, "_FLUSH_BYTES", 1):
+            checksum.consume_result(5)
+
+        self.assertEqual(
+            checksum._hash.digest(),
+            hashlib.sha256(pickle.dumps(5, protocol=4)).digest(),
+        )
+        self.assertEqual(checksum.checksum.digest(), checksum._hash.digest())
+
+    @unittest.skipIf(xxhash is None, "xxhash not installed")
+    def test_xxh3_128(self):
+        from google.cloud.spanner_dbapi.checksum import CHECKSUM_XXH3_128
+
+        rows = self._make_rows()
+        checksum = self._make_one(CHECKSUM_XXH3_128)
+        checksum.consume_results(rows)
+
+        other = self._make_one(CHECKSUM_XXH3_128)
+        other.consume_results(rows)
+
+        self.assertEqual(len(checksum.checksum.digest()), 16)
+        self.assertEqual(other, checksum)
+
+    def test_checkpoints(self):
+        from google.cloud.spanner_dbapi import checksum as MUT
+
+        checksum = self._make_one()
+        with mock.patch.object(MUT, "_CHECKPOINT_RESULTS", 2):
+            for index in range(3):
+                checksum.consume_result((index,))
+            checksum.consume_results([(3,), (4,)])
+
+        expected = self._make_one()
+        expected.consume_results([(0,), (1,)])
+        first = expected.checksum.digest()
+        expected.consume_results([(2,), (3,), (4,)])
+
+        self.assertEqual(
+            checksum._checkpoints, [(2, first), (5, expected.checksum.digest())]
+        )
+        self.assertIsNone(checksum._pickler)
+
+    def test_compact(self):
+        checksum = self._make_one()
+        checksum.consume_result((1,))
+        self.assertIsNotNone(checksum._buffer)
+
+        checksum.compact()
+        self.assertIsNone(checksum._buffer)
+
+        checksum.consume_result((2,))
+        expected = self._make_one()
+        expected.consume_results([(1,), (2,)])
+        self.assertEqual(checksum, expected)
+
+
+class Test_replay_results(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.spanner_dbapi.checksum import _replay_results
+
+        return _replay_results(*args, **kwargs)
+
+    def _make_checksum(self, rows):
+        from google.cloud.spanner_dbapi import checksum as MUT
+
+        checksum = MUT.ResultsChecksum()
+        with mock.patch.object(MUT, "_CHECKPOINT_RESULTS", 2):
+            checksum.consume_results(rows[:2])
+            checksum.consume_results(rows[2:])
+        return checksum
+
+    def test_match(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        rows = [[index] for index in range(5)]
+        original = self._make_checksum(rows)
+        retried = ResultsChecksum()
+
+        self._call_fut(original, retried, iter(rows))
+
+        self.assertEqual(retried, original)
+
+    def test_mismatch_stops_at_checkpoint(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.exceptions import RetryAborted
+
+        original = self._make_checksum([[index] for index in range(5)])
+        retried = ResultsChecksum()
+        results = iter([[0], [-1], [2], [3], [4]])
+
+        with self.assertRaises(RetryAborted):
+            self._call_fut(original, retried, results)
+
+        self.assertEqual(len(retried), 2)
+        self.assertEqual(list(results), [[2], [3], [4]])
+
+    def test_more_results(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        original = self._make_checksum([[index] for index in range(5)])
+        retried = ResultsChecksum()
+        results = iter([[index] for index in range(8)])
+
+        self._call_fut(original, retried, results)
+
+        self.assertEqual(len(retried), 6)
+        self.assertNotEqual(retried, original)
+        self.assertEqual(list(results), [[6], [7]])
+
+    def test_incomplete(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        rows = [[index] for index in range(8)]
+        original = self._make_checksum(rows[:5])
+        retried = ResultsChecksum()
+        results = iter(rows)
+
+        self._call_fut(original, retried, results, complete=False)
+
+        self.assertEqual(retried, original)
+        self.assertEqual(list(results), rows[5:])
+
+    def test_streamed_result_set(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+        rows = [[index] for index in range(5)]
+        original = self._make_checksum(rows)
+        retried = ResultsChecksum()
+        results = mock.create_autospec(StreamedResultSet, instance=True)
+        results.iter_batches.return_value = iter([rows[:3], rows[3:]])
+
+        self._call_fut(original, retried, results)
+
+        self.assertEqual(retried, original)
+        results.iter_batches.assert_called_once_with()
@@ -544,6 +544,35 @@ class TestConnection(unittest.TestCase):
         with self.assertRaises(RetryAborted):
             connection.retry_transaction()
 
+    def test_retry_transaction_wo_checksum_results(self):
+        """
+        Check retrying an aborted transaction
+        without comparing results checksums.
+        """
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.cursor import Statement
+
+        connection = self._make_connection()
+        connection.checksum_results = False
+
+        completed = Statement("SELECT 1", [], {}, ResultsChecksum())
+        failed = Statement("SELECT 2", [], {}, ResultsChecksum())
+        connection._statements.extend([completed, failed])
+        retried_checksum = ResultsChecksum()
+        run_mock = connection.run_statement = mock.Mock()
+        run_mock.return_value = (iter([["field3", "field4"]]), retried_checksum)
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi.connection._compare_checksums"
+        ) as compare_mock:
+            connection.retry_transaction()
+
+        compare_mock.assert_not_called()
+        self.assertEqual(len(retried_checksum), 0)
+        run_mock.assert_has_calls(
+            [mock.call(completed, retried=True), mock.call(failed, retried=True)]
+        )
+
     @mock.patch("google.cloud.spanner_v1.Client")
     def test_commit_retry_aborted_statements(self, mock_client):
         """Check that retried transaction executing the same statements."""
@@ -712,6 +741,72 @@ class TestConnection(unittest.TestCase):
 
         run_mock.assert_called_with(statement1, retried=True)
 
+    def test_retry_transaction_replay_stats(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.connection import ReplayStats
+        from google.cloud.spanner_dbapi.cursor import Statement
+
+        rows = [["field1"], ["field2"]]
+        connection = self._make_connection()
+        checksum = ResultsChecksum()
+        checksum.consume_results(rows)
+        partial_checksum = ResultsChecksum()
+        partial_checksum.consume_result(rows[0])
+
+        statement = Statement("SELECT 1", [], {}, checksum)
+        statement1 = Statement("SELECT 2", [], {}, partial_checksum)
+        connection._statements.extend([statement, statement1])
+        run_mock = connection.run_statement = mock.Mock()
+        run_mock.side_effect = [
+            (iter(rows), ResultsChecksum()),
+            (iter(rows), ResultsChecksum()),
+        ]
+
+        self.assertEqual(connection.replay_stats, ReplayStats(0, 0, 0, 0.0))
+        with mock.patch("time.monotonic", side_effect=[10.0, 10.5]):
+            connection.retry_transaction()
+
+        self.assertEqual(connection.replay_stats, ReplayStats(1, 2, 3, 0.5))
+
+    def test_retry_transaction_w_batch_dml(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.exceptions import RetryAborted
+        from google.rpc.code_pb2 import OK
+
+        connection = self._make_connection()
+        statements = [("UPDATE t SET a = 1 WHERE b = 2", {}, {})]
+        checksum = ResultsChecksum()
+        checksum.consume_result([1])
+        checksum.consume_result(OK)
+        connection._statements.append((statements, checksum))
+
+        transaction = mock.Mock()
+        transaction.batch_update.return_value = (mock.Mock(code=OK), [1])
+        connection.transaction_checkout = mock.Mock(return_value=transaction)
+
+        connection.retry_transaction()
+
+        transaction.batch_update.assert_called_once_with(statements)
+
+        transaction.batch_update.return_value = (mock.Mock(code=OK), [2])
+        with self.assertRaises(RetryAborted):
+            connection.retry_transaction()
+
+    def test_run_statement_compacts_previous_checksum(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.cursor import Statement
+
+        connection = self._make_connection()
+        connection.transaction_checkout = mock.Mock()
+        checksum = ResultsChecksum()
+        checksum.consume_result(["field1"])
+        connection._statements.append(Statement("SELECT 1", [], {}, checksum))
+
+        connection.run_statement(Statement("SELECT 2", [], {}, ResultsChecksum()))
+
+        self.assertIsNone(checksum._buffer)
+        self.assertEqual(len(connection._statements), 2)
+
     def test_retry_transaction_w_empty_response(self):
         """Check retrying an aborted transaction."""
         from google.cloud.spanner_dbapi.checksum import ResultsChecksum
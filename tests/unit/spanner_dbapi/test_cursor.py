@@ -51,6 +51,33 @@ class TestCursor(unittest.TestCase):
         cursor = self._make_one(connection)
         self.assertEqual(cursor.connection, connection)
 
+    def test_property_dialect(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        database = mock.Mock(database_dialect=DatabaseDialect.POSTGRESQL)
+        cursor = self._make_one(self._make_connection(self.INSTANCE, database))
+        self.assertEqual(cursor._dialect, DatabaseDialect.POSTGRESQL)
+
+        cursor = self._make_one(self._make_connection(self.INSTANCE, None))
+        self.assertIsNone(cursor._dialect)
+
+    def test_batch_ddls_postgresql(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+
+        database = mock.Mock(database_dialect=DatabaseDialect.POSTGRESQL)
+        connection = self._make_connection(self.INSTANCE, database)
+        cursor = self._make_one(connection)
+
+        cursor._batch_DDLs(
+            "CREATE TABLE t (a varchar DEFAULT 'C:\\');"
+            " /* a; /* b; */ c; */ DROP TABLE u"
+        )
+
+        self.assertEqual(
+            connection._ddl_statements,
+            ["CREATE TABLE t (a varchar DEFAULT 'C:\\')", "DROP TABLE u"],
+        )
+
     def test_property_description(self):
         from google.cloud.spanner_dbapi._helpers import ColumnInfo
 
@@ -220,7 +247,9 @@ class TestCursor(unittest.TestCase):
             sql = "sql"
             with self.assertRaises(ValueError):
                 cursor.execute(sql=sql)
-            mock_classify_stmt.assert_called_with(sql)
+            mock_classify_stmt.assert_called_with(
+                sql, connection.database.database_dialect
+            )
             self.assertEqual(mock_classify_stmt.call_count, 2)
             self.assertEqual(cursor.connection._ddl_statements, [])
 
@@ -230,7 +259,9 @@ class TestCursor(unittest.TestCase):
         ) as mock_classify_stmt:
             sql = "sql"
             cursor.execute(sql=sql)
-            mock_classify_stmt.assert_called_with(sql)
+            mock_classify_stmt.assert_called_with(
+                sql, connection.database.database_dialect
+            )
             self.assertEqual(mock_classify_stmt.call_count, 2)
             self.assertEqual(cursor.connection._ddl_statements, [sql])
 
@@ -613,6 +644,7 @@ class TestCursor(unittest.TestCase):
             ],
         )
         self.assertIsInstance(connection._statements[0][1], ResultsChecksum)
+        self.assertIsNone(connection._statements[0][1]._buffer)
 
     @mock.patch("google.cloud.spanner_v1.Client")
     def test_executemany_database_error(self, mock_client):
@@ -693,6 +725,19 @@ class TestCursor(unittest.TestCase):
         lst = [(1,), (2,), (3,)]
         cursor._itr = iter(lst)
         self.assertEqual(cursor.fetchall(), lst)
+        self.assertEqual(len(cursor._checksum), 3)
+
+    def test_fetchall_wo_checksum_results(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        connection.checksum_results = False
+        cursor = self._make_one(connection)
+        cursor._checksum = ResultsChecksum()
+        lst = [(1,), (2,), (3,)]
+        cursor._itr = iter(lst)
+        self.assertEqual(cursor.fetchall(), lst)
+        self.assertEqual(len(cursor._checksum), 0)
 
     def test_fetchall_w_autocommit(self):
         from google.cloud.spanner_dbapi.checksum import ResultsChecksum
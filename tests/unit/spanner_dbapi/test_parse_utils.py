@@ -15,6 +15,8 @@
 import sys
 import unittest
 
+import mock
+
 from google.cloud.spanner_v1 import param_types
 from google.cloud.spanner_v1 import JsonObject
 
@@ -60,6 +62,11 @@ class TestParseUtils(unittest.TestCase):
             ("GRANT ROLE parent TO ROLE child", STMT_DDL),
             ("INSERT INTO table (col1) VALUES (1)", STMT_INSERT),
             ("UPDATE table SET col1 = 1 WHERE col1 = NULL", STMT_UPDATING),
+            ("-- comment\n/* block */ select 1", STMT_NON_UPDATING),
+            ("@{FORCE_INDEX=_BASE_TABLE} SELECT 1", STMT_NON_UPDATING),
+            ("# comment\ninsert into t (a) values (1)", STMT_INSERT),
+            ("'SELECT' AS x", STMT_UPDATING),
+            ("", STMT_UPDATING),
         )
 
         for query, want_class in cases:
@@ -141,6 +148,90 @@ class TestParseUtils(unittest.TestCase):
                 )
 
     @unittest.skipIf(skip_condition, skip_message)
+    def test_sql_pyformat_args_to_spanner_cached(self):
+        from google.cloud.spanner_dbapi import _lexer
+        from google.cloud.spanner_dbapi import parse_utils
+
+        parse_utils.clear_statement_cache()
+        sql = "SELECT * from t WHERE f1=%s AND f2=%s AND f3 LIKE '100%%'"
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi._lexer.scan_statements",
+            wraps=_lexer.scan_statements,
+        ) as scan:
+            first = parse_utils.sql_pyformat_args_to_spanner(sql, ("a", 1))
+            second = parse_utils.sql_pyformat_args_to_spanner(sql, ("b", 2))
+            unbound = parse_utils.sql_pyformat_args_to_spanner(sql, None)
+
+        scan.assert_called_once_with(sql, None)
+        want_sql = "SELECT * from t WHERE f1=@a0 AND f2=@a1 AND f3 LIKE '100%'"
+        self.assertEqual(first, (want_sql, {"a0": "a", "a1": 1}))
+        self.assertEqual(second, (want_sql, {"a0": "b", "a1": 2}))
+        self.assertEqual(
+            unbound, ("SELECT * from t WHERE f1=%s AND f2=%s AND f3 LIKE '100%'", None)
+        )
+
+    def test_sql_pyformat_args_to_spanner_postgresql(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+        from google.cloud.spanner_dbapi.parse_utils import sql_pyformat_args_to_spanner
+
+        sql = "SELECT a # %s FROM t WHERE b = 'C:\\' AND c = %s"
+
+        got = sql_pyformat_args_to_spanner(sql, (1, 2), DatabaseDialect.POSTGRESQL)
+
+        self.assertEqual(
+            got,
+            (
+                "SELECT a # @a0 FROM t WHERE b = 'C:\\' AND c = @a1",
+                {"a0": 1, "a1": 2},
+            ),
+        )
+
+    def test_classify_stmt_postgresql(self):
+        from google.cloud.spanner_admin_database_v1 import DatabaseDialect
+        from google.cloud.spanner_dbapi import parse_utils
+
+        sql = "/* a /* b */ SELECT */ DELETE FROM t"
+
+        self.assertEqual(
+            parse_utils.classify_stmt(sql, DatabaseDialect.POSTGRESQL),
+            parse_utils.STMT_UPDATING,
+        )
+        self.assertEqual(
+            parse_utils.ensure_where_clause(sql, DatabaseDialect.POSTGRESQL),
+            sql + " WHERE 1=1",
+        )
+
+    def test_statement_cache(self):
+        from google.cloud.spanner_dbapi import _lexer
+        from google.cloud.spanner_dbapi import parse_utils
+
+        parse_utils.clear_statement_cache()
+        sql = "DELETE FROM t -- all rows"
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi._lexer.leading_keyword",
+            wraps=_lexer.leading_keyword,
+        ) as leading_keyword:
+            with mock.patch(
+                "google.cloud.spanner_dbapi._lexer.scan_statements",
+                wraps=_lexer.scan_statements,
+            ) as scan:
+                for _ in range(3):
+                    self.assertEqual(
+                        parse_utils.classify_stmt(sql), parse_utils.STMT_UPDATING
+                    )
+                    self.assertEqual(
+                        parse_utils.ensure_where_clause(sql),
+                        "DELETE FROM t WHERE 1=1 -- all rows",
+                    )
+
+                parse_utils.clear_statement_cache()
+                parse_utils.classify_stmt(sql)
+
+        self.assertEqual(leading_keyword.call_count, 2)
+        scan.assert_called_once_with(sql, None)
+
     def test_get_param_types(self):
         import datetime
         import decimal
@@ -198,10 +289,12 @@ class TestParseUtils(unittest.TestCase):
         err_cases = (
             "UPDATE (SELECT * FROM A JOIN c ON ai.id = c.id WHERE cl.ci = 1) SET d=5",
             "DELETE * FROM TABLE",
+            "DELETE FROM t WHERE_CLAUSE",
+            "UPDATE t SET a = 'WHERE'",
         )
         for sql in cases:
             with self.subTest(sql=sql):
-                ensure_where_clause(sql)
+                self.assertEqual(ensure_where_clause(sql), sql)
 
         for sql in err_cases:
             with self.subTest(sql=sql):
@@ -0,0 +1,192 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+def _make_type(type_code, element_type_code=None, struct_fields=None):
+    from google.cloud.spanner_v1 import StructType
+    from google.cloud.spanner_v1 import Type
+
+    if element_type_code is not None:
+        return Type(code=type_code, array_element_type=Type(code=element_type_code))
+    if struct_fields is not None:
+        return Type(
+            code=type_code,
+            struct_type=StructType(
+                fields=[
+                    StructType.Field(name=name, type_=Type(code=field_type_code))
+                    for name, field_type_code in struct_fields
+                ]
+            ),
+        )
+    return Type(code=type_code)
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow not installed")
+class Test_arrow_type(unittest.TestCase):
+    def _call_fut(self, field_type):
+        from google.cloud.spanner_v1._arrow import _arrow_type
+
+        return _arrow_type(field_type)
+
+    def test_scalars(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        expected = {
+            TypeCode.BOOL: pyarrow.bool_(),
+            TypeCode.INT64: pyarrow.int64(),
+            TypeCode.FLOAT64: pyarrow.float64(),
+            TypeCode.STRING: pyarrow.string(),
+            TypeCode.BYTES: pyarrow.binary(),
+            TypeCode.DATE: pyarrow.date32(),
+            TypeCode.TIMESTAMP: pyarrow.timestamp("ns", tz="UTC"),
+            TypeCode.NUMERIC: pyarrow.decimal128(38, 9),
+            TypeCode.JSON: pyarrow.string(),
+        }
+        for type_code, arrow_type in expected.items():
+            self.assertEqual(self._call_fut(_make_type(type_code)), arrow_type)
+
+    def test_array(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = _make_type(TypeCode.ARRAY, element_type_code=TypeCode.DATE)
+        self.assertEqual(self._call_fut(field_type), pyarrow.list_(pyarrow.date32()))
+
+    def test_struct_w_anonymous_field(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = _make_type(
+            TypeCode.STRUCT,
+            struct_fields=[("a", TypeCode.INT64), ("", TypeCode.STRING)],
+        )
+        self.assertEqual(
+            self._call_fut(field_type),
+            pyarrow.struct([("a", pyarrow.int64()), ("_1", pyarrow.string())]),
+        )
+
+    def test_unknown(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        with self.assertRaises(ValueError):
+            self._call_fut(_make_type(TypeCode.TYPE_CODE_UNSPECIFIED))
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow not installed")
+class Test_make_array_converters(unittest.TestCase):
+    def _convert(self, field_type, values):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1._arrow import _make_array_converters
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        row_type = StructType(fields=[StructType.Field(name="c", type_=field_type)])
+        (converter,) = _make_array_converters(row_type)
+        return converter([_make_value_pb(value) for value in values])
+
+    def test_int64(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        result = self._convert(_make_type(TypeCode.INT64), [1, None, -3])
+        self.assertEqual(result.type, pyarrow.int64())
+        self.assertEqual(result.null_count, 1)
+        self.assertEqual(result.to_pylist(), [1, None, -3])
+
+    def test_float64(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        result = self._convert(_make_type(TypeCode.FLOAT64), [1.5, float("inf")])
+        self.assertEqual(result.null_count, 0)
+        self.assertEqual(result.to_pylist(), [1.5, float("inf")])
+
+    def test_string(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = ["abc", None, "", "été"]
+        result = self._convert(_make_type(TypeCode.STRING), values)
+        self.assertEqual(result.type, pyarrow.string())
+        self.assertEqual(result.to_pylist(), values)
+
+    def test_bytes(self):
+        import base64
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = [base64.b64encode(b"\x00\xff"), None]
+        result = self._convert(_make_type(TypeCode.BYTES), values)
+        self.assertEqual(result.to_pylist(), [b"\x00\xff", None])
+
+    def test_bool(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        result = self._convert(_make_type(TypeCode.BOOL), [True, None, False])
+        self.assertEqual(result.to_pylist(), [True, None, False])
+
+    def test_timestamp_w_nanos(self):
+        import datetime
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+        from google.cloud.spanner_v1 import TypeCode
+
+        stamp = DatetimeWithNanoseconds(
+            2023, 6, 1, 12, 30, 0, nanosecond=123456789, tzinfo=datetime.timezone.utc
+        )
+        result = self._convert(_make_type(TypeCode.TIMESTAMP), [stamp, None])
+        self.assertEqual(result.type, pyarrow.timestamp("ns", tz="UTC"))
+        self.assertEqual(result.cast(pyarrow.int64())[0].as_py() % 10**9, 123456789)
+        self.assertIsNone(result[1].as_py())
+
+    def test_numeric_and_json(self):
+        import decimal
+        from google.cloud.spanner_v1 import JsonObject
+        from google.cloud.spanner_v1 import TypeCode
+
+        numerics = self._convert(
+            _make_type(TypeCode.NUMERIC), [decimal.Decimal("1.25"), None]
+        )
+        self.assertEqual(numerics.to_pylist(), [decimal.Decimal("1.250000000"), None])
+        documents = self._convert(_make_type(TypeCode.JSON), [JsonObject({"a": 1})])
+        self.assertEqual(documents.to_pylist(), ['{"a":1}'])
+
+    def test_array_of_struct(self):
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1 import Type
+
+        struct_type = _make_type(
+            TypeCode.STRUCT,
+            struct_fields=[("a", TypeCode.INT64), ("b", TypeCode.STRING)],
+        )
+        field_type = Type(code=TypeCode.ARRAY, array_element_type=struct_type)
+        result = self._convert(field_type, [[[1, "x"], [2, None]], None])
+        self.assertEqual(
+            result.to_pylist(), [[{"a": 1, "b": "x"}, {"a": 2, "b": None}], None]
+        )
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow not installed")
+class Test_concat_tables(unittest.TestCase):
+    def _call_fut(self, tables):
+        from google.cloud.spanner_v1._arrow import _concat_tables
+
+        return _concat_tables(tables)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([pyarrow.table({})]).num_columns, 0)
+
+    def test_skips_tables_without_schema(self):
+        tables = [pyarrow.table({}), pyarrow.table({"a": [1]})]
+        self.assertEqual(self._call_fut(tables).to_pydict(), {"a": [1]})
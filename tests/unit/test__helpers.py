@@ -110,6 +110,35 @@ class Test_make_value_pb(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._callFUT(BYTES)
 
+    def test_w_bytearray(self):
+        # Same meaning as ``bytes``:  already base64-encoded.
+        value_pb = self._callFUT(bytearray(b"YWJj"))
+        self.assertEqual(value_pb.string_value, "YWJj")
+
+    def test_w_invalid_bytearray(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(bytearray(b"\xff\xfe\x03&"))
+
+    def test_w_memoryview(self):
+        value_pb = self._callFUT(memoryview(b"xxYWJjxx")[2:6])
+        self.assertEqual(value_pb.string_value, "YWJj")
+
+    def test_w_raw_bytes(self):
+        import base64
+        from google.cloud.spanner_v1 import RawBytes
+
+        BYTES = b"\xff\xfe\x03&"
+        value_pb = self._callFUT(RawBytes(BYTES))
+        self.assertEqual(value_pb.string_value, base64.b64encode(BYTES).decode())
+
+    def test_w_raw_bytes_memoryview(self):
+        import base64
+        from google.cloud.spanner_v1 import RawBytes
+
+        BYTES = b"\x00" * 100
+        value_pb = self._callFUT(RawBytes(memoryview(BYTES)[10:20]))
+        self.assertEqual(value_pb.string_value, base64.b64encode(BYTES[10:20]).decode())
+
     def test_w_explicit_unicode(self):
         from google.protobuf.struct_pb2 import Value
 
@@ -382,6 +411,158 @@ class Test_make_list_value_pbs(unittest.TestCase):
             self.assertEqual(found.values[1].string_value, expected[1])
 
 
+class Test_make_value_encoder(unittest.TestCase):
+    def _encode(self, field_type, value):
+        from google.protobuf.struct_pb2 import ListValue
+        from google.cloud.spanner_v1._helpers import _make_value_encoder
+
+        list_value = ListValue()
+        _make_value_encoder(field_type)(list_value.values, value)
+        self.assertEqual(len(list_value.values), 1)
+        return list_value.values[0]
+
+    def test_matches_make_value_pb(self):
+        import datetime
+        import decimal
+        from google.cloud.spanner_v1 import RawBytes
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        cases = [
+            (param_types.STRING, ["abc", "", None, b"YWJj"]),
+            (
+                param_types.BYTES,
+                [b"YWJj", "YWJj", bytearray(b"YWJj"), RawBytes(b"abc"), None],
+            ),
+            (param_types.INT64, [0, -12, 2**63 - 1, True, None]),
+            (param_types.FLOAT64, [1.5, float("nan"), float("-inf"), 3, None]),
+            (param_types.BOOL, [True, False, None]),
+            (param_types.DATE, [datetime.date(2023, 1, 2), None]),
+            (
+                param_types.TIMESTAMP,
+                [datetime.datetime(2023, 1, 2, tzinfo=datetime.timezone.utc)],
+            ),
+            (param_types.NUMERIC, [decimal.Decimal("1.5"), None]),
+            (param_types.Array(param_types.INT64), [[1, None, 3], [], (4,), None]),
+            (None, ["abc", 1, None]),
+        ]
+        for field_type, values in cases:
+            for value in values:
+                self.assertEqual(
+                    self._encode(field_type, value), _make_value_pb(value), value
+                )
+
+    def test_empty_array_is_not_null(self):
+        from google.cloud.spanner_v1 import param_types
+
+        value_pb = self._encode(param_types.Array(param_types.STRING), [])
+
+        self.assertEqual(value_pb.WhichOneof("kind"), "list_value")
+
+    def test_w_invalid_value(self):
+        from google.cloud.spanner_v1 import param_types
+
+        with self.assertRaises(ValueError):
+            self._encode(param_types.INT64, object())
+
+
+class Test_make_column_encoders(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_column_encoders
+
+        return _make_column_encoders(*args, **kw)
+
+    def test_wo_column_types(self):
+        from google.cloud.spanner_v1._helpers import _encode_any
+
+        self.assertEqual(self._callFUT(["a", "b"]), (_encode_any, _encode_any))
+
+    def test_w_mapping(self):
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1._helpers import _encode_any
+        from google.cloud.spanner_v1._helpers import _encode_int64
+
+        encoders = self._callFUT(["a", "b"], {"b": param_types.INT64})
+
+        self.assertEqual(encoders, (_encode_any, _encode_int64))
+
+    def test_w_list(self):
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1._helpers import _encode_bool
+        from google.cloud.spanner_v1._helpers import _encode_string
+
+        encoders = self._callFUT(["a", "b"], [param_types.STRING, param_types.BOOL])
+
+        self.assertEqual(encoders, (_encode_string, _encode_bool))
+
+    def test_w_list_mismatched(self):
+        from google.cloud.spanner_v1 import param_types
+
+        with self.assertRaises(ValueError):
+            self._callFUT(["a", "b"], [param_types.STRING])
+
+    def test_w_schema_fields(self):
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1._helpers import _encode_float64
+        from google.cloud.spanner_v1._helpers import _encode_int64
+
+        schema = [
+            param_types.StructField("id", param_types.INT64),
+            param_types.StructField("other", param_types.STRING),
+            param_types.StructField("score", param_types.FLOAT64),
+        ]
+
+        encoders = self._callFUT(["score", "id"], schema)
+
+        self.assertEqual(encoders, (_encode_float64, _encode_int64))
+
+
+class Test_column_value_lists(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _column_value_lists
+
+        return _column_value_lists(*args, **kw)
+
+    def test_w_rows(self):
+        self.assertIsNone(self._callFUT(["a"], [[1], [2]]))
+
+    def test_w_mapping(self):
+        data = {"a": [1, 2], "b": ("x", "y"), "unused": [None]}
+
+        self.assertEqual(self._callFUT(["b", "a"], data), [("x", "y"), [1, 2]])
+
+    def test_w_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(["a", "b"], {"a": [1, 2], "b": [1]})
+
+    def test_w_numpy_arrays(self):
+        try:
+            import numpy
+        except ImportError:  # pragma: NO COVER
+            self.skipTest("numpy not installed")
+
+        data = {"a": numpy.arange(3), "b": numpy.array([0.5, 1.5, 2.5])}
+
+        found = self._callFUT(["a", "b"], data)
+
+        self.assertEqual(found, [[0, 1, 2], [0.5, 1.5, 2.5]])
+        self.assertIs(type(found[0][0]), int)
+
+    def test_w_arrow_table(self):
+        try:
+            import pyarrow
+        except ImportError:  # pragma: NO COVER
+            self.skipTest("pyarrow not installed")
+
+        table = pyarrow.table({"a": [1, None], "b": [b"\x00", b"\xff"]})
+
+        found = self._callFUT(["a", "b"], table)
+
+        self.assertEqual(found[0], [1, None])
+        self.assertEqual([bytes(value) for value in found[1]], [b"\x00", b"\xff"])
+        self.assertIsInstance(found[1][0], memoryview)
+
+
 class Test_parse_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_value_pb
@@ -604,6 +785,120 @@ class Test_parse_value_pb(unittest.TestCase):
             self._callFUT(value_pb, field_type)
 
 
+class Test_make_value_decoder(Test_parse_value_pb):
+    def _callFUT(self, value_pb, field_type):
+        from google.cloud.spanner_v1._helpers import _make_value_decoder
+
+        return _make_value_decoder(field_type)(value_pb)
+
+    def test_w_empty_string(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = Type(code=TypeCode.STRING)
+        value_pb = Value(string_value="")
+
+        self.assertEqual(self._callFUT(value_pb, field_type), "")
+
+    def test_w_false(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = Type(code=TypeCode.BOOL)
+        value_pb = Value(bool_value=False)
+
+        self.assertIs(self._callFUT(value_pb, field_type), False)
+
+    def test_w_null_of_each_type(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        value_pb = Value(null_value=NULL_VALUE)
+        for type_code in TypeCode:
+            if type_code == TypeCode.ARRAY:
+                field_type = Type(
+                    code=type_code, array_element_type=Type(code=TypeCode.INT64)
+                )
+            elif type_code == TypeCode.STRUCT:
+                field_type = Type(code=type_code, struct_type=StructType(fields=[]))
+            else:
+                field_type = Type(code=type_code)
+
+            self.assertIsNone(self._callFUT(value_pb, field_type), type_code)
+
+    def test_w_invalid_int64(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = Type(code=TypeCode.INT64)
+        value_pb = Value(string_value="Borked")
+
+        with self.assertRaises(ValueError):
+            self._callFUT(value_pb, field_type)
+
+
+class Test_make_row_decoders(unittest.TestCase):
+    def test_it(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1._helpers import _make_row_decoders
+
+        row_type = StructType(
+            fields=[
+                StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+                StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+            ]
+        )
+
+        decoders = _make_row_decoders(row_type)
+
+        self.assertIsInstance(decoders, tuple)
+        self.assertEqual(len(decoders), 2)
+        self.assertEqual(decoders[0](Value(string_value="phred")), "phred")
+        self.assertEqual(decoders[1](Value(string_value="32")), 32)
+
+    def test_w_decode_bytes(self):
+        import base64
+        from google.protobuf.struct_pb2 import ListValue
+        from google.protobuf.struct_pb2 import NULL_VALUE
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1._helpers import _make_row_decoders
+
+        bytes_type = Type(code=TypeCode.BYTES)
+        row_type = StructType(
+            fields=[
+                StructType.Field(name="blob", type_=bytes_type),
+                StructType.Field(
+                    name="blobs",
+                    type_=Type(code=TypeCode.ARRAY, array_element_type=bytes_type),
+                ),
+            ]
+        )
+        RAW = b"\x00\xff\x10"
+        encoded = Value(string_value=base64.b64encode(RAW).decode())
+        null = Value(null_value=NULL_VALUE)
+
+        blob, blobs = _make_row_decoders(row_type, decode_bytes=True)
+
+        self.assertEqual(blob(encoded), RAW)
+        self.assertIsNone(blob(null))
+        array_pb = Value(list_value=ListValue(values=[encoded, null]))
+        self.assertEqual(blobs(array_pb), [RAW, None])
+        self.assertEqual(
+            _make_row_decoders(row_type)[0](encoded), base64.b64encode(RAW)
+        )
+
+
 class Test_parse_list_value_pbs(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_list_value_pbs
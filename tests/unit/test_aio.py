@@ -0,0 +1,516 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import mock
+
+from tests._helpers import OpenTelemetryBase
+
+
+DATABASE_NAME = "projects/project-id/instances/instance-id/databases/database-id"
+TXN_ID = b"DEAFBEAD"
+RESUME_TOKEN = b"DEADBEEF"
+SQL_QUERY = "SELECT name, age FROM citizens"
+DML = "UPDATE citizens SET age = age + 1 WHERE TRUE"
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _make_rpc_error(error_cls):
+    import grpc
+    from google.protobuf.duration_pb2 import Duration
+    from google.rpc.error_details_pb2 import RetryInfo
+
+    retry_info = RetryInfo(retry_delay=Duration(seconds=0, nanos=1000))
+    grpc_error = mock.create_autospec(grpc.Call, instance=True)
+    grpc_error.trailing_metadata.return_value = [
+        ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
+    ]
+    return error_cls("error", errors=(grpc_error,))
+
+
+def _make_metadata(transaction_id=None):
+    from google.cloud.spanner_v1 import ResultSetMetadata
+    from google.cloud.spanner_v1 import StructType
+    from google.cloud.spanner_v1 import Type
+    from google.cloud.spanner_v1 import TypeCode
+
+    fields = [
+        StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+        StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+    ]
+    metadata = ResultSetMetadata(row_type=StructType(fields=fields))
+    if transaction_id is not None:
+        metadata.transaction.id = transaction_id
+    return metadata
+
+
+def _make_partial_result_set(
+    values, metadata=None, resume_token=b"", chunked_value=False
+):
+    from google.cloud.spanner_v1 import PartialResultSet
+    from google.cloud.spanner_v1._helpers import _make_value_pb
+
+    results = PartialResultSet(
+        metadata=metadata, resume_token=resume_token, chunked_value=chunked_value
+    )
+    for value in values:
+        results.values.append(_make_value_pb(value))
+    return results
+
+
+def _copy(request):
+    # Requests are mutated when streams are restarted.
+    request_class = type(request)
+    return request_class.deserialize(request_class.serialize(request))
+
+
+class _AsyncStream(object):
+    def __init__(self, items):
+        self._items = items
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in self._items:
+            await asyncio.sleep(0)
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class _FauxAsyncSpannerAPI(object):
+    def __init__(self, streams=(), commit_errors=()):
+        self._streams = list(streams)
+        self._commit_errors = list(commit_errors)
+        self._stream_requests = []
+        self._execute_sql_requests = []
+        self._commit_requests = []
+        self._rollbacks = []
+        self._created = 0
+        self._deleted = []
+
+    async def create_session(self, request, metadata):
+        from google.cloud.spanner_v1 import Session
+
+        self._created += 1
+        return Session(name="{}/sessions/{}".format(request.database, self._created))
+
+    async def get_session(self, name, metadata):
+        return mock.Mock(name=name)
+
+    async def delete_session(self, name, metadata):
+        self._deleted.append(name)
+
+    async def execute_streaming_sql(self, request, metadata, retry, timeout):
+        self._stream_requests.append(_copy(request))
+        return _AsyncStream(self._streams.pop(0))
+
+    async def execute_sql(self, request, metadata, retry, timeout):
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetStats
+
+        self._execute_sql_requests.append(_copy(request))
+        await asyncio.sleep(0)
+        result_set = ResultSet(stats=ResultSetStats(row_count_exact=1))
+        if "begin" in request.transaction:
+            result_set.metadata.transaction.id = TXN_ID
+        return result_set
+
+    async def commit(self, request, metadata):
+        import datetime
+        from google.cloud.spanner_v1 import CommitResponse
+
+        self._commit_requests.append(request)
+        if self._commit_errors:
+            raise self._commit_errors.pop(0)
+        now = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc)
+        return CommitResponse(commit_timestamp=now)
+
+    async def rollback(self, session, transaction_id, metadata):
+        self._rollbacks.append((session, transaction_id))
+
+
+class _Client(object):
+    def __init__(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        self._query_options = ExecuteSqlRequest.QueryOptions(optimizer_version="1")
+
+
+class _Instance(object):
+    def __init__(self):
+        self._client = _Client()
+
+
+class _Database(object):
+
+    database_role = None
+    log_commit_stats = False
+
+    def __init__(self):
+        self.name = DATABASE_NAME
+        self._instance = _Instance()
+        self._route_to_leader_enabled = True
+        self.logger = mock.Mock(spec=["info"])
+
+
+class TestAsyncDatabase(OpenTelemetryBase):
+    def _make_one(self, api, pool=None):
+        from google.cloud.spanner_v1.aio import AsyncDatabase
+
+        database = AsyncDatabase(_Database(), pool=pool)
+        database._spanner_api = api
+        return database
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.aio import AsyncSessionPool
+
+        database = self._make_one(_FauxAsyncSpannerAPI())
+
+        self.assertEqual(database.name, DATABASE_NAME)
+        self.assertIsInstance(database._pool, AsyncSessionPool)
+        self.assertIs(database._pool._database, database)
+
+    def test_snapshot_execute_sql(self):
+        api = _FauxAsyncSpannerAPI(
+            streams=[
+                [
+                    _make_partial_result_set(
+                        ["Phr"], metadata=_make_metadata(), chunked_value=True
+                    ),
+                    _make_partial_result_set(["ed", "32", "Bharney", "31"]),
+                ]
+            ]
+        )
+        database = self._make_one(api)
+
+        async def _query():
+            async with database.snapshot() as snapshot:
+                return await snapshot.execute_sql(SQL_QUERY).to_list()
+
+        rows = _run(_query())
+
+        self.assertEqual(rows, [["Phred", 32], ["Bharney", 31]])
+        (request,) = api._stream_requests
+        self.assertEqual(request.sql, SQL_QUERY)
+        self.assertTrue(request.transaction.single_use.read_only.strong)
+        self.assertEqual(database._pool._get_queue().qsize(), 1)
+
+    def test_snapshot_execute_sql_resumes_after_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        api = _FauxAsyncSpannerAPI(
+            streams=[
+                [
+                    _make_partial_result_set(
+                        ["Phred", "32"],
+                        metadata=_make_metadata(),
+                        resume_token=RESUME_TOKEN,
+                    ),
+                    _make_partial_result_set(["Lost", "0"]),
+                    ServiceUnavailable("testing"),
+                ],
+                [_make_partial_result_set(["Bharney", "31"])],
+            ]
+        )
+        database = self._make_one(api)
+
+        async def _query():
+            async with database.snapshot() as snapshot:
+                return [row async for row in snapshot.execute_sql(SQL_QUERY)]
+
+        rows = _run(_query())
+
+        self.assertEqual(rows, [["Phred", 32], ["Bharney", 31]])
+        first, second = api._stream_requests
+        self.assertEqual(first.resume_token, b"")
+        self.assertEqual(second.resume_token, RESUME_TOKEN)
+
+    def test_snapshot_execute_sql_w_flushed_buffer_raises(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud.spanner_v1.snapshot import ResumeBufferPolicy
+
+        api = _FauxAsyncSpannerAPI(
+            streams=[
+                [
+                    _make_partial_result_set(["Phred", "32"], _make_metadata()),
+                    _make_partial_result_set(["Bharney", "31"]),
+                    ServiceUnavailable("testing"),
+                ],
+            ]
+        )
+        database = self._make_one(api)
+        rows = []
+
+        async def _query():
+            policy = ResumeBufferPolicy(max_items=1)
+            async with database.snapshot() as snapshot:
+                async for row in snapshot.execute_sql(SQL_QUERY, buffer_policy=policy):
+                    rows.append(row)
+
+        with self.assertRaises(ServiceUnavailable):
+            _run(_query())
+
+        self.assertEqual(rows, [["Phred", 32], ["Bharney", 31]])
+        self.assertEqual(len(api._stream_requests), 1)
+
+    def test_snapshot_one(self):
+        api = _FauxAsyncSpannerAPI(
+            streams=[[_make_partial_result_set(["Phred", "32"], _make_metadata())]]
+        )
+        database = self._make_one(api)
+
+        async def _query():
+            async with database.snapshot() as snapshot:
+                return await snapshot.execute_sql(SQL_QUERY).one()
+
+        self.assertEqual(_run(_query()), ["Phred", 32])
+
+    def test_snapshot_checkout_recreates_missing_session(self):
+        from google.cloud.exceptions import NotFound
+
+        api = _FauxAsyncSpannerAPI()
+        database = self._make_one(api)
+
+        async def _missing_session(name, metadata):
+            raise NotFound("testing")
+
+        api.get_session = _missing_session
+
+        async def _query():
+            async with database.snapshot():
+                raise NotFound("testing")
+
+        with self.assertRaises(NotFound):
+            _run(_query())
+
+        session = database._pool._get_queue().get_nowait()
+        self.assertEqual(session.session_id, "2")
+
+    def test_batch_commits_on_exit(self):
+        api = _FauxAsyncSpannerAPI()
+        database = self._make_one(api)
+
+        async def _write():
+            async with database.batch() as batch:
+                batch.insert("citizens", ["name", "age"], [["Phred", 32]])
+            return batch
+
+        batch = _run(_write())
+
+        self.assertIsNotNone(batch.committed)
+        (request,) = api._commit_requests
+        self.assertEqual(len(request.mutations), 1)
+        self.assertTrue(request.single_use_transaction.read_write is not None)
+
+    def test_batch_skips_commit_on_error(self):
+        api = _FauxAsyncSpannerAPI()
+        database = self._make_one(api)
+
+        async def _write():
+            async with database.batch() as batch:
+                batch.insert("citizens", ["name", "age"], [["Phred", 32]])
+                raise ValueError("testing")
+
+        with self.assertRaises(ValueError):
+            _run(_write())
+
+        self.assertEqual(api._commit_requests, [])
+        self.assertEqual(database._pool._get_queue().qsize(), 1)
+
+    def test_run_in_transaction_retries_aborted_commit(self):
+        from google.api_core.exceptions import Aborted
+
+        api = _FauxAsyncSpannerAPI(commit_errors=[_make_rpc_error(Aborted)])
+        database = self._make_one(api)
+        called_with = []
+
+        async def _unit_of_work(transaction, delta):
+            called_with.append(transaction)
+            return await transaction.execute_update(DML) + delta
+
+        result = _run(database.run_in_transaction(_unit_of_work, 10))
+
+        self.assertEqual(result, 11)
+        self.assertEqual(len(called_with), 2)
+        self.assertEqual(len(api._commit_requests), 2)
+        self.assertEqual(api._commit_requests[1].transaction_id, TXN_ID)
+
+    def test_run_in_transaction_rolls_back_on_error(self):
+        api = _FauxAsyncSpannerAPI()
+        database = self._make_one(api)
+
+        async def _unit_of_work(transaction):
+            await transaction.execute_update(DML)
+            raise ValueError("testing")
+
+        with self.assertRaises(ValueError):
+            _run(database.run_in_transaction(_unit_of_work))
+
+        self.assertEqual(api._commit_requests, [])
+        self.assertEqual(api._rollbacks, [(DATABASE_NAME + "/sessions/1", TXN_ID)])
+
+    def test_run_in_transaction_nested(self):
+        database = self._make_one(_FauxAsyncSpannerAPI())
+
+        async def _nested(transaction):
+            await database.run_in_transaction(_nested)
+
+        with self.assertRaises(RuntimeError):
+            _run(database.run_in_transaction(_nested))
+
+    def test_close(self):
+        api = _FauxAsyncSpannerAPI()
+        api.transport = mock.Mock(spec=["close"])
+        api.transport.close = mock.AsyncMock()
+        database = self._make_one(api)
+
+        async def _use_and_close():
+            async with database.snapshot():
+                pass
+            await database.close()
+
+        _run(_use_and_close())
+
+        self.assertEqual(api._deleted, [DATABASE_NAME + "/sessions/1"])
+        api.transport.close.assert_awaited_once_with()
+        self.assertIsNone(database._spanner_api)
+
+
+class TestAsyncTransaction(OpenTelemetryBase):
+    def _make_session(self, api):
+        from google.cloud.spanner_v1.aio import AsyncDatabase
+
+        database = AsyncDatabase(_Database())
+        database._spanner_api = api
+        session = database.session()
+        session._session_id = "session-id"
+        return session
+
+    def test_concurrent_statements_begin_once(self):
+        api = _FauxAsyncSpannerAPI()
+        transaction = self._make_session(api).transaction()
+
+        async def _updates():
+            return await asyncio.gather(
+                transaction.execute_update(DML), transaction.execute_update(DML)
+            )
+
+        self.assertEqual(_run(_updates()), [1, 1])
+        first, second = api._execute_sql_requests
+        self.assertIn("begin", first.transaction)
+        self.assertEqual(second.transaction.id, TXN_ID)
+        self.assertEqual(transaction._transaction_id, TXN_ID)
+
+    def test_execute_sql_begins_inline(self):
+        api = _FauxAsyncSpannerAPI(
+            streams=[
+                [
+                    _make_partial_result_set(
+                        ["Phred", "32"], metadata=_make_metadata(TXN_ID)
+                    )
+                ]
+            ]
+        )
+        transaction = self._make_session(api).transaction()
+
+        async def _query_then_update():
+            rows = await transaction.execute_sql(SQL_QUERY).to_list()
+            await transaction.execute_update(DML)
+            return rows
+
+        self.assertEqual(_run(_query_then_update()), [["Phred", 32]])
+        (stream_request,) = api._stream_requests
+        self.assertIn("begin", stream_request.transaction)
+        (update_request,) = api._execute_sql_requests
+        self.assertEqual(update_request.transaction.id, TXN_ID)
+
+    def test_sync_context_manager_rejected(self):
+        transaction = self._make_session(_FauxAsyncSpannerAPI()).transaction()
+
+        with self.assertRaises(TypeError):
+            with transaction:
+                pass
+
+
+class TestAsyncStreamedResultSet(OpenTelemetryBase):
+    def test_sync_iteration_rejected(self):
+        from google.cloud.spanner_v1.aio import AsyncStreamedResultSet
+
+        streamed = AsyncStreamedResultSet(_AsyncStream([]).__aiter__())
+
+        with self.assertRaises(TypeError):
+            list(streamed)
+
+    def test_one_or_none_multiple_rows(self):
+        from google.cloud.spanner_v1.aio import AsyncStreamedResultSet
+
+        stream = _AsyncStream(
+            [
+                _make_partial_result_set(
+                    ["Phred", "32", "Bharney", "31"], _make_metadata()
+                )
+            ]
+        )
+        streamed = AsyncStreamedResultSet(stream.__aiter__())
+
+        with self.assertRaises(ValueError):
+            _run(streamed.one_or_none())
+
+
+class TestAsyncSessionPool(OpenTelemetryBase):
+    def test_get_waits_for_put(self):
+        from google.cloud.spanner_v1.aio import AsyncDatabase
+        from google.cloud.spanner_v1.aio import AsyncSessionPool
+
+        pool = AsyncSessionPool(size=1)
+        database = AsyncDatabase(_Database(), pool=pool)
+        database._spanner_api = _FauxAsyncSpannerAPI()
+
+        async def _checkout():
+            session = await pool.get()
+            with self.assertRaises(asyncio.TimeoutError):
+                await pool.get(timeout=0.01)
+            waiter = asyncio.ensure_future(pool.get())
+            await asyncio.sleep(0)
+            pool.put(session)
+            return session, await waiter
+
+        session, again = _run(_checkout())
+
+        self.assertIs(again, session)
+        self.assertEqual(database._spanner_api._created, 1)
+
+    def test_session_checkout(self):
+        from google.cloud.spanner_v1.aio import AsyncDatabase
+        from google.cloud.spanner_v1.aio import AsyncSessionPool
+
+        pool = AsyncSessionPool(size=2, labels={"foo": "bar"})
+        database = AsyncDatabase(_Database(), pool=pool)
+        database._spanner_api = _FauxAsyncSpannerAPI()
+
+        async def _checkout():
+            async with pool.session() as session:
+                self.assertEqual(pool._get_queue().qsize(), 0)
+            return session
+
+        session = _run(_checkout())
+
+        self.assertEqual(session.labels, {"foo": "bar"})
+        self.assertIs(pool._get_queue().get_nowait(), session)
@@ -14,6 +14,8 @@
 
 
 import unittest
+
+import grpc
 from tests._helpers import OpenTelemetryBase, StatusCode
 from google.cloud.spanner_v1 import RequestOptions
 
@@ -141,6 +143,44 @@ class Test_BatchBase(_BaseTest):
         self.assertEqual(write.columns, COLUMNS)
         self._compare_values(write.values, VALUES)
 
+    def test_insert_w_column_types(self):
+        from google.cloud.spanner_v1 import param_types
+
+        session = _Session()
+        base = self._make_one(session)
+        column_types = {"age": param_types.INT64, "email": param_types.STRING}
+
+        base.insert(TABLE_NAME, COLUMNS, VALUES, column_types=column_types)
+        base.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        typed, untyped = base._mutations
+        self.assertEqual(typed, untyped)
+        self._compare_values(typed.insert.values, VALUES)
+
+    def test_replace_w_columnar_values(self):
+        from google.cloud.spanner_v1 import param_types
+
+        session = _Session()
+        base = self._make_one(session)
+        columnar = {
+            column: [row[index] for row in VALUES]
+            for index, column in enumerate(COLUMNS)
+        }
+        schema = [
+            param_types.StructField(column, param_types.STRING)
+            for column in COLUMNS[:-1]
+        ] + [param_types.StructField("age", param_types.INT64)]
+
+        base.replace(TABLE_NAME, COLUMNS, columnar, column_types=schema)
+        base.replace(TABLE_NAME, COLUMNS, columnar)
+        base.replace(TABLE_NAME, COLUMNS, VALUES)
+
+        typed, untyped, rows = base._mutations
+        self.assertEqual(typed, rows)
+        self.assertEqual(untyped, rows)
+        self.assertEqual(typed.replace.table, TABLE_NAME)
+        self._compare_values(typed.replace.values, VALUES)
+
     def test_delete(self):
         from google.cloud.spanner_v1 import Mutation
         from google.cloud.spanner_v1.keyset import KeySet
@@ -332,6 +372,118 @@ class TestBatch(_BaseTest, OpenTelemetryBase):
         with self.assertRaises(ValueError):
             self._test_commit_with_request_options(request_options=request_options)
 
+    def _make_async_batch(self, api):
+        database = _Database()
+        database.spanner_api = api
+        batch = self._make_one(_Session(database))
+        batch.insert(TABLE_NAME, COLUMNS, VALUES)
+        return batch
+
+    def test_commit_async_already_committed(self):
+        batch = self._make_async_batch(_FauxSpannerAPI())
+        batch.committed = object()
+
+        with self.assertRaises(ValueError):
+            batch.commit_async()
+
+    def test_commit_async_ok(self):
+        import datetime
+        from google.cloud.spanner_v1 import CommitResponse
+        from google.cloud._helpers import UTC
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        response = CommitResponse(commit_timestamp=_datetime_to_pb_timestamp(now))
+        transport = _FauxCommitTransport()
+        batch = self._make_async_batch(_FauxSpannerAPI(transport=transport))
+
+        future = batch.commit_async(return_commit_stats=True, timeout=5)
+
+        self.assertFalse(future.done())
+        self.assertIsNone(batch.committed)
+        ((request, metadata, timeout),) = transport.requests
+        self.assertEqual(request.session, self.SESSION_NAME)
+        self.assertEqual(request.mutations, batch._mutations)
+        self.assertTrue(request.return_commit_stats)
+        self.assertEqual(timeout, 5)
+        self.assertEqual(
+            metadata,
+            [
+                ("google-cloud-resource-prefix", "testing"),
+                ("x-goog-spanner-route-to-leader", "true"),
+                ("x-goog-request-params", "session=" + self.SESSION_NAME),
+            ],
+        )
+
+        transport.calls[0].complete(response)
+
+        self.assertEqual(future.result(), now)
+        self.assertEqual(batch.committed, now)
+        self.assertSpanAttributes(
+            "CloudSpanner.Commit", attributes=dict(BASE_ATTRIBUTES, num_mutations=1)
+        )
+
+    def test_commit_async_w_client_defaults(self):
+        from google.api_core import gapic_v1
+        from google.api_core.gapic_v1.client_info import ClientInfo
+
+        transport = _FauxCommitTransport()
+        client_info = ClientInfo(client_library_version="1.2.3")
+        transport._wrapped_methods = {
+            transport.commit: gapic_v1.method.wrap_method(
+                transport.commit.future,
+                default_timeout=42.0,
+                client_info=client_info,
+            )
+        }
+        batch = self._make_async_batch(_FauxSpannerAPI(transport=transport))
+
+        batch.commit_async()
+        batch.committed = None
+        batch.commit_async(timeout=None)
+
+        (_, metadata, timeout), (_, _, no_timeout) = transport.requests
+        self.assertEqual(timeout, 42.0)
+        self.assertIsNone(no_timeout)
+        self.assertEqual(metadata[-1], client_info.to_grpc_metadata())
+
+    def test_commit_async_grpc_error(self):
+        from google.api_core.exceptions import Aborted
+
+        transport = _FauxCommitTransport()
+        batch = self._make_async_batch(_FauxSpannerAPI(transport=transport))
+
+        future = batch.commit_async()
+        transport.calls[0].complete(error=_FauxRpcError())
+
+        self.assertIsInstance(future.exception(), Aborted)
+        self.assertIsNone(batch.committed)
+        self.assertSpanAttributes(
+            "CloudSpanner.Commit",
+            status=StatusCode.ERROR,
+            attributes=dict(BASE_ATTRIBUTES, num_mutations=1),
+        )
+
+    def test_commit_async_wo_future_api(self):
+        import datetime
+        from google.api_core.exceptions import Unknown
+        from google.cloud.spanner_v1 import CommitResponse
+        from google.cloud._helpers import UTC
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        response = CommitResponse(commit_timestamp=_datetime_to_pb_timestamp(now))
+        api = _FauxSpannerAPI(_commit_response=response)
+        batch = self._make_async_batch(api)
+
+        future = batch.commit_async()
+
+        self.assertEqual(future.result(timeout=0), now)
+        self.assertEqual(api._committed[1], batch._mutations)
+
+        failing = self._make_async_batch(_FauxSpannerAPI(_rpc_error=True))
+        self.assertIsInstance(failing.commit_async().exception(timeout=0), Unknown)
+
     def test_context_mgr_already_committed(self):
         import datetime
         from google.cloud._helpers import UTC
@@ -414,6 +566,132 @@ class TestBatch(_BaseTest, OpenTelemetryBase):
         self.assertEqual(len(batch._mutations), 1)
 
 
+class TestMutationGroups(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.batch import MutationGroups
+
+        return MutationGroups
+
+    def _make_one(self, database):
+        return self._getTargetClass()(database)
+
+    def _make_groups(self, database, count):
+        groups = self._make_one(database)
+        for index in range(count):
+            group = groups.group()
+            group.insert(TABLE_NAME, COLUMNS, [VALUES[index % 2]])
+            group.update("counts", ["table", "rows"], [[TABLE_NAME, index]])
+        return groups
+
+    def test_mutation_groups_factory(self):
+        from google.cloud.spanner_v1.database import Database
+
+        database = Database.__new__(Database)
+        groups = database.mutation_groups()
+        self.assertIsInstance(groups, self._getTargetClass())
+        self.assertEqual(len(groups), 0)
+
+    def test_batch_write(self):
+        import datetime
+
+        database = _GroupsDatabase()
+        groups = self._make_groups(database, 3)
+
+        results = sorted(groups.batch_write())
+
+        self.assertEqual([result.indexes for result in results], [[0], [1], [2]])
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertIsInstance(result.commit_timestamp, datetime.datetime)
+        self.assertEqual(len(database.commits), 3)
+        for mutations in database.commits:
+            self.assertEqual(len(mutations), 2)
+
+    def test_batch_write_retry_failed_groups(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.spanner_v1 import RequestOptions
+
+        database = _GroupsDatabase(failing={1})
+        groups = self._make_groups(database, 3)
+        options = RequestOptions(transaction_tag="tag")
+
+        results = list(groups.batch_write(request_options=options, max_workers=1))
+
+        failed = [result for result in results if result.error is not None]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].indexes, [1])
+        self.assertIsNone(failed[0].commit_timestamp)
+        self.assertIsInstance(failed[0].error, InvalidArgument)
+        self.assertEqual(database.request_options[0]["transaction_tag"], "tag")
+
+        database.failing.clear()
+        (retried,) = groups.batch_write(indexes=failed[0].indexes)
+
+        self.assertIsNone(retried.error)
+        self.assertEqual(database.commits[-1], groups[1]._mutations)
+
+    def test_batch_write_w_empty_group(self):
+        groups = self._make_groups(_GroupsDatabase(), 1)
+        groups.group()
+
+        with self.assertRaises(ValueError):
+            groups.batch_write()
+
+    def test_batch_write_w_invalid_max_workers(self):
+        groups = self._make_groups(_GroupsDatabase(), 1)
+
+        with self.assertRaises(ValueError):
+            groups.batch_write(max_workers=0)
+
+    def test_batch_write_wo_groups(self):
+        self.assertEqual(list(self._make_one(_GroupsDatabase()).batch_write()), [])
+
+
+class _GroupsBatch(object):
+    committed = None
+
+    def __init__(self):
+        self._mutations = []
+
+
+class _GroupsBatchCheckout(object):
+    def __init__(self, database):
+        self._database = database
+        self._batch = _GroupsBatch()
+
+    def __enter__(self):
+        return self._batch
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._batch.committed = self._database._commit(self._batch._mutations)
+
+
+class _GroupsDatabase(object):
+    def __init__(self, failing=()):
+        import threading
+
+        self.commits = []
+        self.request_options = []
+        self.failing = set(failing)
+        self._lock = threading.Lock()
+
+    def batch(self, request_options=None):
+        self.request_options.append(request_options)
+        return _GroupsBatchCheckout(self)
+
+    def _commit(self, mutations):
+        import datetime
+        from google.api_core.exceptions import InvalidArgument
+
+        with self._lock:
+            rows = mutations[1].update.values
+            if int(rows[0][1]) in self.failing:
+                raise InvalidArgument("invalid")
+            self.commits.append(list(mutations))
+            return datetime.datetime.now(datetime.timezone.utc)
+
+
 class _Session(object):
     def __init__(self, database=None, name=TestBatch.SESSION_NAME):
         self._database = database
@@ -425,6 +703,54 @@ class _Database(object):
     _route_to_leader_enabled = True
 
 
+class _FauxRpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.ABORTED
+
+    def details(self):
+        return "aborted"
+
+    def trailing_metadata(self):
+        return None
+
+
+class _FauxCall(object):
+    def __init__(self):
+        self._callbacks = []
+        self._response = self._error = None
+
+    def add_done_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def result(self):
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+    def complete(self, response=None, error=None):
+        self._response, self._error = response, error
+        for callback in self._callbacks:
+            callback(self)
+
+
+class _FauxCommitStub(object):
+    def __init__(self, transport):
+        self._transport = transport
+
+    def future(self, request, metadata=None, timeout=None):
+        call = _FauxCall()
+        self._transport.requests.append((request, metadata, timeout))
+        self._transport.calls.append(call)
+        return call
+
+
+class _FauxCommitTransport(object):
+    def __init__(self):
+        self.requests = []
+        self.calls = []
+        self.commit = _FauxCommitStub(self)
+
+
 class _FauxSpannerAPI:
 
     _create_instance_conflict = False
@@ -439,6 +765,7 @@ class _FauxSpannerAPI:
         self,
         request=None,
         metadata=None,
+        timeout=None,
     ):
         from google.api_core.exceptions import Unknown
 
@@ -0,0 +1,258 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "age"]
+
+
+def _rows(count, start=0):
+    return [["person%d@example.com" % index, index] for index in range(start, count)]
+
+
+class TestBulkMutationWriter(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkMutationWriter
+
+        return BulkMutationWriter
+
+    def _make_one(self, database, **kwargs):
+        kwargs.setdefault("retry", None)
+        return self._getTargetClass()(database, **kwargs)
+
+    @staticmethod
+    def _written_rows(database):
+        rows = []
+        for mutations in database.commits:
+            for mutation in mutations:
+                write = mutation.insert_or_update or mutation.insert
+                rows.extend(list(row) for row in write.values)
+        return sorted(rows, key=lambda row: int(row[1]))
+
+    def test_ctor_w_invalid_limits(self):
+        database = _Database()
+        for kwargs in (
+            {"max_mutations": 0},
+            {"max_bytes": 0},
+            {"max_workers": 0},
+            {"max_pending_chunks": 0},
+        ):
+            with self.assertRaises(ValueError):
+                self._make_one(database, **kwargs)
+
+    def test_bulk_writer_factory(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkMutationWriter
+        from google.cloud.spanner_v1.database import Database
+
+        database = Database.__new__(Database)
+        writer = database.bulk_writer(max_workers=2)
+        self.assertIsInstance(writer, BulkMutationWriter)
+        self.assertIs(writer._database, database)
+        writer.close()
+
+    def test_splits_by_mutation_count(self):
+        database = _Database()
+        # Two columns plus one index:  three mutations per row.
+        writer = self._make_one(
+            database, max_mutations=30, index_counts={TABLE_NAME: 1}
+        )
+
+        with writer:
+            writer.insert_or_update(TABLE_NAME, COLUMNS, _rows(15))
+            writer.insert_or_update(TABLE_NAME, COLUMNS, _rows(25, 15))
+
+        self.assertEqual(sorted(_commit_sizes(database)), [5, 10, 10], database.commits)
+        self.assertEqual(writer.commit_count, 3)
+        self.assertEqual(writer.mutation_count, 75)
+        self.assertEqual(self._written_rows(database), _stringify(_rows(25)))
+
+    def test_splits_by_size(self):
+        from google.cloud.spanner_v1 import Mutation
+
+        database = _Database()
+        writer = self._make_one(database, max_bytes=1000)
+
+        with writer:
+            writer.insert(TABLE_NAME, COLUMNS, _rows(100))
+
+        self.assertGreater(len(database.commits), 2)
+        for mutations in database.commits:
+            size = sum(Mutation.pb(mutation).ByteSize() for mutation in mutations)
+            self.assertLessEqual(size, 1000)
+        self.assertEqual(self._written_rows(database), _stringify(_rows(100)))
+
+    def test_combines_small_mutations(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = _Database()
+        writer = self._make_one(database)
+
+        writer.insert(TABLE_NAME, COLUMNS, _rows(1))
+        writer.update(TABLE_NAME, COLUMNS, _rows(2, 1))
+        writer.delete(TABLE_NAME, KeySet(keys=[["a"], ["b"]]))
+        self.assertEqual(database.commits, [])
+        writer.close()
+
+        (mutations,) = database.commits
+        self.assertEqual(len(mutations), 3)
+        self.assertEqual(writer.mutation_count, 2 + 2 + 2)
+
+    def test_delete_counts_index_entries(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = _Database()
+        writer = self._make_one(database, max_mutations=4, index_counts={TABLE_NAME: 1})
+
+        writer.delete(TABLE_NAME, KeySet(keys=[["a"], ["b"]]))
+        writer.delete(TABLE_NAME, KeySet(all_=True))
+        writer.close()
+
+        self.assertEqual(_commit_sizes(database), [1, 1])
+
+    def test_retries_failed_chunk(self):
+        from google.api_core.exceptions import Aborted
+        from google.api_core.retry import Retry
+        from google.api_core.retry import if_exception_type
+
+        database = _Database(errors=[Aborted("retry me")])
+        retry = Retry(initial=0.001, predicate=if_exception_type(Aborted))
+        writer = self._make_one(database, retry=retry)
+
+        with writer:
+            writer.insert_or_update(TABLE_NAME, COLUMNS, _rows(3))
+
+        self.assertEqual(database.attempts, 2)
+        self.assertEqual(_commit_sizes(database), [3])
+
+    def test_reports_failed_chunks(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.spanner_v1.bulk_writer import BulkWriteError
+
+        error = InvalidArgument("too big")
+        database = _Database(errors=[error])
+        writer = self._make_one(database, max_mutations=4, max_workers=1)
+        writer.insert_or_update(TABLE_NAME, COLUMNS, _rows(4))
+
+        with self.assertRaises(BulkWriteError) as raised:
+            writer.flush()
+
+        (failure,) = raised.exception.failures
+        self.assertIs(failure.error, error)
+        self.assertEqual(len(failure.mutations), 1)
+        self.assertEqual(_commit_sizes(database), [2])
+
+        # The failed mutations can be written again.
+        writer.write_mutations(failure.mutations)
+        writer.close()
+        self.assertEqual(self._written_rows(database), _stringify(_rows(4)))
+
+    def test_write_after_close(self):
+        writer = self._make_one(_Database())
+        writer.close()
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, _rows(1))
+
+    def test_exit_w_error_drops_pending(self):
+        database = _Database()
+
+        with self.assertRaises(KeyError):
+            with self._make_one(database) as writer:
+                writer.insert(TABLE_NAME, COLUMNS, _rows(2))
+                raise KeyError()
+
+        self.assertEqual(database.commits, [])
+
+    def test_bounds_pending_chunks(self):
+        database = _Database(blocked=True)
+        writer = self._make_one(
+            database, max_mutations=2, max_workers=1, max_pending_chunks=1
+        )
+        done = threading.Event()
+
+        def _produce():
+            writer.insert_or_update(TABLE_NAME, COLUMNS, _rows(4))
+            done.set()
+
+        producer = threading.Thread(target=_produce)
+        producer.start()
+
+        # The first chunk is committing, the second waiting:  the producer
+        # blocks on the third.
+        self.assertFalse(done.wait(0.2))
+        database.unblock.set()
+        self.assertTrue(done.wait(5))
+        producer.join()
+        writer.close()
+        self.assertEqual(_commit_sizes(database), [1, 1, 1, 1])
+
+
+def _stringify(rows):
+    return [[email, str(age)] for email, age in rows]
+
+
+def _commit_sizes(database):
+    sizes = []
+    for mutations in database.commits:
+        size = 0
+        for mutation in mutations:
+            write = mutation.insert_or_update or mutation.insert or mutation.update
+            size += len(write.values) or 1
+        sizes.append(size)
+    return sizes
+
+
+class _Batch(object):
+    def __init__(self):
+        self._mutations = []
+
+
+class _BatchCheckout(object):
+    def __init__(self, database):
+        self._database = database
+        self._batch = _Batch()
+
+    def __enter__(self):
+        return self._batch
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._database._commit(self._batch._mutations)
+
+
+class _Database(object):
+    def __init__(self, errors=(), blocked=False):
+        self.commits = []
+        self.attempts = 0
+        self.request_options = []
+        self._errors = list(errors)
+        self._lock = threading.Lock()
+        self.unblock = threading.Event()
+        if not blocked:
+            self.unblock.set()
+
+    def batch(self, request_options=None):
+        self.request_options.append(request_options)
+        return _BatchCheckout(self)
+
+    def _commit(self, mutations):
+        self.unblock.wait()
+        with self._lock:
+            self.attempts += 1
+            if self._errors:
+                raise self._errors.pop(0)
+            self.commits.append(list(mutations))
@@ -0,0 +1,215 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+
+def _make_field(name, type_code, element_type_code=None):
+    from google.cloud.spanner_v1 import StructType
+    from google.cloud.spanner_v1 import Type
+
+    if element_type_code is not None:
+        type_ = Type(code=type_code, array_element_type=Type(code=element_type_code))
+    else:
+        type_ = Type(code=type_code)
+    return StructType.Field(name=name, type_=type_)
+
+
+def _make_value_pbs(values):
+    from google.cloud.spanner_v1._helpers import _make_value_pb
+
+    return [_make_value_pb(value) for value in values]
+
+
+class Test_make_column_decoders(unittest.TestCase):
+    def _call_fut(self, fields, values, decode_bytes=False):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1.columnar import _make_column_decoders
+
+        decoders = _make_column_decoders(StructType(fields=fields), decode_bytes)
+        self.assertEqual(len(decoders), len(fields))
+        return decoders[0](_make_value_pbs(values))
+
+    def test_int64(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._call_fut([_make_field("age", TypeCode.INT64)], [1, -2, 3])
+        self.assertEqual(column.name, "age")
+        self.assertEqual(column.values.typecode, "q")
+        self.assertEqual(list(column.values), [1, -2, 3])
+        self.assertIsNone(column.nulls)
+        self.assertEqual(column.null_count, 0)
+        self.assertEqual(column.to_list(), [1, -2, 3])
+
+    def test_int64_w_nulls(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._call_fut([_make_field("age", TypeCode.INT64)], [1, None, 3])
+        self.assertEqual(list(column.values), [1, 0, 3])
+        self.assertEqual(list(column.nulls), [0, 1, 0])
+        self.assertEqual(column.null_count, 1)
+        self.assertEqual(column.to_list(), [1, None, 3])
+        self.assertIsNone(column[-2])
+
+    def test_float64(self):
+        import math
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = [1.5, float("nan"), float("inf"), None]
+        column = self._call_fut([_make_field("f", TypeCode.FLOAT64)], values)
+        self.assertEqual(column.values.typecode, "d")
+        found = column.to_list()
+        self.assertEqual(found[0], 1.5)
+        self.assertTrue(math.isnan(found[1]))
+        self.assertEqual(found[2], float("inf"))
+        self.assertIsNone(found[3])
+
+    def test_bool(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._call_fut([_make_field("b", TypeCode.BOOL)], [True, False, None])
+        self.assertEqual(column.values.typecode, "b")
+        self.assertEqual(column.to_list(), [True, False, None])
+        self.assertIs(column[0], True)
+
+    def test_string(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = ["abc", "", None, "été"]
+        column = self._call_fut([_make_field("s", TypeCode.STRING)], values)
+        self.assertEqual(len(column), 4)
+        self.assertEqual(bytes(column.values), "abcété".encode("utf8"))
+        self.assertEqual(list(column.offsets), [0, 3, 3, 3, 8])
+        self.assertEqual(column.to_list(), values)
+
+    def test_bytes(self):
+        import base64
+        from google.cloud.spanner_v1 import TypeCode
+
+        raw = base64.b64encode(b"\x00\x01")
+        column = self._call_fut([_make_field("b", TypeCode.BYTES)], [raw, None])
+        self.assertEqual(column.to_list(), [raw, None])
+
+    def test_bytes_w_decode_bytes(self):
+        from google.cloud.spanner_v1 import RawBytes
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = [b"\x00\x01", None, b"", b"\xff"]
+        column = self._call_fut(
+            [_make_field("b", TypeCode.BYTES)],
+            [None if value is None else RawBytes(value) for value in values],
+            decode_bytes=True,
+        )
+        self.assertEqual(bytes(column.values), b"\x00\x01\xff")
+        self.assertEqual(list(column.offsets), [0, 2, 2, 2, 3])
+        self.assertEqual(column.to_list(), values)
+
+    def test_array_of_bytes_w_decode_bytes(self):
+        import base64
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = [[base64.b64encode(b"\x00"), None]]
+        column = self._call_fut(
+            [_make_field("a", TypeCode.ARRAY, TypeCode.BYTES)],
+            values,
+            decode_bytes=True,
+        )
+        self.assertEqual(column.to_list(), [[b"\x00", None]])
+
+    def test_other_types(self):
+        import datetime
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = [datetime.date(2023, 1, 2), None]
+        column = self._call_fut([_make_field("d", TypeCode.DATE)], values)
+        self.assertEqual(column.values, values)
+        self.assertIsNone(column.nulls)
+        self.assertEqual(column.to_list(), values)
+
+    def test_array(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        values = [[1, 2], None, []]
+        column = self._call_fut(
+            [_make_field("a", TypeCode.ARRAY, TypeCode.INT64)], values
+        )
+        self.assertEqual(column.to_list(), values)
+
+
+class TestColumn(unittest.TestCase):
+    def _decode(self, type_code, values):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1.columnar import _make_column_decoders
+
+        row_type = StructType(fields=[_make_field("c", type_code)])
+        (decoder,) = _make_column_decoders(row_type)
+        return decoder(_make_value_pbs(values))
+
+    def test_extend_fixed_width(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._decode(TypeCode.INT64, [1, 2])
+        column.extend(self._decode(TypeCode.INT64, [None, 4]))
+        column.extend(self._decode(TypeCode.INT64, [5]))
+        self.assertEqual(column.to_list(), [1, 2, None, 4, 5])
+        self.assertEqual(list(column.nulls), [0, 0, 1, 0, 0])
+
+    def test_extend_string(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._decode(TypeCode.STRING, ["ab", None])
+        column.extend(self._decode(TypeCode.STRING, ["cde"]))
+        self.assertEqual(column.to_list(), ["ab", None, "cde"])
+        self.assertEqual(list(column.offsets), [0, 2, 2, 5])
+
+    def test_extend_object(self):
+        import decimal
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._decode(TypeCode.NUMERIC, [decimal.Decimal("1.5")])
+        column.extend(self._decode(TypeCode.NUMERIC, [None]))
+        self.assertEqual(column.to_list(), [decimal.Decimal("1.5"), None])
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_to_numpy_fixed_width(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._decode(TypeCode.FLOAT64, [1.0, 2.5])
+        result = column.to_numpy()
+        self.assertEqual(result.dtype, numpy.float64)
+        self.assertEqual(result.tolist(), [1.0, 2.5])
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_to_numpy_w_nulls(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._decode(TypeCode.BOOL, [True, None])
+        result = column.to_numpy()
+        self.assertIsInstance(result, numpy.ma.MaskedArray)
+        self.assertEqual(result.tolist(), [True, None])
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_to_numpy_string(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        column = self._decode(TypeCode.STRING, ["a", None])
+        result = column.to_numpy()
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(result.tolist(), ["a", None])
@@ -21,6 +21,12 @@ from google.cloud.spanner_v1.param_types import INT64
 from google.api_core.retry import Retry
 
 from google.cloud.spanner_v1 import RequestOptions
+from google.cloud.spanner_v1.pool import AbstractSessionPool
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 
 DML_WO_PARAM = """
 DELETE FROM citizens
@@ -1081,6 +1087,22 @@ class TestDatabase(_BaseTest):
         else:
             self.assertEqual(api.execute_streaming_sql.call_count, 1)
 
+    def test_default_retry_backoff_matches_pdml_policy(self):
+        from google.api_core.retry import Retry
+        from google.cloud.spanner_v1.database import DEFAULT_PDML_RETRY_POLICY
+        from google.cloud.spanner_v1.database import DEFAULT_RETRY_BACKOFF
+
+        self.assertIsInstance(DEFAULT_RETRY_BACKOFF, Retry)
+        self.assertEqual(
+            DEFAULT_RETRY_BACKOFF._initial, DEFAULT_PDML_RETRY_POLICY.initial
+        )
+        self.assertEqual(
+            DEFAULT_RETRY_BACKOFF._maximum, DEFAULT_PDML_RETRY_POLICY.maximum
+        )
+        self.assertEqual(
+            DEFAULT_RETRY_BACKOFF._multiplier, DEFAULT_PDML_RETRY_POLICY.multiplier
+        )
+
     def test_execute_partitioned_dml_wo_params(self):
         self._execute_partitioned_dml_helper(dml=DML_WO_PARAM)
 
@@ -1124,6 +1146,43 @@ class TestDatabase(_BaseTest):
     def test_execute_partitioned_dml_wo_params_retry_aborted(self):
         self._execute_partitioned_dml_helper(dml=DML_WO_PARAM, retried=True)
 
+    def test_execute_partitioned_dml_w_session_not_found(self):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetStats
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        stats_pb = ResultSetStats(row_count_lower_bound=2)
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        expired = _Session(name="expired")
+        pool.put(expired)
+        session = _Session()
+        session.create = mock.Mock()
+        pool._new_session = mock.Mock(return_value=session)
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+        api = database._spanner_api = self._make_spanner_api()
+        api.begin_transaction.side_effect = [
+            NotFound("Session not found: expired"),
+            TransactionPB(id=self.TRANSACTION_ID),
+        ]
+        api.execute_streaming_sql.return_value = _MockIterator(
+            PartialResultSet(stats=stats_pb)
+        )
+
+        row_count = database.execute_partitioned_dml(DML_WO_PARAM)
+
+        self.assertEqual(row_count, 2)
+        sessions = [
+            call.kwargs["session"] for call in api.begin_transaction.call_args_list
+        ]
+        self.assertEqual(sessions, ["expired", self.SESSION_NAME])
+        request = api.execute_streaming_sql.call_args.kwargs["request"]
+        self.assertEqual(request.session, self.SESSION_NAME)
+        session.create.assert_called_once_with()
+        self.assertIs(pool._session, session)
+
     def test_session_factory_defaults(self):
         from google.cloud.spanner_v1.session import Session
 
@@ -1241,6 +1300,16 @@ class TestDatabase(_BaseTest):
         self.assertIsNone(batch_txn._read_timestamp)
         self.assertEqual(batch_txn._exact_staleness, duration)
 
+    def test_batch_snapshot_w_multiplexed_pool(self):
+        from google.cloud.spanner_v1.pool import MultiplexedSessionPool
+
+        instance = _Instance(self.INSTANCE_NAME)
+        pool = mock.create_autospec(MultiplexedSessionPool, instance=True)
+        database = self._make_one(self.DATABASE_ID, instance=instance, pool=pool)
+
+        batch_txn = database.batch_snapshot()
+        self.assertIs(batch_txn._session_pool, pool)
+
     def test_run_in_transaction_wo_args(self):
         import datetime
 
@@ -1260,6 +1329,55 @@ class TestDatabase(_BaseTest):
         self.assertEqual(committed, NOW)
         self.assertEqual(session._retried, (_unit_of_work, (), {}))
 
+    def test_run_in_transaction_w_session_not_found(self):
+        import datetime
+        from google.cloud.exceptions import NotFound
+
+        NOW = datetime.datetime.now()
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        expired = _Session()
+        expired.run_in_transaction = mock.Mock(
+            side_effect=NotFound("Session not found: expired")
+        )
+        pool.put(expired)
+        session = _Session()
+        session._committed = NOW
+        pool._new_session = mock.Mock(return_value=session)
+        session.create = mock.Mock()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        _unit_of_work = object()
+
+        committed = database.run_in_transaction(_unit_of_work, timeout_secs=5)
+
+        self.assertEqual(committed, NOW)
+        expired.run_in_transaction.assert_called_once_with(
+            _unit_of_work, timeout_secs=5
+        )
+        self.assertEqual(session._retried, (_unit_of_work, (), {"timeout_secs": 5}))
+        session.create.assert_called_once_with()
+        self.assertIs(pool._session, session)
+
+    def test_run_in_transaction_w_other_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        session = _Session()
+        session.run_in_transaction = mock.Mock(side_effect=NotFound("Table not found"))
+        pool.put(session)
+        pool._new_session = mock.Mock()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        with self.assertRaises(NotFound):
+            database.run_in_transaction(object())
+
+        pool._new_session.assert_not_called()
+        self.assertIs(pool._session, session)
+
     def test_run_in_transaction_w_args(self):
         import datetime
 
@@ -1810,6 +1928,304 @@ class TestBatchCheckout(_BaseTest):
         self.assertIs(pool._session, session)
         self.assertIsNone(batch.committed)
 
+    def test_context_mgr_w_session_not_found(self):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1 import CommitResponse
+
+        database = _Database(self.DATABASE_NAME)
+        api = database.spanner_api = self._make_spanner_client()
+        api.commit.side_effect = [
+            NotFound("Session not found: session-1"),
+            CommitResponse(),
+        ]
+        pool = database._pool = _Pool()
+        session = _Session(database, name="session-1")
+        pool.put(session)
+        new_session = _Session(database, name="session-2")
+        new_session.create = mock.Mock()
+        pool._new_session = mock.Mock(return_value=new_session)
+        checkout = self._make_one(database)
+
+        with checkout as batch:
+            batch.delete("citizens", _keyset())
+
+        sessions = [
+            call.kwargs["request"].session for call in api.commit.call_args_list
+        ]
+        self.assertEqual(sessions, ["session-1", "session-2"])
+        self.assertEqual(len(api.commit.call_args.kwargs["request"].mutations), 1)
+        self.assertIs(batch._session, new_session)
+        self.assertIs(pool._session, new_session)
+
+    def test_context_mgr_w_other_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        database = _Database(self.DATABASE_NAME)
+        api = database.spanner_api = self._make_spanner_client()
+        api.commit.side_effect = NotFound("Table not found")
+        pool = database._pool = _Pool()
+        session = _Session(database)
+        pool.put(session)
+        pool._new_session = mock.Mock()
+        checkout = self._make_one(database)
+
+        with self.assertRaises(NotFound):
+            with checkout:
+                pass
+
+        api.commit.assert_called_once()
+        pool._new_session.assert_not_called()
+        self.assertIs(pool._session, session)
+
+
+class TestCommitPipeline(_BaseTest):
+    def _get_target_class(self):
+        from google.cloud.spanner_v1.database import CommitPipeline
+
+        return CommitPipeline
+
+    def _make_database(self, sessions=2):
+        database = _Database(self.DATABASE_NAME)
+        database._pool = _QueuePool(
+            [_Session(database, name="session-%d" % index) for index in range(sessions)]
+        )
+        return database
+
+    @staticmethod
+    def _patch_commit_async(futures):
+        import concurrent.futures
+        from google.cloud.spanner_v1.batch import Batch
+
+        def _commit_async(batch, **kwargs):
+            future = concurrent.futures.Future()
+            futures.append((batch, kwargs, future))
+            return future
+
+        return mock.patch.object(Batch, "commit_async", _commit_async)
+
+    def _make_one_database(self):
+        from google.cloud.spanner_v1.database import Database
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        return Database(self.DATABASE_ID, instance, pool=_Pool())
+
+    def test_ctor_w_invalid_max_outstanding(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self._make_database(), max_outstanding=0)
+
+    def test_commit_pipeline_factory(self):
+        from google.cloud.spanner_v1.database import CommitPipeline
+
+        database = self._make_one_database()
+        pipeline = database.commit_pipeline(
+            max_outstanding=3, request_options={"transaction_tag": "tag"}
+        )
+        self.assertIsInstance(pipeline, CommitPipeline)
+        self.assertIs(pipeline._database, database)
+        self.assertEqual(pipeline._request_options.transaction_tag, "tag")
+
+    def test_batches_hold_sessions_until_committed(self):
+        from google.cloud.spanner_v1.batch import Batch
+
+        database = self._make_database()
+        pool = database._pool
+        futures = []
+        pipeline = self._make_one(
+            database, request_options={"transaction_tag": self.TRANSACTION_TAG}
+        )
+
+        with self._patch_commit_async(futures):
+            with pipeline.batch() as first:
+                self.assertIsInstance(first, Batch)
+                first.delete("citizens", _keyset())
+            with pipeline.batch() as second:
+                second.delete("citizens", _keyset())
+
+        self.assertEqual(pool.sessions, [])
+        self.assertEqual(len(futures), 2)
+        batch, kwargs, future = futures[0]
+        self.assertIs(batch, first)
+        self.assertEqual(first.transaction_tag, self.TRANSACTION_TAG)
+        self.assertFalse(kwargs["return_commit_stats"])
+        self.assertIs(kwargs["request_options"], pipeline._request_options)
+
+        future.set_result("committed")
+        self.assertEqual(pool.sessions, [first._session])
+        futures[1][2].set_result("committed")
+        pipeline.close()
+        self.assertEqual(len(pool.sessions), 2)
+
+        with self.assertRaises(ValueError):
+            pipeline.batch()
+
+    def test_bounds_outstanding_commits(self):
+        import threading
+
+        database = self._make_database(sessions=3)
+        futures = []
+        pipeline = self._make_one(database, max_outstanding=1)
+        opened = threading.Event()
+
+        with self._patch_commit_async(futures):
+            with pipeline.batch():
+                pass
+
+            def _produce():
+                with pipeline.batch():
+                    opened.set()
+
+            producer = threading.Thread(target=_produce)
+            producer.start()
+            self.assertFalse(opened.wait(0.1))
+            futures[0][2].set_result("committed")
+            self.assertTrue(opened.wait(5))
+            producer.join()
+
+        futures[1][2].set_result("committed")
+        pipeline.close()
+        self.assertEqual(len(database._pool.sessions), 3)
+
+    def test_commit_failure_raised_by_next_batch(self):
+        from google.api_core.exceptions import Aborted
+
+        database = self._make_database()
+        futures = []
+        pipeline = self._make_one(database)
+        error = Aborted("aborted")
+
+        with self._patch_commit_async(futures):
+            with pipeline.batch():
+                pass
+            futures[0][2].set_exception(error)
+
+            with self.assertRaises(Aborted) as raised:
+                pipeline.batch().__enter__()
+
+        self.assertIs(raised.exception, error)
+        self.assertEqual(len(database._pool.sessions), 2)
+        pipeline.flush()
+
+    def test_flush_waits_for_commits(self):
+        import threading
+        from google.api_core.exceptions import Aborted
+
+        database = self._make_database()
+        futures = []
+        pipeline = self._make_one(database)
+
+        with self._patch_commit_async(futures):
+            with pipeline.batch():
+                pass
+
+        timer = threading.Timer(
+            0.05, futures[0][2].set_exception, (Aborted("aborted"),)
+        )
+        timer.start()
+        with self.assertRaises(Aborted):
+            pipeline.flush()
+        timer.join()
+
+    def test_flush_waits_for_sessions_released(self):
+        import threading
+
+        database = self._make_database()
+        pool = database._pool
+        futures = []
+        pipeline = self._make_one(database)
+        releasing = threading.Event()
+        proceed = threading.Event()
+        put = pool.put
+
+        def _slow_put(session):
+            releasing.set()
+            proceed.wait(5)
+            put(session)
+
+        pool.put = _slow_put
+
+        with self._patch_commit_async(futures):
+            with pipeline.batch():
+                pass
+
+        # The future is done once the callback starts releasing the session.
+        completer = threading.Thread(
+            target=futures[0][2].set_result, args=("committed",)
+        )
+        completer.start()
+        self.assertTrue(releasing.wait(5))
+        flushed = threading.Event()
+
+        def _flush():
+            pipeline.flush()
+            flushed.set()
+
+        flusher = threading.Thread(target=_flush)
+        flusher.start()
+        self.assertFalse(flushed.wait(0.1))
+        proceed.set()
+        self.assertTrue(flushed.wait(5))
+        completer.join()
+        flusher.join()
+        self.assertEqual(len(pool.sessions), 2)
+
+    def test_commit_async_failure_not_outstanding(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.spanner_v1.batch import Batch
+
+        database = self._make_database()
+        pipeline = self._make_one(database)
+
+        with mock.patch.object(
+            Batch, "commit_async", side_effect=InvalidArgument("invalid")
+        ):
+            with self.assertRaises(InvalidArgument):
+                with pipeline.batch():
+                    pass
+
+        self.assertEqual(pipeline._outstanding, 0)
+        pipeline.flush()
+        self.assertEqual(len(database._pool.sessions), 2)
+
+    def test_commit_stats_logged(self):
+        database = self._make_database()
+        database.log_commit_stats = True
+        futures = []
+        pipeline = self._make_one(database)
+
+        with self._patch_commit_async(futures):
+            with pipeline.batch():
+                pass
+
+        batch, kwargs, future = futures[0]
+        self.assertTrue(kwargs["return_commit_stats"])
+        batch.commit_stats = {"mutation_count": 4}
+        future.set_result("committed")
+        database.logger.info.assert_called_once_with(
+            "CommitStats: {'mutation_count': 4}",
+            extra={"commit_stats": {"mutation_count": 4}},
+        )
+
+    def test_batch_w_error_returns_session(self):
+        database = self._make_database()
+        futures = []
+
+        class _BailOut(Exception):
+            pass
+
+        with self._patch_commit_async(futures):
+            with self.assertRaises(_BailOut):
+                with self._make_one(database, max_outstanding=1) as pipeline:
+                    with pipeline.batch():
+                        raise _BailOut()
+
+            # The slot was freed.
+            with pipeline._slots:
+                pass
+
+        self.assertEqual(futures, [])
+        self.assertEqual(len(database._pool.sessions), 2)
+
 
 class TestSnapshotCheckout(_BaseTest):
     def _get_target_class(self):
@@ -1904,6 +2320,75 @@ class TestSnapshotCheckout(_BaseTest):
         # Assert that session-1 was removed from pool and new session was added.
         self.assertEqual(pool._session, new_session)
 
+    def test_context_mgr_replaces_expired_session(self):
+        database = _Database(self.DATABASE_NAME)
+        session = _Session(database, name="session-1")
+        pool = database._pool = _Pool()
+        new_session = _Session(database, name="session-2")
+        new_session.create = mock.Mock()
+        pool._new_session = mock.Mock(return_value=new_session)
+        pool.put(session)
+        checkout = self._make_one(database)
+
+        with checkout as snapshot:
+            self.assertIs(snapshot._replace_expired_session(), new_session)
+            self.assertIs(snapshot._session, new_session)
+
+        new_session.create.assert_called_once_with()
+        self.assertIs(pool._session, new_session)
+
+    def test_context_mgr_wo_replacing_session_of_begun_transaction(self):
+        database = _Database(self.DATABASE_NAME)
+        session = _Session(database)
+        pool = database._pool = _Pool()
+        pool._new_session = mock.Mock()
+        pool.put(session)
+        checkout = self._make_one(database, multi_use=True)
+
+        with checkout as snapshot:
+            snapshot._transaction_id = b"DEADBEEF"
+            self.assertIsNone(snapshot._replace_expired_session())
+
+        pool._new_session.assert_not_called()
+        self.assertIs(pool._session, session)
+
+    def test_context_mgr_w_multiplexed_pool(self):
+        from google.cloud.spanner_v1.pool import MultiplexedSessionPool
+        from google.cloud.spanner_v1.snapshot import Snapshot
+
+        database = _Database(self.DATABASE_NAME)
+        session = _Session(database)
+        pool = database._pool = mock.create_autospec(
+            MultiplexedSessionPool, instance=True
+        )
+        pool.get_read_only.return_value = session
+        checkout = self._make_one(database)
+
+        with checkout as snapshot:
+            self.assertIsInstance(snapshot, Snapshot)
+            self.assertIs(snapshot._session, session)
+
+        pool.get.assert_not_called()
+        pool.get_read_only.assert_called_once_with(multi_use=False)
+        pool.put_read_only.assert_called_once_with(session)
+
+    def test_context_mgr_w_multiplexed_pool_multi_use(self):
+        from google.cloud.spanner_v1.pool import MultiplexedSessionPool
+
+        database = _Database(self.DATABASE_NAME)
+        session = _Session(database)
+        pool = database._pool = mock.create_autospec(
+            MultiplexedSessionPool, instance=True
+        )
+        pool.get_read_only.return_value = session
+        checkout = self._make_one(database, multi_use=True)
+
+        with checkout as snapshot:
+            self.assertIs(snapshot._session, session)
+
+        pool.get_read_only.assert_called_once_with(multi_use=True)
+        pool.put_read_only.assert_called_once_with(session)
+
     def test_context_mgr_table_not_found_error(self):
         from google.cloud.exceptions import NotFound
 
@@ -2581,6 +3066,23 @@ class TestBatchSnapshot(_BaseTest):
 
         session.delete.assert_called_once_with()
 
+    def test_close_w_session_pool(self):
+        from google.cloud.spanner_v1.pool import MultiplexedSessionPool
+
+        database = self._make_database()
+        pool = mock.create_autospec(MultiplexedSessionPool, instance=True)
+        session = pool.get_read_only.return_value
+        batch_txn = self._make_one(database, session_pool=pool)
+
+        self.assertIs(batch_txn._get_session(), session)
+        batch_txn.close()
+
+        database.session.assert_not_called()
+        pool.get_read_only.assert_called_once_with(multi_use=True)
+        pool.put_read_only.assert_called_once_with(session)
+        session.delete.assert_not_called()
+        self.assertIsNone(batch_txn._session)
+
     def test_process_w_invalid_batch(self):
         token = b"TOKEN"
         batch = {"partition": token, "bogus": b"BOGUS"}
@@ -2650,6 +3152,71 @@ class TestBatchSnapshot(_BaseTest):
             timeout=gapic_v1.method.DEFAULT,
         )
 
+    def test_run_partitioned_query(self):
+        from google.cloud.spanner_v1.partitioned import PartitionedQueryResults
+
+        sql = "SELECT COUNT(*) FROM table_name"
+        client = _Client(self.PROJECT_ID)
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = _Database(self.DATABASE_NAME, instance=instance)
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.partition_query.return_value = self.TOKENS
+        rows_by_token = {b"TOKEN1": [[1], [2]], b"TOKEN2": [[3]]}
+        snapshot.execute_sql.side_effect = lambda partition, **kw: iter(
+            rows_by_token[partition]
+        )
+
+        results = batch_txn.run_partitioned_query(
+            sql, max_partitions=2, max_workers=2, ordered=True
+        )
+
+        self.assertIsInstance(results, PartitionedQueryResults)
+        self.assertEqual(results.partition_count, 2)
+        snapshot.partition_query.assert_called_once_with(
+            sql=sql,
+            params=None,
+            param_types=None,
+            partition_size_bytes=None,
+            max_partitions=2,
+            retry=gapic_v1.method.DEFAULT,
+            timeout=gapic_v1.method.DEFAULT,
+        )
+        snapshot.execute_sql.assert_not_called()
+
+        self.assertEqual(list(results), [[1], [2], [3]])
+        self.assertEqual(
+            sorted(stats.row_count for stats in results.partition_stats), [1, 2]
+        )
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_to_arrow(self):
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        batches = [
+            {"partition": b"ONE", "query": {"sql": "SELECT 1"}},
+            {"partition": b"TWO", "query": {"sql": "SELECT 1"}},
+            {"partition": b"EMPTY", "query": {"sql": "SELECT 1"}},
+        ]
+        tables = {
+            b"ONE": pyarrow.table({"a": [1, 2]}),
+            b"TWO": pyarrow.table({"a": [3]}),
+            b"EMPTY": pyarrow.table({}),
+        }
+
+        def execute_sql(partition, **kwargs):
+            result_set = mock.Mock(spec=["to_arrow"])
+            result_set.to_arrow.return_value = tables[partition]
+            return result_set
+
+        snapshot.execute_sql.side_effect = execute_sql
+
+        found = batch_txn.to_arrow(iter(batches), max_workers=2)
+
+        self.assertEqual(found.to_pydict(), {"a": [1, 2, 3]})
+        self.assertEqual(snapshot.execute_sql.call_count, 3)
+
 
 def _make_instance_api():
     from google.cloud.spanner_admin_instance_v1 import InstanceAdminClient
@@ -2697,7 +3264,7 @@ class _Database(object):
         self.logger = mock.create_autospec(Logger, instance=True)
 
 
-class _Pool(object):
+class _Pool(AbstractSessionPool):
     _bound = None
 
     def bind(self, database):
@@ -2711,6 +3278,23 @@ class _Pool(object):
         self._session = session
 
 
+class _QueuePool(object):
+    def __init__(self, sessions):
+        self.sessions = list(sessions)
+
+    def get(self):
+        return self.sessions.pop(0)
+
+    def put(self, session):
+        self.sessions.append(session)
+
+
+def _keyset():
+    from google.cloud.spanner_v1.keyset import KeySet
+
+    return KeySet(all_=True)
+
+
 class _Session(object):
 
     _rows = ()
@@ -0,0 +1,259 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import unittest
+
+
+class TestPartitionedQueryResults(unittest.TestCase):
+    def _get_target_class(self):
+        from google.cloud.spanner_v1.partitioned import PartitionedQueryResults
+
+        return PartitionedQueryResults
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    @staticmethod
+    def _make_batches(count):
+        return [
+            {"partition": index, "query": {"sql": "SELECT 1"}} for index in range(count)
+        ]
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.partitioned import DEFAULT_BATCH_SIZE
+
+        batch_snapshot = _BatchSnapshot({})
+        results = self._make_one(batch_snapshot, iter(self._make_batches(3)))
+
+        self.assertEqual(results.partition_count, 3)
+        self.assertEqual(results.partition_stats, [])
+        self.assertFalse(results._ordered)
+        self.assertEqual(results._batch_size, DEFAULT_BATCH_SIZE)
+        self.assertGreaterEqual(results._max_workers, 1)
+        self.assertLessEqual(results._max_workers, 3)
+
+    def test_ctor_invalid(self):
+        batch_snapshot = _BatchSnapshot({})
+        with self.assertRaises(ValueError):
+            self._make_one(batch_snapshot, [], max_workers=0)
+        with self.assertRaises(ValueError):
+            self._make_one(batch_snapshot, [], batch_size=0)
+        with self.assertRaises(ValueError):
+            self._make_one(batch_snapshot, [], max_pending_batches=0)
+
+    def test_iter_no_partitions(self):
+        batch_snapshot = _BatchSnapshot({})
+        results = self._make_one(batch_snapshot, [])
+
+        self.assertEqual(list(results), [])
+        self.assertEqual(batch_snapshot.processed, [])
+
+    def test_iter_twice(self):
+        results = self._make_one(_BatchSnapshot({}), [])
+        list(results)
+
+        with self.assertRaises(RuntimeError):
+            iter(results)
+        with self.assertRaises(RuntimeError):
+            results.iter_batches()
+
+    def test_iter_ordered(self):
+        rows = {0: [[1], [2], [3]], 1: [], 2: [[4], [5]]}
+        batch_snapshot = _BatchSnapshot(rows)
+        results = self._make_one(
+            batch_snapshot,
+            self._make_batches(3),
+            max_workers=3,
+            ordered=True,
+            batch_size=2,
+        )
+
+        batches = list(results.iter_batches())
+
+        self.assertEqual(batches, [[[1], [2]], [[3]], [[4], [5]]])
+        self.assertTrue(batch_snapshot.snapshot_begun)
+        stats = sorted(results.partition_stats)
+        self.assertEqual([stat.index for stat in stats], [0, 1, 2])
+        self.assertEqual([stat.row_count for stat in stats], [3, 0, 2])
+        for stat in stats:
+            self.assertGreaterEqual(stat.elapsed, 0)
+
+    def test_iter_unordered(self):
+        rows = {index: [[index, value] for value in range(5)] for index in range(4)}
+        batch_snapshot = _BatchSnapshot(rows)
+        results = self._make_one(
+            batch_snapshot, self._make_batches(4), max_workers=2, batch_size=3
+        )
+
+        found = list(results)
+
+        expected = [row for index in range(4) for row in rows[index]]
+        self.assertEqual(sorted(found), expected)
+        self.assertEqual(len(results.partition_stats), 4)
+
+    def test_iter_read_batches(self):
+        batch_snapshot = _BatchSnapshot({"r": [["read"]]})
+        batches = [{"partition": "r", "read": {"table": "citizens"}}]
+        results = self._make_one(batch_snapshot, batches)
+
+        self.assertEqual(list(results), [["read"]])
+
+    def test_iter_invalid_batch(self):
+        results = self._make_one(_BatchSnapshot({}), [{"partition": 0}])
+
+        with self.assertRaises(ValueError):
+            list(results)
+
+    def test_iter_w_error(self):
+        rows = {0: [[1]], 1: _Failing(ValueError("testing"))}
+        results = self._make_one(
+            _BatchSnapshot(rows), self._make_batches(2), ordered=True
+        )
+
+        iterator = iter(results)
+        with self.assertRaises(ValueError):
+            list(iterator)
+
+    def test_backpressure_and_early_exit(self):
+        produced = threading.Event()
+
+        def rows():
+            for value in range(100):
+                if value == 10:
+                    produced.set()
+                yield [value]
+
+        batch_snapshot = _BatchSnapshot({0: rows()})
+        results = self._make_one(
+            batch_snapshot,
+            self._make_batches(1),
+            batch_size=1,
+            max_pending_batches=2,
+        )
+
+        iterator = results.iter_batches()
+        self.assertEqual(next(iterator), [[0]])
+        # The worker is blocked on the bounded queue, well before the end.
+        self.assertFalse(produced.wait(0.3))
+
+        iterator.close()
+
+        self.assertIsNone(results._executor)
+        self.assertTrue(results._cancelled.is_set())
+        self.assertEqual(results.partition_stats, [])
+
+    def test_close_checks_cancellation_per_row(self):
+        pulled = []
+        results = None
+
+        def rows():
+            for value in range(100):
+                pulled.append(value)
+                if value == 3:
+                    results.close()
+                yield [value]
+
+        batch_snapshot = _BatchSnapshot({0: rows()})
+        results = self._make_one(batch_snapshot, self._make_batches(1))
+
+        self.assertEqual(list(results), [])
+        self.assertEqual(pulled, [0, 1, 2, 3])
+
+    def test_close_from_other_thread(self):
+        from google.api_core.exceptions import Cancelled
+
+        waiting = threading.Event()
+        batch_snapshot = None
+
+        def rows():
+            yield [0]
+            waiting.set()
+            # Blocks, as a gRPC stream awaiting a response, until cancelled.
+            batch_snapshot.results[1].cancelled.wait()
+            raise Cancelled("cancelled")
+
+        batch_snapshot = _BatchSnapshot({0: [], 1: rows()})
+        results = self._make_one(
+            batch_snapshot, self._make_batches(2), ordered=True, batch_size=1
+        )
+
+        iterator = results.iter_batches()
+        self.assertEqual(next(iterator), [[0]])
+        closer = threading.Thread(target=lambda: waiting.wait() and results.close())
+        closer.start()
+        self.assertEqual(list(iterator), [])
+        closer.join()
+
+        self.assertTrue(batch_snapshot.results[1].cancelled.is_set())
+        self.assertIsNone(results._executor)
+
+    def test_context_manager(self):
+        results = self._make_one(_BatchSnapshot({}), [])
+        with results as entered:
+            self.assertIs(entered, results)
+        self.assertTrue(results._cancelled.is_set())
+
+
+class _Results(object):
+    """Stand-in for a streamed result set."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self.cancelled = threading.Event()
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+class _Failing(object):
+    def __init__(self, exc):
+        self._exc = exc
+
+    def __iter__(self):
+        raise self._exc
+
+
+class _BatchSnapshot(object):
+    snapshot_begun = False
+
+    def __init__(self, rows_by_partition):
+        self._rows_by_partition = rows_by_partition
+        self.processed = []
+        self.results = []
+        self._lock = threading.Lock()
+
+    def _get_snapshot(self):
+        self.snapshot_begun = True
+
+    def _process(self, batch, retry, timeout):
+        from google.api_core import gapic_v1
+
+        assert retry is gapic_v1.method.DEFAULT
+        assert timeout is gapic_v1.method.DEFAULT
+        with self._lock:
+            self.processed.append(batch["partition"])
+        results = _Results(self._rows_by_partition[batch["partition"]])
+        self.results.append(results)
+        return results
+
+    def process_query_batch(self, batch, *, retry, timeout):
+        return self._process(batch, retry, timeout)
+
+    def process_read_batch(self, batch, *, retry, timeout):
+        return self._process(batch, retry, timeout)
@@ -76,6 +76,34 @@ class TestAbstractSessionPool(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             pool.clear()
 
+    def test_get_read_only_defaults_to_get(self):
+        pool = self._make_one()
+        session = object()
+        pool.get = mock.Mock(return_value=session)
+
+        self.assertIs(pool.get_read_only(), session)
+        pool.get.assert_called_once_with()
+
+    def test_put_read_only_defaults_to_put(self):
+        pool = self._make_one()
+        session = object()
+        pool.put = mock.Mock()
+
+        pool.put_read_only(session)
+
+        pool.put.assert_called_once_with(session)
+
+    def test__replace_session(self):
+        pool = self._make_one()
+        database = pool._database = _make_database("name")
+        session = _make_session()
+        database.session.return_value = session
+
+        new_session = pool._replace_session(object())
+
+        self.assertIs(new_session, session)
+        session.create.assert_called_once_with()
+
     def test__new_session_wo_labels(self):
         pool = self._make_one()
         database = pool._database = _make_database("name")
@@ -184,6 +212,51 @@ class TestFixedSizePool(unittest.TestCase):
         for session in SESSIONS:
             session.create.assert_not_called()
 
+    def test_ctor_w_invalid_bind_workers(self):
+        with self.assertRaises(ValueError):
+            self._make_one(bind_workers=0)
+
+    def test_bind_w_multiple_batches(self):
+        pool = self._make_one(size=250, bind_workers=3)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(250)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertTrue(pool._sessions.full())
+        self.assertEqual(pool._session_count, 250)
+        self.assertTrue(pool.wait_for_warmup())
+        api = database.spanner_api
+        requested = sorted(
+            call.kwargs["request"].session_count
+            for call in api.batch_create_sessions.call_args_list
+        )
+        # Each batch asks for at most 100 sessions.
+        self.assertEqual(requested[-1], 100)
+        self.assertEqual(requested.count(100), 2)
+        self.assertIn(50, requested)
+
+    def test_bind_w_min_sessions(self):
+        pool = self._make_one(size=10, bind_min_sessions=4)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(10)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertIsNotNone(pool._warmup_thread)
+        session = pool.get()
+        self.assertIn(session, SESSIONS)
+        pool.put(session)
+
+        self.assertTrue(pool.wait_for_warmup(timeout=5))
+        self.assertTrue(pool._sessions.full())
+        self.assertEqual(pool._session_count, 10)
+        api = database.spanner_api
+        first = api.batch_create_sessions.call_args_list[0]
+        self.assertEqual(first.kwargs["request"].session_count, 4)
+
     def test_get_non_expired(self):
         pool = self._make_one(size=4)
         database = _Database("name")
@@ -213,6 +286,23 @@ class TestFixedSizePool(unittest.TestCase):
         self.assertTrue(SESSIONS[0]._exists_checked)
         self.assertFalse(pool._sessions.full())
 
+    def test_put_replaced_session(self):
+        pool = self._make_one(size=1)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(2)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        pool.stats.enable_leak_detection(threshold=0)
+
+        session = pool.get()
+        replacement = pool._replace_session(session)
+        pool.put(replacement)
+
+        self.assertIs(replacement, SESSIONS[1])
+        self.assertEqual(pool.stats.in_use, 0)
+        self.assertEqual(pool.stats.find_leaks(), [])
+        self.assertEqual(pool.stats.sessions_expired, 1)
+
     def test_get_empty_default_timeout(self):
         import queue
 
@@ -235,6 +325,47 @@ class TestFixedSizePool(unittest.TestCase):
 
         self.assertEqual(session_queue._got, {"block": True, "timeout": 1})
 
+    def test_get_empty_records_timeout(self):
+        import queue
+
+        pool = self._make_one(size=1)
+        pool._sessions = _Queue()
+
+        with self.assertRaises(queue.Empty):
+            pool.get()
+
+        self.assertEqual(pool.stats.checkout_timeouts, 1)
+        self.assertEqual(pool.stats.checkouts, 0)
+
+    def test_stats(self):
+        pool = self._make_one(size=4)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(4)]
+        SESSIONS[3]._exists = False
+        database._sessions.extend(SESSIONS)
+        database._sessions.append(_Session(database))
+        pool.bind(database)
+        stats = pool.stats
+        self.assertEqual(stats.sessions_created, 4)
+        self.assertEqual(stats.idle, 4)
+
+        session = pool.get()  # LIFO:  the expired session is replaced
+
+        self.assertEqual(stats.checkouts, 1)
+        self.assertEqual(stats.in_use, 1)
+        self.assertEqual(stats.idle, 3)
+        self.assertEqual(stats.utilization, 0.25)
+        self.assertEqual(stats.validations, 1)
+        self.assertEqual(stats.sessions_expired, 1)
+        self.assertEqual(stats.sessions_created, 5)
+        self.assertEqual(sum(count for _, count in stats.checkout_latency), 1)
+
+        pool.put(session)
+        pool.clear()
+
+        self.assertEqual(stats.in_use, 0)
+        self.assertEqual(stats.sessions_deleted, 4)
+
     def test_put_full(self):
         import queue
 
@@ -279,6 +410,179 @@ class TestFixedSizePool(unittest.TestCase):
         for session in SESSIONS:
             self.assertTrue(session._deleted)
 
+    def test_get_w_validation_interval_recently_used(self):
+        pool = self._make_one(size=1, validation_interval=60)
+        database = _Database("name")
+        session = _Session(database)
+        database._sessions.append(session)
+        pool.bind(database)
+
+        self.assertIs(pool.get(), session)
+        self.assertFalse(session._exists_checked)
+
+    def test_get_w_validation_interval_idle_session(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=1, validation_interval=60)
+        database = _Database("name")
+        session = _Session(database)
+        database._sessions.append(session)
+        pool.bind(database)
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=61)
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            self.assertIs(pool.get(), session)
+
+        self.assertTrue(session._exists_checked)
+
+    def test_put_marks_session_used(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=1, validation_interval=60)
+        session = _Session(_Database("name"))
+        now = datetime.datetime.utcnow()
+
+        with _Monkey(MUT, _NOW=lambda: now):
+            pool.put(session)
+
+        self.assertEqual(session._last_use_time, now)
+
+    def test_ctor_w_max_size_too_small(self):
+        with self.assertRaises(ValueError):
+            self._make_one(size=4, max_size=2)
+
+    def _make_bound(self, sessions, **kwargs):
+        pool = self._make_one(size=len(sessions), **kwargs)
+        database = _Database("name")
+        database._sessions.extend(sessions)
+        pool.bind(database)
+        return pool, database
+
+    def test_maintain_pings_idle_and_replaces_dead(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        database = _Database("name")
+        alive, dead, replacement = [_Session(database) for _ in range(3)]
+        dead._exists = False
+        pool, database = self._make_bound([alive, dead])
+        database._sessions.append(replacement)
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=3001)
+        pool._stats.record_return = mock.Mock()
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            pool.maintain()
+
+        # Idle sessions are re-queued without returning a checkout.
+        pool._stats.record_return.assert_not_called()
+
+        self.assertTrue(alive._pinged)
+        self.assertTrue(dead._pinged)
+        self.assertEqual(alive._last_use_time, later)
+        self.assertEqual(sorted(pool._sessions.queue), sorted([alive, replacement]))
+        self.assertEqual(pool._session_count, 2)
+        self.assertEqual(database.spanner_api.batch_create_sessions.call_count, 2)
+
+    def test_maintain_skips_fresh_sessions(self):
+        database = _Database("name")
+        sessions = [_Session(database) for _ in range(2)]
+        pool, database = self._make_bound(sessions)
+
+        pool.maintain()
+
+        for session in sessions:
+            self.assertFalse(session._pinged)
+        self.assertEqual(pool._sessions.qsize(), 2)
+
+    def test_maintain_grows_under_wait_pressure(self):
+        database = _Database("name")
+        session, extra_1, extra_2 = [_Session(database) for _ in range(3)]
+        pool, database = self._make_bound([session], max_size=3)
+        database._sessions.extend([extra_1, extra_2])
+        pool._waits = 5
+
+        pool.maintain()
+
+        self.assertEqual(pool._session_count, 3)
+        self.assertTrue(pool._sessions.full())
+        self.assertEqual(pool._waits, 0)
+
+    def test_maintain_counts_sessions_being_created(self):
+        database = _Database("name")
+        session = _Session(database)
+        pool, database = self._make_bound([session], max_size=3)
+        pool._pending = 2  # e.g. still being created by ``bind``
+        pool._waits = 5
+
+        pool.maintain()
+
+        self.assertEqual(pool._session_count, 1)
+        self.assertEqual(database.spanner_api.batch_create_sessions.call_count, 1)
+
+    def test_create_sessions_counts_each_session_added(self):
+        database = _Database("name")
+        session = _Session(database)
+        pool = self._make_one(size=3)
+        pool._database = database
+        counts = []
+
+        class _Failed(Exception):
+            pass
+
+        def _batch_create_sessions(count, add_session):
+            self.assertEqual(pool._pending, 3)
+            add_session(session)
+            counts.append((pool._session_count, pool._pending))
+            raise _Failed()
+
+        with mock.patch.object(
+            pool, "_batch_create_sessions", side_effect=_batch_create_sessions
+        ):
+            with self.assertRaises(_Failed):
+                pool._create_sessions(3)
+
+        self.assertEqual(counts, [(1, 2)])
+        self.assertEqual(pool._session_count, 1)
+        self.assertEqual(pool._pending, 0)
+        self.assertEqual(list(pool._sessions.queue), [session])
+
+    def test_get_empty_counts_waits(self):
+        import queue
+
+        pool = self._make_one(size=1, default_timeout=0.01)
+
+        with self.assertRaises(queue.Empty):
+            pool.get()
+
+        self.assertEqual(pool._waits, 1)
+
+    def test_maintain_shrinks_idle_excess(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        database = _Database("name")
+        session, extra_1, extra_2 = [_Session(database) for _ in range(3)]
+        pool, database = self._make_bound([session], max_size=3)
+        database._sessions.extend([extra_1, extra_2])
+        pool._create_sessions(2)
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=601)
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            pool.maintain()
+
+        self.assertEqual(pool._session_count, 1)
+        self.assertEqual(pool._sessions.qsize(), 1)
+        deleted = [s for s in (session, extra_1, extra_2) if s._deleted]
+        self.assertEqual(len(deleted), 2)
+        for s in (session, extra_1, extra_2):
+            self.assertFalse(s._pinged)
+
 
 class TestBurstyPool(unittest.TestCase):
     def _getTargetClass(self):
@@ -397,6 +701,24 @@ class TestBurstyPool(unittest.TestCase):
         self.assertTrue(younger._deleted)
         self.assertIs(pool.get(), older)
 
+    def test_stats(self):
+        pool = self._make_one(target_size=1)
+        database = _Database("name")
+        database._sessions.extend([_Session(database), _Session(database)])
+        pool.bind(database)
+
+        first = pool.get()
+        second = pool.get()
+        pool.put(first)
+        pool.put(second)  # discarded
+
+        stats = pool.stats
+        self.assertEqual(stats.checkouts, 2)
+        self.assertEqual(stats.in_use, 0)
+        self.assertEqual(stats.idle, 1)
+        self.assertEqual(stats.sessions_created, 2)
+        self.assertEqual(stats.sessions_deleted, 1)
+
     def test_clear(self):
         pool = self._make_one()
         database = _Database("name")
@@ -408,6 +730,26 @@ class TestBurstyPool(unittest.TestCase):
 
         self.assertTrue(previous._deleted)
 
+    def test_get_w_validation_interval_recently_used(self):
+        pool = self._make_one(validation_interval=60)
+        database = _Database("name")
+        pool.bind(database)
+        session = _Session(database)
+        pool.put(session)
+
+        self.assertIs(pool.get(), session)
+        self.assertFalse(session._exists_checked)
+
+    def test_get_w_validation_interval_never_used(self):
+        pool = self._make_one(validation_interval=60)
+        database = _Database("name")
+        pool.bind(database)
+        session = _Session(database)
+        pool._sessions.put(session)
+
+        self.assertIs(pool.get(), session)
+        self.assertTrue(session._exists_checked)
+
 
 class TestPingingPool(unittest.TestCase):
     def _getTargetClass(self):
@@ -474,6 +816,20 @@ class TestPingingPool(unittest.TestCase):
         for session in SESSIONS:
             session.create.assert_not_called()
 
+    def test_bind_w_min_sessions(self):
+        pool = self._make_one(size=6, bind_min_sessions=2)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(6)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertTrue(pool.wait_for_warmup(timeout=5))
+        self.assertTrue(pool._sessions.full())
+        api = database.spanner_api
+        first = api.batch_create_sessions.call_args_list[0]
+        self.assertEqual(first.kwargs["request"].session_count, 2)
+
     def test_get_hit_no_ping(self):
         pool = self._make_one(size=4)
         database = _Database("name")
@@ -630,12 +986,14 @@ class TestPingingPool(unittest.TestCase):
         SESSIONS = [_Session(database)] * 1
         database._sessions.extend(SESSIONS)
         pool.bind(database)
+        pool._stats.record_return = mock.Mock()
 
         later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
         with _Monkey(MUT, _NOW=lambda: later):
             pool.ping()
 
         self.assertTrue(SESSIONS[0]._pinged)
+        pool._stats.record_return.assert_not_called()
 
     def test_ping_oldest_stale_and_not_exists(self):
         import datetime
@@ -844,6 +1202,563 @@ class TestTransactionPingingPool(unittest.TestCase):
         self.assertTrue(pending.empty())
 
 
+class TestMultiplexedSessionPool(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import MultiplexedSessionPool
+
+        return MultiplexedSessionPool
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    @staticmethod
+    def _make_fallback_pool():
+        from google.cloud.spanner_v1.pool import FixedSizePool
+
+        return mock.create_autospec(FixedSizePool, instance=True)
+
+    def _make_bound(self, session_count=2, sessions=None):
+        fallback = self._make_fallback_pool()
+        pool = self._make_one(session_count=session_count, fallback_pool=fallback)
+        database = _Database("name")
+        if sessions is None:
+            sessions = [_Session(database) for _ in range(session_count)]
+        database._sessions.extend(sessions)
+        pool.bind(database)
+        return pool, sessions
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.pool import FixedSizePool
+
+        pool = self._make_one()
+        self.assertIsNone(pool._database)
+        self.assertEqual(pool.session_count, 1)
+        self.assertIsInstance(pool.fallback_pool, FixedSizePool)
+        self.assertEqual(pool._sessions, [])
+        self.assertEqual(pool.labels, {})
+        self.assertIsNone(pool.database_role)
+
+    def test_ctor_explicit(self):
+        labels = {"foo": "bar"}
+        fallback = self._make_fallback_pool()
+        pool = self._make_one(
+            session_count=3,
+            fallback_pool=fallback,
+            ping_interval=30,
+            labels=labels,
+            database_role="dummy-role",
+        )
+        self.assertEqual(pool.session_count, 3)
+        self.assertIs(pool.fallback_pool, fallback)
+        self.assertEqual(pool._delta.seconds, 30)
+        self.assertEqual(pool.labels, labels)
+        self.assertEqual(pool.database_role, "dummy-role")
+
+    def test_ctor_w_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            self._make_one(session_count=0)
+        with self.assertRaises(ValueError):
+            self._make_one(max_streams_per_session=0)
+
+    def test_bind(self):
+        pool, sessions = self._make_bound()
+
+        self.assertEqual(pool._sessions, sessions)
+        self.assertEqual(pool.read_only_checkouts(), [0, 0])
+        for session in sessions:
+            session.create.assert_called_once_with()
+        pool.fallback_pool.bind.assert_called_once_with(pool._database)
+
+    def test_get_read_only_shares_least_loaded_session(self):
+        pool, sessions = self._make_bound()
+
+        first = pool.get_read_only()
+        second = pool.get_read_only()
+        third = pool.get_read_only()
+
+        self.assertIs(first, sessions[0])
+        self.assertIs(second, sessions[1])
+        self.assertIs(third, sessions[0])
+        self.assertEqual(pool.read_only_checkouts(), [2, 1])
+        pool.fallback_pool.get.assert_not_called()
+
+    def test_get_read_only_waits_for_session_below_limit(self):
+        import threading
+
+        fallback = self._make_fallback_pool()
+        pool = self._make_one(
+            session_count=1, fallback_pool=fallback, max_streams_per_session=2
+        )
+        database = _Database("name")
+        session = _Session(database)
+        database._sessions.append(session)
+        pool.bind(database)
+        checked_out = [pool.get_read_only(), pool.get_read_only()]
+        waiters = [
+            threading.Thread(target=lambda: checked_out.append(pool.get_read_only()))
+            for _ in range(2)
+        ]
+        for waiter in waiters:
+            waiter.start()
+
+        # Both snapshots beyond the limit wait for a session to be returned.
+        for waiter in waiters:
+            waiter.join(0.1)
+            self.assertTrue(waiter.is_alive())
+        self.assertEqual(pool.read_only_checkouts(), [2])
+
+        pool.put_read_only(session)
+        pool.put_read_only(session)
+        for waiter in waiters:
+            waiter.join(5)
+            self.assertFalse(waiter.is_alive())
+
+        self.assertEqual(checked_out, [session] * 4)
+        self.assertEqual(pool.read_only_checkouts(), [2])
+
+    def test_get_read_only_timeout_at_limit(self):
+        import queue
+
+        fallback = self._make_fallback_pool()
+        pool = self._make_one(
+            session_count=1, fallback_pool=fallback, max_streams_per_session=1
+        )
+        database = _Database("name")
+        database._sessions.append(_Session(database))
+        pool.bind(database)
+        pool.get_read_only()
+
+        with self.assertRaises(queue.Empty):
+            pool.get_read_only(timeout=0.01)
+
+        self.assertEqual(pool.stats.checkout_timeouts, 1)
+        self.assertEqual(pool.read_only_checkouts(), [1])
+
+    def test_put_read_only(self):
+        pool, sessions = self._make_bound()
+        session = pool.get_read_only()
+
+        pool.put_read_only(session)
+
+        self.assertEqual(pool.read_only_checkouts(), [0, 0])
+        pool.fallback_pool.put.assert_not_called()
+
+    def test_get_read_only_multi_use_uses_fallback_pool(self):
+        pool, _ = self._make_bound()
+        session = pool.fallback_pool.get.return_value
+
+        self.assertIs(pool.get_read_only(multi_use=True), session)
+        pool.put_read_only(session)
+
+        pool.fallback_pool.get.assert_called_once_with()
+        pool.fallback_pool.put.assert_called_once_with(session)
+        self.assertEqual(pool.read_only_checkouts(), [0, 0])
+
+    def test_get_read_only_unbound(self):
+        pool = self._make_one(fallback_pool=self._make_fallback_pool())
+
+        with self.assertRaises(ValueError):
+            pool.get_read_only()
+
+    def test_get_read_only_wo_sessions_created(self):
+        pool, _ = self._make_bound(session_count=1)
+        pool.clear()
+        pool._database = _Database("name")
+        pool._create_sessions = mock.Mock(return_value=0)
+
+        with self.assertRaises(ValueError):
+            pool.get_read_only()
+
+        pool._create_sessions.assert_called_once_with()
+
+    def test_get_read_only_after_clear(self):
+        pool, sessions = self._make_bound(session_count=1)
+        pool.clear()
+        replacement = _Session(pool._database)
+        pool._database._sessions.append(replacement)
+
+        self.assertIs(pool.get_read_only(), replacement)
+        replacement.create.assert_called_once_with()
+        self.assertEqual(pool.read_only_checkouts(), [1])
+
+    def test_stats_read_only(self):
+        pool, sessions = self._make_bound()
+        first = pool.get_read_only()
+        second = pool.get_read_only()
+        third = pool.get_read_only()
+        stats = pool.stats
+
+        self.assertEqual(stats.sessions_created, 2)
+        self.assertEqual(stats.checkouts, 3)
+        self.assertEqual(stats.in_use, 3)
+        self.assertEqual(stats.idle, 0)
+
+        pool.put_read_only(first)
+        pool.put_read_only(second)
+
+        self.assertEqual(stats.in_use, 1)
+        self.assertEqual(stats.idle, 1)
+        pool.put_read_only(third)
+        self.assertEqual(stats.in_use, 0)
+
+    def test_get_and_put_use_fallback_pool(self):
+        pool, _ = self._make_bound()
+        session = pool.fallback_pool.get.return_value
+
+        self.assertIs(pool.get(timeout=5), session)
+        pool.put(session)
+
+        pool.fallback_pool.get.assert_called_once_with(timeout=5)
+        pool.fallback_pool.put.assert_called_once_with(session)
+        self.assertEqual(pool.read_only_checkouts(), [0, 0])
+
+    def test__replace_session_recreates_shared_session_in_place(self):
+        pool, sessions = self._make_bound(session_count=1)
+        session = pool.get_read_only()
+        session._exists = False
+        session.create.reset_mock()
+
+        replaced = pool._replace_session(session)
+
+        self.assertIs(replaced, session)
+        self.assertIsNone(session._session_id)
+        session.create.assert_called_once_with()
+        self.assertEqual(pool.read_only_checkouts(), [1])
+
+    def test__replace_session_wo_checkout_lock(self):
+        pool, sessions = self._make_bound(session_count=1)
+        session = sessions[0]
+        locked = []
+
+        def exists():
+            locked.append(pool._lock.locked())
+            return False
+
+        session.exists = exists
+
+        pool._replace_session(session)
+
+        self.assertEqual(locked, [False])
+
+    def test__replace_session_fallback_session(self):
+        pool, _ = self._make_bound()
+        session = _Session(pool._database)
+        replaced = pool.fallback_pool._replace_session.return_value
+
+        self.assertIs(pool._replace_session(session), replaced)
+        pool.fallback_pool._replace_session.assert_called_once_with(session)
+
+    def test__replace_session_already_recreated(self):
+        pool, sessions = self._make_bound(session_count=1)
+        session = sessions[0]
+        session.create.reset_mock()
+
+        self.assertIs(pool._replace_session(session), session)
+        session.create.assert_not_called()
+
+    def test_clear(self):
+        pool, sessions = self._make_bound()
+        sessions[1]._exists = False
+
+        pool.clear()
+
+        self.assertEqual(pool._sessions, [])
+        for session in sessions:
+            self.assertTrue(session._deleted)
+        pool.fallback_pool.clear.assert_called_once_with()
+
+    def test_maintain(self):
+        pool, sessions = self._make_bound()
+
+        pool.maintain()
+
+        pool.fallback_pool.maintain.assert_called_once_with()
+
+    def test_ping_not_due(self):
+        pool, sessions = self._make_bound()
+
+        pool.ping()
+
+        for session in sessions:
+            self.assertFalse(session._pinged)
+
+    def test_ping_due(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool, sessions = self._make_bound()
+        sessions[1]._exists = False
+        for session in sessions:
+            session.create.reset_mock()
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            pool.ping()
+
+        for session in sessions:
+            self.assertTrue(session._pinged)
+        sessions[0].create.assert_not_called()
+        sessions[1].create.assert_called_once_with()
+        self.assertIsNone(sessions[1]._session_id)
+        self.assertGreater(pool._ping_after, later)
+
+
+class TestSessionPoolMaintainer(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import SessionPoolMaintainer
+
+        return SessionPoolMaintainer
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_pool(self, passes=2, side_effect=None):
+        import threading
+
+        done = threading.Event()
+        calls = []
+
+        def _maintain():
+            calls.append(None)
+            if len(calls) >= passes:
+                done.set()
+            if side_effect is not None:
+                raise side_effect
+
+        pool = mock.Mock(spec=["maintain", "stats"])
+        pool.maintain.side_effect = _maintain
+        pool.stats.find_leaks.return_value = []
+        return pool, done, calls
+
+    def test_ctor_defaults(self):
+        pool = object()
+        maintainer = self._make_one(pool)
+        self.assertIs(maintainer._pool, pool)
+        self.assertEqual(maintainer.interval, 60)
+        self.assertFalse(maintainer.running)
+
+    def test_start_stop(self):
+        pool, done, calls = self._make_pool()
+        maintainer = self._make_one(pool, interval=0.001)
+
+        maintainer.start()
+        self.assertTrue(done.wait(5))
+        self.assertTrue(maintainer.running)
+        maintainer.stop()
+
+        self.assertFalse(maintainer.running)
+        self.assertGreaterEqual(len(calls), 2)
+
+    def test_start_twice(self):
+        pool, done, _ = self._make_pool()
+        maintainer = self._make_one(pool, interval=0.001)
+
+        with maintainer:
+            with self.assertRaises(RuntimeError):
+                maintainer.start()
+
+        self.assertFalse(maintainer.running)
+
+    def test_errors_logged(self):
+        pool, done, calls = self._make_pool(side_effect=ValueError("testing"))
+        maintainer = self._make_one(pool, interval=0.001)
+
+        with mock.patch("google.cloud.spanner_v1.pool._LOGGER") as logger:
+            with maintainer:
+                self.assertTrue(done.wait(5))
+
+        self.assertGreaterEqual(len(calls), 2)
+        logger.exception.assert_called()
+
+    def test_leaks_logged(self):
+        from google.cloud.spanner_v1.pool import SessionLeak
+
+        pool, done, calls = self._make_pool()
+        session = mock.Mock(session_id="session-id", spec=["session_id"])
+        leak = SessionLeak(session, 42.0, "File stack\n")
+        pool.stats.find_leaks.side_effect = [[leak], [], [], []] + [[]] * 1000
+        maintainer = self._make_one(pool, interval=0.001)
+
+        with mock.patch("google.cloud.spanner_v1.pool._LOGGER") as logger:
+            with maintainer:
+                self.assertTrue(done.wait(5))
+
+        pool.stats.find_leaks.assert_called_with(unreported_only=True)
+        logger.warning.assert_called_once()
+        self.assertIn("session-id", logger.warning.call_args.args)
+        logger.exception.assert_not_called()
+
+
+class TestSessionPoolStats(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import SessionPoolStats
+
+        return SessionPoolStats
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_defaults(self):
+        stats = self._make_one()
+        self.assertEqual(stats.checkouts, 0)
+        self.assertEqual(stats.in_use, 0)
+        self.assertIsNone(stats.idle)
+        self.assertIsNone(stats.utilization)
+        self.assertIsNone(stats.mean_checkout_latency)
+        self.assertEqual(stats.find_leaks(), [])
+
+    def test_checkout_latency(self):
+        stats = self._make_one(latency_buckets=(1.0, 0.1))
+        waits = []
+        stats.add_checkout_listener(waits.append)
+
+        stats.record_checkout(object(), 0.05)
+        stats.record_checkout(object(), 0.5)
+        stats.record_checkout(object(), 2.0)
+        stats.record_checkout(object(), 3.0)
+
+        self.assertEqual(
+            stats.checkout_latency, [(0.1, 1), (1.0, 1), (float("inf"), 2)]
+        )
+        self.assertEqual(stats.mean_checkout_latency, 5.55 / 4)
+        self.assertEqual(waits, [0.05, 0.5, 2.0, 3.0])
+
+    def test_record_return(self):
+        stats = self._make_one(idle_count=lambda: 3)
+        session = object()
+        stats.record_checkout(session, 0.0)
+        stats.record_checkout(session, 0.0)  # shared, read-only
+        self.assertEqual(stats.utilization, 0.4)
+
+        stats.record_return(session)
+        stats.record_return(object())  # not checked out:  ignored
+
+        self.assertEqual(stats.in_use, 1)
+        stats.record_return(session)
+        self.assertEqual(stats.in_use, 0)
+        self.assertEqual(stats._checked_out, {})
+
+    def test_record_replaced(self):
+        stats = self._make_one()
+        session, replacement = object(), object()
+        stats.record_checkout(session, 0.0)
+
+        stats.record_replaced(session, replacement)
+        stats.record_replaced(object(), object())  # not checked out:  ignored
+
+        self.assertEqual(stats.in_use, 1)
+        (entry,) = stats._checked_out[id(replacement)]
+        self.assertIs(entry[0], replacement)
+        stats.record_return(replacement)
+        self.assertEqual(stats.in_use, 0)
+        self.assertEqual(stats._checked_out, {})
+
+    def test_lifecycle_counters(self):
+        stats = self._make_one(idle_count=lambda: 0)
+        stats.record_created(3)
+        stats.record_deleted()
+        stats.record_validation(True)
+        stats.record_validation(False)
+        stats.record_expired(2)
+        stats.record_timeout()
+
+        result = stats.as_dict()
+
+        self.assertEqual(result["sessions_created"], 3)
+        self.assertEqual(result["sessions_deleted"], 1)
+        self.assertEqual(result["validations"], 2)
+        self.assertEqual(result["sessions_expired"], 3)
+        self.assertEqual(result["checkout_timeouts"], 1)
+        self.assertEqual(result["idle"], 0)
+        self.assertIsNone(result["utilization"])
+
+    def test_find_leaks(self):
+        stats = self._make_one()
+        stats.enable_leak_detection(threshold=10)
+        held, returned, fresh = object(), object(), object()
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            stats.record_checkout(held, 0.0)
+            stats.record_checkout(returned, 0.0)
+        stats.record_return(returned)
+        with mock.patch("time.monotonic", return_value=105.0):
+            stats.record_checkout(fresh, 0.0)
+
+        with mock.patch("time.monotonic", return_value=112.0):
+            leaks = stats.find_leaks()
+            reported = stats.find_leaks(unreported_only=True)
+            reported_again = stats.find_leaks(unreported_only=True)
+
+        self.assertEqual(len(leaks), 1)
+        leak = leaks[0]
+        self.assertIs(leak.session, held)
+        self.assertEqual(leak.held_for, 12.0)
+        self.assertIn("test_find_leaks", leak.stack)
+        self.assertEqual(reported, leaks)
+        self.assertEqual(reported_again, [])
+
+    def test_find_leaks_wo_stacks(self):
+        stats = self._make_one()
+        stats.enable_leak_detection(threshold=0, capture_stacks=False)
+        stats.record_checkout(object(), 0.0)
+
+        (leak,) = stats.find_leaks()
+
+        self.assertIsNone(leak.stack)
+
+    def test_register_opentelemetry_metrics_wo_opentelemetry(self):
+        stats = self._make_one()
+        with mock.patch(
+            "google.cloud.spanner_v1._opentelemetry_tracing."
+            "HAS_OPENTELEMETRY_METRICS",
+            False,
+        ):
+            self.assertIsNone(stats.register_opentelemetry_metrics())
+
+    def test_register_opentelemetry_metrics(self):
+        stats = self._make_one(idle_count=lambda: 4)
+        meter = mock.Mock()
+        attributes = {"database": "name"}
+        metrics = mock.Mock()
+        metrics.Observation.side_effect = lambda value, attrs: (value, attrs)
+
+        with mock.patch(
+            "google.cloud.spanner_v1._opentelemetry_tracing."
+            "HAS_OPENTELEMETRY_METRICS",
+            True,
+        ), mock.patch(
+            "google.cloud.spanner_v1._opentelemetry_tracing.metrics",
+            metrics,
+            create=True,
+        ):
+            result = stats.register_opentelemetry_metrics(meter, attributes)
+            gauges = {
+                call.args[0]: call.kwargs["callbacks"][0]
+                for call in meter.create_observable_gauge.call_args_list
+            }
+            counters = {
+                call.args[0]: call.kwargs["callbacks"][0]
+                for call in meter.create_observable_counter.call_args_list
+            }
+            stats.record_checkout(object(), 0.25)
+
+            self.assertEqual(
+                gauges["spanner.pool.sessions.idle"](None), [(4, attributes)]
+            )
+            self.assertEqual(
+                gauges["spanner.pool.sessions.in_use"](None), [(1, attributes)]
+            )
+            self.assertEqual(
+                counters["spanner.pool.checkouts"](None), [(1, attributes)]
+            )
+
+        self.assertIs(result, meter)
+        self.assertEqual(len(counters), 5)
+        histogram = meter.create_histogram.return_value
+        histogram.record.assert_called_once_with(0.25, attributes)
+
+
 class TestSessionCheckout(unittest.TestCase):
     def _getTargetClass(self):
         from google.cloud.spanner_v1.pool import SessionCheckout
@@ -915,6 +1830,7 @@ def _make_transaction(*args, **kw):
 class _Session(object):
 
     _transaction = None
+    _last_use_time = None
 
     def __init__(self, database, exists=True, transaction=None):
         self._database = database
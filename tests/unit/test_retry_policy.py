@@ -0,0 +1,143 @@
+# Copyright 2023 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+def _make_aborted(retry_seconds=None):
+    from google.api_core.exceptions import Aborted
+    from google.protobuf.duration_pb2 import Duration
+    from google.rpc.error_details_pb2 import RetryInfo
+
+    trailing_metadata = []
+    if retry_seconds is not None:
+        retry_info = RetryInfo(
+            retry_delay=Duration(seconds=retry_seconds, nanos=500000000)
+        )
+        trailing_metadata.append(
+            ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
+        )
+    cause = mock.Mock(spec=["trailing_metadata"])
+    cause.trailing_metadata.return_value = trailing_metadata
+    return Aborted("aborted", errors=[cause])
+
+
+class TestAbortRetryPolicy(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+
+        return AbortRetryPolicy
+
+    def _make_one(self, **kwargs):
+        return self._getTargetClass()(**kwargs)
+
+    def test_ctor_w_invalid_settings(self):
+        for kwargs in (
+            {"initial": -1},
+            {"initial": 2, "maximum": 1},
+            {"multiplier": 0.5},
+            {"jitter": 1.5},
+            {"max_attempts": 0},
+        ):
+            with self.assertRaises(ValueError):
+                self._make_one(**kwargs)
+
+    def test_backoff_wo_jitter(self):
+        policy = self._make_one(initial=0.1, maximum=1, multiplier=2, jitter=0)
+
+        delays = [policy.backoff(attempts) for attempts in range(1, 7)]
+
+        self.assertEqual(delays, [0.1, 0.2, 0.4, 0.8, 1, 1])
+        self.assertEqual(policy.backoff(100000), 1)
+
+    def test_backoff_w_jitter(self):
+        policy = self._make_one(initial=1, maximum=1, jitter=0.5)
+
+        with mock.patch("random.random", return_value=0.5):
+            self.assertEqual(policy.backoff(3), 0.75)
+
+    def test_retry_delay_w_server_delay(self):
+        policy = self._make_one(initial=0, maximum=0)
+
+        with mock.patch("time.time", return_value=10):
+            delay = policy.retry_delay(_make_aborted(retry_seconds=2), 20, 1)
+
+        self.assertEqual(delay, 2.5)
+
+    def test_retry_delay_past_deadline(self):
+        from google.api_core.exceptions import Aborted
+
+        policy = self._make_one(initial=2, maximum=2, jitter=0)
+        exc = _make_aborted()
+
+        with mock.patch("time.time", return_value=10):
+            self.assertEqual(policy.retry_delay(exc, 12, 1), 2)
+            with self.assertRaises(Aborted) as raised:
+                policy.retry_delay(exc, 11.5, 2)
+
+        self.assertIs(raised.exception, exc)
+
+    def test_retry_delay_w_max_attempts(self):
+        from google.api_core.exceptions import Aborted
+
+        policy = self._make_one(max_attempts=2)
+        deadline = policy.deadline()
+
+        policy.retry_delay(_make_aborted(), deadline, 1)
+        with self.assertRaises(Aborted):
+            policy.retry_delay(_make_aborted(), deadline, 2)
+
+    def test_retry_delay_wo_errors(self):
+        from google.api_core.exceptions import Aborted
+
+        policy = self._make_one(initial=0.5, maximum=0.5, jitter=0)
+
+        self.assertEqual(
+            policy.retry_delay(Aborted("aborted"), policy.deadline(), 1), 0.5
+        )
+
+    def test_deadline(self):
+        policy = self._make_one(timeout=5)
+
+        with mock.patch("time.time", return_value=100):
+            self.assertEqual(policy.deadline(), 105)
+            self.assertEqual(policy.deadline(timeout=1), 101)
+
+    def test_abort_stats(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1.retry_policy import TransactionAbortStats
+
+        policy = self._make_one(max_attempts=2)
+        deadline = policy.deadline()
+
+        for attempts in (1, 2):
+            policy.record_attempt("tag")
+            try:
+                policy.retry_delay(_make_aborted(), deadline, attempts, "tag")
+            except Aborted:
+                pass
+        policy.record_attempt()
+
+        self.assertEqual(
+            policy.abort_stats(),
+            {
+                "tag": TransactionAbortStats(attempts=2, aborts=2, exhausted=1),
+                None: TransactionAbortStats(attempts=1, aborts=0, exhausted=0),
+            },
+        )
+
+        policy.reset_abort_stats()
+        self.assertEqual(policy.abort_stats(), {})
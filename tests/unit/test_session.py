@@ -1376,6 +1376,7 @@ class TestSession(OpenTelemetryBase):
 
     def test_run_in_transaction_w_timeout(self):
         from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
         from google.cloud.spanner_v1 import CommitRequest
         from google.cloud.spanner_v1 import (
             Transaction as TransactionPB,
@@ -1410,16 +1411,21 @@ class TestSession(OpenTelemetryBase):
         def _time(_results=[1, 2, 4, 8]):
             return _results.pop(0)
 
+        policy = AbortRetryPolicy(initial=2, multiplier=2, jitter=0)
         with mock.patch("time.time", _time):
             if HAS_OPENTELEMETRY_INSTALLED:
                 with mock.patch("opentelemetry.util._time", _ConstantTime()):
                     with mock.patch("time.sleep") as sleep_mock:
                         with self.assertRaises(Aborted):
-                            session.run_in_transaction(unit_of_work, timeout_secs=8)
+                            session.run_in_transaction(
+                                unit_of_work, timeout_secs=8, retry_policy=policy
+                            )
             else:
                 with mock.patch("time.sleep") as sleep_mock:
                     with self.assertRaises(Aborted):
-                        session.run_in_transaction(unit_of_work, timeout_secs=8)
+                        session.run_in_transaction(
+                            unit_of_work, timeout_secs=8, retry_policy=policy
+                        )
 
         # unpacking call args into list
         call_args = [call_[0][0] for call_ in sleep_mock.call_args_list]
@@ -1690,27 +1696,80 @@ class TestSession(OpenTelemetryBase):
         )
 
     def test_delay_helper_w_no_delay(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
         from google.cloud.spanner_v1.session import _delay_until_retry
 
         metadata_mock = mock.Mock()
         metadata_mock.trailing_metadata.return_value = {}
 
-        exc_mock = mock.Mock(errors=[metadata_mock])
+        exc = Aborted("aborted", errors=[metadata_mock])
+        policy = AbortRetryPolicy(initial=0, maximum=0)
 
         def _time_func():
             return 3
 
         # check if current time > deadline
         with mock.patch("time.time", _time_func):
-            with self.assertRaises(Exception):
-                _delay_until_retry(exc_mock, 2, 1)
+            with self.assertRaises(Aborted):
+                _delay_until_retry(exc, 2, 1, policy)
 
         with mock.patch("time.time", _time_func):
-            with mock.patch(
-                "google.cloud.spanner_v1.session._get_retry_delay"
-            ) as get_retry_delay_mock:
-                with mock.patch("time.sleep") as sleep_mock:
-                    get_retry_delay_mock.return_value = None
+            with mock.patch("time.sleep") as sleep_mock:
+                _delay_until_retry(exc, 6, 1, policy)
+                sleep_mock.assert_not_called()
+
+    def test_get_retry_delay_delegates_to_policy(self):
+        from google.protobuf.duration_pb2 import Duration
+        from google.rpc.error_details_pb2 import RetryInfo
+        from google.cloud.spanner_v1.session import _get_retry_delay
+
+        retry_info = RetryInfo(retry_delay=Duration(seconds=1, nanos=500000000))
+        cause = mock.Mock()
+        cause.trailing_metadata.return_value = [
+            ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
+        ]
+        self.assertEqual(_get_retry_delay(cause, 1), 1.5)
+
+        cause.trailing_metadata.return_value = []
+        with mock.patch(
+            "google.cloud.spanner_v1.session.DEFAULT_ABORT_RETRY_POLICY"
+        ) as policy:
+            policy.backoff.return_value = 0.01
+            self.assertEqual(_get_retry_delay(cause, 3), 0.01)
+        policy.backoff.assert_called_once_with(3)
+
+    def test_run_in_transaction_w_abort_default_backoff(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1 import CommitResponse
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+
+        aborted = _make_rpc_error(Aborted, trailing_metadata=[])
+        gax_api = self._make_spanner_api()
+        gax_api.begin_transaction.return_value = TransactionPB(id=b"FACEDACE")
+        gax_api.commit.side_effect = [aborted, aborted, aborted, CommitResponse()]
+        database = self._make_database()
+        database.spanner_api = gax_api
+        session = self._make_one(database)
+        session._session_id = self.SESSION_ID
+        policy = AbortRetryPolicy()
+
+        def unit_of_work(txn):
+            txn.insert("citizens", ["email"], [["phred@example.com"]])
+            return 42
+
+        with mock.patch("time.sleep") as sleep_mock:
+            self.assertEqual(
+                session.run_in_transaction(
+                    unit_of_work, transaction_tag="tag", retry_policy=policy
+                ),
+                42,
+            )
 
-                    _delay_until_retry(exc_mock, 6, 1)
-                    sleep_mock.assert_not_called()
+        # Jittered exponential backoff from 20ms, rather than 2 ** attempts.
+        delays = [call_[0][0] for call_ in sleep_mock.call_args_list]
+        self.assertEqual(len(delays), 3)
+        for attempt, delay in enumerate(delays, start=1):
+            self.assertLessEqual(delay, 0.02 * 1.3 ** (attempt - 1))
+        self.assertEqual(policy.abort_stats()["tag"], (4, 3, 0))
@@ -83,12 +83,25 @@ class Test_restart_on_unavailable(OpenTelemetryBase):
         return mock.create_autospec(SpannerClient, instance=True)
 
     def _call_fut(
-        self, derived, restart, request, span_name=None, session=None, attributes=None
+        self,
+        derived,
+        restart,
+        request,
+        span_name=None,
+        session=None,
+        attributes=None,
+        buffer_policy=None,
     ):
         from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
 
         return _restart_on_unavailable(
-            restart, request, span_name, session, attributes, transaction=derived
+            restart,
+            request,
+            span_name,
+            session,
+            attributes,
+            transaction=derived,
+            buffer_policy=buffer_policy,
         )
 
     def _make_item(self, value, resume_token=b"", metadata=None):
@@ -513,6 +526,297 @@ class Test_restart_on_unavailable(OpenTelemetryBase):
                 )
 
 
+class Test_CancellableStream(OpenTelemetryBase):
+    def _make_one(self, method, request=None, replace_session=None):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+        from google.cloud.spanner_v1 import TransactionSelector
+        from google.cloud.spanner_v1.snapshot import _CancellableStream
+
+        if request is None:
+            request = ExecuteSqlRequest()
+        return _CancellableStream(
+            method,
+            request,
+            transaction_selector=TransactionSelector(id=b"DEADBEEF"),
+            replace_session=replace_session,
+        )
+
+    @staticmethod
+    def _make_item(value):
+        return mock.Mock(value=value, resume_token=b"", metadata=None)
+
+    def test_iter(self):
+        item = self._make_item(0)
+        method = mock.Mock(return_value=_MockIterator(item))
+        stream = self._make_one(method)
+
+        self.assertEqual(list(stream), [item])
+        method.assert_called_once()
+
+    def test_cancel(self):
+        call = mock.MagicMock()
+        call.__iter__.return_value = iter([self._make_item(0)])
+        stream = self._make_one(mock.Mock(return_value=call))
+
+        stream.cancel()
+        call.cancel.assert_not_called()
+
+        # A call started once cancelled is cancelled right away.
+        next(stream)
+        call.cancel.assert_called_once_with()
+
+        stream.cancel()
+        self.assertEqual(call.cancel.call_count, 2)
+
+    def test_cancel_wo_cancellable_call(self):
+        stream = self._make_one(mock.Mock(return_value=_MockIterator()))
+
+        self.assertEqual(list(stream), [])
+        stream.cancel()
+
+    def _make_session_not_found_stream(self, *items, replacement="session-2"):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        sessions = []
+
+        def _method(request):
+            sessions.append(request.session)
+            if len(sessions) == 1:
+                return _MockIterator(
+                    *items, fail_after=True, error=NotFound("Session not found: x")
+                )
+            return _MockIterator(self._make_item(1))
+
+        replace_session = mock.Mock(
+            return_value=None if replacement is None else mock.Mock(name=replacement)
+        )
+        if replacement is not None:
+            replace_session.return_value.name = replacement
+        request = ExecuteSqlRequest(session="session-1")
+        stream = self._make_one(_method, request, replace_session)
+        return stream, replace_session, sessions
+
+    def test_retry_on_session_not_found(self):
+        stream, replace_session, sessions = self._make_session_not_found_stream()
+
+        self.assertEqual([item.value for item in stream], [1])
+        replace_session.assert_called_once_with()
+        self.assertEqual(sessions, ["session-1", "session-2"])
+
+    def test_retry_on_session_not_found_wo_replacement(self):
+        from google.api_core.exceptions import NotFound
+
+        stream, replace_session, sessions = self._make_session_not_found_stream(
+            replacement=None
+        )
+
+        with self.assertRaises(NotFound):
+            list(stream)
+        replace_session.assert_called_once_with()
+        self.assertEqual(sessions, ["session-1"])
+
+    def test_retry_on_session_not_found_after_results(self):
+        from google.api_core.exceptions import NotFound
+
+        item = self._make_item(0)
+        item.resume_token = b"token"
+        stream, replace_session, sessions = self._make_session_not_found_stream(item)
+
+        self.assertIs(next(stream), item)
+        with self.assertRaises(NotFound):
+            next(stream)
+        replace_session.assert_not_called()
+        self.assertEqual(sessions, ["session-1"])
+
+    def test_retry_on_other_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        replace_session = mock.Mock()
+        method = mock.Mock(
+            return_value=_MockIterator(
+                fail_after=True, error=NotFound("Table not found")
+            )
+        )
+        stream = self._make_one(method, replace_session=replace_session)
+
+        with self.assertRaises(NotFound):
+            list(stream)
+        replace_session.assert_not_called()
+
+
+class TestResumeBufferPolicy(OpenTelemetryBase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.snapshot import ResumeBufferPolicy
+
+        return ResumeBufferPolicy
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _call_fut(self, restart, request, buffer_policy):
+        from google.cloud.spanner_v1 import TransactionSelector
+        from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
+
+        return _restart_on_unavailable(
+            restart,
+            request,
+            transaction_selector=TransactionSelector(id=TXN_ID),
+            buffer_policy=buffer_policy,
+        )
+
+    def _make_stream(self, count, value_size, tokens=(), error=None):
+        """Fake ``streaming_read``:  large results, mostly without tokens.
+
+        Returns the iterator, and a list recording the number of results
+        emitted so far, sampled each time the consumer receives one.
+        """
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.protobuf.struct_pb2 import Value
+
+        emitted = [0]
+
+        def _generate():
+            for index in range(count):
+                item = PartialResultSet(
+                    resume_token=b"token-%d" % index if index in tokens else b""
+                )
+                item.values.append(Value(string_value="x" * value_size))
+                emitted[0] += 1
+                yield item
+            if error is not None:
+                raise error
+
+        return _generate(), emitted
+
+    def _consume(self, iterator, emitted):
+        """Return the results, and the most ever emitted but not consumed."""
+        results, high_water = [], 0
+        for item in iterator:
+            results.append(item)
+            high_water = max(high_water, emitted[0] - len(results))
+        return results, high_water
+
+    def test_ctor_defaults(self):
+        policy = self._make_one()
+        self.assertIsNone(policy.max_items)
+        self.assertIsNone(policy.max_bytes)
+        self.assertEqual(policy.on_overflow, policy.FLUSH)
+        self.assertTrue(policy.resumable)
+
+    def test_ctor_w_invalid_on_overflow(self):
+        with self.assertRaises(ValueError):
+            self._make_one(on_overflow="drop")
+
+    def test_unbounded_buffers_whole_run(self):
+        stream, emitted = self._make_stream(200, 1024)
+        restart = mock.Mock(spec=[], side_effect=[stream])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+
+        results, high_water = self._consume(
+            self._call_fut(restart, request, None), emitted
+        )
+
+        self.assertEqual(len(results), 200)
+        self.assertEqual(high_water, 199)
+
+    def test_max_items_bounds_buffer(self):
+        policy = self._make_one(max_items=8)
+        stream, emitted = self._make_stream(200, 1024)
+        restart = mock.Mock(spec=[], side_effect=[stream])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+
+        results, high_water = self._consume(
+            self._call_fut(restart, request, policy), emitted
+        )
+
+        self.assertEqual(len(results), 200)
+        self.assertLessEqual(high_water, 8)
+
+    def test_max_bytes_bounds_buffer(self):
+        policy = self._make_one(max_bytes=256 * 1024)
+        stream, emitted = self._make_stream(100, 64 * 1024)
+        restart = mock.Mock(spec=[], side_effect=[stream])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+
+        results, high_water = self._consume(
+            self._call_fut(restart, request, policy), emitted
+        )
+
+        self.assertEqual(len(results), 100)
+        # Four 64KiB results fit;  the fifth overflows the buffer.
+        self.assertLessEqual(high_water, 4)
+
+    def test_fail_on_overflow(self):
+        from google.cloud.spanner_v1.snapshot import ResumeBufferOverflow
+
+        policy = self._make_one(max_items=8, on_overflow="fail")
+        stream, emitted = self._make_stream(50, 16)
+        restart = mock.Mock(spec=[], side_effect=[stream])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+
+        with self.assertRaises(ResumeBufferOverflow):
+            list(self._call_fut(restart, request, policy))
+
+        self.assertEqual(emitted[0], 9)
+
+    def test_error_after_flush_is_raised(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        policy = self._make_one(max_items=4)
+        stream, _ = self._make_stream(
+            10, 16, tokens=(1,), error=ServiceUnavailable("testing")
+        )
+        restart = mock.Mock(spec=[], side_effect=[stream])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+        results = []
+
+        with self.assertRaises(ServiceUnavailable):
+            for item in self._call_fut(restart, request, policy):
+                results.append(item)
+
+        # Results 2-6 were flushed;  7-9 were still buffered.
+        self.assertEqual(len(results), 7)
+        self.assertEqual(len(restart.mock_calls), 1)
+
+    def test_error_after_flush_and_token_resumes(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        policy = self._make_one(max_items=4)
+        before, _ = self._make_stream(
+            10, 16, tokens=(7,), error=ServiceUnavailable("testing")
+        )
+        after, _ = self._make_stream(2, 16)
+        restart = mock.Mock(spec=[], side_effect=[before, after])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+
+        results = list(self._call_fut(restart, request, policy))
+
+        # Results 8 and 9 were buffered after the token, then discarded.
+        self.assertEqual(len(results), 10)
+        self.assertEqual(len(restart.mock_calls), 2)
+        self.assertEqual(request.resume_token, b"token-7")
+
+    def test_non_resumable_yields_immediately(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        policy = self._make_one(resumable=False)
+        stream, emitted = self._make_stream(
+            20, 16, tokens=(19,), error=ServiceUnavailable("testing")
+        )
+        restart = mock.Mock(spec=[], side_effect=[stream])
+        request = mock.Mock(spec=["resume_token", "transaction"])
+        results = []
+
+        with self.assertRaises(ServiceUnavailable):
+            for item in self._call_fut(restart, request, policy):
+                self.assertEqual(emitted[0], len(results) + 1)
+                results.append(item)
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(len(restart.mock_calls), 1)
+
+
 class Test_SnapshotBase(OpenTelemetryBase):
 
     PROJECT_ID = "project-id"
@@ -815,6 +1119,66 @@ class Test_SnapshotBase(OpenTelemetryBase):
             attributes=dict(BASE_ATTRIBUTES, **{"db.statement": SQL_QUERY}),
         )
 
+    def test_execute_sql_w_prefetch(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        metadata = ResultSetMetadata(
+            row_type=StructType(
+                fields=[StructType.Field(name="age", type_=Type(code=TypeCode.INT64))]
+            )
+        )
+        result_sets = [
+            PartialResultSet(metadata=metadata, resume_token=RESUME_TOKEN),
+            PartialResultSet(),
+        ]
+        for result_set, value in zip(result_sets, ("1", "2")):
+            result_set.values.append(_make_value_pb(value))
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        database.spanner_api.execute_streaming_sql.return_value = iter(result_sets)
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        result_set = derived.execute_sql(SQL_QUERY, prefetch=2)
+
+        self.assertEqual(result_set._prefetch, 2)
+        self.assertEqual(list(result_set), [[1], [2]])
+
+    def test_read_w_decode_bytes(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1 import RawBytes
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        metadata = ResultSetMetadata(
+            row_type=StructType(
+                fields=[StructType.Field(name="blob", type_=Type(code=TypeCode.BYTES))]
+            )
+        )
+        result_set = PartialResultSet(metadata=metadata)
+        result_set.values.append(_make_value_pb(RawBytes(b"\x00\xff")))
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        database.spanner_api.streaming_read.return_value = iter([result_set])
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        result_set = derived.read(
+            TABLE_NAME, ["blob"], KeySet(all_=True), decode_bytes=True
+        )
+
+        self.assertTrue(result_set._decode_bytes)
+        self.assertEqual(list(result_set), [[b"\x00\xff"]])
+
     def test_execute_sql_w_params_wo_param_types(self):
         database = _Database()
         session = _Session(database)
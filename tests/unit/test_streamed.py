@@ -17,6 +17,16 @@ import unittest
 
 import mock
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 
 class TestStreamedResultSet(unittest.TestCase):
     def _getTargetClass(self):
@@ -46,6 +56,21 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertIsNone(streamed.metadata)
         self.assertIsNone(streamed.stats)
 
+    def test_cancel(self):
+        iterator = mock.Mock(spec=["__next__", "cancel"])
+        streamed = self._make_one(iterator)
+
+        streamed.cancel()
+
+        iterator.cancel.assert_called_once_with()
+
+    def test_cancel_wo_cancellable_iterator(self):
+        streamed = self._make_one(iter([]))
+
+        streamed.cancel()
+
+        self.assertEqual(list(streamed), [])
+
     def test_fields_unset(self):
         iterator = _MockCancellableIterator()
         streamed = self._make_one(iterator)
@@ -419,6 +444,101 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(merged, expected)
         self.assertIsNone(streamed._pending_chunk)
 
+    def test___iter___w_value_chunked_across_many_responses(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("id", TypeCode.INT64),
+            self._make_scalar_field("blob", TypeCode.STRING),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        pieces = ["piece-%d;" % index for index in range(50)]
+        result_sets = [
+            self._make_partial_result_set(
+                [self._make_value(1), self._make_value(pieces[0])],
+                metadata=metadata,
+                chunked_value=True,
+            )
+        ]
+        for piece in pieces[1:-1]:
+            result_sets.append(
+                self._make_partial_result_set(
+                    [self._make_value(piece)], chunked_value=True
+                )
+            )
+        result_sets.append(
+            self._make_partial_result_set(
+                [self._make_value(pieces[-1]), self._make_value(2)]
+            )
+        )
+        result_sets.append(self._make_partial_result_set([self._make_value("b")]))
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator)
+
+        for _ in range(len(result_sets) - 2):
+            streamed._consume_next()
+
+        # Chunks are kept apart until the value is complete.
+        self.assertEqual(len(streamed._pending_chunk_tail), len(pieces) - 2)
+        self.assertEqual(streamed._rows, [])
+
+        found = list(streamed)
+
+        self.assertEqual(found, [[1, "".join(pieces)], [2, "b"]])
+        self.assertIsNone(streamed._pending_chunk)
+        self.assertEqual(streamed._pending_chunk_tail, [])
+
+    def test__merge_chunk_w_pending_tail_array_of_string(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        FIELDS = [self._make_array_field("name", element_type_code=TypeCode.STRING)]
+        streamed._metadata = self._make_result_set_metadata(FIELDS)
+        streamed._pending_chunk = self._make_list_value(["A", "B", "C"])
+        streamed._pending_chunk_tail = [
+            self._make_list_value(["D"]),
+            self._make_list_value([]),
+            self._make_list_value(["E"]),
+        ]
+        chunk = self._make_list_value(["F", None, "G"])
+
+        merged = streamed._merge_chunk(chunk)
+
+        expected = self._make_list_value(["A", "B", "CDEF", None, "G"])
+        self.assertEqual(merged, expected)
+        self.assertEqual(streamed._pending_chunk_tail, [])
+
+    def test__merge_chunk_w_pending_tail_struct(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        struct_type = self._make_struct_type(
+            [
+                ("name", TypeCode.STRING),
+                ("age", TypeCode.FLOAT64),
+                ("married", TypeCode.BOOL),
+            ]
+        )
+        FIELDS = [self._make_array_field("test", element_type=struct_type)]
+        streamed._metadata = self._make_result_set_metadata(FIELDS)
+        partial = self._make_list_value(["Phr"])
+        streamed._pending_chunk = self._make_list_value(value_pbs=[partial])
+        streamed._pending_chunk_tail = [
+            self._make_list_value(
+                value_pbs=[self._make_list_value(["e"])],
+            )
+        ]
+        rest = self._make_list_value(["d", 42.5, True])
+        chunk = self._make_list_value(value_pbs=[rest])
+
+        merged = streamed._merge_chunk(chunk)
+
+        struct = self._make_list_value(["Phred", 42.5, True])
+        expected = self._make_list_value(value_pbs=[struct])
+        self.assertEqual(merged, expected)
+
     def test__merge_chunk_array_of_array_of_string(self):
         from google.cloud.spanner_v1 import StructType
         from google.cloud.spanner_v1 import Type
@@ -971,6 +1091,467 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def _make_split_stream(self, *splits, **kwargs):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred", 42, "Bharney", 39, "Wylma", 41, "Pebbylz", 4, "Dino", 4]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_sets = []
+        start = 0
+        for stop in splits + (len(VALUES),):
+            result_sets.append(
+                self._make_partial_result_set(
+                    VALUES[start:stop], metadata=None if start else metadata
+                )
+            )
+            start = stop
+        iterator = _MockCancellableIterator(*result_sets)
+        return self._make_one(iterator, **kwargs)
+
+    def test_iter_batches_empty(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        self.assertEqual(list(streamed.iter_batches()), [])
+        self.assertEqual(list(streamed.iter_batches(max_rows=2)), [])
+
+    def test_iter_batches_w_invalid_max_rows(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            streamed.iter_batches(max_rows=0)
+
+    def test_iter_batches_per_result_set(self):
+        # The second result set completes no row.
+        streamed = self._make_split_stream(4, 5)
+
+        batches = list(streamed.iter_batches())
+
+        self.assertEqual(
+            batches,
+            [
+                [["Phred", 42], ["Bharney", 39]],
+                [["Wylma", 41], ["Pebbylz", 4], ["Dino", 4]],
+            ],
+        )
+        self.assertEqual(streamed._rows, [])
+        self.assertEqual(streamed._current_row, [])
+
+    def test_iter_batches_w_max_rows(self):
+        streamed = self._make_split_stream(5, 6)
+
+        batches = list(streamed.iter_batches(max_rows=2))
+
+        self.assertEqual(
+            batches,
+            [
+                [["Phred", 42], ["Bharney", 39]],
+                [["Wylma", 41], ["Pebbylz", 4]],
+                [["Dino", 4]],
+            ],
+        )
+
+    def test_iter_batches_w_max_rows_spanning_result_sets(self):
+        streamed = self._make_split_stream(2, 4, 6, 8)
+
+        batches = list(streamed.iter_batches(max_rows=3))
+
+        self.assertEqual(
+            batches,
+            [
+                [["Phred", 42], ["Bharney", 39], ["Wylma", 41]],
+                [["Pebbylz", 4], ["Dino", 4]],
+            ],
+        )
+
+    def test_iter_batches_after_iteration_started(self):
+        streamed = self._make_split_stream(4)
+        rows = iter(streamed)
+        self.assertEqual(next(rows), ["Phred", 42])
+        self.assertEqual(next(rows), ["Bharney", 39])
+
+        batches = list(streamed.iter_batches())
+
+        self.assertEqual(batches, [[["Wylma", 41], ["Pebbylz", 4], ["Dino", 4]]])
+
+    def test_iter_batches_w_prefetch(self):
+        streamed = self._make_split_stream(4, prefetch=2)
+
+        batches = list(streamed.iter_batches(max_rows=4))
+
+        self.assertEqual(
+            batches,
+            [
+                [["Phred", 42], ["Bharney", 39], ["Wylma", 41], ["Pebbylz", 4]],
+                [["Dino", 4]],
+            ],
+        )
+
+    def test_iter_column_batches_empty(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        self.assertEqual(list(streamed.iter_column_batches()), [])
+        self.assertEqual(streamed.to_columns(), [])
+
+    def test_iter_column_batches_w_partial_rows_and_chunk(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set1 = self._make_partial_result_set(
+            [self._make_value("Phred"), self._make_value(42), self._make_value("Bh")],
+            metadata=metadata,
+            chunked_value=True,
+        )
+        result_set2 = self._make_partial_result_set(
+            [self._make_value("arney"), self._make_value(None)]
+        )
+        result_set3 = self._make_partial_result_set([self._make_value("Wylma")])
+        result_set4 = self._make_partial_result_set([self._make_value(41)])
+        iterator = _MockCancellableIterator(
+            result_set1, result_set2, result_set3, result_set4
+        )
+        streamed = self._make_one(iterator)
+
+        batches = list(streamed.iter_column_batches())
+
+        self.assertEqual(
+            [[column.to_list() for column in batch] for batch in batches],
+            [[["Phred"], [42]], [["Bharney"], [None]], [["Wylma"], [41]]],
+        )
+        self.assertEqual(batches[0][0].name, "full_name")
+        self.assertEqual(streamed._current_row, [])
+        self.assertIsNone(streamed._pending_chunk)
+
+    def test_to_columns(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred", 42, "Bharney", None, "Wylma", 41]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:3], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[3:])
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator)
+
+        names, ages = streamed.to_columns()
+
+        self.assertEqual(names.to_list(), ["Phred", "Bharney", "Wylma"])
+        self.assertEqual(ages.to_list(), [42, None, 41])
+
+    def test_to_columns_no_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [self._make_scalar_field("age", TypeCode.INT64)]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        (ages,) = streamed.to_columns()
+
+        self.assertEqual(len(ages), 0)
+        self.assertEqual(ages.name, "age")
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_to_arrow(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+            self._make_array_field("scores", element_type_code=TypeCode.FLOAT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred", 42, [1.5, None], "Bharney", None, None, "Wylma", 41, []]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:4], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[4:])
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator)
+
+        table = streamed.to_arrow()
+
+        self.assertEqual(table.column_names, ["full_name", "age", "scores"])
+        self.assertEqual(table.schema.field("age").type, pyarrow.int64())
+        self.assertEqual(
+            table.schema.field("scores").type, pyarrow.list_(pyarrow.float64())
+        )
+        self.assertEqual(
+            table.to_pydict(),
+            {
+                "full_name": ["Phred", "Bharney", "Wylma"],
+                "age": [42, None, 41],
+                "scores": [[1.5, None], None, []],
+            },
+        )
+        with self.assertRaises(RuntimeError):
+            streamed.to_arrow()
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_to_arrow_no_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [self._make_scalar_field("age", TypeCode.INT64)]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        table = streamed.to_arrow()
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.column_names, ["age"])
+
+    def test_to_arrow_wo_pyarrow(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+
+        with mock.patch.dict("sys.modules", {"pyarrow": None}):
+            with self.assertRaises(ImportError):
+                streamed.to_arrow()
+
+    @unittest.skipIf(pandas is None or pyarrow is None, "pandas not installed")
+    def test_to_pandas(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred", 42, "Bharney", 39]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator)
+
+        frame = streamed.to_pandas()
+
+        self.assertEqual(list(frame.columns), ["full_name", "age"])
+        self.assertEqual(frame["age"].tolist(), [42, 39])
+        self.assertEqual(frame["full_name"].tolist(), ["Phred", "Bharney"])
+
+    def test_iter_column_batches_consumed_stream(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        streamed._metadata = object()
+        with self.assertRaises(RuntimeError):
+            streamed.iter_column_batches()
+        with self.assertRaises(RuntimeError):
+            streamed.to_columns()
+
+    def _make_people_stream(self, count):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_sets = []
+        for index in range(count):
+            values = [self._make_value("Person %d" % index), self._make_value(index)]
+            result_sets.append(
+                self._make_partial_result_set(
+                    values, metadata=metadata if index == 0 else None
+                )
+            )
+        return result_sets
+
+    def test___iter___w_prefetch(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        stats = self._make_result_set_stats(rows_returned="2")
+        result_set1 = self._make_partial_result_set(
+            [self._make_value("Phr")], metadata=metadata, chunked_value=True
+        )
+        result_set2 = self._make_partial_result_set(
+            [self._make_value(value) for value in ("ed", 42, "Bharney", 39)],
+            stats=stats,
+        )
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator, prefetch=2)
+
+        found = list(streamed)
+
+        self.assertEqual(found, [["Phred", 42], ["Bharney", 39]])
+        self.assertEqual(streamed.metadata, metadata)
+        self.assertEqual(streamed.stats, stats)
+        self.assertEqual(list(streamed), [])
+
+    def test___iter___w_prefetch_reads_ahead(self):
+        import threading
+
+        result_sets = self._make_people_stream(10)
+        produced = []
+        ahead = threading.Event()
+
+        def _generate():
+            for result_set in result_sets:
+                produced.append(result_set)
+                if len(produced) == 4:
+                    ahead.set()
+                yield result_set
+
+        streamed = self._make_one(_generate(), prefetch=3)
+        rows = iter(streamed)
+
+        first = next(rows)
+        # While the consumer holds the first row, the producer reads ahead:
+        # the rows of three responses queued, plus the one in hand.
+        self.assertTrue(ahead.wait(5))
+        self.assertEqual(first, ["Person 0", 0])
+        self.assertLessEqual(len(produced), 5)
+        self.assertEqual(len(list(rows)), 9)
+
+    def test___iter___w_prefetch_error(self):
+        result_sets = self._make_people_stream(3)
+
+        def _generate():
+            yield from result_sets
+            raise ValueError("testing")
+
+        streamed = self._make_one(_generate(), prefetch=1)
+        found = []
+
+        with self.assertRaises(ValueError):
+            for row in streamed:
+                found.append(row)
+
+        self.assertEqual(len(found), 3)
+
+    def test___iter___w_prefetch_closed_early(self):
+        import threading
+
+        result_sets = self._make_people_stream(100)
+        closed = threading.Event()
+
+        def _generate():
+            try:
+                yield from result_sets
+            finally:
+                closed.set()
+
+        streamed = self._make_one(_generate(), prefetch=2)
+        rows = iter(streamed)
+        self.assertEqual(next(rows), ["Person 0", 0])
+
+        rows.close()
+
+        self.assertTrue(closed.wait(5))
+
+    def test___iter___w_prefetch_closed_while_waiting(self):
+        import threading
+        from google.api_core.exceptions import Cancelled
+
+        result_sets = self._make_people_stream(1)
+
+        class _Call(object):
+            def __init__(self):
+                self.cancelled = threading.Event()
+                self.exited = threading.Event()
+                self._responses = self._generate()
+
+            def __next__(self):
+                return next(self._responses)
+
+            def _generate(self):
+                try:
+                    yield from result_sets
+                    # Wait for the next response, until cancelled.
+                    self.cancelled.wait()
+                    raise Cancelled("cancelled")
+                finally:
+                    self.exited.set()
+
+            def cancel(self):
+                self.cancelled.set()
+
+        call = _Call()
+        streamed = self._make_one(call, prefetch=2)
+        rows = iter(streamed)
+        self.assertEqual(next(rows), ["Person 0", 0])
+
+        rows.close()
+
+        self.assertTrue(call.cancelled.is_set())
+        self.assertTrue(call.exited.wait(5))
+
+    def test___iter___w_prefetch_exhausted_not_cancelled(self):
+        iterator = _MockCancellableIterator(*self._make_people_stream(2))
+        iterator.cancel = mock.Mock()
+        streamed = self._make_one(iterator, prefetch=2)
+
+        self.assertEqual(len(list(streamed)), 2)
+        iterator.cancel.assert_not_called()
+
+    def test_iter_column_batches_w_prefetch(self):
+        result_sets = self._make_people_stream(3)
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator, prefetch=2)
+
+        batches = list(streamed.iter_column_batches())
+
+        self.assertEqual(len(batches), 3)
+        self.assertEqual([list(column) for column in batches[2]], [["Person 2"], [2]])
+
+    def _make_blob_stream(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("id", TypeCode.INT64),
+            self._make_scalar_field("blob", TypeCode.BYTES),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        # 'AAEC' is the base64 encoding of b'\x00\x01\x02', chunked.
+        result_set1 = self._make_partial_result_set(
+            [self._make_value(1), self._make_value(b"AA")],
+            metadata=metadata,
+            chunked_value=True,
+        )
+        result_set2 = self._make_partial_result_set(
+            [self._make_value(b"EC"), self._make_value(2), self._make_value(None)]
+        )
+        return _MockCancellableIterator(result_set1, result_set2)
+
+    def test___iter___w_decode_bytes(self):
+        streamed = self._make_one(self._make_blob_stream(), decode_bytes=True)
+
+        found = list(streamed)
+
+        self.assertEqual(found, [[1, b"\x00\x01\x02"], [2, None]])
+
+    def test___iter___wo_decode_bytes(self):
+        streamed = self._make_one(self._make_blob_stream())
+
+        found = list(streamed)
+
+        self.assertEqual(found, [[1, b"AAEC"], [2, None]])
+
+    def test_to_columns_w_decode_bytes(self):
+        streamed = self._make_one(self._make_blob_stream(), decode_bytes=True)
+
+        ids, blobs = streamed.to_columns()
+
+        self.assertEqual(bytes(blobs.values), b"\x00\x01\x02")
+        self.assertEqual(blobs.to_list(), [b"\x00\x01\x02", None])
+
 
 class _MockCancellableIterator(object):
 
@@ -1090,6 +1671,16 @@ class TestStreamedResultSet_JSON_acceptance_tests(unittest.TestCase):
     def test_multiple_row_chunks_non_chunks_interleaved(self):
         self._match_results("Multiple Row Chunks/Non Chunks Interleaved")
 
+    def test_to_columns_matches_rows(self):
+        self._load_json_test("Basic Test")
+        for name, (partial_result_sets, expected) in self._json_tests.items():
+            if name.startswith("FLOAT64"):  # NaN can't be tested for equality
+                continue
+            iterator = _MockCancellableIterator(*partial_result_sets)
+            columns = self._make_one(iterator).to_columns()
+            rows = [list(row) for row in zip(*[c.to_list() for c in columns])]
+            self.assertEqual(rows, expected, name)
+
 
 def _generate_partial_result_sets(prs_text_pbs):
     from google.cloud.spanner_v1 import PartialResultSet
@@ -482,6 +482,200 @@ class TestTransaction(OpenTelemetryBase):
         with self.assertRaises(ValueError):
             transaction.execute_update(DML_QUERY_WITH_PARAM, PARAMS)
 
+    def test_execute_update_concurrent_waits_for_inline_begin(self):
+        import threading
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import ResultSetStats
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        started, proceed = threading.Event(), threading.Event()
+        requests = []
+
+        def _execute_sql(request=None, **kwargs):
+            requests.append(request)
+            if len(requests) == 1:
+                started.set()
+                proceed.wait(5)
+            return ResultSet(
+                metadata=ResultSetMetadata(
+                    transaction=TransactionPB(id=self.TRANSACTION_ID)
+                ),
+                stats=ResultSetStats(row_count_exact=1),
+            )
+
+        api.execute_sql.side_effect = _execute_sql
+        transaction = self._make_one(_Session(database))
+
+        first = threading.Thread(target=transaction.execute_update, args=(DML_QUERY,))
+        first.start()
+        self.assertTrue(started.wait(5))
+        second = threading.Thread(target=transaction.execute_update, args=(DML_QUERY,))
+        second.start()
+
+        # The second statement waits for the transaction ID.
+        second.join(0.1)
+        self.assertTrue(second.is_alive())
+        self.assertEqual(len(requests), 1)
+
+        proceed.set()
+        first.join()
+        second.join()
+
+        self.assertEqual(transaction._transaction_id, self.TRANSACTION_ID)
+        begin, follower = requests
+        self.assertIn("begin", begin.transaction)
+        self.assertEqual(follower.transaction.id, self.TRANSACTION_ID)
+        self.assertEqual(sorted([begin.seqno, follower.seqno]), [0, 1])
+
+    def test_execute_update_concurrent_seqnos_follow_inline_begin(self):
+        import threading
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import ResultSetStats
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        waiting, sent = threading.Event(), threading.Event()
+        requests = []
+
+        def _execute_sql(request=None, **kwargs):
+            requests.append(request)
+            sent.set()
+            return ResultSet(
+                metadata=ResultSetMetadata(
+                    transaction=TransactionPB(id=self.TRANSACTION_ID)
+                ),
+                stats=ResultSetStats(row_count_exact=1),
+            )
+
+        api.execute_sql.side_effect = _execute_sql
+        transaction = self._make_one(_Session(database))
+        acquire = transaction._acquire_inline_begin
+
+        def _acquire_inline_begin():
+            # Delay the first statement until the second begins the
+            # transaction ahead of it.
+            if threading.current_thread() is first:
+                waiting.set()
+                sent.wait(5)
+            return acquire()
+
+        transaction._acquire_inline_begin = _acquire_inline_begin
+        first = threading.Thread(target=transaction.execute_update, args=(DML_QUERY,))
+        second = threading.Thread(target=transaction.execute_update, args=(DML_QUERY,))
+        first.start()
+        self.assertTrue(waiting.wait(5))
+        second.start()
+        second.join()
+        first.join()
+
+        begin, follower = requests
+        self.assertIn("begin", begin.transaction)
+        self.assertEqual(follower.transaction.id, self.TRANSACTION_ID)
+        # Sequence numbers reach the server in order.
+        self.assertEqual([begin.seqno, follower.seqno], [0, 1])
+
+    def test_execute_update_inline_begin_failure(self):
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import ResultSetStats
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        response = ResultSet(
+            metadata=ResultSetMetadata(
+                transaction=TransactionPB(id=self.TRANSACTION_ID)
+            ),
+            stats=ResultSetStats(row_count_exact=1),
+        )
+        api.execute_sql.side_effect = [RuntimeError("failed"), response]
+        transaction = self._make_one(_Session(database))
+
+        with self.assertRaises(RuntimeError):
+            transaction.execute_update(DML_QUERY)
+
+        # The next statement begins the transaction instead.
+        self.assertEqual(transaction.execute_update(DML_QUERY), 1)
+        self.assertEqual(transaction._transaction_id, self.TRANSACTION_ID)
+        request = api.execute_sql.call_args.kwargs["request"]
+        self.assertIn("begin", request.transaction)
+
+    def test_read_concurrent_with_inline_begin(self):
+        import threading
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        count = 4
+        started, proceed = threading.Event(), threading.Event()
+        barrier = threading.Barrier(count - 1, timeout=5)
+        selectors = []
+
+        def _streaming_read(request=None, **kwargs):
+            selectors.append(request.transaction)
+            if "begin" in request.transaction:
+                started.set()
+                proceed.wait(5)
+            else:
+                # Once the ID is known, the reads are in flight together.
+                barrier.wait()
+            metadata = ResultSetMetadata(
+                row_type=StructType(fields=[]),
+                transaction=TransactionPB(id=self.TRANSACTION_ID),
+            )
+            return iter([PartialResultSet(metadata=metadata)])
+
+        api.streaming_read.side_effect = _streaming_read
+        transaction = self._make_one(_Session(database))
+        result_sets = [
+            transaction.read(TABLE_NAME, COLUMNS, KeySet(all_=True))
+            for _ in range(count)
+        ]
+        threads = [
+            threading.Thread(target=list, args=(result_set,))
+            for result_set in result_sets
+        ]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        threads[1].join(0.1)
+        self.assertEqual(len(selectors), 1)
+
+        proceed.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(selectors), count)
+        self.assertIn("begin", selectors[0])
+        for selector in selectors[1:]:
+            self.assertEqual(selector.id, self.TRANSACTION_ID)
+
+    def test__wait_for_inline_begin(self):
+        import threading
+
+        transaction = self._make_one(_Session(_Database()))
+        transaction._inline_begin_lock.acquire()
+
+        def _begun():
+            transaction._transaction_id = self.TRANSACTION_ID
+            transaction._release_inline_begin()
+
+        timer = threading.Timer(0.05, _begun)
+        timer.start()
+        transaction._wait_for_inline_begin()
+        self.assertEqual(transaction._transaction_id, self.TRANSACTION_ID)
+        timer.join()
+
     def _execute_update_helper(
         self,
         count=0,